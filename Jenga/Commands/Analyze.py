@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Analyze command – Analyses du build à partir des données déjà collectées.
+  jenga analyze includes : coût des headers (.d + traces clang -ftime-trace).
+"""
+
+import argparse
+import json
+from pathlib import Path
+from typing import List
+
+from ..Utils import Colored, Display, FileSystem
+from ..Core.Loader import Loader
+from ..Core.IncludeAnalysis import IncludeAnalyzer, SORT_KEYS
+
+
+class AnalyzeCommand:
+    """jenga analyze includes [--config CONFIG] [--platform PLATFORM] [--project NAME] [--top N] [--sort KEY] [--output FILE]"""
+
+    @staticmethod
+    def Execute(args: List[str]) -> int:
+        parser = argparse.ArgumentParser(
+            prog="jenga analyze",
+            description="Analyze build data. 'includes' ranks headers by cost from the .d files "
+                        "of the last build and, when present, clang -ftime-trace outputs "
+                        "(build with cxxflags(['-ftime-trace']) to get parse/compile timings; "
+                        "clang 19+ with '-ftime-trace-verbose' also attributes template "
+                        "instantiation time to the header defining each template, otherwise "
+                        "only per-TU instantiation totals are reported).")
+        parser.add_argument("what", choices=["includes"], help="Analysis to run")
+        parser.add_argument("--config", default="Debug", help="Build configuration to analyze")
+        parser.add_argument("--platform", default=None, help="Target platform (default: host)")
+        parser.add_argument("--project", action="append", default=[],
+                            help="Restrict to this project (repeatable)")
+        parser.add_argument("--top", type=int, default=20, help="Rows shown in the console table")
+        parser.add_argument("--sort", choices=SORT_KEYS, default="impact",
+                            help="Ranking: impact (rebuild cost), tus, parse, instantiate, fanout")
+        parser.add_argument("--output", "-o", default=None,
+                            help="JSON report path (default: Build/Reports/include_analysis.json)")
+        parser.add_argument("--verbose", "-v", action="store_true")
+        parser.add_argument("--jenga-file", help="Path to the workspace .jenga file (default: auto-detected)")
+        parsed = parser.parse_args(args)
+
+        if parsed.jenga_file:
+            entry_file = Path(parsed.jenga_file).resolve()
+            if not entry_file.exists():
+                Colored.PrintError(f"Jenga file not found: {entry_file}")
+                return 1
+        else:
+            entry_file = FileSystem.FindWorkspaceEntry(Path.cwd())
+            if not entry_file:
+                Colored.PrintError("No .jenga workspace file found.")
+                return 1
+
+        loader = Loader(verbose=parsed.verbose)
+        workspace = loader.LoadWorkspace(str(entry_file))
+        if workspace is None:
+            Colored.PrintError("Failed to load workspace.")
+            return 1
+
+        return AnalyzeCommand._AnalyzeIncludes(workspace, parsed)
+
+    @staticmethod
+    def _AnalyzeIncludes(workspace, parsed) -> int:
+        from .Build import BuildCommand
+
+        builder = BuildCommand.CreateBuilder(
+            workspace, parsed.config, parsed.platform, None, parsed.verbose,
+            action="build",
+            options=BuildCommand.CollectFilterOptions(
+                config=parsed.config,
+                platform=parsed.platform,
+                target=None,
+                verbose=parsed.verbose,
+                no_cache=False,
+                no_daemon=True,
+                extra=["action:build"]
+            )
+        )
+
+        analyzer = IncludeAnalyzer()
+        for name, project in workspace.projects.items():
+            if name.startswith("__") or (parsed.project and name not in parsed.project):
+                continue
+            builder._ApplyProjectFilters(project)
+            obj_dir = builder.GetObjectDir(project)
+            if not obj_dir.is_dir():
+                continue
+            for dep_file in sorted(obj_dir.rglob("*.d")):
+                object_file = dep_file.with_suffix("")   # foo.o.d -> foo.o
+                analyzer.AddUnit(str(object_file), builder._ParseDependencyFile(dep_file, project))
+                trace_file = object_file.with_suffix(".json")  # clang: -o foo.o -> foo.json
+                if trace_file.is_file():
+                    try:
+                        analyzer.AddTimeTrace(str(object_file),
+                                              json.loads(trace_file.read_text(encoding="utf-8")))
+                    except (OSError, ValueError):
+                        pass
+
+        if analyzer.unitCount == 0:
+            Colored.PrintWarning(f"No dependency data found for config '{parsed.config}'. "
+                                 "Build the workspace first (jenga build).")
+            return 1
+
+        report = analyzer.Analyze(sortBy=parsed.sort)
+        root = Path(workspace.location).resolve()
+        output = Path(parsed.output) if parsed.output else root / "Build" / "Reports" / "include_analysis.json"
+        IncludeAnalyzer.WriteReport(report, output)
+
+        Display.PrintHeader(f"Header cost ({report['unitCount']} TUs, sorted by {parsed.sort})",
+                            char="=", color="cyan")
+        Display.PrintTable(IncludeAnalyzer.FormatRows(report, parsed.top, root),
+                           headers=["Header", "TUs", "Fan-out", "Parse ms", "Inst. ms", "Rebuild ms"])
+        if not report["timeTraceUnits"]:
+            Colored.PrintInfo("No -ftime-trace data: parse/rebuild costs unavailable "
+                              "(clang: add cxxflags(['-ftime-trace']) and rebuild).")
+        Colored.PrintSuccess(f"Report written to {output}")
+        return 0
@@ -3,6 +3,12 @@
 """
 Bench command – Lance des benchmarks automatisés.
 Utilise Google Benchmark, Catch2, ou scripts personnalisés.
+
+Chaque exécution est enregistrée dans l'historique local du workspace
+(.jenga/bench_history.jsonl) pour le commit et la configuration courants.
+--baseline REF compare avec la dernière exécution enregistrée pour REF
+(branche, tag, commit) et échoue si un benchmark régresse
+significativement au-delà de --threshold pour cent.
 """
 
 import argparse
@@ -14,10 +20,11 @@ from ..Utils import Colored, Display, FileSystem, Process
 from ..Core.Loader import Loader
 from ..Core.Cache import Cache
 from ..Core import Api
+from ..Core.BenchHistory import BenchHistory, BenchComparison
 
 
 class BenchCommand:
-    """jenga bench [--project PROJECT] [--config CONFIG] [--platform PLATFORM] [--iterations N] [--output FILE]"""
+    """jenga bench [--project PROJECT] [--config CONFIG] [--platform PLATFORM] [--iterations N] [--output FILE] [--baseline REF] [--threshold PCT] [--no-history]"""
 
     @staticmethod
     def Execute(args: List[str]) -> int:
@@ -27,6 +34,11 @@ class BenchCommand:
         parser.add_argument("--platform", default=None, help="Target platform")
         parser.add_argument("--iterations", type=int, default=10, help="Number of iterations")
         parser.add_argument("--output", "-o", default="./bench_results.json", help="Output file for results")
+        parser.add_argument("--baseline", default=None, metavar="REF",
+                            help="Compare with the last recorded run of REF (branch, tag or commit)")
+        parser.add_argument("--threshold", type=float, default=5.0, metavar="PCT",
+                            help="Fail when a benchmark is significantly slower than the baseline by more than PCT%%")
+        parser.add_argument("--no-history", action="store_true", help="Do not record this run in the bench history")
         parser.add_argument("--no-daemon", action="store_true")
         parser.add_argument("--verbose", "-v", action="store_true")
         parser.add_argument("--jenga-file", help="Path to the workspace .jenga file (default: auto-detected)")
@@ -138,8 +150,90 @@ class BenchCommand:
                 Colored.PrintError(f"Benchmark executable not found: {exe_path}")
                 return 1
 
-        cmd = [str(exe_path), f"--benchmark_out={parsed.output}", f"--benchmark_repetitions={parsed.iterations}"]
+        output = Path(parsed.output).resolve()
+        cmd = [str(exe_path), f"--benchmark_out={output}", f"--benchmark_repetitions={parsed.iterations}"]
+        if output.exists():
+            output.unlink()  # ne jamais relire les résultats d'une exécution précédente
         result = Process.ExecuteCommand(cmd, captureOutput=False, silent=False)
-        if result.returnCode == 0:
-            Colored.PrintSuccess(f"Benchmark results saved to {parsed.output}")
-        return result.returnCode
+        if result.returnCode != 0:
+            return result.returnCode
+        if not output.exists():
+            Colored.PrintWarning(f"{exe_path.name} did not write {output}: no history recorded.")
+            return 0
+        Colored.PrintSuccess(f"Benchmark results saved to {output}")
+
+        try:
+            benchmarks = BenchHistory.LoadResults(output)
+        except (OSError, ValueError, KeyError) as e:
+            Colored.PrintError(f"Cannot read benchmark results {output}: {e}")
+            return 1
+        platform = f"{builder.targetOs.value}-{builder.targetArch.value}"
+        history = BenchHistory(workspace_root)
+        run = BenchHistory.NewRun(workspace_root, parsed.config, platform, project_name, benchmarks)
+
+        baseline = None
+        if parsed.baseline:
+            baseline = history.FindBaseline(parsed.baseline, parsed.config, platform, project_name)
+            if baseline is None:
+                Colored.PrintWarning(f"No recorded run for baseline '{parsed.baseline}' "
+                                     f"({project_name}, {parsed.config}, {platform}).")
+        if not parsed.no_history:
+            history.Append(run)
+
+        rows = BenchHistory.Compare(run, baseline, parsed.threshold)
+        BenchCommand.PrintTable(rows, baseline is not None)
+        regressions = [r for r in rows if r.regression]
+        if regressions:
+            Colored.PrintError(f"{len(regressions)} benchmark(s) regressed by more than "
+                               f"{parsed.threshold:g}% against {parsed.baseline} ({baseline.commit[:10]}).")
+            return 1
+        if baseline is not None:
+            Colored.PrintSuccess(f"No regression against {parsed.baseline} ({baseline.commit[:10]}).")
+        return 0
+
+    # -----------------------------------------------------------------------
+    # Affichage
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def FormatTime(ms: float) -> str:
+        if ms >= 1000.0:
+            return f"{ms / 1000.0:.3f} s"
+        if ms >= 1.0:
+            return f"{ms:.3f} ms"
+        if ms >= 1e-3:
+            return f"{ms * 1e3:.3f} us"
+        return f"{ms * 1e6:.1f} ns"
+
+    @staticmethod
+    def PrintTable(rows: List[BenchComparison], withBaseline: bool) -> None:
+        """Ranked table: regressions first, then by relative change (or by mean time without baseline)."""
+        table, colors = [], []
+        for rank, row in enumerate(rows, 1):
+            current = BenchCommand.FormatTime(row.current.mean) if row.current else "-"
+            if not withBaseline:
+                spread = f"±{row.current.stddev / row.current.mean * 100.0:.1f}%" if row.current.mean else "-"
+                table.append([str(rank), row.name, current, spread, str(row.current.samples)])
+                colors.append(None)
+                continue
+            base = BenchCommand.FormatTime(row.baseline.mean) if row.baseline else "-"
+            if row.baseline is None or row.current is None:
+                status, change, confidence, color = ("new" if row.baseline is None else "removed"), "-", "-", "cyan"
+            else:
+                change, confidence = f"{row.changePercent:+.1f}%", f"{row.confidence * 100.0:.0f}%"
+                if row.regression:
+                    status, color = "REGRESSION", "red"
+                elif row.significant and row.ratio < 1.0:
+                    status, color = "faster", "green"
+                elif row.significant:
+                    status, color = "slower", "yellow"
+                else:
+                    status, color = "unchanged", None
+            table.append([str(rank), row.name, base, current, change, confidence, status])
+            colors.append(color)
+        headers = (["#", "Benchmark", "Baseline", "Current", "Change", "Confidence", "Status"] if withBaseline
+                   else ["#", "Benchmark", "Mean", "Stddev", "Samples"])
+        Colored.Print("")
+        Colored.Print(Colored.FormatTable(table, headers, colors=colors if Colored.SupportsColor() else None,
+                                          headerColors=["white"] * len(headers)))
+        Colored.Print("")
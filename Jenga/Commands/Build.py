@@ -6,9 +6,10 @@ Utilise le daemon s'il est actif, sinon exécute un build direct.
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from ..Core.Builder import Builder
 from ..Core.Platform import Platform
@@ -223,7 +224,12 @@ class BuildCommand:
                       verbose: bool,
                       action: str = "build",
                       options: Optional[List[str]] = None,
-                      jobs: int = 0) -> Builder:
+                      jobs: int = 0,
+                      linkJobs: int = 0,
+                      memoryBudgetMb: int = 0,
+                      maxLoad: float = 0.0,
+                      throttle: bool = True,
+                      unity: Optional[bool] = None) -> Builder:
         """Crée un builder pour la configuration et la plateforme spécifiées."""
         # Déterminer la cible à partir de la plateforme
         target_os = None
@@ -306,6 +312,8 @@ class BuildCommand:
                 options=options or []
             )
             builder.jobs = jobs  # Set parallel jobs count
+            BuildCommand._ApplyResourceLimits(builder, linkJobs, memoryBudgetMb, maxLoad, throttle)
+            builder.unity = unity  # --unity / --no-unity override
             return builder
         except TypeError as e:
             # Backward compatibility: some concrete builders still expose the old __init__ signature.
@@ -324,6 +332,8 @@ class BuildCommand:
             builder.action = (action or "build").strip().lower()
             builder.options = sorted({str(opt).strip().lower() for opt in (options or []) if str(opt).strip()})
             builder.jobs = jobs  # Set parallel jobs count
+            BuildCommand._ApplyResourceLimits(builder, linkJobs, memoryBudgetMb, maxLoad, throttle)
+            builder.unity = unity  # --unity / --no-unity override
             if getattr(builder, "_expander", None) is not None:
                 cfg = dict(getattr(builder._expander, "_config", {}) or {})
                 cfg["action"] = builder.action
@@ -331,6 +341,65 @@ class BuildCommand:
                 builder._expander.SetConfig(cfg)
             return builder
 
+    @staticmethod
+    def _ApplyResourceLimits(builder: Builder, linkJobs: int, memoryBudgetMb: int,
+                             maxLoad: float, throttle: bool) -> None:
+        """Report the resource-aware throttling settings onto the builder."""
+        builder.linkJobs = max(0, int(linkJobs or 0))
+        builder.memoryBudgetMb = max(0, int(memoryBudgetMb or 0))
+        builder.maxLoad = max(0.0, float(maxLoad or 0.0))
+        if not throttle:
+            builder.throttle = False
+
+    @staticmethod
+    def ResourceOptionsFromArgs(parsed) -> Dict[str, Any]:
+        """Extract CreateBuilder() throttling kwargs from parsed CLI args."""
+        return {
+            "linkJobs": getattr(parsed, "link_jobs", 0) or 0,
+            "memoryBudgetMb": getattr(parsed, "mem_budget", 0) or 0,
+            "maxLoad": getattr(parsed, "max_load", 0.0) or 0.0,
+            "throttle": not getattr(parsed, "no_throttle", False),
+        }
+
+    @staticmethod
+    def AddResourceArguments(parser: argparse.ArgumentParser) -> None:
+        """Register the throttling options shared by build-like commands."""
+        parser.add_argument("--link-jobs", type=int, default=0,
+                            help="Max concurrent link jobs (0 = auto: jobs/4, at least 1)")
+        parser.add_argument("--mem-budget", type=int,
+                            default=int(os.environ.get("JENGA_MEM_BUDGET_MB", "0") or 0),
+                            help="Memory budget in MB for concurrent compile/link jobs "
+                                 "(0 = limited by available memory only; env JENGA_MEM_BUDGET_MB)")
+        parser.add_argument("--max-load", type=float, default=0.0,
+                            help="Hold back new jobs while the 1-min load average is above this value (0 = off)")
+        parser.add_argument("--no-throttle", action="store_true",
+                            help="Disable memory/load-aware job throttling")
+
+    @staticmethod
+    def WriteCompilationDatabase(builder: Builder, target: Optional[str], path: Path) -> bool:
+        """
+        Met à jour compile_commands.json avec les commandes de compilation que
+        le builder lancerait (enregistrées, rien n'est compilé). Seules les
+        entrées des projets de target (et de ses dépendances) sont remplacées.
+        """
+        from ..Core.BuildPlan import BuildPlanner
+        from ..Core.CompilationDatabase import CompilationDatabase
+        try:
+            plans = BuildPlanner(builder).Plan(target, withLink=False)
+        except RuntimeError as e:
+            Colored.PrintError(f"compile_commands.json not updated: {e}")
+            return False
+        if plans is None:
+            return False
+        directory = builder.workspace.location or str(Path(path).parent)
+        update = CompilationDatabase(path).Update(plans, directory)
+        if update.written:
+            Colored.PrintSuccess(f"compile_commands.json updated: {update.path} ({update.entries} entries, "
+                                 f"+{update.added} ~{update.changed} -{update.removed})")
+        elif builder.verbose:
+            Colored.PrintInfo(f"compile_commands.json up to date ({update.entries} entries)")
+        return True
+
     @staticmethod
     def CollectFilterOptions(config: str,
                              platform: Optional[str],
@@ -394,7 +463,9 @@ class BuildCommand:
                              target: Optional[str], verbose: bool,
                              action: str = "build",
                              options: Optional[List[str]] = None,
-                             jobs: int = 0) -> int:
+                             jobs: int = 0,
+                             resourceOptions: Optional[Dict[str, Any]] = None,
+                             unity: Optional[bool] = None) -> int:
         """
         Build séquentiel sur plusieurs plateformes.
         Continue même si une plateforme échoue, puis renvoie un code global.
@@ -417,7 +488,9 @@ class BuildCommand:
                     verbose=verbose,
                     action=action,
                     options=(options or []) + [f"platform:{platform_name}"],
-                    jobs=jobs
+                    jobs=jobs,
+                    unity=unity,
+                    **(resourceOptions or {})
                 )
             except Exception as e:
                 failures += 1
@@ -478,8 +551,16 @@ class BuildCommand:
         parser.add_argument("--no-daemon", action="store_true", help="Do not use daemon even if available")
         parser.add_argument("--jobs", "-j", type=int, default=0,
                             help="Number of parallel compilation jobs (0 = auto-detect CPU cores, 1 = sequential)")
+        BuildCommand.AddResourceArguments(parser)
+        parser.add_argument("--unity", dest="unity", action="store_true", default=None,
+                            help="Force unity (jumbo) build for every project")
+        parser.add_argument("--no-unity", dest="unity", action="store_false",
+                            help="Disable unity build even for projects using unitybuild()")
+        parser.add_argument("--compdb", action="store_true",
+                            help="Also update <workspace>/compile_commands.json (clangd, clang-tidy)")
         parser.add_argument("--jenga-file", help="Path to the workspace .jenga file (default: auto-detected)")
         parsed, unknown_args = parser.parse_known_args(args)
+        resource_options = BuildCommand.ResourceOptionsFromArgs(parsed)
         try:
             cli_custom_options = BuildCommand.ParseCustomOptionArgs(unknown_args)
         except ValueError as e:
@@ -551,6 +632,10 @@ class BuildCommand:
                         'options': daemon_filter_options,
                         'custom_options': cli_custom_options,
                         'action': parsed.action,
+                        'jobs': parsed.jobs,
+                        'resources': resource_options,
+                        'unity': parsed.unity,
+                        'compdb': parsed.compdb,
                     })
                     if response.get('status') == 'ok':
                         return response.get('return_code', 0)
@@ -630,6 +715,8 @@ class BuildCommand:
         )
 
         if BuildCommand.IsAllPlatformsRequest(parsed.platform):
+            if parsed.compdb:
+                Colored.PrintWarning("--compdb is ignored for multi-platform builds (use --platform NAME)")
             platforms = BuildCommand.GetAllDeclaredPlatforms(workspace)
             return BuildCommand.BuildAcrossPlatforms(
                 workspace,
@@ -639,7 +726,9 @@ class BuildCommand:
                 verbose=parsed.verbose,
                 action=parsed.action,
                 options=filter_options,
-                jobs=parsed.jobs
+                jobs=parsed.jobs,
+                resourceOptions=resource_options,
+                unity=parsed.unity
             )
 
         # 2. Créer le builder
@@ -652,7 +741,9 @@ class BuildCommand:
                 verbose=parsed.verbose,
                 action=parsed.action,
                 options=filter_options,
-                jobs=parsed.jobs
+                jobs=parsed.jobs,
+                unity=parsed.unity,
+                **resource_options
             )
         except Exception as e:
             Colored.PrintError(f"Cannot create builder: {e}")
@@ -685,13 +776,20 @@ class BuildCommand:
                     verbose=parsed.verbose,
                     action=parsed.action,
                     options=filter_options,
-                    jobs=parsed.jobs
+                    jobs=parsed.jobs,
+                    unity=parsed.unity,
+                    **resource_options
                 )
             except Exception as e:
                 Colored.PrintError(f"Cannot create builder after cache refresh: {e}")
                 return result
 
-            return builder.Build(parsed.target)
+            result = builder.Build(parsed.target)
+
+        # 4. compile_commands.json (--compdb) : commandes du builder, rien n'est recompilé
+        if parsed.compdb:
+            BuildCommand.WriteCompilationDatabase(builder, parsed.target,
+                                                  workspace_root / "compile_commands.json")
 
         return result
 
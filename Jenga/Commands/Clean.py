@@ -3,12 +3,22 @@
 """
 Clean command – Supprime les fichiers générés (objets, binaires, cache).
 Ne supprime que les fichiers appartenant au projet (pas les répertoires partagés).
+
+Les arborescences sont supprimées en parallèle (FileSystem.RemoveTreeParallel).
+Avec --stale, seuls les artefacts que le workspace actuel ne produit plus
+(objets de sources supprimées ou renommées, .d/.jenga_sig orphelins, PCH,
+BMI, lots unity disparus, sorties de projets retirés) sont supprimés : le
+reste du cache incrémental est conservé.
 """
 
 import argparse
+import os
 import sys
+import threading
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Set
 
 from ..Core.Loader import Loader
 from ..Core.Cache import Cache
@@ -17,9 +27,50 @@ from ..Core.Platform import Platform
 from ..Core.Builder import Builder
 from ..Utils import FileSystem, Colored
 
+# Suffixes ajoutés au nom de l'objet par le builder (foo.o.d, foo.o.jenga_sig)
+_SIDECAR_SUFFIXES = ('.d', '.jenga_sig')
+_OBJECT_SUFFIXES = {'.o', '.obj'}
+_BMI_SUFFIXES = {'.pcm', '.ifc', '.gcm'}
+_PCH_SUFFIXES = {'.pch', '.gch'}
+
+
+@dataclass
+class _ExpectedArtifacts:
+    """Ce que le workspace actuel produit dans un répertoire d'objets."""
+    objects: Set[str] = field(default_factory=set)      # noms d'objets (main.o)
+    modules: Set[str] = field(default_factory=set)      # stems des unités de module
+    unity: Set[str] = field(default_factory=set)        # noms des TU unity
+    pch: Set[str] = field(default_factory=set)          # stems des PCH (nom du projet)
+
+
+class _ProgressLine:
+    """Compteur de suppression affiché sur une seule ligne (terminal uniquement)."""
+
+    def __init__(self, label: str):
+        self.label = label
+        self.enabled = sys.stdout.isatty()
+        self._lock = threading.Lock()
+        self._last = 0.0
+        self._shown = False
+
+    def Update(self, count: int) -> None:
+        if not self.enabled:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last < 0.1:
+                return
+            self._last = now
+            self._shown = True
+            Colored.Print(f"  {self.label}: {count} file(s) removed...", end="\r")
+
+    def Done(self) -> None:
+        if self._shown:
+            Colored.Print(" " * 72, end="\r")
+
 
 class CleanCommand:
-    """jenga clean [--config NAME] [--platform NAME] [--project NAME] [--all] [--no-daemon]"""
+    """jenga clean [--config NAME] [--platform NAME] [--project NAME] [--all] [--stale] [--dry-run] [--jobs N] [--no-daemon]"""
 
     @staticmethod
     def Execute(args: List[str]) -> int:
@@ -28,6 +79,11 @@ class CleanCommand:
         parser.add_argument("--platform", default=None, help="Target platform (Windows, Linux, etc.)")
         parser.add_argument("--project", default=None, help="Clean only a specific project")
         parser.add_argument("--all", action="store_true", help="Remove all build artifacts and cache")
+        parser.add_argument("--stale", action="store_true",
+                            help="Remove only artifacts no longer produced by the workspace "
+                                 "(objects of deleted/renamed sources, outputs of removed projects)")
+        parser.add_argument("--dry-run", action="store_true", help="With --stale: list files without removing them")
+        parser.add_argument("--jobs", "-j", type=int, default=0, help="Parallel deletion threads (0 = auto)")
         parser.add_argument("--no-daemon", action="store_true", help="Do not use daemon")
         parser.add_argument("--jenga-file", help="Path to the workspace .jenga file (default: auto-detected)")
         parsed = parser.parse_args(args)
@@ -56,7 +112,10 @@ class CleanCommand:
                         'config': parsed.config,
                         'platform': parsed.platform,
                         'project': parsed.project,
-                        'all': parsed.all
+                        'all': parsed.all,
+                        'stale': parsed.stale,
+                        'dry_run': parsed.dry_run,
+                        'jobs': parsed.jobs,
                     })
                     if response.get('status') == 'ok':
                         return response.get('return_code', 0)
@@ -80,8 +139,11 @@ class CleanCommand:
         if parsed.all:
             build_dir = workspace_root / "Build"
             if build_dir.exists():
-                FileSystem.RemoveDirectory(build_dir, recursive=True)
-                Colored.PrintInfo(f"Removed {build_dir}")
+                progress = _ProgressLine("Build")
+                start = time.perf_counter()
+                removed = FileSystem.RemoveTreeParallel(build_dir, jobs=parsed.jobs, onProgress=progress.Update)
+                progress.Done()
+                Colored.PrintInfo(f"Removed {build_dir} ({removed} file(s) in {time.perf_counter() - start:.2f}s)")
             cache.Invalidate()
             return 0
 
@@ -104,7 +166,15 @@ class CleanCommand:
         else:
             projects_to_clean = list(workspace.projects.values())
 
+        if parsed.stale:
+            # Sans --platform ni targetoses, comparer au build par défaut (plateforme hôte)
+            stale_platforms = platforms if (parsed.platform or workspace.targetOses) else [None]
+            return CleanCommand._CleanStale(workspace, workspace_root, configs, stale_platforms,
+                                            projects_to_clean, orphans=not parsed.project,
+                                            dryRun=parsed.dry_run, jobs=parsed.jobs)
+
         # Pour chaque combinaison config/platform, nettoyer les fichiers générés
+        removed_files = 0
         for config in configs:
             for platform in platforms:
                 expander = loader.GetExpanderForWorkspace(workspace)
@@ -136,13 +206,10 @@ class CleanCommand:
                         obj_dir = expander.Expand(proj.objDir)
                         if obj_dir and Path(obj_dir).exists():
                             # Supprimer uniquement les fichiers objets de ce projet
-                            obj_ext = Builder.GetObjectExtensionForPlatform(platform)  # à définir
-                            # Ou plus simplement : chercher tous les fichiers ayant une extension objet
+                            files = []
                             for ext in ['.o', '.obj']:
-                                files = FileSystem.ListFiles(obj_dir, f"*{ext}", recursive=True, fullPath=True)
-                                for f in files:
-                                    FileSystem.RemoveFile(f, ignoreErrors=True)
-                                    Colored.PrintInfo(f"Removed {f}")
+                                files += FileSystem.ListFiles(obj_dir, f"*{ext}", recursive=True, fullPath=True)
+                            removed_files += FileSystem.RemoveFiles(files, jobs=parsed.jobs)
                             # Optionnel : supprimer le répertoire s'il est vide
                             try:
                                 if not any(Path(obj_dir).iterdir()):
@@ -156,13 +223,12 @@ class CleanCommand:
                         if target_dir and Path(target_dir).exists():
                             # Supprimer uniquement les fichiers de sortie de ce projet
                             # (exe, dll, so, a, lib, etc.)
-                            out_ext = Builder.GetOutputExtensionsForProject(proj)  # à définir
+                            out_ext = Builder.GetOutputExtensionsForProject(proj)
+                            files = []
                             for ext in out_ext:
                                 pattern = f"*{ext}"
-                                files = FileSystem.ListFiles(target_dir, pattern, recursive=False, fullPath=True)
-                                for f in files:
-                                    FileSystem.RemoveFile(f, ignoreErrors=True)
-                                    Colored.PrintInfo(f"Removed {f}")
+                                files += FileSystem.ListFiles(target_dir, pattern, recursive=False, fullPath=True)
+                            removed_files += FileSystem.RemoveFiles(sorted(set(files)), jobs=parsed.jobs)
                             # Idem : supprimer le répertoire s'il est vide
                             try:
                                 if not any(Path(target_dir).iterdir()):
@@ -170,4 +236,180 @@ class CleanCommand:
                             except:
                                 pass
 
+        Colored.PrintInfo(f"Removed {removed_files} file(s)")
+        return 0
+
+    # -----------------------------------------------------------------------
+    # --stale : garbage collection des artefacts orphelins
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def _CleanStale(workspace, workspaceRoot: Path, configs: List[str], platforms: List[Optional[str]],
+                    projects: List, orphans: bool, dryRun: bool, jobs: int) -> int:
+        from .Build import BuildCommand
+
+        stale_files: Set[str] = set()
+        stale_dirs: Set[str] = set()
+        for config in configs:
+            for platform in platforms:
+                try:
+                    builder = BuildCommand.CreateBuilder(
+                        workspace, config, platform, None, False, action="build",
+                        options=BuildCommand.CollectFilterOptions(
+                            config=config, platform=platform, target=None, verbose=False,
+                            no_cache=False, no_daemon=True, extra=["action:build"]))
+                except Exception as e:
+                    Colored.PrintWarning(f"Skipping {config}/{platform}: {e}")
+                    continue
+                stale_files.update(CleanCommand.CollectStaleArtifacts(builder, workspace, projects))
+                if orphans:
+                    stale_dirs.update(CleanCommand.FindOrphanDirectories(builder, workspace, workspaceRoot))
+
+        # Un fichier déjà couvert par un répertoire orphelin n'est pas compté deux fois
+        stale_files = {f for f in stale_files
+                       if not any(Path(d) in Path(f).parents for d in stale_dirs)}
+
+        if dryRun:
+            for d in sorted(stale_dirs):
+                Colored.Print(f"  would remove {d}{os.sep}")
+            for f in sorted(stale_files):
+                Colored.Print(f"  would remove {f}")
+            Colored.PrintInfo(f"{len(stale_files)} stale file(s), {len(stale_dirs)} stale director(y/ies)")
+            return 0
+
+        progress = _ProgressLine("Stale")
+        removed = FileSystem.RemoveFiles(sorted(stale_files), jobs=jobs)
+        for d in sorted(stale_dirs):
+            removed += FileSystem.RemoveTreeParallel(d, jobs=jobs, onProgress=progress.Update)
+            Colored.PrintInfo(f"Removed {d}")
+        progress.Done()
+        Colored.PrintInfo(f"Removed {removed} stale file(s)")
         return 0
+
+    @staticmethod
+    def CollectStaleArtifacts(builder: Builder, workspace, projects: List) -> Set[str]:
+        """
+        Artefacts périmés dans les répertoires d'objets de 'projects'. Les
+        artefacts attendus viennent de tout le workspace : un objdir partagé
+        garde les objets des projets non sélectionnés (--project).
+        """
+        expected = CleanCommand.CollectExpectedArtifacts(builder, list(workspace.projects.values()))
+        scanned = {str(builder.GetObjectDir(project)) for project in projects}
+        stale: Set[str] = set()
+        for obj_dir, artifacts in expected.items():
+            if obj_dir in scanned:
+                stale.update(CleanCommand.FindStaleArtifacts(Path(obj_dir), artifacts, expected))
+        return stale
+
+    @staticmethod
+    def CollectExpectedArtifacts(builder: Builder, projects: List) -> Dict[str, _ExpectedArtifacts]:
+        """
+        Artefacts que le builder produirait, par répertoire d'objets.
+        Les objets des sources et ceux des lots unity sont gardés tous les
+        deux : un cache construit avec ou sans --unity reste valide.
+        """
+        obj_ext = builder.GetObjectExtension()
+        expected: Dict[str, _ExpectedArtifacts] = {}
+        for project in projects:
+            builder._ApplyProjectFilters(project)
+            artifacts = expected.setdefault(str(builder.GetObjectDir(project)), _ExpectedArtifacts())
+            sources = builder._CollectSourceFiles(project)
+            modules = [s for s in sources if builder.IsModuleFile(s)]
+            regular = [s for s in sources if not builder.IsModuleFile(s)]
+            batches, _ = builder._PlanUnityBatches(project, regular) if regular else ([], [])
+            artifacts.unity.update(name for name, _ in batches)
+            for src in regular + modules + [name for name, _ in batches]:
+                artifacts.objects.add(Path(src).with_suffix(obj_ext).name)
+            artifacts.modules.update(Path(m).stem for m in modules)
+            artifacts.pch.add(project.name)
+        return expected
+
+    @staticmethod
+    def FindStaleArtifacts(objDir: Path, artifacts: _ExpectedArtifacts,
+                           expected: Optional[Dict[str, _ExpectedArtifacts]] = None) -> List[str]:
+        """
+        Build artifacts under objDir that the workspace no longer produces.
+        Files with an unknown suffix are never reported; sub-directories that
+        are the object directory of another project are skipped.
+        """
+        if not objDir.is_dir():
+            return []
+        other_dirs = {d for d in (expected or {}) if d != str(objDir)}
+        stale: List[str] = []
+        for directory, subdirs, files in os.walk(objDir):
+            subdirs[:] = [d for d in subdirs if os.path.join(directory, d) not in other_dirs]
+            parent = Path(directory).name
+            stale_stems: Set[str] = set()
+            traces: List[str] = []
+            for name in files:
+                base = name
+                for sidecar in _SIDECAR_SUFFIXES:
+                    if base.endswith(sidecar):
+                        base = base[:-len(sidecar)]
+                        break
+                stem, suffix = os.path.splitext(base)
+                suffix = suffix.lower()
+                if parent == "unity" and base.startswith("unity_") and suffix not in _OBJECT_SUFFIXES:
+                    is_stale = base not in artifacts.unity
+                elif suffix in _PCH_SUFFIXES:
+                    is_stale = stem not in artifacts.pch
+                elif suffix in _BMI_SUFFIXES or (parent == "modules" and suffix in _OBJECT_SUFFIXES):
+                    is_stale = stem not in artifacts.modules
+                elif suffix in _OBJECT_SUFFIXES:
+                    is_stale = base not in artifacts.objects
+                    if is_stale:
+                        stale_stems.add(stem)
+                elif suffix == ".json" and parent != "modules":
+                    traces.append(name)     # trace -ftime-trace : suit son objet
+                    continue
+                else:
+                    is_stale = False
+                if is_stale:
+                    stale.append(os.path.join(directory, name))
+            stale.extend(os.path.join(directory, t) for t in traces if Path(t).stem in stale_stems)
+        return stale
+
+    @staticmethod
+    def FindOrphanDirectories(builder: Builder, workspace, workspaceRoot: Path) -> List[str]:
+        """
+        Per-project object/output directories left by projects that no longer
+        exist. Only layouts where each project has its own directory named
+        after it, inside the workspace but outside any source location, are
+        considered (e.g. Build/Obj/Debug-Linux/<project>).
+        """
+        root = Path(workspaceRoot).resolve()
+        names = set(workspace.projects)
+        names.update(p.targetName for p in workspace.projects.values() if p.targetName)
+        protected: Set[Path] = {root}
+        for project in workspace.projects.values():
+            try:
+                protected.add(builder._GetProjectBaseDir(project))
+            except Exception:
+                pass
+
+        expected_dirs: Set[Path] = set()
+        for project in workspace.projects.values():
+            builder._ApplyProjectFilters(project)
+            expected_dirs.add(builder.GetObjectDir(project))
+            expected_dirs.add(builder.GetTargetDir(project))
+
+        containers: Dict[Path, Set[str]] = {}
+        for d in expected_dirs:
+            parent = d.parent
+            if root not in parent.parents:
+                continue
+            if any(parent == p or parent in p.parents for p in protected):
+                continue
+            containers.setdefault(parent, set()).add(d.name)
+
+        orphans: List[str] = []
+        for parent, children in containers.items():
+            if not children <= names or not parent.is_dir():
+                continue
+            for entry in parent.iterdir():
+                if not entry.is_dir() or entry.is_symlink() or entry.name.startswith('.'):
+                    continue
+                if entry.name in children or any(entry in d.parents for d in expected_dirs):
+                    continue
+                orphans.append(str(entry))
+        return sorted(orphans)
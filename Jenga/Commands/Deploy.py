@@ -13,6 +13,7 @@ from typing import List, Optional
 from ..Utils import Colored, Display, FileSystem, Process
 from ..Core.Loader import Loader
 from ..Core.Cache import Cache
+from ..Core.BuildSession import BuildSession
 from ..Core import Api
 
 
@@ -96,6 +97,7 @@ class DeployCommand:
                 Colored.PrintError("No .jenga workspace file found.")
                 return 1
         workspace_root = entry_file.parent
+        parsed.jenga_file = str(entry_file)
 
         loader    = Loader(verbose=parsed.verbose)
         cache     = Cache(workspace_root, workspaceName=entry_file.stem)
@@ -161,6 +163,21 @@ class DeployCommand:
         Colored.PrintError(f"Deploy for platform '{parsed.platform}' not implemented.")
         return 1
 
+    @staticmethod
+    def _BuildForDeploy(workspace, project, parsed, platform: str, extra: List[str],
+                        customOptions: Optional[dict] = None):
+        """
+        Build du projet puis builder de la même session : le workspace déjà
+        chargé et la toolchain détectée servent au build et à la recherche de
+        l'artefact. Retourne le builder, ou None si le build a échoué.
+        """
+        session = BuildSession(Path(parsed.jenga_file), parsed.config, platform, action="deploy",
+                               verbose=parsed.verbose, extraOptions=extra,
+                               customOptions=customOptions, workspace=workspace)
+        if session.Build(project.name) != 0:
+            return None
+        return session.GetBuilder(project.name)
+
     # =========================================================================
     # HarmonyOS — mode direct (--hap / --list-devices)
     # =========================================================================
@@ -452,34 +469,13 @@ class DeployCommand:
             return 1
 
         # ── Étape 1 : Build ───────────────────────────────────────────────────
-        from .Build import BuildCommand
-        build_args = [
-            "--config",   parsed.config,
-            "--action",   "deploy",
-            "--platform", "harmonyos-arm64",
-            "--target",   project.name,
-        ]
-        if parsed.jenga_file:
-            build_args += ["--jenga-file", parsed.jenga_file]
-        if BuildCommand.Execute(build_args) != 0:
+        builder = DeployCommand._BuildForDeploy(workspace, project, parsed, "harmonyos-arm64",
+                                                ["deploy:harmonyos"])
+        if builder is None:
             Colored.PrintError("Build failed, cannot deploy.")
             return 1
 
         # ── Étape 2 : Localiser le .hap ──────────────────────────────────────
-        builder = BuildCommand.CreateBuilder(
-            workspace, parsed.config, "harmonyos-arm64",
-            project.name, parsed.verbose,
-            action="deploy",
-            options=BuildCommand.CollectFilterOptions(
-                config      = parsed.config,
-                platform    = "harmonyos-arm64",
-                target      = project.name,
-                verbose     = parsed.verbose,
-                no_cache    = False,
-                no_daemon   = parsed.no_daemon,
-                extra       = ["action:deploy", "deploy:harmonyos"],
-            )
-        )
 
         target_dir = builder.GetTargetDir(project)
         hap_name   = f"{project.targetName or project.name}.hap"
@@ -632,24 +628,10 @@ class DeployCommand:
             Colored.PrintError("adb not found.")
             return 1
 
-        from .Build import BuildCommand
-        build_args = [
-            "--config", parsed.config, "--action", "deploy",
-            "--platform", "Android", "--target", project.name,
-        ]
-        if parsed.jenga_file:
-            build_args += ["--jenga-file", parsed.jenga_file]
-        if BuildCommand.Execute(build_args) != 0:
+        builder = DeployCommand._BuildForDeploy(workspace, project, parsed, "Android", ["deploy:android"])
+        if builder is None:
             return 1
 
-        builder = BuildCommand.CreateBuilder(
-            workspace, parsed.config, "Android", project.name, parsed.verbose,
-            action="deploy",
-            options=BuildCommand.CollectFilterOptions(
-                config=parsed.config, platform="Android", target=project.name,
-                verbose=parsed.verbose, no_cache=False, no_daemon=parsed.no_daemon,
-                extra=["action:deploy", "deploy:android"]))
-
         apk_path = builder.GetTargetDir(project) / f"{project.targetName or project.name}.apk"
         if not apk_path.exists():
             Colored.PrintError(f"APK not found: {apk_path}")
@@ -746,30 +728,12 @@ class DeployCommand:
             "watchos": "watchOS",
         }.get((apple_platform or "ios").lower(), "iOS")
 
-        from .Build import BuildCommand
-        build_args = [
-            "--config", parsed.config, "--action", "deploy",
-            "--platform", platform_token, "--target", project.name,
-        ]
-        if parsed.ios_builder:
-            build_args += [f"--ios-builder={parsed.ios_builder}"]
-        if parsed.jenga_file:
-            build_args += ["--jenga-file", parsed.jenga_file]
-        if BuildCommand.Execute(build_args) != 0:
+        custom_options = {"ios-builder": parsed.ios_builder} if parsed.ios_builder else None
+        builder = DeployCommand._BuildForDeploy(workspace, project, parsed, platform_token,
+                                                [f"deploy:{apple_platform.lower()}"], custom_options)
+        if builder is None:
             return 1
 
-        extra_options = ["action:deploy", f"deploy:{apple_platform.lower()}"]
-        if parsed.ios_builder:
-            extra_options.append(f"ios-builder={parsed.ios_builder}")
-
-        builder = BuildCommand.CreateBuilder(
-            workspace, parsed.config, platform_token, project.name, parsed.verbose,
-            action="deploy",
-            options=BuildCommand.CollectFilterOptions(
-                config=parsed.config, platform=platform_token, target=project.name,
-                verbose=parsed.verbose, no_cache=False, no_daemon=parsed.no_daemon,
-                extra=extra_options))
-
         app_bundle = builder.GetTargetDir(project) / f"{project.targetName or project.name}.app"
         if not app_bundle.exists():
             Colored.PrintError(f".app bundle not found: {app_bundle}")
@@ -821,24 +785,10 @@ class DeployCommand:
             Colored.PrintError("XboxBuilder not available.")
             return 1
 
-        from .Build import BuildCommand
-        build_args = [
-            "--config", parsed.config, "--action", "deploy",
-            "--platform", "Xbox", "--target", project.name,
-        ]
-        if parsed.jenga_file:
-            build_args += ["--jenga-file", parsed.jenga_file]
-        if BuildCommand.Execute(build_args) != 0:
+        builder = DeployCommand._BuildForDeploy(workspace, project, parsed, "Xbox", ["deploy:xbox"])
+        if builder is None:
             return 1
 
-        builder = BuildCommand.CreateBuilder(
-            workspace, parsed.config, "Xbox", project.name, parsed.verbose,
-            action="deploy",
-            options=BuildCommand.CollectFilterOptions(
-                config=parsed.config, platform="Xbox", target=project.name,
-                verbose=parsed.verbose, no_cache=False, no_daemon=parsed.no_daemon,
-                extra=["action:deploy", "deploy:xbox"]))
-
         layout_dir = builder.GetTargetDir(project) / builder.xbox_platform
         if not layout_dir.exists():
             Colored.PrintError("Xbox layout directory not found.")
@@ -853,24 +803,10 @@ class DeployCommand:
     @staticmethod
     def _DeployLinux(workspace, project, parsed) -> int:
         """Déploiement Linux (build + copie locale ou remote scp)."""
-        from .Build import BuildCommand
-        build_args = [
-            "--config", parsed.config, "--action", "deploy",
-            "--platform", "Linux", "--target", project.name,
-        ]
-        if parsed.jenga_file:
-            build_args += ["--jenga-file", parsed.jenga_file]
-        if BuildCommand.Execute(build_args) != 0:
+        builder = DeployCommand._BuildForDeploy(workspace, project, parsed, "Linux", ["deploy:linux"])
+        if builder is None:
             return 1
 
-        builder = BuildCommand.CreateBuilder(
-            workspace, parsed.config, "Linux", project.name, parsed.verbose,
-            action="deploy",
-            options=BuildCommand.CollectFilterOptions(
-                config=parsed.config, platform="Linux", target=project.name,
-                verbose=parsed.verbose, no_cache=False, no_daemon=parsed.no_daemon,
-                extra=["action:deploy", "deploy:linux"]))
-
         exe_path = builder.GetTargetPath(project)
         if not exe_path.exists():
             Colored.PrintError(f"Executable not found: {exe_path}")
@@ -902,24 +838,10 @@ class DeployCommand:
     @staticmethod
     def _DeployMacOS(workspace, project, parsed) -> int:
         """Déploiement macOS (copie locale)."""
-        from .Build import BuildCommand
-        build_args = [
-            "--config", parsed.config, "--action", "deploy",
-            "--platform", "macOS", "--target", project.name,
-        ]
-        if parsed.jenga_file:
-            build_args += ["--jenga-file", parsed.jenga_file]
-        if BuildCommand.Execute(build_args) != 0:
+        builder = DeployCommand._BuildForDeploy(workspace, project, parsed, "macOS", ["deploy:macos"])
+        if builder is None:
             return 1
 
-        builder = BuildCommand.CreateBuilder(
-            workspace, parsed.config, "macOS", project.name, parsed.verbose,
-            action="deploy",
-            options=BuildCommand.CollectFilterOptions(
-                config=parsed.config, platform="macOS", target=project.name,
-                verbose=parsed.verbose, no_cache=False, no_daemon=parsed.no_daemon,
-                extra=["action:deploy", "deploy:macos"]))
-
         app_bundle = builder.GetTargetDir(project) / f"{project.targetName or project.name}.app"
         if app_bundle.exists():
             Colored.PrintInfo(f"Application built at: {app_bundle}")
@@ -932,24 +854,10 @@ class DeployCommand:
     @staticmethod
     def _DeployWindows(workspace, project, parsed) -> int:
         """Déploiement Windows (copie locale)."""
-        from .Build import BuildCommand
-        build_args = [
-            "--config", parsed.config, "--action", "deploy",
-            "--platform", "Windows", "--target", project.name,
-        ]
-        if parsed.jenga_file:
-            build_args += ["--jenga-file", parsed.jenga_file]
-        if BuildCommand.Execute(build_args) != 0:
+        builder = DeployCommand._BuildForDeploy(workspace, project, parsed, "Windows", ["deploy:windows"])
+        if builder is None:
             return 1
 
-        builder = BuildCommand.CreateBuilder(
-            workspace, parsed.config, "Windows", project.name, parsed.verbose,
-            action="deploy",
-            options=BuildCommand.CollectFilterOptions(
-                config=parsed.config, platform="Windows", target=project.name,
-                verbose=parsed.verbose, no_cache=False, no_daemon=parsed.no_daemon,
-                extra=["action:deploy", "deploy:windows"]))
-
         exe_path = builder.GetTargetPath(project)
         if exe_path.exists():
             Colored.PrintInfo(f"Executable built at: {exe_path}")
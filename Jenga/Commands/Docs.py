@@ -5,9 +5,20 @@ Docs command – Génère la documentation des projets à partir des commentaire
 Analyse le code C++, extrait les signatures et les commentaires, produit des pages Markdown/HTML/PDF.
 Fonctionnalités complètes : extraction, statistiques, listing, nettoyage.
 Format supportés : markdown, html, pdf, all.
+
+L'extraction est parallèle (pool de processus, un lot de fichiers par
+tâche) et incrémentale : le résultat du parsing de chaque fichier est mis
+en cache sur disque (.jenga/docs_cache/<projet>.pickle) par hash de
+contenu ; seuls les fichiers modifiés sont re-parsés, et si aucun fichier
+n'a changé la documentation agrégée (index, liens, statistiques) est
+reprise telle quelle.
 """
 
 import argparse
+import concurrent.futures
+import hashlib
+import os
+import pickle
 import sys
 import re
 import io
@@ -33,6 +44,19 @@ if sys.stdout.encoding and sys.stdout.encoding.lower() not in ('utf-8', 'utf8'):
     except Exception:
         pass
 
+# Version du format du cache de parsing (à incrémenter si les parsers changent)
+_DOCS_CACHE_VERSION = 1
+
+# En dessous de ce nombre de fichiers à parser, le pool de processus coûte plus qu'il ne rapporte
+_PARALLEL_MIN_FILES = 32
+
+# Manifeste des pages générées (hash de contenu) pour les écritures incrémentales
+_PAGES_MANIFEST = ".pages.json"
+_PAGES_MANIFEST_VERSION = 1
+
+# Longueur des préfixes qui découpent l'index de recherche en fragments
+_SEARCH_PREFIX_LENGTH = 2
+
 # ============================================================================
 # TYPES D'ÉLÉMENTS C++
 # ============================================================================
@@ -188,11 +212,15 @@ class DocumentationExtractor:
     SUPPORTED_EXTENSIONS = {'.h', '.hpp', '.hxx', '.hh', '.cpp', '.cxx', '.cc', '.c', '.inl', '.ipp', '.tpp'}
     
     def __init__(self, project_name: str, project_path: Path, 
-                 include_private: bool = False, verbose: bool = False):
+                 include_private: bool = False, verbose: bool = False,
+                 jobs: int = 0, cache_file: Optional[Path] = None):
         self.project_name = project_name
         self.project_path = project_path
         self.include_private = include_private
         self.verbose = verbose
+        self.jobs = jobs                  # 0 = nombre de CPU, 1 = séquentiel
+        self.cache_file = cache_file      # None = pas de cache
+        self.parsed_count = 0             # fichiers re-parsés lors du dernier extract()
         
         # Parsers
         self.signature_parser = CppSignatureParser()
@@ -222,29 +250,66 @@ class DocumentationExtractor:
         if self.verbose:
             print(f"📁 Found {len(all_files)} source files")
         
-        # Parser chaque fichier
-        for i, file_path in enumerate(all_files):
-            if self.verbose:
-                print(f"  [{i+1}/{len(all_files)}] Processing {file_path.name}...", end='\r')
+        # Réutiliser les résultats en cache des fichiers inchangés
+        cache = self._load_cache()
+        entries = cache["files"]
+        digests: Dict[str, str] = {}
+        dirty = False
+        results: Dict[str, Optional[FileDocumentation]] = {}
+        to_parse: List[Path] = []
+        for file_path in all_files:
+            key = str(file_path)
+            entry = entries.get(key)
+            stamp, digest = self._file_stamp(file_path, entry)
+            digests[key] = digest
+            if entry is not None and entry[2] == digest:
+                if (entry[0], entry[1]) != stamp:
+                    entries[key] = (stamp[0], stamp[1], digest, entry[3])
+                    dirty = True      # touché sans changement de contenu
+                results[key] = entry[3]
+            else:
+                entries[key] = (stamp[0], stamp[1], digest, None)
+                to_parse.append(file_path)
+        
+        if self.verbose and self.cache_file:
+            print(f"♻️  {len(all_files) - len(to_parse)} cached, {len(to_parse)} to parse")
+        
+        # Parser les fichiers modifiés (en parallèle si assez nombreux)
+        for file_path, file_doc in zip(to_parse, self._parse_files(to_parse)):
+            key = str(file_path)
+            entries[key] = entries[key][:3] + (file_doc,)
+            results[key] = file_doc
+        self.parsed_count = len(to_parse)
+        for key in [k for k in entries if k not in results]:
+            del entries[key]          # fichiers supprimés
+            dirty = True
+        
+        # Aucun changement : reprendre la documentation agrégée
+        aggregate_key = hashlib.sha1(
+            "\n".join(f"{k}:{digests[k]}" for k in sorted(digests)).encode("utf-8")).hexdigest()
+        cached_aggregate = cache.get("aggregate")
+        if not to_parse and cached_aggregate and cached_aggregate[0] == aggregate_key:
+            self.project_doc = cached_aggregate[1]
+        else:
+            self.project_doc.files = [results[str(f)] for f in all_files
+                                      if results[str(f)] and results[str(f)].elements]
             
-            file_doc = self._parse_file(file_path)
-            if file_doc and file_doc.elements:
-                self.project_doc.files.append(file_doc)
-        
-        if self.verbose:
-            print()  # Nouvelle ligne après progression
-        
-        # Construire les index
-        self._build_indices()
-        
-        # Résoudre les liens inter-éléments
-        self._resolve_links()
-        
-        # Analyser les dépendances
-        self._analyze_dependencies()
-        
-        # Calculer les statistiques
-        self._calculate_stats()
+            # Construire les index
+            self._build_indices()
+            
+            # Résoudre les liens inter-éléments
+            self._resolve_links()
+            
+            # Analyser les dépendances
+            self._analyze_dependencies()
+            
+            # Calculer les statistiques
+            self._calculate_stats()
+            
+            cache["aggregate"] = (aggregate_key, self.project_doc)
+            dirty = True
+        if dirty or to_parse:
+            self._save_cache(cache)
         
         if self.verbose:
             print(f"✅ Extraction complete:")
@@ -254,7 +319,7 @@ class DocumentationExtractor:
         return self.project_doc
     
     def _collect_files(self, source_dirs: List[Path]) -> List[Path]:
-        """Collecte tous les fichiers sources"""
+        """Collecte tous les fichiers sources (un seul parcours par répertoire)"""
         files = []
         for source_dir in source_dirs:
             if not source_dir.exists():
@@ -262,12 +327,90 @@ class DocumentationExtractor:
                     print(f"⚠️  Warning: Directory does not exist: {source_dir}")
                 continue
             
-            for ext in self.SUPPORTED_EXTENSIONS:
-                files.extend(source_dir.rglob(f"*{ext}"))
+            for root, _dirs, names in os.walk(source_dir):
+                for name in names:
+                    if os.path.splitext(name)[1] in self.SUPPORTED_EXTENSIONS:
+                        files.append(Path(root) / name)
         
         # Trier pour avoir un ordre déterministe
         return sorted(set(files))
     
+    def _parse_files(self, paths: List[Path]) -> List[Optional[FileDocumentation]]:
+        """Parse des fichiers, dans l'ordre, sur un pool de processus si possible"""
+        jobs = self.jobs if self.jobs > 0 else (os.cpu_count() or 1)
+        if jobs > 1 and len(paths) >= _PARALLEL_MIN_FILES:
+            # Quelques lots par worker : équilibre la charge sans multiplier les échanges
+            batch_size = max(8, -(-len(paths) // (jobs * 4)))
+            batches = [paths[i:i + batch_size] for i in range(0, len(paths), batch_size)]
+            tasks = [(self.project_name, self.project_path, self.include_private, batch) for batch in batches]
+            try:
+                with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+                    results: List[Optional[FileDocumentation]] = []
+                    for batch_docs in pool.map(_parse_files_worker, tasks):
+                        results.extend(batch_docs)
+                        if self.verbose:
+                            print(f"  [{len(results)}/{len(paths)}] parsed", end='\r')
+                    if self.verbose:
+                        print()
+                    return results
+            except (OSError, concurrent.futures.process.BrokenProcessPool) as e:
+                if self.verbose:
+                    print(f"⚠️  Process pool unavailable ({e}), parsing sequentially")
+        
+        results = []
+        for i, file_path in enumerate(paths):
+            if self.verbose:
+                print(f"  [{i+1}/{len(paths)}] Processing {file_path.name}...", end='\r')
+            results.append(self._parse_file(file_path))
+        if self.verbose and paths:
+            print()  # Nouvelle ligne après progression
+        return results
+    
+    # ------------------------------------------------------------------------
+    # Cache de parsing
+    # ------------------------------------------------------------------------
+    
+    def _file_stamp(self, file_path: Path, entry) -> Tuple[Tuple[int, int], str]:
+        """(taille, mtime) et hash du contenu ; le hash n'est recalculé que si le stat a changé"""
+        try:
+            st = file_path.stat()
+        except OSError:
+            return (0, 0), ""
+        stamp = (st.st_size, st.st_mtime_ns)
+        if entry is not None and (entry[0], entry[1]) == stamp:
+            return stamp, entry[2]
+        try:
+            return stamp, hashlib.sha1(file_path.read_bytes()).hexdigest()
+        except OSError:
+            return stamp, ""
+    
+    def _load_cache(self) -> dict:
+        empty = {"version": _DOCS_CACHE_VERSION, "include_private": self.include_private, "files": {}}
+        if not self.cache_file or not self.cache_file.exists():
+            return empty
+        try:
+            with open(self.cache_file, "rb") as f:
+                cache = pickle.load(f)
+        except Exception:
+            return empty          # cache corrompu ou d'une autre version de Jenga
+        if (not isinstance(cache, dict) or cache.get("version") != _DOCS_CACHE_VERSION
+                or cache.get("include_private") != self.include_private):
+            return empty
+        return cache
+    
+    def _save_cache(self, cache: dict):
+        if not self.cache_file:
+            return
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.cache_file.with_suffix(".tmp")
+            with open(tmp, "wb") as f:
+                pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self.cache_file)
+        except OSError as e:
+            if self.verbose:
+                print(f"⚠️  Cannot write docs cache {self.cache_file}: {e}")
+    
     def _parse_file(self, file_path: Path) -> Optional[FileDocumentation]:
         """Parse un fichier source complet"""
         
@@ -574,6 +717,7 @@ class DocumentationExtractor:
         # Construire un index include -> fichier
         file_by_name = {}
         for file_doc in self.project_doc.files:
+            file_doc.included_by = []  # les FileDocumentation peuvent venir du cache
             file_by_name[file_doc.file_name] = file_doc
             file_by_name[file_doc.relative_path] = file_doc
         
@@ -645,6 +789,13 @@ class DocumentationExtractor:
         self.project_doc.stats = stats
 
 
+def _parse_files_worker(task) -> List[Optional[FileDocumentation]]:
+    """Worker du pool : parse un lot de fichiers et renvoie des FileDocumentation picklables"""
+    project_name, project_path, include_private, paths = task
+    extractor = DocumentationExtractor(project_name, project_path, include_private=include_private)
+    return [extractor._parse_file(path) for path in paths]
+
+
 # ============================================================================
 # PARSER C++ AVANCÉ
 # ============================================================================
@@ -1136,13 +1287,122 @@ def sanitize_filename(name: str) -> str:
     return name
 
 
+_WORD_RE = re.compile(r'[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+')
+
+
+def search_terms(element: DocComment) -> Set[str]:
+    """
+    Termes indexés pour un élément : nom, classe parente et namespace,
+    entiers et découpés (camelCase, snake_case), plus les mots du brief.
+    Tous en minuscules, limités à [a-z0-9_] (noms de fragments sûrs).
+    """
+    sig = element.signature
+    terms = set()
+    for text in (sig.name, sig.parent_class or "", sig.namespace or ""):
+        for part in re.split(r'[^A-Za-z0-9_]+', text):
+            if not part:
+                continue
+            terms.add(part.lower())
+            for word in _WORD_RE.findall(part):
+                terms.add(word.lower())
+    for word in re.findall(r'[A-Za-z0-9]{3,}', element.brief or ""):
+        terms.add(word.lower())
+    terms.discard("_")
+    return terms
+
+
 # ============================================================================
 # GÉNÉRATEUR MARKDOWN
 # ============================================================================
 
+# Page de recherche : charge search/index.json puis uniquement le ou les
+# fragments du préfixe saisi (servir le dossier en HTTP : fetch() est
+# bloqué sur file:// par la plupart des navigateurs).
+_SEARCH_HTML = """<!DOCTYPE html>
+<html lang="fr">
+<head>
+<meta charset="utf-8">
+<title>{{PROJECT}} - Recherche</title>
+<style>
+body { font-family: system-ui, sans-serif; max-width: 56rem; margin: 2rem auto; padding: 0 1rem; }
+input { width: 100%; font-size: 1.1rem; padding: .5rem; }
+li { margin: .3rem 0; }
+</style>
+</head>
+<body>
+<h1>🔍 {{PROJECT}}</h1>
+<p><a href="./index.md">🏠 Accueil</a> | <a href="./search.md">Index alphabétique</a></p>
+<input id="q" type="search" placeholder="Nom, namespace, mot du brief..." autofocus>
+<ul id="results"></ul>
+<script>
+(function () {
+  var manifest = null, shards = {}, MAX = 100;
+  function load(url) { return fetch(url).then(function (r) { return r.json(); }); }
+  function shard(prefix) {
+    if (!shards[prefix]) shards[prefix] = load("search/" + prefix + ".json");
+    return shards[prefix];
+  }
+  function lookup(word) {
+    var n = manifest.prefix_length, prefixes = Object.keys(manifest.shards).filter(function (p) {
+      return word.length >= n ? p === word.slice(0, n) : p.indexOf(word) === 0;
+    });
+    return Promise.all(prefixes.map(shard)).then(function (parts) {
+      var hits = {};
+      parts.forEach(function (s) {
+        Object.keys(s.terms).forEach(function (t) {
+          if (t.indexOf(word) === 0) s.terms[t].forEach(function (id) { hits[id] = s.docs[id]; });
+        });
+      });
+      return hits;
+    });
+  }
+  function search(text) {
+    var words = text.toLowerCase().split(/[^a-z0-9_]+/).filter(Boolean);
+    if (!words.length) return Promise.resolve([]);
+    return Promise.all(words.map(lookup)).then(function (sets) {
+      return Object.keys(sets[0]).filter(function (id) {
+        return sets.every(function (s) { return id in s; });
+      }).map(function (id) { return sets[0][id]; });
+    });
+  }
+  function render(docs) {
+    var ul = document.getElementById("results");
+    ul.innerHTML = "";
+    docs.slice(0, MAX).forEach(function (d) {
+      var li = document.createElement("li"), a = document.createElement("a");
+      a.href = d[3]; a.textContent = d[0];
+      li.appendChild(a);
+      li.appendChild(document.createTextNode(" " + d[1] + (d[2] ? " (" + d[2] + ")" : "") + (d[4] ? " — " + d[4] : "")));
+      ul.appendChild(li);
+    });
+  }
+  var input = document.getElementById("q");
+  load("search/index.json").then(function (m) {
+    manifest = m;
+    input.addEventListener("input", function () {
+      var text = input.value;
+      search(text).then(function (docs) { if (input.value === text) render(docs); });
+    });
+  });
+})();
+</script>
+</body>
+</html>
+"""
+
+
 class MarkdownGenerator:
-    """Générateur de documentation Markdown avec design moderne"""
-    
+    """
+    Générateur de documentation Markdown avec design moderne.
+
+    Les pages sont écrites seulement si leur contenu change : le hash de
+    chaque page générée est conservé dans <output>/.pages.json, ce qui
+    permet aussi de supprimer les pages devenues orphelines (fichier ou
+    namespace disparu). La recherche s'appuie sur un index inversé
+    découpé par préfixe (search/index.json + search/<préfixe>.json),
+    chargé à la demande par search.html.
+    """
+
     def __init__(self, project_doc: ProjectDocumentation):
         self.project_doc = project_doc
         self.output_dir = Path(".")
@@ -1158,25 +1418,98 @@ class MarkdownGenerator:
             ElementType.TYPEDEF: "📝",
             ElementType.NAMESPACE: "🗂️",
         }
-    
+        self.written: List[str] = []      # pages réécrites lors du dernier generate()
+        self.unchanged = 0                # pages identiques, non réécrites
+        self.removed: List[str] = []      # pages orphelines supprimées
+        self._pages: Dict[str, str] = {}
+        self._previous: Dict[str, str] = {}
+        self._file_names: Set[str] = set()
+        self._file_pages: Dict[str, str] = {}   # chemin source -> page files/
+
     def generate(self, output_dir: Path):
         self.output_dir = output_dir
         output_dir.mkdir(parents=True, exist_ok=True)
         print(f"📝 Generating Markdown documentation in: {output_dir}")
+        self.written, self.unchanged, self.removed = [], 0, []
+        self._pages = {}
+        self._previous = self._load_manifest()
+        self._file_names = {f.file_name for f in self.project_doc.files}
         self._generate_index()
         self._generate_by_files()
         self._generate_by_namespace()
         self._generate_by_type()
         self._generate_search()
+        self._generate_search_index()
         self._generate_api()
         self._generate_stats()
-        print(f"✅ Markdown generation complete!")
-    
+        self._remove_stale_pages()
+        self._save_manifest()
+        print(f"✅ Markdown generation complete! "
+              f"({len(self.written)} écrites, {self.unchanged} inchangées, {len(self.removed)} supprimées)")
+
+    # ------------------------------------------------------------------------
+    # Écritures incrémentales
+    # ------------------------------------------------------------------------
+
+    def _write_page(self, path: Path, content: str):
+        """Écrit la page si son contenu diffère de la dernière génération."""
+        data = content.encode('utf-8')
+        digest = hashlib.sha1(data).hexdigest()
+        rel = path.relative_to(self.output_dir).as_posix()
+        self._pages[rel] = digest
+        if self._previous.get(rel) == digest and path.is_file():
+            self.unchanged += 1
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        self.written.append(rel)
+
+    def _load_manifest(self) -> Dict[str, str]:
+        try:
+            data = json.loads((self.output_dir / _PAGES_MANIFEST).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get('version') != _PAGES_MANIFEST_VERSION:
+            return {}
+        return dict(data.get('pages', {}))
+
+    def _save_manifest(self):
+        if self._pages == self._previous and (self.output_dir / _PAGES_MANIFEST).is_file():
+            return
+        path = self.output_dir / _PAGES_MANIFEST
+        tmp = path.with_suffix('.tmp')
+        tmp.write_text(json.dumps({'version': _PAGES_MANIFEST_VERSION, 'pages': self._pages},
+                                  sort_keys=True), encoding='utf-8')
+        os.replace(tmp, path)
+
+    def _remove_stale_pages(self):
+        """Supprime les pages générées précédemment qui n'existent plus."""
+        for rel in sorted(set(self._previous) - set(self._pages)):
+            try:
+                (self.output_dir / rel).unlink()
+                self.removed.append(rel)
+            except FileNotFoundError:
+                pass
+
+    def _source_date(self) -> str:
+        """Date de la source la plus récente : stable tant que rien ne change."""
+        newest = 0.0
+        for file_doc in self.project_doc.files:
+            try:
+                newest = max(newest, os.stat(file_doc.file_path).st_mtime)
+            except OSError:
+                continue
+        return datetime.fromtimestamp(newest or time.time()).strftime('%Y-%m-%d %H:%M:%S')
+
+    # ------------------------------------------------------------------------
+    # Pages
+    # ------------------------------------------------------------------------
+
     def _generate_index(self):
         stats = self.project_doc.stats
         md = f"""# {self.project_doc.project_name} - Documentation API
 
-> 🚀 Généré le {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+> 🚀 Généré depuis les sources du {self._source_date()}
 
 ![Elements](https://img.shields.io/badge/Elements-{stats.get('total_elements', 0)}-blue)
 ![Files](https://img.shields.io/badge/Files-{stats.get('total_files', 0)}-green)
@@ -1199,7 +1532,7 @@ class MarkdownGenerator:
 - [📁 Par Fichier](./files/index.md) - Documentation organisée par fichier source
 - [🗂️ Par Namespace](./namespaces/index.md) - Navigation par espace de noms
 - [🎯 Par Type](./types/index.md) - Éléments groupés par type
-- [🔍 Recherche](./search.md) - Index alphabétique complet
+- [🔍 Recherche](./search.md) - Index alphabétique complet ([recherche instantanée](./search.html))
 - [🔧 API Complète](./api.md) - Vue d'ensemble de l'API
 - [📊 Statistiques](./stats.md) - Métriques détaillées
 
@@ -1213,13 +1546,13 @@ Cette documentation a été générée automatiquement depuis les commentaires D
 
 *Documentation générée avec ❤️ par Jenga Build System*
 """
-        (self.output_dir / "index.md").write_text(md, encoding='utf-8')
+        self._write_page(self.output_dir / "index.md", md)
         print(f"  ✓ index.md")
-    
+
     def _generate_by_files(self):
         files_dir = self.output_dir / "files"
         files_dir.mkdir(exist_ok=True)
-        md = f"""# 📁 Documentation par Fichier
+        md = [f"""# 📁 Documentation par Fichier
 
 > {len(self.project_doc.files)} fichiers documentés
 
@@ -1227,77 +1560,75 @@ Cette documentation a été générée automatiquement depuis les commentaires D
 
 ## Liste des Fichiers
 
-"""
+"""]
+        # Les pages sont nommées d'après le nom de fichier : en cas d'homonymes
+        # (include/a/util.h, include/b/util.h), seule la dernière est conservée,
+        # inutile de générer les autres.
+        pages = {}
         for file_doc in sorted(self.project_doc.files, key=lambda f: f.file_name):
             md_name = sanitize_filename(file_doc.file_name) + ".md"
-            md += f"- 📄 [{file_doc.file_name}](./{md_name}) ({len(file_doc.elements)} éléments)\n"
+            md.append(f"- 📄 [{file_doc.file_name}](./{md_name}) ({len(file_doc.elements)} éléments)\n")
+            pages[md_name] = file_doc
+        for file_doc in pages.values():
             self._generate_file_page(file_doc, files_dir)
-        (files_dir / "index.md").write_text(md, encoding='utf-8')
+        self._write_page(files_dir / "index.md", "".join(md))
         print(f"  ✓ files/ ({len(self.project_doc.files)} files)")
-    
+
     def _generate_file_page(self, file_doc: FileDocumentation, files_dir: Path):
         md_name = sanitize_filename(file_doc.file_name) + ".md"
-        md = f"""# 📄 {file_doc.file_name}
+        md = [f"""# 📄 {file_doc.file_name}
 
 [🏠 Accueil](../index.md) | [📁 Fichiers](./index.md)
 
 ## Informations
 
-"""
+"""]
         if file_doc.file_description:
-            md += f"**Description:** {file_doc.file_description}\n\n"
+            md.append(f"**Description:** {file_doc.file_description}\n\n")
         if file_doc.file_author:
-            md += f"**Auteur:** {file_doc.file_author}\n\n"
-        md += f"**Chemin:** `{file_doc.relative_path}`\n\n"
+            md.append(f"**Auteur:** {file_doc.file_author}\n\n")
+        md.append(f"**Chemin:** `{file_doc.relative_path}`\n\n")
         if file_doc.includes:
-            md += "### 📦 Fichiers Inclus\n\n"
+            md.append("### 📦 Fichiers Inclus\n\n")
             for inc in file_doc.includes:
                 inc_name = Path(inc).name
-                linked = False
-                for f in self.project_doc.files:
-                    if f.file_name == inc_name:
-                        inc_md = sanitize_filename(inc_name) + ".md"
-                        md += f"- [`{inc}`](./{inc_md})\n"
-                        linked = True
-                        break
-                if not linked:
-                    md += f"- `{inc}`\n"
-            md += "\n"
+                if inc_name in self._file_names:
+                    inc_md = sanitize_filename(inc_name) + ".md"
+                    md.append(f"- [`{inc}`](./{inc_md})\n")
+                else:
+                    md.append(f"- `{inc}`\n")
+            md.append("\n")
         if file_doc.included_by:
-            md += "### 🔗 Inclus Par\n\n"
+            md.append("### 🔗 Inclus Par\n\n")
             for inc_by in file_doc.included_by:
                 inc_name = Path(inc_by).name
                 inc_md = sanitize_filename(inc_name) + ".md"
-                md += f"- [`{inc_name}`](./{inc_md})\n"
-            md += "\n"
+                md.append(f"- [`{inc_name}`](./{inc_md})\n")
+            md.append("\n")
         if file_doc.namespaces:
-            md += "### 🗂️ Namespaces\n\n"
+            md.append("### 🗂️ Namespaces\n\n")
             for ns in file_doc.namespaces:
                 ns_md = ns.replace('::', '_') + ".md"
-                md += f"- [`{ns}`](../namespaces/{ns_md})\n"
-            md += "\n"
-        md += f"## 🎯 Éléments ({len(file_doc.elements)})\n\n"
+                md.append(f"- [`{ns}`](../namespaces/{ns_md})\n")
+            md.append("\n")
+        md.append(f"## 🎯 Éléments ({len(file_doc.elements)})\n\n")
         by_type = {}
         for elem in file_doc.elements:
-            t = elem.signature.element_type
-            if t not in by_type:
-                by_type[t] = []
-            by_type[t].append(elem)
+            by_type.setdefault(elem.signature.element_type, []).append(elem)
         for elem_type in sorted(by_type.keys(), key=lambda t: t.value):
             elements = by_type[elem_type]
             icon = self.type_icons.get(elem_type, "📌")
-            md += f"### {icon} {elem_type.value.capitalize()}s ({len(elements)})\n\n"
+            md.append(f"### {icon} {elem_type.value.capitalize()}s ({len(elements)})\n\n")
             for elem in sorted(elements, key=lambda e: e.signature.name):
-                md += self._format_element(elem, file_doc.file_name)
-                md += "\n---\n\n"
-        (files_dir / md_name).write_text(md, encoding='utf-8')
-    
+                md.append(self._format_element(elem, file_doc.file_name))
+                md.append("\n---\n\n")
+        self._write_page(files_dir / md_name, "".join(md))
+
     def _format_element(self, elem: DocComment, current_file: str = "") -> str:
         sig = elem.signature
         icon = self.type_icons.get(sig.element_type, "📌")
         elem_id = create_element_id(elem)
-        md = f'<a name="{elem_id}"></a>\n\n'
-        md += f"#### {icon} `{sig.name}`\n\n"
+        md = [f'<a name="{elem_id}"></a>\n\n', f"#### {icon} `{sig.name}`\n\n"]
         badges = []
         if sig.is_static:
             badges.append("`static`")
@@ -1312,51 +1643,51 @@ Cette documentation a été générée automatiquement depuis les commentaires D
         if sig.access != "public":
             badges.append(f"`{sig.access}`")
         if badges:
-            md += " ".join(badges) + "\n\n"
-        md += f"```cpp\n{sig.full_signature}\n```\n\n"
+            md.append(" ".join(badges) + "\n\n")
+        md.append(f"```cpp\n{sig.full_signature}\n```\n\n")
         if elem.brief:
-            md += f"**{elem.brief}**\n\n"
+            md.append(f"**{elem.brief}**\n\n")
         if elem.description:
-            md += f"{elem.description}\n\n"
+            md.append(f"{elem.description}\n\n")
         if sig.template_params:
-            md += "**Paramètres Template:**\n\n"
+            md.append("**Paramètres Template:**\n\n")
             for tp in sig.template_params:
-                md += f"- `{tp}`\n"
-            md += "\n"
+                md.append(f"- `{tp}`\n")
+            md.append("\n")
         if sig.parameters:
-            md += "**Paramètres:**\n\n"
-            md += "| Nom | Type | Description |\n"
-            md += "|-----|------|-------------|\n"
+            md.append("**Paramètres:**\n\n")
+            md.append("| Nom | Type | Description |\n")
+            md.append("|-----|------|-------------|\n")
             for param in sig.parameters:
                 desc = elem.param_docs.get(param.name, "")
                 direction = f"[{param.direction}] " if param.direction else ""
-                md += f"| `{param.name}` | `{param.type}` | {direction}{desc} |\n"
-            md += "\n"
+                md.append(f"| `{param.name}` | `{param.type}` | {direction}{desc} |\n")
+            md.append("\n")
         if elem.returns:
-            md += f"**Retour:** {elem.returns}\n\n"
+            md.append(f"**Retour:** {elem.returns}\n\n")
         if elem.examples:
-            md += "**Exemples:**\n\n"
-            for i, ex in enumerate(elem.examples, 1):
-                md += f"```cpp\n{ex}\n```\n\n"
+            md.append("**Exemples:**\n\n")
+            for ex in elem.examples:
+                md.append(f"```cpp\n{ex}\n```\n\n")
         for note in elem.notes:
-            md += f"> 📝 **Note:** {note}\n\n"
+            md.append(f"> 📝 **Note:** {note}\n\n")
         for warn in elem.warnings:
-            md += f"> ⚠️ **Attention:** {warn}\n\n"
+            md.append(f"> ⚠️ **Attention:** {warn}\n\n")
         if elem.see_also:
-            md += "**Voir Aussi:**\n\n"
+            md.append("**Voir Aussi:**\n\n")
             for see in elem.see_also:
                 if see in self.project_doc.by_name:
                     target = self.project_doc.by_name[see]
                     target_file = target.file_path
                     target_id = create_element_id(target)
                     if Path(target_file).name == current_file:
-                        md += f"- [`{see}`](#{target_id})\n"
+                        md.append(f"- [`{see}`](#{target_id})\n")
                     else:
                         target_md = sanitize_filename(Path(target_file).name) + ".md"
-                        md += f"- [`{see}`](./{target_md}#{target_id})\n"
+                        md.append(f"- [`{see}`](./{target_md}#{target_id})\n")
                 else:
-                    md += f"- `{see}`\n"
-            md += "\n"
+                    md.append(f"- `{see}`\n")
+            md.append("\n")
         meta = []
         if elem.since:
             meta.append(f"Depuis: {elem.since}")
@@ -1365,16 +1696,23 @@ Cette documentation a été générée automatiquement depuis les commentaires D
         if elem.thread_safety:
             meta.append(f"Thread-safety: {elem.thread_safety}")
         if meta:
-            md += "*" + " | ".join(meta) + "*\n\n"
+            md.append("*" + " | ".join(meta) + "*\n\n")
         if elem.deprecated:
-            md += f"> 🚫 **DÉPRÉCIÉ:** {elem.deprecated}\n\n"
-        md += f"*Défini dans: `{elem.file_path}:{elem.line_number}`*\n\n"
-        return md
-    
+            md.append(f"> 🚫 **DÉPRÉCIÉ:** {elem.deprecated}\n\n")
+        md.append(f"*Défini dans: `{elem.file_path}:{elem.line_number}`*\n\n")
+        return "".join(md)
+
+    def _element_link(self, elem: DocComment, prefix: str) -> str:
+        file_md = self._file_pages.get(elem.file_path)
+        if file_md is None:
+            file_md = sanitize_filename(Path(elem.file_path).name) + ".md"
+            self._file_pages[elem.file_path] = file_md
+        return f"{prefix}files/{file_md}#{create_element_id(elem)}"
+
     def _generate_by_namespace(self):
         ns_dir = self.output_dir / "namespaces"
         ns_dir.mkdir(exist_ok=True)
-        md = f"""# 🗂️ Documentation par Namespace
+        md = [f"""# 🗂️ Documentation par Namespace
 
 > {len(self.project_doc.by_namespace)} namespaces
 
@@ -1382,20 +1720,20 @@ Cette documentation a été générée automatiquement depuis les commentaires D
 
 ## Liste
 
-"""
+"""]
         for ns in sorted(self.project_doc.by_namespace.keys()):
             elements = self.project_doc.by_namespace[ns]
             ns_display = "Global" if ns == "__global__" else ns
             ns_md = sanitize_filename(ns) + ".md"
-            md += f"- 🗂️ [`{ns_display}`](./{ns_md}) ({len(elements)} éléments)\n"
+            md.append(f"- 🗂️ [`{ns_display}`](./{ns_md}) ({len(elements)} éléments)\n")
             self._generate_namespace_page(ns, elements, ns_dir)
-        (ns_dir / "index.md").write_text(md, encoding='utf-8')
+        self._write_page(ns_dir / "index.md", "".join(md))
         print(f"  ✓ namespaces/ ({len(self.project_doc.by_namespace)} namespaces)")
-    
+
     def _generate_namespace_page(self, ns: str, elements: List[DocComment], ns_dir: Path):
         ns_display = "Global" if ns == "__global__" else ns
         ns_md = sanitize_filename(ns) + ".md"
-        md = f"""# 🗂️ Namespace `{ns_display}`
+        md = [f"""# 🗂️ Namespace `{ns_display}`
 
 > {len(elements)} éléments
 
@@ -1403,38 +1741,32 @@ Cette documentation a été générée automatiquement depuis les commentaires D
 
 ## Éléments
 
-"""
+"""]
         by_type = {}
         for elem in elements:
-            t = elem.signature.element_type
-            if t not in by_type:
-                by_type[t] = []
-            by_type[t].append(elem)
+            by_type.setdefault(elem.signature.element_type, []).append(elem)
         for elem_type in sorted(by_type.keys(), key=lambda t: t.value):
             elems = by_type[elem_type]
             icon = self.type_icons.get(elem_type, "📌")
-            md += f"### {icon} {elem_type.value.capitalize()}s ({len(elems)})\n\n"
+            md.append(f"### {icon} {elem_type.value.capitalize()}s ({len(elems)})\n\n")
             for elem in sorted(elems, key=lambda e: e.signature.name):
-                file_name = Path(elem.file_path).name
-                file_md = sanitize_filename(file_name) + ".md"
-                elem_id = create_element_id(elem)
-                md += f"- **[`{elem.signature.name}`](../files/{file_md}#{elem_id})**"
+                md.append(f"- **[`{elem.signature.name}`]({self._element_link(elem, '../')})**")
                 if elem.brief:
-                    md += f" — {elem.brief}"
-                md += "\n"
-            md += "\n"
-        (ns_dir / ns_md).write_text(md, encoding='utf-8')
-    
+                    md.append(f" — {elem.brief}")
+                md.append("\n")
+            md.append("\n")
+        self._write_page(ns_dir / ns_md, "".join(md))
+
     def _generate_by_type(self):
         types_dir = self.output_dir / "types"
         types_dir.mkdir(exist_ok=True)
-        md = """# 🎯 Documentation par Type
+        md = ["""# 🎯 Documentation par Type
 
 [🏠 Accueil](../index.md)
 
 ## Types
 
-"""
+"""]
         type_lists = [
             (ElementType.CLASS, self.project_doc.classes),
             (ElementType.STRUCT, self.project_doc.structs),
@@ -1451,15 +1783,15 @@ Cette documentation a été générée automatiquement depuis les commentaires D
                 continue
             icon = self.type_icons.get(elem_type, "📌")
             type_md = elem_type.value + "s.md"
-            md += f"- {icon} [{elem_type.value.capitalize()}s](./{type_md}) ({len(elements)} éléments)\n"
+            md.append(f"- {icon} [{elem_type.value.capitalize()}s](./{type_md}) ({len(elements)} éléments)\n")
             self._generate_type_page(elem_type, elements, types_dir)
-        (types_dir / "index.md").write_text(md, encoding='utf-8')
+        self._write_page(types_dir / "index.md", "".join(md))
         print(f"  ✓ types/ (9 types)")
-    
+
     def _generate_type_page(self, elem_type: ElementType, elements: List[DocComment], types_dir: Path):
         icon = self.type_icons.get(elem_type, "📌")
         type_md = elem_type.value + "s.md"
-        md = f"""# {icon} {elem_type.value.capitalize()}s
+        md = [f"""# {icon} {elem_type.value.capitalize()}s
 
 > {len(elements)} éléments
 
@@ -1467,60 +1799,101 @@ Cette documentation a été générée automatiquement depuis les commentaires D
 
 ## Liste
 
-"""
+"""]
         for elem in sorted(elements, key=lambda e: e.signature.name):
-            file_name = Path(elem.file_path).name
-            file_md = sanitize_filename(file_name) + ".md"
-            elem_id = create_element_id(elem)
-            md += f"- **[`{elem.signature.name}`](../files/{file_md}#{elem_id})**"
+            md.append(f"- **[`{elem.signature.name}`]({self._element_link(elem, '../')})**")
             ns = elem.signature.namespace or "__global__"
             if ns != "__global__":
-                md += f" (`{ns}`)"
+                md.append(f" (`{ns}`)")
             if elem.brief:
-                md += f" — {elem.brief}"
-            md += "\n"
-        (types_dir / type_md).write_text(md, encoding='utf-8')
-    
-    def _generate_search(self):
+                md.append(f" — {elem.brief}")
+            md.append("\n")
+        self._write_page(types_dir / type_md, "".join(md))
+
+    def _all_elements(self) -> List[DocComment]:
         all_elements = []
         for file_doc in self.project_doc.files:
             all_elements.extend(file_doc.elements)
-        md = f"""# 🔍 Recherche Alphabétique
+        return all_elements
+
+    def _generate_search(self):
+        all_elements = self._all_elements()
+        md = [f"""# 🔍 Recherche Alphabétique
 
 > {len(all_elements)} éléments
 
-[🏠 Accueil](./index.md)
+[🏠 Accueil](./index.md) | [⚡ Recherche instantanée](./search.html)
 
 ## Index
 
-"""
+"""]
         by_letter = {}
         for elem in all_elements:
-            letter = elem.signature.name[0].upper()
-            if letter not in by_letter:
-                by_letter[letter] = []
-            by_letter[letter].append(elem)
+            by_letter.setdefault(elem.signature.name[0].upper(), []).append(elem)
         for letter in sorted(by_letter.keys()):
-            md += f"[{letter}](#{letter.lower()}) "
-        md += "\n\n---\n\n"
+            md.append(f"[{letter}](#{letter.lower()}) ")
+        md.append("\n\n---\n\n")
         for letter in sorted(by_letter.keys()):
-            md += f'<a name="{letter.lower()}"></a>\n\n'
-            md += f"## {letter}\n\n"
+            md.append(f'<a name="{letter.lower()}"></a>\n\n')
+            md.append(f"## {letter}\n\n")
             for elem in sorted(by_letter[letter], key=lambda e: e.signature.name.lower()):
-                file_name = Path(elem.file_path).name
-                file_md = sanitize_filename(file_name) + ".md"
-                elem_id = create_element_id(elem)
                 icon = self.type_icons.get(elem.signature.element_type, "📌")
-                md += f"- {icon} **[`{elem.signature.name}`](./files/{file_md}#{elem_id})**"
+                md.append(f"- {icon} **[`{elem.signature.name}`]({self._element_link(elem, './')})**")
                 if elem.brief:
-                    md += f" — {elem.brief}"
-                md += "\n"
-            md += "\n"
-        (self.output_dir / "search.md").write_text(md, encoding='utf-8')
+                    md.append(f" — {elem.brief}")
+                md.append("\n")
+            md.append("\n")
+        self._write_page(self.output_dir / "search.md", "".join(md))
         print(f"  ✓ search.md")
-    
+
+    def _generate_search_index(self):
+        """
+        Index inversé terme -> éléments, découpé en fragments par préfixe de
+        _SEARCH_PREFIX_LENGTH caractères. Chaque fragment contient les
+        éléments qu'il référence : une recherche ne charge que
+        search/index.json puis un seul fragment. Un fragment n'est réécrit
+        que si l'un de ses termes ou éléments change : l'identifiant d'un
+        élément est un hash court de son lien (et de son rang parmi les
+        surcharges de même lien), pas sa position dans la liste.
+        """
+        search_dir = self.output_dir / "search"
+        docs: Dict[str, list] = {}
+        shards: Dict[str, Dict[str, List[str]]] = {}
+        seen_links: Dict[str, int] = {}
+        elements = sorted(self._all_elements(),
+                          key=lambda e: (e.signature.name.lower(), e.file_path, e.line_number))
+        for elem in elements:
+            sig = elem.signature
+            link = self._element_link(elem, "")
+            rank = seen_links.get(link, 0)
+            seen_links[link] = rank + 1
+            doc_id = hashlib.sha1(f"{link}|{rank}".encode("utf-8")).hexdigest()[:10]
+            docs[doc_id] = [sig.name, sig.element_type.value, sig.namespace or "", link, elem.brief or ""]
+            for term in search_terms(elem):
+                prefix = term[:_SEARCH_PREFIX_LENGTH]
+                postings = shards.setdefault(prefix, {}).setdefault(term, [])
+                if not postings or postings[-1] != doc_id:
+                    postings.append(doc_id)
+        manifest = {}
+        for prefix in sorted(shards):
+            terms = shards[prefix]
+            ids = sorted({i for postings in terms.values() for i in postings})
+            shard = {
+                "terms": {term: postings for term, postings in sorted(terms.items())},
+                "docs": {i: docs[i] for i in ids},
+            }
+            self._write_page(search_dir / f"{prefix}.json",
+                             json.dumps(shard, ensure_ascii=False, separators=(',', ':'), sort_keys=True))
+            manifest[prefix] = len(terms)
+        index = {"version": 1, "prefix_length": _SEARCH_PREFIX_LENGTH,
+                 "documents": len(docs), "shards": manifest}
+        self._write_page(search_dir / "index.json", json.dumps(index, separators=(',', ':'), sort_keys=True))
+        self._write_page(self.output_dir / "search.html",
+                         _SEARCH_HTML.replace("{{PROJECT}}", self.project_doc.project_name))
+        print(f"  ✓ search/ ({len(manifest)} fragments, {len(docs)} éléments)")
+
     def _generate_api(self):
-        md = f"""# 🔧 API Complète
+        md = [f"""# 🔧 API Complète
 
 [🏠 Accueil](./index.md)
 
@@ -1528,8 +1901,7 @@ Cette documentation a été générée automatiquement depuis les commentaires D
 
 Documentation complète de l'API du projet {self.project_doc.project_name}.
 
-"""
-        md += "## Par Type\n\n"
+""", "## Par Type\n\n"]
         type_lists = [
             (ElementType.CLASS, self.project_doc.classes),
             (ElementType.STRUCT, self.project_doc.structs),
@@ -1542,10 +1914,10 @@ Documentation complète de l'API du projet {self.project_doc.project_name}.
                 continue
             icon = self.type_icons.get(elem_type, "📌")
             type_md = elem_type.value + "s.md"
-            md += f"- {icon} [{elem_type.value.capitalize()}s](./types/{type_md}) ({len(elements)})\n"
-        (self.output_dir / "api.md").write_text(md, encoding='utf-8')
+            md.append(f"- {icon} [{elem_type.value.capitalize()}s](./types/{type_md}) ({len(elements)})\n")
+        self._write_page(self.output_dir / "api.md", "".join(md))
         print(f"  ✓ api.md")
-    
+
     def _generate_stats(self):
         stats = self.project_doc.stats
         md = f"""# 📊 Statistiques Détaillées
@@ -1582,7 +1954,7 @@ Documentation complète de l'API du projet {self.project_doc.project_name}.
 - **Paramètres moyens par fonction:** {stats.get('avg_params_per_function', 0):.1f}
 
 """
-        (self.output_dir / "stats.md").write_text(md, encoding='utf-8')
+        self._write_page(self.output_dir / "stats.md", md)
         print(f"  ✓ stats.md")
 
 # ============================================================================
@@ -1615,6 +1987,7 @@ Exemples:
   jenga docs extract --project NKCore         # Projet spécifique
   jenga docs extract --format markdown        # Format spécifique
   jenga docs extract --include-private        # Inclure membres privés
+  jenga docs extract --jobs 8 --no-cache      # Tout re-parser sur 8 processus
   jenga docs stats                            # Statistiques
   jenga docs list                             # Lister projets
   jenga docs clean                            # Nettoyer documentation
@@ -1637,6 +2010,8 @@ Formats supportés:
         extract_parser.add_argument('--include-private', action='store_true', help='Inclure les membres privés/protégés')
         extract_parser.add_argument('--exclude-projects', nargs='+', help='Projets à exclure')
         extract_parser.add_argument('--exclude-dirs', nargs='+', help='Répertoires à exclure (ex: tests, vendor)')
+        extract_parser.add_argument('--jobs', '-j', type=int, default=0, help='Processus de parsing (0 = nombre de CPU, 1 = séquentiel)')
+        extract_parser.add_argument('--no-cache', action='store_true', help='Re-parser tous les fichiers (ignorer le cache)')
         extract_parser.add_argument('--verbose', action='store_true', help='Affichage détaillé')
         
         # --- Stats ---
@@ -1794,7 +2169,9 @@ Formats supportés:
                 project_name=name,
                 project_path=workspace_dir / Path(project.location),
                 include_private=args.include_private,
-                verbose=args.verbose
+                verbose=args.verbose,
+                jobs=args.jobs,
+                cache_file=None if args.no_cache else workspace_dir / ".jenga" / "docs_cache" / f"{name}.pickle"
             )
             
             doc = extractor.extract(sources)
@@ -1811,7 +2188,7 @@ Formats supportés:
             
             # TODO: HTML, PDF generators
             
-            Display.Success(f"  ✓ {doc.stats['total_files']} fichiers")
+            Display.Success(f"  ✓ {doc.stats['total_files']} fichiers ({extractor.parsed_count} analysés)")
             Display.Success(f"  ✓ {doc.stats['total_elements']} éléments")
             
             return {'files': doc.stats['total_files'], 'elements': doc.stats['total_elements']}
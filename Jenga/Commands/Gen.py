@@ -2,10 +2,14 @@
 # -*- coding: utf-8 -*-
 """
 Gen command – Génère des fichiers projet pour différents outils de build.
-Support : CMake, Makefile, MK, Android NDK MK, Visual Studio 2022, Xcode.
+Support : CMake, Makefile, MK, Ninja, compile_commands.json, Android NDK MK, Visual Studio 2022, Xcode.
 """
 
 import argparse
+import os
+import shlex
+import subprocess
+import sys
 import uuid
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -13,13 +17,14 @@ from typing import Any, Dict, List, Optional, Tuple
 from ..Core.Loader import Loader
 from ..Core.Cache import Cache
 from ..Core.Builder import Builder
+from ..Core.BuildSession import BuildSession
 from ..Core.Platform import Platform
-from ..Utils import FileSystem, Colored
+from ..Utils import FileSystem, Colored, Process
 from ..Core import Api
 
 
 class GenCommand:
-    """jenga gen [--cmake] [--makefile] [--vs2022] [--xcode] [--output DIR] [--no-cache]"""
+    """jenga gen [--cmake] [--makefile] [--ninja] [--compdb] [--vs2022] [--xcode] [--output DIR] [--no-cache]"""
 
     @staticmethod
     def Execute(args: List[str]) -> int:
@@ -28,6 +33,11 @@ class GenCommand:
         parser.add_argument("--cmake", action="store_true", help="Generate CMakeLists.txt")
         parser.add_argument("--makefile", action="store_true", help="Generate Makefile")
         parser.add_argument("--mk", action="store_true", help="Generate workspace.mk include file")
+        parser.add_argument("--ninja", action="store_true",
+                            help="Generate a native build.ninja (per-file compile edges; needs a toolchain)")
+        parser.add_argument("--link-jobs", type=int, default=0, help="Ninja link pool depth (default: jobs / 4)")
+        parser.add_argument("--compdb", action="store_true",
+                            help="Generate/update compile_commands.json (exact builder commands; needs a toolchain)")
         parser.add_argument("--android-mk", action="store_true", help="Generate Android.mk/Application.mk")
         parser.add_argument("--vs2022", action="store_true", help="Generate Visual Studio 2022 solution")
         parser.add_argument("--xcode", action="store_true", help="Generate Xcode project (.xcodeproj)")
@@ -41,8 +51,10 @@ class GenCommand:
         if parsed.all:
             parsed.cmake = parsed.makefile = parsed.mk = parsed.android_mk = parsed.vs2022 = parsed.xcode = True
 
-        if not (parsed.cmake or parsed.makefile or parsed.mk or parsed.android_mk or parsed.vs2022 or parsed.xcode):
-            Colored.PrintError("No generator specified. Use --cmake, --makefile, --mk, --android-mk, --vs2022 or --xcode.")
+        if not (parsed.cmake or parsed.makefile or parsed.mk or parsed.ninja or parsed.compdb
+                or parsed.android_mk or parsed.vs2022 or parsed.xcode):
+            Colored.PrintError("No generator specified. Use --cmake, --makefile, --mk, --ninja, --compdb, "
+                               "--android-mk, --vs2022 or --xcode.")
             return 1
 
         # Déterminer le répertoire de travail (workspace root)
@@ -138,6 +150,16 @@ class GenCommand:
         if parsed.mk:
             builder = _build_gen_context("gen-mk", "mk")
             GenCommand._GenerateMk(workspace, output_dir, builder, entry_file)
+        if parsed.ninja:
+            if not GenCommand._RunNinjaGenerator(workspace, output_dir, entry_file, parsed, context_platform,
+                                                 custom_option_values, unknown_args):
+                return 1
+        if parsed.compdb:
+            builder = GenCommand._CreateToolchainBuilder(workspace, parsed, context_platform,
+                                                         custom_option_values, "compdb")
+            if builder is None or not BuildCommand.WriteCompilationDatabase(
+                    builder, None, output_dir / "compile_commands.json"):
+                return 1
         if parsed.android_mk:
             builder = _build_gen_context("gen-android-mk", "android-mk", platform_override=android_context_platform)
             GenCommand._GenerateAndroidMk(workspace, output_dir, builder)
@@ -150,6 +172,45 @@ class GenCommand:
 
         return 0
 
+    @staticmethod
+    def _RunNinjaGenerator(workspace, output_dir: Path, entry_file: Path, parsed, platform: str,
+                           custom_option_values, custom_args: List[str]) -> bool:
+        """Ninja a besoin des vraies commandes : builder complet (toolchain résolue)."""
+        builder = GenCommand._CreateToolchainBuilder(workspace, parsed, platform, custom_option_values, "ninja")
+        if builder is None:
+            return False
+        quote = subprocess.list2cmdline if os.name == "nt" else shlex.join
+        jenga_cmd = "jenga" if Process.Which("jenga") else quote([sys.executable, "-m", "Jenga.Jenga"])
+        context_args = ["--config", quote([parsed.config]), "--platform", quote([platform]),
+                        "--jenga-file", quote([str(entry_file)])]
+        context_args += [quote([a]) for a in custom_args]
+        if parsed.link_jobs:
+            context_args += ["--link-jobs", str(parsed.link_jobs)]
+        return GenCommand._GenerateNinja(workspace, output_dir, builder, entry_file, jenga_cmd,
+                                         context_args, parsed.link_jobs)
+
+    @staticmethod
+    def _CreateToolchainBuilder(workspace, parsed, platform: str, custom_option_values,
+                                generator_token: str) -> Optional[Builder]:
+        """Builder de build réel (action "build") pour les générateurs qui rejouent ses commandes."""
+        from .Build import BuildCommand
+        opts = BuildCommand.CollectFilterOptions(
+            config=parsed.config,
+            platform=platform,
+            target=None,
+            verbose=False,
+            no_cache=parsed.no_cache,
+            no_daemon=True,
+            extra=[f"generator:{generator_token}"],
+            custom_option_values=custom_option_values
+        )
+        try:
+            return BuildCommand.CreateBuilder(workspace, config=parsed.config, platform=platform,
+                                              target=None, verbose=False, action="build", options=opts)
+        except Exception as e:
+            Colored.PrintError(f"'{generator_token}' generation needs a usable toolchain for {platform}: {e}")
+            return None
+
     @staticmethod
     def _ApplyGenerationFilters(workspace, builder: Builder) -> None:
         """Materialize project filters for the generation action/context."""
@@ -556,6 +617,212 @@ class GenCommand:
 
         Colored.PrintSuccess(f"MK include generated: {mk_path}")
 
+    # -----------------------------------------------------------------------
+    # Générateur Ninja (graphe natif : une arête par unité de compilation)
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def _GenerateNinja(workspace, output_dir: Path, builder: Builder, entry_file: Path,
+                       jenga_cmd: str, context_args: List[str], link_jobs: int = 0) -> bool:
+        """
+        Génère build.ninja à partir du BuildPlan : arêtes de compilation par
+        fichier source avec les commandes exactes du builder, dépendances
+        d'en-têtes via depfile (deps = gcc) ou /showIncludes (deps = msvc),
+        PCH, link dans un pool dédié, copies des DLL/.so et règle de
+        régénération sur les fichiers .jenga.
+        jenga_cmd : commande qui lance jenga ; context_args : --config,
+        --platform, --jenga-file et options (repris par la régénération).
+        """
+        from ..Core.BuildPlan import BuildPlanner
+        try:
+            plans = BuildPlanner(builder).Plan()
+        except RuntimeError as e:
+            Colored.PrintError(f"Ninja generation failed: {e}")
+            return False
+        if plans is None:
+            return False
+
+        windows = os.name == "nt"
+        quote = subprocess.list2cmdline if windows else shlex.join
+        rules: Dict[str, Dict[str, str]] = {}
+        templates: Dict[Tuple[str, str], str] = {}
+        lines: List[str] = []
+        esc = GenCommand._NinjaEscapePath
+
+        def rule_for(prefix: str, command: str, extra: Dict[str, str]) -> str:
+            key = (prefix, command)
+            if key not in templates:
+                name = prefix if prefix not in rules else f"{prefix}_{len(rules)}"
+                templates[key] = name
+                rules[name] = {"command": command, **extra}
+            return templates[key]
+
+        all_targets: List[str] = []
+        project_outputs: Dict[str, List[str]] = {}
+        for plan in plans:
+            token = GenCommand._NinjaIdentifier(plan.name)
+            outputs: List[str] = []
+            if plan.moduleSources:
+                # Modules C++20 : l'ordre des BMI demande un scan (dyndep) que
+                # le plan ne décrit pas encore -> le projet est délégué à jenga.
+                Colored.PrintWarning(f"{plan.name}: C++20 modules are built through 'jenga build' in build.ninja")
+                cmd = " ".join([jenga_cmd, "build", "--target", quote([plan.name])] + context_args)
+                name = rule_for(f"jenga_{token}", cmd.replace("$", "$$"),
+                                {"description": f"JENGA {plan.name}", "pool": "console"})
+                line = f"build {token}_jenga: {name}"
+                order_only = [d for dep in plan.dependsOn for d in project_outputs.get(dep, [])]
+                if order_only:
+                    line += " || " + " ".join(map(esc, order_only))
+                lines.append(line)
+                project_outputs[plan.name] = [f"{token}_jenga"]
+                all_targets.append(token)
+                lines.append(f"build {token}: phony {token}_jenga\n")
+                continue
+            if plan.preBuildCommands or plan.postBuildCommands:
+                Colored.PrintWarning(f"{plan.name}: prebuild/postbuild commands are not part of build.ninja")
+
+            pch_deps: List[str] = []
+            if plan.pch:
+                cmd = GenCommand._NinjaCommand(plan.pch.commands, {plan.pch.output: "$out"}, windows)
+                name = rule_for(f"pch_{token}", cmd, {"description": f"PCH {Path(plan.pch.output).name}"})
+                lines.append(f"build {esc(plan.pch.output)}: {name} {' '.join(map(esc, plan.pch.inputs))}")
+                pch_deps.append(plan.pch.output)
+
+            for step in plan.compiles:
+                subst = {step.inputs[0]: "$in", step.output: "$out"}
+                extra = {"description": "CC $out"}
+                if step.depfile:
+                    subst[step.depfile] = "$dep_file"
+                    extra.update({"depfile": "$dep_file", "deps": "gcc"})
+                cmd = GenCommand._NinjaCommand(step.commands, subst, windows)
+                if not step.depfile and GenCommand._IsMsvcLike(step.commands):
+                    cmd = GenCommand._NinjaCommand(step.commands, subst, windows, ["/showIncludes"])
+                    extra["deps"] = "msvc"
+                name = rule_for(f"cc_{token}", cmd, extra)
+                line = f"build {esc(step.output)}: {name} {esc(step.inputs[0])}"
+                if pch_deps:
+                    line += " | " + " ".join(map(esc, pch_deps))
+                lines.append(line)
+                if step.depfile:
+                    lines.append(f"  dep_file = {step.depfile.replace('$', '$$')}")
+                outputs.append(step.output)
+
+            if plan.link:
+                subst = {plan.link.output: "$out"}
+                subst.update({obj: "$in" for obj in plan.link.inputs})
+                cmd = GenCommand._NinjaCommand(plan.link.commands, subst, windows)
+                kind = "AR" if plan.kind == Api.ProjectKind.STATIC_LIB else "LINK"
+                name = rule_for(f"link_{token}", cmd, {"description": f"{kind} $out", "pool": "link_pool"})
+                line = f"build {esc(plan.link.output)}: {name} {' '.join(map(esc, plan.link.inputs))}"
+                implicit = [d for d in plan.linkDependencies if plan.kind != Api.ProjectKind.STATIC_LIB]
+                if implicit:
+                    line += " | " + " ".join(map(esc, implicit))
+                order_only = [d for dep in plan.dependsOn for d in project_outputs.get(dep, [])
+                              if d not in implicit]
+                if order_only:
+                    line += " || " + " ".join(map(esc, order_only))
+                lines.append(line)
+                outputs = [plan.link.output]
+                for src, dst in plan.runtimeCopies:
+                    lines.append(f"build {esc(dst)}: copy {esc(src)}")
+                    outputs.append(dst)
+
+            project_outputs[plan.name] = outputs
+            all_targets.append(token)
+            lines.append(f"build {token}: phony {' '.join(map(esc, outputs))}\n")
+
+        jenga_files = BuildSession.CollectJengaFiles(workspace, entry_file)
+        regen_cmd = " ".join([jenga_cmd, "gen", "--ninja", "--output", quote([str(output_dir)])] + context_args)
+        jobs = link_jobs if link_jobs > 0 else max(1, builder._GetEffectiveJobs() // 4)
+        copy_cmd = "cmd /c copy /Y $in $out >NUL" if windows else "cp -f $in $out"
+        header = [
+            "# build.ninja generated by Jenga - do not edit (regenerated when .jenga files change)",
+            f"# workspace: {workspace.name}  config: {builder.config}  platform: {builder.platform}",
+            "",
+            "ninja_required_version = 1.3",
+            "",
+            "pool link_pool",
+            f"  depth = {jobs}",
+            "",
+            "rule regen",
+            f"  command = {regen_cmd.replace('$', '$$')}",
+            "  description = Regenerating build.ninja",
+            "  generator = 1",
+            "",
+            "rule copy",
+            f"  command = {copy_cmd}",
+            "  description = COPY $out",
+            "",
+        ]
+        for name, variables in rules.items():
+            header.append(f"rule {name}")
+            header.extend(f"  {key} = {value}" for key, value in variables.items())
+            header.append("")
+        footer = [
+            f"build build.ninja: regen {' '.join(map(esc, jenga_files))}",
+            "",
+            f"build all: phony {' '.join(all_targets)}",
+        ]
+        default = GenCommand._NinjaIdentifier(workspace.startProject) if workspace.startProject else ""
+        footer.append(f"default {default if default in all_targets else 'all'}")
+
+        ninja_path = output_dir / "build.ninja"
+        ninja_path.write_text("\n".join(header + lines + footer) + "\n", encoding="utf-8")
+        Colored.PrintSuccess(f"build.ninja generated: {ninja_path} "
+                             f"({sum(len(p.compiles) for p in plans)} compile edges, {len(plans)} projects)")
+        return True
+
+    @staticmethod
+    def _NinjaEscapePath(path: str) -> str:
+        return str(path).replace("$", "$$").replace(" ", "$ ").replace(":", "$:")
+
+    @staticmethod
+    def _NinjaIdentifier(name: str) -> str:
+        return "".join(c if c.isalnum() or c in "_-." else "_" for c in name)
+
+    @staticmethod
+    def _IsMsvcLike(commands) -> bool:
+        if not commands or not isinstance(commands[0][0], list):
+            return False
+        tool = Path(commands[0][0][0]).name.lower()
+        return tool in ("cl", "cl.exe", "clang-cl", "clang-cl.exe")
+
+    @staticmethod
+    def _NinjaCommand(commands, substitutions: Dict[str, str], windows: bool,
+                      extraFlags: Optional[List[str]] = None) -> str:
+        """
+        Commande ninja à partir des commandes enregistrées : chemins remplacés
+        par $in/$out/..., arguments cités pour le shell (sh ou cmd), '$' échappé.
+        """
+        quote = subprocess.list2cmdline if windows else shlex.join
+        parts: List[str] = []
+        for args, cwd in commands:
+            if not isinstance(args, list):
+                parts.append(str(args).replace("$", "$$"))
+                continue
+            if extraFlags:
+                args = args[:1] + extraFlags + args[1:]
+            words: List[str] = []
+            for arg in args:
+                var = substitutions.get(arg)
+                if var is not None:
+                    if not (words and words[-1] == var == "$in"):
+                        words.append(var)
+                    continue
+                word = quote([arg]).replace("$", "$$")
+                for path, var in substitutions.items():
+                    if var != "$in" and path and path.replace("$", "$$") in word:
+                        word = word.replace(path.replace("$", "$$"), var)
+                words.append(word)
+            command = " ".join(words)
+            if cwd:
+                command = f"cd {quote([cwd]).replace('$', '$$')} && {command}"
+            parts.append(command)
+        command = " && ".join(parts)
+        if windows and len(parts) > 1:
+            command = f'cmd /c "{command}"'
+        return command
+
     @staticmethod
     def _MapArchToAndroidAbi(arch: Api.TargetArch) -> Optional[str]:
         mapping = {
@@ -55,6 +55,8 @@ class HelpCommand:
             ("publish", "Publie un package sur un registre"),
             ("profile", "Lance un profilage de performance"),
             ("bench", "Exécute des benchmarks"),
+            ("selfbench", "Mesure le coût du moteur de build (workspaces synthétiques)"),
+            ("analyze includes", "Classe les headers par coût (.d, -ftime-trace)"),
             ("help, h", "Affiche cette aide"),
         ]
         for cmd, desc in cmds:
@@ -107,6 +107,8 @@ class InfoCommand:
             )
         else:
             print("No toolchains detected.")
+        linkers = ", ".join(f"{name} ({path})" for name, path in tc_manager.linkers.items())
+        print(f"Linkers (-fuse-ld): {linkers or 'none'} ; workspace linker(\"{workspace.linker}\")")
         print()
 
         # Daemon status
@@ -116,7 +118,10 @@ class InfoCommand:
         if daemon_status.get('running'):
             print(f"Status: {Colored.Colorize('Running', color='green')}")
             print(f"PID: {daemon_status.get('pid')}")
-            print(f"Port: {daemon_status.get('port')}")
+            if daemon_status.get('socket'):
+                print(f"Socket: {daemon_status.get('socket')}")
+            else:
+                print(f"Port: {daemon_status.get('port')}")
             print(f"Uptime: {daemon_status.get('uptime', 0):.1f}s")
             print(f"Watcher active: {daemon_status.get('watcher', False)}")
         else:
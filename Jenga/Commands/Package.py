@@ -1429,13 +1429,19 @@ Description: {project.name} packaged by Jenga
         # signingidentity, signingthumbprint, signingtimestampurl, signinggpgkey).
         sign_options = PackageCommand._CollectSignOptions(project)
 
+        # Compression du payload : installeroption("compression", "deflate").
+        # Par defaut "none" (payload en clair, moins suspect pour les AV).
+        installer_options = getattr(project, "installerOptions", None) or {}
+        compression = str(installer_options.get("compression", "none") or "none")
+
         # Construction de l'installateur.
         ext = ".exe" if platform == "windows" else ".run"
         out = output_dir / f"{project.name}-setup{ext}"
         try:
             BuildInstaller(files, manifest, out, verbose=False,
                            platform=platform, require_admin=require_admin,
-                           icon_path=stub_icon_path, sign_options=sign_options)
+                           icon_path=stub_icon_path, sign_options=sign_options,
+                           compression=compression)
         except BuilderError as e:
             Colored.PrintError(f"Echec construction de l'installateur : {e}")
             return 1
@@ -4,13 +4,63 @@
 Registry – Registre central des commandes CLI.
 Ce module est dédié à la gestion des commandes et des alias pour éviter les imports circulaires.
 Il ne doit importer aucune commande.
+
+Les commandes sont déclarées par chemin de module (COMMAND_MODULES) et ne
+sont importées qu'à leur première utilisation : `jenga build` ne charge ni
+Docs, ni Package, ni Install.
 """
 
-from typing import Dict, Type, Callable, List
+import importlib
+from typing import Dict, Type, Callable, List, Tuple
 import sys
 
-# Dictionnaire des commandes (sera rempli par Commands/__init__.py)
-COMMANDS: Dict[str, Type] = {}
+# Nom de commande -> (module de Jenga.Commands, classe) (rempli par Commands/__init__.py)
+COMMAND_MODULES: Dict[str, Tuple[str, str]] = {}
+
+
+class _CommandTable(dict):
+    """
+    dict nom -> classe de commande. Les commandes de COMMAND_MODULES sont
+    importées à la demande ; les classes enregistrées directement restent
+    prioritaires.
+    """
+
+    def __missing__(self, name: str) -> Type:
+        spec = COMMAND_MODULES.get(name)
+        if spec is None:
+            raise KeyError(name)
+        module = importlib.import_module(f"{__package__}.{spec[0]}")
+        cls = getattr(module, spec[1])
+        self[name] = cls
+        return cls
+
+    def __contains__(self, name) -> bool:
+        return dict.__contains__(self, name) or name in COMMAND_MODULES
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def keys(self):
+        return list(dict.fromkeys(list(dict.keys(self)) + list(COMMAND_MODULES)))
+
+    def values(self):
+        return [self[name] for name in self.keys()]
+
+    def items(self):
+        return [(name, self[name]) for name in self.keys()]
+
+    def get(self, name, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+
+# Dictionnaire des commandes (classes importées à la demande)
+COMMANDS: Dict[str, Type] = _CommandTable()
 
 # Dictionnaire des alias (commande courte -> nom long)
 ALIASES: Dict[str, str] = {}
@@ -42,5 +92,5 @@ def execute_command(name: str, args: List[str]) -> int:
 
 
 __all__ = [
-    'COMMANDS', 'ALIASES', 'get_command_class', 'execute_command'
+    'COMMANDS', 'COMMAND_MODULES', 'ALIASES', 'get_command_class', 'execute_command'
 ]
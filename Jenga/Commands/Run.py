@@ -9,13 +9,9 @@ import sys
 from pathlib import Path
 from typing import List, Optional, Tuple
 
-from ..Core.Loader import Loader
-from ..Core.Cache import Cache
-from ..Core.Builder import Builder
 from ..Core import Api
+from ..Core.BuildSession import ArtifactManifest, BuildSession
 from ..Utils import Colored, Process, FileSystem
-from .Build import BuildCommand
-from .Deploy import DeployCommand
 
 
 class RunCommand:
@@ -52,6 +48,15 @@ class RunCommand:
                 return 1
         workspace_root = entry_file.parent
 
+        # Chemin rapide : exécutable déjà résolu par un 'jenga run' précédent et
+        # .jenga inchangés -> ni chargement du workspace ni création de builder.
+        if not parsed.build and (parsed.platform or "").strip().lower() != "android":
+            hit = ArtifactManifest(workspace_root).Lookup(
+                ArtifactManifest.Key("run", parsed.config, parsed.platform, parsed.project))
+            if hit:
+                Colored.PrintInfo(f"Running {hit['path']}...")
+                return Process.Run([hit["path"]] + parsed.args)
+
         # Utiliser le daemon si disponible
         if not parsed.no_daemon:
             from ..Core.Daemon import DaemonClient, DaemonStatus
@@ -73,17 +78,13 @@ class RunCommand:
                 except Exception as e:
                     Colored.PrintWarning(f"Daemon error: {e}, falling back.")
 
-        # Mode direct
-        loader = Loader(verbose=False)
-        cache = Cache(workspace_root)
-        workspace = cache.LoadWorkspace(entry_file, loader)
+        # Mode direct : un seul chargement du workspace et un seul builder
+        # pour le build éventuel et la recherche de l'exécutable.
+        session = BuildSession(entry_file, parsed.config, parsed.platform, action="run")
+        workspace = session.LoadWorkspace()
         if workspace is None:
-            workspace = loader.LoadWorkspace(str(entry_file))
-            if workspace:
-                cache.SaveWorkspace(workspace, entry_file, loader)
-            else:
-                Colored.PrintError("Failed to load workspace.")
-                return 1
+            Colored.PrintError("Failed to load workspace.")
+            return 1
 
         # Déterminer le projet à exécuter
         project_name = parsed.project
@@ -122,6 +123,7 @@ class RunCommand:
                 )
                 return 1
 
+            from .Deploy import DeployCommand
             adb = DeployCommand._ResolveAdb(workspace=workspace)
             if not adb:
                 Colored.PrintError("adb not found. Set ANDROID_SDK_ROOT or add adb to PATH.")
@@ -187,37 +189,13 @@ class RunCommand:
         # Build si demandé explicitement (par défaut : skip build)
         if parsed.build:
             Colored.PrintInfo(f"Building {project_name}...")
-            build_args = ["--config", parsed.config]
-            build_args += ["--action", "run"]
-            if parsed.platform:
-                build_args += ["--platform", parsed.platform]
-            if parsed.jenga_file:
-                build_args += ["--jenga-file", str(entry_file)]
-            build_args += ["--target", project_name]
-            ret = BuildCommand.Execute(build_args)
+            ret = session.Build(project_name)
             if ret != 0:
                 return ret
 
-        # Déterminer le chemin de l'exécutable
-        # Il faut un builder pour connaître l'extension et le chemin exact
+        # Déterminer le chemin de l'exécutable avec le builder de la session
         try:
-            builder = BuildCommand.CreateBuilder(
-                workspace,
-                config=parsed.config,
-                platform=parsed.platform or (workspace.targetOses[0].value if workspace.targetOses else "Windows"),
-                target=project_name,
-                verbose=False,
-                action="run",
-                options=BuildCommand.CollectFilterOptions(
-                    config=parsed.config,
-                    platform=parsed.platform,
-                    target=project_name,
-                    verbose=False,
-                    no_cache=False,
-                    no_daemon=parsed.no_daemon,
-                    extra=["action:run"]
-                )
-            )
+            builder = session.GetBuilder(project_name)
         except Exception as e:
             Colored.PrintError(f"Cannot create builder: {e}")
             return 1
@@ -226,6 +204,7 @@ class RunCommand:
         if not exe_path.exists():
             Colored.PrintError(f"Executable not found: {exe_path}")
             return 1
+        session.RecordArtifact(project, exe_path, requestedProject=parsed.project)
 
         # Exécuter
         Colored.PrintInfo(f"Running {exe_path}...")
@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SelfBench command – Mesure le coût propre du moteur de build de Jenga.
+
+Génère des workspaces synthétiques (N projets de M fichiers, chaînes
+d'includes profondes, nombreux filtres et includedirs) compilés par un
+compilateur factice : le stub écrit l'objet et le fichier .d (fermeture
+des #include "..."), sans toolchain réelle. Chaque phase est chronométrée
+dans le processus courant :
+
+  load                 Loader.LoadWorkspace
+  filters              _ApplyProjectFilters sur tous les projets
+  collect_sources      _CollectSourceFiles sur tous les projets
+  expand_variables     VariableExpander sur les chemins des projets
+  cold_build           premier build complet
+  noop_build           build sans changement
+  single_change_build  build après modification d'un seul source
+  clean                jenga clean
+
+--model N mesure aussi le modèle de données (sans build) : N projets
+déclarés via le DSL, octets alloués et microsecondes par projet
+(tracemalloc), pour suivre l'empreinte mémoire de Api.Project.
+
+Le résultat est écrit en JSON sur la sortie standard et dans --output
+(à préférer en CI, la bannière de jenga précède la sortie), pour suivre
+les régressions de Builder, Loader et VariableExpander.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Tailles prédéfinies : (projets, fichiers par projet, profondeur d'include, filtres par projet)
+_SCALES = {
+    "small": (5, 20, 4, 4),
+    "medium": (20, 50, 8, 8),
+    "large": (60, 100, 12, 16),
+}
+
+_FAKE_COMPILER = r'''
+import os
+import re
+import sys
+
+_INCLUDE = re.compile(r'^[ \t]*#[ \t]*include[ \t]*"([^"]+)"', re.M)
+
+
+def _Closure(source, includeDirs):
+    seen, stack = [], [source]
+    while stack:
+        current = stack.pop()
+        try:
+            with open(current, encoding="utf-8", errors="replace") as f:
+                text = f.read()
+        except OSError:
+            continue
+        for name in _INCLUDE.findall(text):
+            for base in [os.path.dirname(current)] + includeDirs:
+                candidate = os.path.normpath(os.path.join(base, name))
+                if os.path.isfile(candidate):
+                    if candidate not in seen:
+                        seen.append(candidate)
+                        stack.append(candidate)
+                    break
+    return seen
+
+
+def main(argv):
+    if argv and argv[0] in ("--version", "-dumpversion", "-v"):
+        print("jenga-fakecc 1.0")
+        return 0
+    if argv and not argv[0].startswith("-") and set(argv[0]) <= set("rcsuvT"):
+        out, inputs = argv[1], argv[2:]                      # ar rcs out objs...
+        mode = "archive"
+    else:
+        out, dep, mode, inputs, includeDirs = None, None, "link", [], []
+        i = 0
+        while i < len(argv):
+            arg = argv[i]
+            if arg in ("-o", "-MF", "-MT", "-I", "-include", "-x") and i + 1 < len(argv):
+                if arg == "-o":
+                    out = argv[i + 1]
+                elif arg == "-MF":
+                    dep = argv[i + 1]
+                elif arg == "-I":
+                    includeDirs.append(argv[i + 1])
+                i += 2
+                continue
+            if arg == "-c":
+                mode = "compile"
+            elif arg.startswith("-I"):
+                includeDirs.append(arg[2:])
+            elif arg.startswith("/Fo"):
+                out = arg[3:]
+            elif arg.startswith("/OUT:"):
+                out = arg[5:]
+            elif not arg.startswith(("-", "/")) or os.path.isfile(arg):
+                inputs.append(arg)
+            i += 1
+    if not out:
+        return 0
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    if mode == "compile":
+        source = inputs[-1] if inputs else ""
+        headers = _Closure(source, includeDirs)
+        with open(out, "wb") as f:
+            f.write(("obj:" + source + "\n" + "\n".join(headers)).encode("utf-8"))
+        if dep:
+            esc = lambda p: p.replace(" ", "\\ ")
+            with open(dep, "w", encoding="utf-8") as f:
+                f.write(esc(out) + ": " + " \\\n  ".join(esc(p) for p in [source] + headers) + "\n")
+    else:
+        with open(out, "wb") as f:
+            f.write((mode + ":" + "\n".join(inputs)).encode("utf-8"))
+        if mode == "link":
+            os.chmod(out, 0o755)
+    return 0
+
+
+sys.exit(main(sys.argv[1:]))
+'''
+
+
+class SelfBenchCommand:
+    """jenga selfbench [--scale small|medium|large] [--projects N] [--files M] [--depth D] [--filters F] [--repeat R] [--model N] [--output FILE] [--keep]"""
+
+    @staticmethod
+    def Execute(args: List[str]) -> int:
+        parser = argparse.ArgumentParser(prog="jenga selfbench",
+                                         description="Benchmark Jenga's own build engine on synthetic workspaces.")
+        parser.add_argument("--scale", action="append", choices=sorted(_SCALES),
+                            help="Predefined scale (repeatable, default: small and medium)")
+        parser.add_argument("--projects", type=int, default=0, help="Custom scale: number of projects")
+        parser.add_argument("--files", type=int, default=0, help="Custom scale: source files per project")
+        parser.add_argument("--depth", type=int, default=8, help="Custom scale: include chain depth")
+        parser.add_argument("--filters", type=int, default=8, help="Custom scale: filter blocks per project")
+        parser.add_argument("--repeat", type=int, default=3, help="Samples per phase (median is reported)")
+        parser.add_argument("--model", type=int, default=0, metavar="N",
+                            help="Also measure memory and time per project for N DSL-declared projects")
+        parser.add_argument("--output", "-o", default=None, help="Also write the JSON results to FILE")
+        parser.add_argument("--dir", default=None, help="Generate workspaces here instead of a temporary directory")
+        parser.add_argument("--keep", action="store_true", help="Keep the generated workspaces")
+        parsed = parser.parse_args(args)
+
+        scales = []
+        if parsed.projects > 0 and parsed.files > 0:
+            scales.append(("custom", parsed.projects, parsed.files, max(1, parsed.depth), max(0, parsed.filters)))
+        for name in parsed.scale or ([] if scales or parsed.model > 0 else ["small", "medium"]):
+            scales.append((name,) + _SCALES[name])
+
+        root = Path(parsed.dir).resolve() if parsed.dir else Path(tempfile.mkdtemp(prefix="jenga-selfbench-"))
+        results = []
+        try:
+            for name, projects, files, depth, filters in scales:
+                # Progression sur stderr : stdout ne contient que le JSON
+                print(f"[selfbench] {name}: {projects} projects x {files} files, "
+                      f"include depth {depth}, {filters} filters/project", file=sys.stderr)
+                wks_dir = root / name
+                if wks_dir.exists():
+                    shutil.rmtree(wks_dir)
+                entry = SelfBenchCommand.GenerateWorkspace(wks_dir, projects, files, depth, filters)
+                timings = SelfBenchCommand.RunScale(entry, max(1, parsed.repeat))
+                results.append({"scale": name, "projects": projects, "files": files, "depth": depth,
+                                "filters": filters, "timings_ms": timings})
+        finally:
+            if not parsed.keep and not parsed.dir:
+                shutil.rmtree(root, ignore_errors=True)
+
+        from .._version import __version__
+        report = {
+            "jenga": __version__,
+            "python": platform.python_version(),
+            "platform": f"{sys.platform}-{platform.machine()}",
+            "cpus": os.cpu_count() or 1,
+            "repeat": max(1, parsed.repeat),
+            "results": results,
+        }
+        if parsed.model > 0:
+            print(f"[selfbench] model: {parsed.model} projects", file=sys.stderr)
+            report["model"] = SelfBenchCommand.MeasureProjectModel(parsed.model)
+        text = json.dumps(report, indent=2)
+        print(text)
+        if parsed.output:
+            Path(parsed.output).write_text(text + "\n", encoding="utf-8")
+        return 0
+
+    # -----------------------------------------------------------------------
+    # Génération
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def WriteFakeCompiler(directory: Path) -> Path:
+        """Write the compiler/linker/archiver stub and return the path to invoke."""
+        directory.mkdir(parents=True, exist_ok=True)
+        if os.name == "nt":
+            script = directory / "fakecc.py"
+            script.write_text(_FAKE_COMPILER.lstrip(), encoding="utf-8")
+            launcher = directory / "fakecc.cmd"
+            launcher.write_text(f'@"{sys.executable}" -S "{script}" %*\r\n', encoding="utf-8")
+        else:
+            launcher = directory / "fakecc"
+            launcher.write_text(f"#!{sys.executable} -S\n" + _FAKE_COMPILER.lstrip(), encoding="utf-8")
+            launcher.chmod(0o755)
+        return launcher
+
+    @staticmethod
+    def GenerateWorkspace(root: Path, projects: int, files: int, depth: int, filters: int) -> Path:
+        """
+        Generate a synthetic workspace: each project has an include chain of
+        depth headers, every source includes the head of its own chain and of
+        its dependency's chain, and projects depend on the previous one.
+        Returns the .jenga entry file.
+        """
+        from ..Core.Platform import Platform
+        compiler = SelfBenchCommand.WriteFakeCompiler(root / "tools")
+        names = [f"Lib{i:03d}" for i in range(projects - 1)] + ["App"]
+        for index, name in enumerate(names):
+            inc = root / name / "include" / name
+            src = root / name / "src"
+            inc.mkdir(parents=True)
+            src.mkdir(parents=True)
+            for level in range(depth):
+                nxt = f'#include "{name}/chain_{level + 1}.h"\n' if level + 1 < depth else ""
+                (inc / f"chain_{level}.h").write_text(
+                    f"#pragma once\n{nxt}inline int {name}_chain_{level}() {{ return {level}; }}\n")
+            dep_include = f'#include "{names[index - 1]}/chain_0.h"\n' if index > 0 else ""
+            for j in range(files):
+                (src / f"file_{j:04d}.cpp").write_text(
+                    f'#include "{name}/chain_0.h"\n{dep_include}int {name}_fn_{j}() {{ return {j}; }}\n')
+
+        lines = [
+            "from Jenga import *",
+            "",
+            'with workspace("SelfBench"):',
+            '    configurations(["Debug", "Release"])',
+            '    with toolchain("fakecc", "gcc"):',
+            f'        settarget("{Platform.GetHostOS().value}", "{Platform.GetHostArchitecture().value}")',
+            f'        ccompiler(r"{compiler}")',
+            f'        cppcompiler(r"{compiler}")',
+            f'        linker(r"{compiler}")',
+            f'        archiver(r"{compiler}")',
+            '    usetoolchain("fakecc")',
+        ]
+        filter_exprs = ["config:Debug", "config:Release", "system:Linux", "system:Windows", "system:MacOS"]
+        for index, name in enumerate(names):
+            lines += [
+                "",
+                f'    with project("{name}"):',
+                "        consoleapp()" if name == "App" else "        staticlib()",
+                '        language("C++")',
+                f'        location("{name}")',
+                '        files(["src/**.cpp"])',
+                '        includedirs(["include"' + "".join(f', "../{d}/include"' for d in names[max(0, index - 4):index]) + "])",
+            ]
+            if index > 0:
+                lines.append(f'        dependson(["{names[index - 1]}"])')
+            for k in range(filters):
+                lines += [f'        with filter("{filter_exprs[k % len(filter_exprs)]}"):',
+                          f'            defines(["{name.upper()}_F{k}=1"])']
+        entry = root / "selfbench.jenga"
+        entry.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return entry
+
+    # -----------------------------------------------------------------------
+    # Mesures
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def _Time(action: Callable[[], Any], repeat: int, before: Optional[Callable[[int], None]] = None) -> float:
+        """Median wall time in ms of action over repeat runs, output silenced."""
+        samples = []
+        for i in range(repeat):
+            if before is not None:
+                before(i)
+            with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+                start = time.perf_counter()
+                action()
+                samples.append((time.perf_counter() - start) * 1000.0)
+        return round(statistics.median(samples), 3)
+
+    @staticmethod
+    def MeasureProjectModel(count: int) -> Dict[str, float]:
+        """
+        Declare count projects through the DSL (a typical static library:
+        files, include dirs, defines, a dependency and two filters) and
+        report the memory retained and the time spent per project.
+        """
+        from ..Core import Api
+
+        def declare():
+            with Api.workspace("SelfBenchModel"):
+                for i in range(count):
+                    with Api.project(f"Lib{i:05d}"):
+                        Api.staticlib()
+                        Api.location(f"libs/Lib{i:05d}")
+                        Api.files(["src/**.cpp", "include/**.h"])
+                        Api.includedirs(["include"])
+                        Api.defines([f"LIB{i}_EXPORTS"])
+                        if i:
+                            Api.dependson([f"Lib{i - 1:05d}"])
+                        with Api.filter("config:Debug"):
+                            Api.defines(["DEBUG"])
+                        with Api.filter("system:Windows"):
+                            Api.links(["user32"])
+            return Api.getcurrentworkspace()
+
+        previous = Api.getcurrentworkspace()
+        try:
+            start = time.perf_counter()
+            declare()
+            elapsed = time.perf_counter() - start
+            tracemalloc.start()
+            try:
+                base = tracemalloc.get_traced_memory()[0]
+                workspace = declare()
+                retained = tracemalloc.get_traced_memory()[0] - base
+            finally:
+                tracemalloc.stop()
+            assert len(workspace.projects) == count
+        finally:
+            Api._currentWorkspace = previous
+            Api._currentProject = None
+        return {
+            "projects": count,
+            "bytes_per_project": round(retained / count),
+            "us_per_project": round(elapsed * 1e6 / count, 2),
+        }
+
+    @staticmethod
+    def RunScale(entry: Path, repeat: int) -> Dict[str, float]:
+        from ..Core.Loader import Loader
+        from ..Core.Platform import Platform
+        from .Build import BuildCommand
+        from .Clean import CleanCommand
+
+        root = entry.parent
+        timings: Dict[str, float] = {}
+        holder: Dict[str, Any] = {}
+
+        def load():
+            holder["workspace"] = Loader(verbose=False).LoadWorkspace(str(entry))
+        timings["load"] = SelfBenchCommand._Time(load, repeat)
+        workspace = holder["workspace"]
+        if workspace is None:
+            raise RuntimeError(f"Cannot load generated workspace {entry}")
+
+        def new_builder():
+            with contextlib.redirect_stdout(io.StringIO()):
+                return BuildCommand.CreateBuilder(
+                    workspace, "Debug", None, None, False, action="build",
+                    options=BuildCommand.CollectFilterOptions(
+                        config="Debug", platform=None, target=None, verbose=False,
+                        no_cache=False, no_daemon=True, extra=[]))
+
+        builder = new_builder()
+        projects = list(workspace.projects.values())
+        timings["filters"] = SelfBenchCommand._Time(
+            lambda: [builder._ApplyProjectFilters(p) for p in projects], repeat)
+        timings["collect_sources"] = SelfBenchCommand._Time(
+            lambda: [builder._CollectSourceFiles(p) for p in projects], repeat)
+
+        expander = builder._expander
+        def expand():
+            for p in projects:
+                expander.SetProject(p)
+                for value in [p.objDir, p.targetDir, p.location] + list(p.includeDirs):
+                    if value:
+                        expander.Expand(value, recursive=True)
+        timings["expand_variables"] = SelfBenchCommand._Time(expand, repeat)
+
+        def build():
+            if new_builder().Build() != 0:
+                raise RuntimeError("selfbench build failed")
+        timings["cold_build"] = SelfBenchCommand._Time(build, 1)
+        timings["noop_build"] = SelfBenchCommand._Time(build, repeat)
+
+        sources = sorted((root / "App" / "src").glob("*.cpp"))
+        def touch(i: int):
+            target = sources[i % len(sources)]
+            target.write_text(target.read_text() + f"// edit {time.time_ns()}\n")
+        timings["single_change_build"] = SelfBenchCommand._Time(build, repeat, before=touch)
+
+        timings["clean"] = SelfBenchCommand._Time(
+            lambda: CleanCommand.Execute(["--no-daemon", "--jenga-file", str(entry),
+                                          "--platform", Platform.GetHostOS().value]), 1)
+        return timings
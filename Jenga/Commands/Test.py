@@ -3,23 +3,44 @@
 """
 Test command – Exécute les suites de tests.
 Recherche les projets de type TEST_SUITE, les compile et les exécute.
+
+Les projets de test sélectionnés sont compilés en un seul build (un seul
+chargement du workspace, un seul builder), puis leurs exécutables sont
+lancés en parallèle avec un timeout par exécutable. --shard i/n répartit
+les suites entre plusieurs machines de CI ; --junit écrit un rapport
+JUnit fusionné.
+
+Comme les « cached test results » de Bazel, une suite dont l'exécutable,
+les bibliothèques dynamiques copiées à côté, les dependfiles() et les
+testoptions() n'ont pas changé depuis son dernier succès n'est pas
+relancée : son résultat en cache est rapporté. --no-test-cache force
+l'exécution.
 """
 
 import argparse
+import concurrent.futures
+import glob
+import os
 import sys
+import time
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..Core import Api
 from ..Core.Loader import Loader
 from ..Core.Cache import Cache
 from ..Core.Builder import Builder
-from ..Utils import Colored, Reporter, Process, FileSystem
+from ..Core.DependencyResolver import DependencyResolver
+from ..Core.TestCache import TestResultCache
+from ..Utils import Colored, Reporter, Process, FileSystem, CreateTestReport, ExportJUnitXml
 from .Build import BuildCommand
 
+# Lignes de sortie gardées dans le rapport JUnit pour une suite en échec
+_JUNIT_OUTPUT_LINES = 50
+
 
 class TestCommand:
-    """jenga test [--config NAME] [--platform NAME] [--project NAME] [--no-build]"""
+    """jenga test [--config NAME] [--platform NAME] [--project NAME] [--no-build] [--jobs N] [--timeout S] [--shard I/N] [--junit FILE] [--no-test-cache]"""
 
     @staticmethod
     def Execute(args: List[str]) -> int:
@@ -28,11 +49,28 @@ class TestCommand:
         parser.add_argument("--platform", default=None, help="Target platform")
         parser.add_argument("--project", default=None, help="Specific test project to run")
         parser.add_argument("--no-build", action="store_true", help="Skip build step")
+        parser.add_argument("--jobs", "-j", type=int, default=0,
+                            help="Test executables run concurrently (0 = CPU count)")
+        parser.add_argument("--timeout", type=float, default=0,
+                            help="Timeout in seconds for each test executable (0 = none)")
+        parser.add_argument("--shard", default=None, metavar="I/N",
+                            help="Run only the I-th of N shards of the test projects (1-based)")
+        parser.add_argument("--junit", default=None, metavar="FILE", help="Write a merged JUnit XML report")
+        parser.add_argument("--no-test-cache", action="store_true",
+                            help="Run every test executable, even when a passing result is cached")
         parser.add_argument("--no-daemon", action="store_true", help="Do not use daemon")
         parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
         parser.add_argument("--jenga-file", help="Path to the workspace .jenga file (default: auto-detected)")
         parsed = parser.parse_args(args)
 
+        shard = None
+        if parsed.shard:
+            try:
+                shard = TestCommand.ParseShard(parsed.shard)
+            except ValueError as e:
+                Colored.PrintError(str(e))
+                return 1
+
         # Déterminer le répertoire de travail (workspace root)
         workspace_root = Path.cwd()
         if parsed.jenga_file:
@@ -58,7 +96,12 @@ class TestCommand:
                         'platform': parsed.platform,
                         'project': parsed.project,
                         'no_build': parsed.no_build,
-                        'verbose': parsed.verbose
+                        'no_test_cache': parsed.no_test_cache,
+                        'verbose': parsed.verbose,
+                        'jobs': parsed.jobs,
+                        'timeout': parsed.timeout,
+                        'shard': parsed.shard,
+                        'junit': str(Path(parsed.junit).resolve()) if parsed.junit else None,
                     })
                     if response.get('status') == 'ok':
                         return response.get('return_code', 0)
@@ -106,65 +149,216 @@ class TestCommand:
             Colored.PrintError("No test projects found.")
             return 1
 
-        # Builder les projets de test (et leurs dépendances)
-        if not parsed.no_build:
-            for name, _ in test_projects:
-                Colored.PrintInfo(f"Building {name}...")
-                build_args = ["--config", parsed.config]
-                build_args += ["--action", "test"]
-                if parsed.platform:
-                    build_args += ["--platform", parsed.platform]
-                if parsed.jenga_file:
-                    build_args += ["--jenga-file", str(entry_file)]
-                build_args += ["--target", name]
-                ret = BuildCommand.Execute(build_args)
-                if ret != 0:
-                    return ret
-
-        # Exécuter chaque test
-        overall = 0
-        for name, proj in test_projects:
-            Colored.PrintInfo(f"\nRunning tests for {name}...")
+        if shard is not None:
+            selected = set(TestCommand.SelectShard([name for name, _ in test_projects], *shard))
+            test_projects = [(name, proj) for name, proj in test_projects if name in selected]
+            Colored.PrintInfo(f"Shard {shard[0]}/{shard[1]}: "
+                              f"{', '.join(sorted(selected)) if selected else 'no test project'}")
+            if not test_projects:
+                return 0
 
-            # Déterminer le chemin de l'exécutable de test
-            try:
-                builder = BuildCommand.CreateBuilder(
-                    workspace,
+        # Un seul builder pour la compilation et la localisation des exécutables
+        try:
+            builder = BuildCommand.CreateBuilder(
+                workspace,
+                config=parsed.config,
+                # Keep platform selection consistent with `jenga build`:
+                # when --platform is omitted, CreateBuilder picks host OS/arch.
+                platform=parsed.platform,
+                target=None,
+                verbose=parsed.verbose,
+                action="test",
+                options=BuildCommand.CollectFilterOptions(
                     config=parsed.config,
-                    # Keep platform selection consistent with `jenga build`:
-                    # when --platform is omitted, CreateBuilder picks host OS/arch.
                     platform=parsed.platform,
-                    target=name,
-                    verbose=False,
-                    action="test",
-                    options=BuildCommand.CollectFilterOptions(
-                        config=parsed.config,
-                        platform=parsed.platform,
-                        target=name,
-                        verbose=parsed.verbose,
-                        no_cache=False,
-                        no_daemon=parsed.no_daemon,
-                        extra=["action:test"]
-                    )
+                    target=None,
+                    verbose=parsed.verbose,
+                    no_cache=False,
+                    no_daemon=parsed.no_daemon,
+                    extra=["action:test"]
                 )
-            except Exception as e:
-                Colored.PrintError(f"Cannot create builder: {e}")
-                overall = 1
-                continue
+            )
+        except Exception as e:
+            Colored.PrintError(f"Cannot create builder: {e}")
+            return 1
+
+        # Builder les projets de test (et leurs dépendances) en un seul build
+        if not parsed.no_build:
+            ret = TestCommand.BuildTestProjects(builder, [name for name, _ in test_projects])
+            if ret != 0:
+                return ret
 
+        # Exécuter les tests en parallèle
+        jobs = parsed.jobs if parsed.jobs > 0 else (os.cpu_count() or 1)
+        timeout = parsed.timeout if parsed.timeout > 0 else None
+        report = CreateTestReport()
+        overall = 0
+        test_cache = TestResultCache(workspace_root)
+        context = [str(builder.config), str(builder.platform or ""), builder.targetArch.value]
+        runnable: List[Tuple[str, List[str]]] = []
+        fingerprints: Dict[str, Tuple[str, Optional[str]]] = {}
+        for name, proj in test_projects:
+            builder._ApplyProjectFilters(proj)
             exe_path = builder.GetTargetPath(proj)
             if not exe_path.exists():
                 Colored.PrintError(f"Test executable not found: {exe_path}")
+                report.AddTestCase(name, "fail", 0.0, f"Test executable not found: {exe_path}", suite=name)
                 overall = 1
                 continue
+            cmd = [str(exe_path)] + list(proj.testOptions)
+            key = "|".join(context + [name])
+            inputs = TestCommand.CollectTestInputs(builder, proj, exe_path)
+            fingerprint = None if inputs is None else test_cache.Fingerprint(inputs, proj.testOptions, context)
+            cached = None if parsed.no_test_cache or fingerprint is None else test_cache.Lookup(key, fingerprint)
+            if cached is not None:
+                duration = float(cached.get("duration", 0.0))
+                Colored.PrintSuccess(f"All tests passed for {name}. (cached, {duration:.2f}s)")
+                report.AddTestCase(name, "pass", duration, "cached", suite=name)
+                continue
+            fingerprints[name] = (key, fingerprint)
+            runnable.append((name, cmd))
 
-            # Exécuter avec les options de test
-            cmd = [str(exe_path)] + proj.testOptions
-            result = Process.ExecuteCommand(cmd, captureOutput=False, silent=False)
-            if result.returnCode != 0:
-                overall = 1
-                Colored.PrintError(f"Tests failed for {name}.")
-            else:
-                Colored.PrintSuccess(f"All tests passed for {name}.")
+        if runnable:
+            Colored.PrintInfo(f"\nRunning {len(runnable)} test executable(s) "
+                              f"({min(jobs, len(runnable))} in parallel)...")
+        start = time.perf_counter()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+            futures = [executor.submit(TestCommand.RunTestExecutable, name, cmd, timeout)
+                       for name, cmd in runnable]
+            for future in concurrent.futures.as_completed(futures):
+                outcome = future.result()
+                TestCommand._PrintOutcome(outcome, parsed.verbose)
+                report.AddTestCase(outcome["name"], outcome["result"], outcome["duration"],
+                                   outcome["message"], suite=outcome["name"])
+                key, fingerprint = fingerprints[outcome["name"]]
+                if outcome["result"] == "pass":
+                    if fingerprint is not None:
+                        test_cache.Record(key, fingerprint, outcome["duration"])
+                else:
+                    test_cache.Forget(key)
+                    overall = 1
+        try:
+            test_cache.Save()
+        except OSError as e:
+            Colored.PrintWarning(f"Cannot save test cache: {e}")
+        report.totalDuration = time.perf_counter() - start
 
+        Colored.Print("")
+        Colored.Print(report.ToText(colored=Colored.SupportsColor()))
+        if parsed.junit:
+            ExportJUnitXml(report, parsed.junit)
+            Colored.PrintInfo(f"JUnit report written to {parsed.junit}")
         return overall
+
+    # -----------------------------------------------------------------------
+    # Helpers
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def ParseShard(value: str) -> Tuple[int, int]:
+        """Parse 'i/n' (1 <= i <= n) into (i, n)."""
+        try:
+            index_str, count_str = value.split("/", 1)
+            index, count = int(index_str), int(count_str)
+        except ValueError:
+            raise ValueError(f"Invalid --shard '{value}': expected I/N, e.g. 1/4")
+        if count < 1 or not 1 <= index <= count:
+            raise ValueError(f"Invalid --shard '{value}': I must be between 1 and N")
+        return index, count
+
+    @staticmethod
+    def SelectShard(names: List[str], index: int, count: int) -> List[str]:
+        """
+        Test projects of shard index/count: round-robin over the sorted names,
+        so every machine computes the same partition from the same workspace.
+        """
+        return [name for i, name in enumerate(sorted(names)) if i % count == index - 1]
+
+    @staticmethod
+    def BuildTestProjects(builder: Builder, names: List[str]) -> int:
+        """Build the given test projects and their dependencies in a single Build()."""
+        needed = set()
+        for name in names:
+            try:
+                needed.update(DependencyResolver.ResolveBuildOrder(builder.workspace, name))
+            except (ValueError, RuntimeError) as e:
+                Colored.PrintError(f"Cannot resolve dependencies of {name}: {e}")
+                return 1
+        Colored.PrintInfo(f"Building {', '.join(sorted(names))}...")
+        builder.onlyProjects = needed
+        try:
+            return builder.Build()
+        finally:
+            builder.onlyProjects = None
+
+    @staticmethod
+    def CollectTestInputs(builder: Builder, project, exePath: Path) -> Optional[List[Path]]:
+        """
+        Files whose content decides the result of a test executable: the
+        binary, the shared libs copied next to it and the dependfiles()
+        (directories are walked, glob patterns expanded).
+        None when the shared libs cannot be listed: no fingerprint, the
+        test always runs.
+        """
+        inputs: List[Path] = [Path(exePath)]
+        try:
+            inputs.extend(dest for _, dest in builder.GetRuntimeDependencies(project, Path(exePath)))
+        except Exception as e:
+            Colored.PrintWarning(f"Test cache disabled for {project.name}: "
+                                 f"cannot list runtime dependencies ({e})")
+            return None
+        for dep in project.dependFiles:
+            resolved = builder.ResolveProjectPath(project, dep)
+            matches = glob.glob(resolved, recursive=True) if glob.has_magic(resolved) else [resolved]
+            for match in matches:
+                path = Path(match)
+                if path.is_dir():
+                    inputs.extend(f for f in path.rglob("*") if f.is_file())
+                else:
+                    inputs.append(path)
+        return inputs
+
+    @staticmethod
+    def RunTestExecutable(name: str, cmd: List[str], timeout: Optional[float]) -> Dict[str, Any]:
+        """Run one test executable, output captured so parallel runs do not interleave."""
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            result = Process.ExecuteCommand(cmd, captureOutput=True, timeout=timeout)
+            code, output = result.returnCode, (result.stdout or "") + (result.stderr or "")
+        except TimeoutError:
+            code, output, timed_out = -1, "", True
+        except OSError as e:
+            code, output = -1, str(e)
+        duration = time.perf_counter() - start
+
+        if timed_out:
+            message = f"Timed out after {timeout:g}s"
+        elif code != 0:
+            tail = output.rstrip().splitlines()[-_JUNIT_OUTPUT_LINES:]
+            message = f"Exit code {code}" + ("\n" + "\n".join(tail) if tail else "")
+        else:
+            message = ""
+        return {
+            "name": name,
+            "result": "pass" if code == 0 and not timed_out else "fail",
+            "duration": duration,
+            "message": message,
+            "output": output,
+            "timedOut": timed_out,
+        }
+
+    @staticmethod
+    def _PrintOutcome(outcome: Dict[str, Any], verbose: bool) -> None:
+        name, duration = outcome["name"], outcome["duration"]
+        if outcome["result"] == "pass":
+            Colored.PrintSuccess(f"All tests passed for {name}. ({duration:.2f}s)")
+            if verbose and outcome["output"]:
+                Colored.Print(outcome["output"].rstrip())
+            return
+        if outcome["timedOut"]:
+            Colored.PrintError(f"Tests timed out for {name}. ({duration:.2f}s)")
+        else:
+            if outcome["output"]:
+                Colored.Print(outcome["output"].rstrip())
+            Colored.PrintError(f"Tests failed for {name}. ({duration:.2f}s)")
@@ -15,7 +15,7 @@ from ..Utils import Colored, FileSystem
 
 
 class WatchCommand:
-    """jenga watch [--config NAME] [--platform NAME] [--polling] [--no-daemon]"""
+    """jenga watch [--config NAME] [--platform NAME] [--polling] [--no-daemon] [--debounce SECONDS]"""
 
     @staticmethod
     def Execute(args: List[str]) -> int:
@@ -24,6 +24,8 @@ class WatchCommand:
         parser.add_argument("--platform", default=None, help="Target platform")
         parser.add_argument("--polling", action="store_true", help="Use polling instead of watchdog")
         parser.add_argument("--no-daemon", action="store_true", help="Do not use daemon (run in foreground)")
+        parser.add_argument("--debounce", type=float, default=0.3,
+                            help="Quiet period in seconds before rebuilding after changes (default: 0.3)")
         parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
         parser.add_argument("--jenga-file", help="Path to the workspace .jenga file (default: auto-detected)")
         parsed = parser.parse_args(args)
@@ -44,46 +46,19 @@ class WatchCommand:
 
         # Si --no-daemon, on exécute un watcher local (sans daemon)
         if parsed.no_daemon:
-            Colored.PrintInfo("Starting local watcher (no daemon)...")
-            from ..Core.Watcher import FileWatcher
-            from ..Core.Loader import Loader
-            from ..Core.Cache import Cache
-            from .Build import BuildCommand
-
-            watcher = FileWatcher(use_polling=parsed.polling)
-            watcher.AddWatch(workspace_root)
-
-            def on_change(event_type, path):
-                Colored.PrintInfo(f"File changed: {path}")
-                # Rebuild
-                build_args = ["--config", parsed.config]
-                if parsed.platform:
-                    build_args += ["--platform", parsed.platform]
-                if parsed.jenga_file:
-                    build_args += ["--jenga-file", str(entry_file)]
-                if parsed.verbose:
-                    build_args.append("--verbose")
-                BuildCommand.Execute(build_args)
-
-            watcher.AddCallback(on_change)
-            watcher.Start()
-            Colored.PrintInfo("Watching for file changes... Press Ctrl+C to stop.")
-            try:
-                while True:
-                    time.sleep(1)
-            except KeyboardInterrupt:
-                watcher.Stop()
-                return 0
+            return WatchCommand._WatchLocal(entry_file, parsed)
 
         # Avec daemon
         # Vérifier si le daemon tourne
         from ..Core.Daemon import DaemonClient, StartDaemon, DaemonStatus, StopDaemon
         status = DaemonStatus(workspace_root)
+        started_here = False
         if not status.get('running'):
             Colored.PrintInfo("Starting daemon...")
             if not StartDaemon(workspace_root, entry_file, foreground=False):
                 Colored.PrintError("Failed to start daemon.")
                 return 1
+            started_here = True
             time.sleep(0.5)  # laisser le temps au daemon de démarrer
 
         client = DaemonClient(workspace_root)
@@ -91,30 +66,84 @@ class WatchCommand:
             Colored.PrintError("Daemon not available.")
             return 1
 
-        # Démarrer le watcher via le daemon
+        # Démarrer le rebuild automatique et suivre sa sortie jusqu'à Ctrl+C
+        Colored.PrintSuccess("Watching for file changes... Press Ctrl+C to stop.")
         try:
             response = client.SendCommand('watch_start', {
                 'polling': parsed.polling,
                 'config': parsed.config,
-                'platform': parsed.platform
+                'platform': parsed.platform,
+                'verbose': parsed.verbose,
+                'debounce': parsed.debounce,
+                'rebuild': True,
+                'follow': True
             })
-            if response.get('status') == 'ok':
-                Colored.PrintSuccess("Watcher started. Press Ctrl+C to stop.")
-                # Boucle pour garder le processus en vie
-                try:
-                    while True:
-                        time.sleep(1)
-                except KeyboardInterrupt:
-                    # Arrêter le watcher
-                    client.SendCommand('watch_stop')
-                    # Optionnellement arrêter le daemon
-                    StopDaemon(workspace_root)
-                    return 0
-            else:
-                Colored.PrintError(f"Failed to start watcher: {response.get('message')}")
-                return 1
         except KeyboardInterrupt:
-            return 0
+            response = {'status': 'ok'}
         except Exception as e:
             Colored.PrintError(f"Daemon communication error: {e}")
             return 1
+
+        try:
+            client.SendCommand('watch_stop', timeout=5)
+        except Exception:
+            pass
+        if started_here:
+            StopDaemon(workspace_root)
+        if response.get('status') != 'ok':
+            Colored.PrintError(f"Watch failed: {response.get('message')}")
+            return 1
+        return 0
+
+    @staticmethod
+    def _WatchLocal(entry_file: Path, parsed) -> int:
+        """Watcher et rebuilds dans ce processus (sans daemon)."""
+        from ..Core.Watcher import FileWatcher
+        from ..Core.Loader import Loader
+        from ..Core.WatchPipeline import WatchPipeline
+        from .Build import BuildCommand
+
+        Colored.PrintInfo("Starting local watcher (no daemon)...")
+        loader = Loader(verbose=parsed.verbose)
+        holder = {}
+
+        def load() -> bool:
+            workspace = loader.LoadWorkspace(str(entry_file))
+            if workspace is None:
+                Colored.PrintError("Failed to load workspace.")
+                return False
+            holder['builder'] = BuildCommand.CreateBuilder(
+                workspace, parsed.config, parsed.platform, None, parsed.verbose,
+                action="build",
+                options=BuildCommand.CollectFilterOptions(
+                    config=parsed.config,
+                    platform=parsed.platform,
+                    target=None,
+                    verbose=parsed.verbose,
+                    no_cache=False,
+                    no_daemon=True,
+                    extra=["action:build"]
+                )
+            )
+            return True
+
+        if not load():
+            return 1
+
+        pipeline = WatchPipeline(lambda: holder['builder'], onWorkspaceChanged=load,
+                                 debounce=parsed.debounce)
+        watcher = FileWatcher(use_polling=parsed.polling)
+        watcher.AddIgnorePattern(str(entry_file.parent / "Build"))
+        watcher.AddWatch(entry_file.parent)
+        watcher.AddCallback(pipeline.OnFileEvent)
+        pipeline.Start()
+        pipeline.RequestBuild()
+        watcher.Start()
+        Colored.PrintInfo("Watching for file changes... Press Ctrl+C to stop.")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            watcher.Stop()
+            pipeline.Stop()
+            return 0
@@ -3,70 +3,48 @@
 """
 Jenga.Commands – Ensemble des commandes CLI disponibles.
 Ce module initialise le registre des commandes et expose l'interface publique.
+Les modules de commande sont importés à la demande (voir Registry).
 """
 
-# Importer d'abord le registre, puis les commandes
-from .Registry import COMMANDS, ALIASES, get_command_class, execute_command
+import importlib
 
-# Import de toutes les commandes (les classes sont enregistrées dans COMMANDS au fur et à mesure)
-from .Build import BuildCommand
-from .Run import RunCommand
-from .Gdb import GdbCommand
-from .Test import TestCommand
-from .Clean import CleanCommand
-from .Rebuild import RebuildCommand
-from .Watch import WatchCommand
-from .Info import InfoCommand
-from .Gen import GenCommand
-from .Init import InitCommand
-from .Create import CreateCommand
-from .Add import AddCommand
-from .Install import InstallCommand
-from .Keygen import KeygenCommand
-from .Sign import SignCommand
-from .Docs import DocsCommand
-from .Help import HelpCommand
-from .Package import PackageCommand
-from .Deploy import DeployCommand
-from .Publish import PublishCommand
-from .Profile import ProfileCommand
-from .Bench import BenchCommand
-from .Config import ConfigCommand
-from .Examples import ExamplesCommand
-from .IdeSetup import IdeSetupCommand
+# Importer d'abord le registre, puis déclarer les commandes
+from .Registry import COMMANDS, COMMAND_MODULES, ALIASES, get_command_class, execute_command
 
-# Enregistrement des commandes
-COMMANDS.update({
-    'build': BuildCommand,
-    'run': RunCommand,
-    'gdb': GdbCommand,
-    'debug': GdbCommand,        # alias
-    'test': TestCommand,
-    'clean': CleanCommand,
-    'rebuild': RebuildCommand,
-    'watch': WatchCommand,
-    'info': InfoCommand,
-    'gen': GenCommand,
-    'workspace': InitCommand,   # alias
-    'init': InitCommand,
-    'project': CreateCommand,   # alias
-    'create': CreateCommand,
-    'file': AddCommand,         # alias
-    'add': AddCommand,
-    'install': InstallCommand,
-    'keygen': KeygenCommand,
-    'sign': SignCommand,
-    'docs': DocsCommand,
-    'package': PackageCommand,
-    'deploy': DeployCommand,
-    'publish': PublishCommand,
-    'profile': ProfileCommand,
-    'bench': BenchCommand,
-    'config': ConfigCommand,
-    'examples': ExamplesCommand,
-    'ide-setup': IdeSetupCommand,
-    'ide': IdeSetupCommand,         # alias court
-    'help': HelpCommand,
+# Enregistrement des commandes : nom -> (module, classe), importés au premier usage
+COMMAND_MODULES.update({
+    'build': ('Build', 'BuildCommand'),
+    'run': ('Run', 'RunCommand'),
+    'gdb': ('Gdb', 'GdbCommand'),
+    'debug': ('Gdb', 'GdbCommand'),         # alias
+    'test': ('Test', 'TestCommand'),
+    'clean': ('Clean', 'CleanCommand'),
+    'rebuild': ('Rebuild', 'RebuildCommand'),
+    'watch': ('Watch', 'WatchCommand'),
+    'info': ('Info', 'InfoCommand'),
+    'gen': ('Gen', 'GenCommand'),
+    'workspace': ('Init', 'InitCommand'),   # alias
+    'init': ('Init', 'InitCommand'),
+    'project': ('Create', 'CreateCommand'), # alias
+    'create': ('Create', 'CreateCommand'),
+    'file': ('Add', 'AddCommand'),          # alias
+    'add': ('Add', 'AddCommand'),
+    'install': ('Install', 'InstallCommand'),
+    'keygen': ('Keygen', 'KeygenCommand'),
+    'sign': ('Sign', 'SignCommand'),
+    'docs': ('Docs', 'DocsCommand'),
+    'package': ('Package', 'PackageCommand'),
+    'deploy': ('Deploy', 'DeployCommand'),
+    'publish': ('Publish', 'PublishCommand'),
+    'profile': ('Profile', 'ProfileCommand'),
+    'bench': ('Bench', 'BenchCommand'),
+    'selfbench': ('SelfBench', 'SelfBenchCommand'),
+    'analyze': ('Analyze', 'AnalyzeCommand'),
+    'config': ('Config', 'ConfigCommand'),
+    'examples': ('Examples', 'ExamplesCommand'),
+    'ide-setup': ('IdeSetup', 'IdeSetupCommand'),
+    'ide': ('IdeSetup', 'IdeSetupCommand'),  # alias court
+    'help': ('Help', 'HelpCommand'),
 })
 
 # Enregistrement des alias courts
@@ -89,12 +67,23 @@ ALIASES.update({
 })
 
 __all__ = [
-    'COMMANDS', 'ALIASES', 'get_command_class', 'execute_command',
+    'COMMANDS', 'COMMAND_MODULES', 'ALIASES', 'get_command_class', 'execute_command',
     'BuildCommand', 'RunCommand', 'TestCommand', 'CleanCommand',
     'RebuildCommand', 'WatchCommand', 'InfoCommand', 'GenCommand',
     'InitCommand', 'CreateCommand', 'AddCommand', 'InstallCommand',
     'KeygenCommand', 'SignCommand', 'DocsCommand', 'HelpCommand',
     'PackageCommand', 'DeployCommand', 'PublishCommand',
-    'ProfileCommand', 'BenchCommand', 'ConfigCommand', 'ExamplesCommand',
-    'IdeSetupCommand',
+    'ProfileCommand', 'BenchCommand', 'SelfBenchCommand', 'ConfigCommand', 'ExamplesCommand',
+    'IdeSetupCommand', 'AnalyzeCommand',
 ]
+
+
+# Classe de commande -> module, pour `from Jenga.Commands import BuildCommand`
+_CLASS_MODULES = {cls: module for module, cls in COMMAND_MODULES.values()}
+
+
+def __getattr__(name: str):
+    module = _CLASS_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{module}", __name__), name)
@@ -14,7 +14,7 @@ Naming conventions (strict):
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any, Union, Tuple
+from typing import List, Dict, Optional, Any, Union, Tuple, Callable
 from pathlib import Path
 from enum import Enum
 import copy
@@ -229,9 +229,44 @@ class FirewallRule:
     programOverride: str       = ""
 
 
-@dataclass
+class _LazyDefault:
+    """
+    Valeur par défaut mutable (list, dict) d'un champ de Project, créée dans
+    l'instance au premier accès. Descripteur non-data : une fois la valeur
+    dans __dict__, les accès suivants ne passent plus par __get__.
+    """
+    __slots__ = ("factory", "name")
+
+    def __init__(self, factory: Callable[[], Any]):
+        self.factory = factory
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj: Any, owner: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        value = obj.__dict__[self.name] = self.factory()
+        return value
+
+
+@dataclass(init=False)
 class Project:
-    """Project configuration – cross‑platform ready."""
+    """
+    Project configuration – cross‑platform ready.
+
+    Modèle compact pour les gros workspaces (milliers de projets) :
+      - les valeurs par défaut immuables (str, int, bool, enums, None) sont
+        des attributs de classe partagés : une instance ne stocke que ce que
+        le script a modifié ;
+      - listes et dicts (groupes Android, iOS, Xbox, HarmonyOS, Emscripten,
+        installer, firewall, filtres...) sont des _LazyDefault, alloués au
+        premier accès seulement.
+    L'instance garde un __dict__ (pas de __slots__) : builders et commandes
+    y ajoutent des attributs internes, et un slot ne peut pas coexister avec
+    une valeur par défaut de classe du même nom.
+    """
     name: str
     kind: ProjectKind = ProjectKind.CONSOLE_APP
     language: Language = Language.CPP
@@ -240,9 +275,10 @@ class Project:
     cppdialect: str = "C++17"
     cdialect: str = "C11"
 
-    cflags: List[str] = field(default_factory=list)   # Additional C compiler flags
-    cxxflags: List[str] = field(default_factory=list) # Additional C++ compiler flags
-    ldflags: List[str] = field(default_factory=list)  # Additional linker flags
+    cflags: List[str] = _LazyDefault(list)   # Additional C compiler flags
+    cxxflags: List[str] = _LazyDefault(list) # Additional C++ compiler flags
+    ldflags: List[str] = _LazyDefault(list)  # Additional linker flags
+    linker: str = ""                         # linker(): auto|mold|lld|bfd|gold, "" = workspace
     
     # Target overrides (if different from workspace)
     targetOs: Optional[TargetOS] = None
@@ -252,17 +288,23 @@ class Project:
     sysroot: Optional[str] = None
 
     # Files
-    files: List[str] = field(default_factory=list)
-    excludeFiles: List[str] = field(default_factory=list)
-    excludeMainFiles: List[str] = field(default_factory=list)
+    files: List[str] = _LazyDefault(list)
+    excludeFiles: List[str] = _LazyDefault(list)
+    excludeMainFiles: List[str] = _LazyDefault(list)
 
     # Precompiled headers
     pchHeader: str = ""
     pchSource: str = ""
 
+    # Unity (jumbo) build : les sources sont regroupées par lots dans des TU
+    # générées (#include "a.cpp" ...). unityBatchSize=0 -> taille par défaut.
+    unityBuild: bool = False
+    unityBatchSize: int = 0
+    unityExcludeFiles: List[str] = _LazyDefault(list)
+
     # Directories
-    includeDirs: List[str] = field(default_factory=list)
-    libDirs: List[str] = field(default_factory=list)
+    includeDirs: List[str] = _LazyDefault(list)
+    libDirs: List[str] = _LazyDefault(list)
 
     # Output
     objDir: str = ""
@@ -270,15 +312,15 @@ class Project:
     targetName: str = ""
 
     # Dependencies
-    links: List[str] = field(default_factory=list)
-    frameworks: List[str] = field(default_factory=list)
-    dependsOn: List[str] = field(default_factory=list)
+    links: List[str] = _LazyDefault(list)
+    frameworks: List[str] = _LazyDefault(list)
+    dependsOn: List[str] = _LazyDefault(list)
 
     # File dependencies (copy after build)
-    dependFiles: List[str] = field(default_factory=list)
+    dependFiles: List[str] = _LazyDefault(list)
 
     # Embedded resources (compiled into binary)
-    embedResources: List[str] = field(default_factory=list)
+    embedResources: List[str] = _LazyDefault(list)
 
     # Icone d'application (cross-platform). Voir Core/IconConverter.py pour
     # les regles de dispatch :
@@ -311,7 +353,7 @@ class Project:
     # Bag d'options libres lues par les builders installer. Permet a l'user
     # d'ajouter de nouvelles options (autostart, registry entries, branding,
     # etc.) sans qu'on doive elargir l'API. Voir installeroption() ci-dessous.
-    installerOptions:      Dict[str, "object"] = field(default_factory=dict)
+    installerOptions:      Dict[str, "object"] = _LazyDefault(dict)
 
     # Permissions reseau / firewall — installer-time. Voir DSL networkenabled()
     # et firewallrule(). Les builders d'installer (MSI WiX 3/4, Inno EXE, DEB
@@ -338,13 +380,13 @@ class Project:
     #                           (autorise HTTP en clair, requis pour LAN sans
     #                           TLS). False par defaut.
     networkEnabled:           bool         = False
-    firewallRules:            List["FirewallRule"] = field(default_factory=list)
+    firewallRules:            List["FirewallRule"] = _LazyDefault(list)
     networkUsageDescription:  str          = ""
-    bonjourServices:          List[str]    = field(default_factory=list)
+    bonjourServices:          List[str]    = _LazyDefault(list)
     allowArbitraryLoads:      bool         = False
 
     # Compiler settings
-    defines: List[str] = field(default_factory=list)
+    defines: List[str] = _LazyDefault(list)
     optimize: Optimization = Optimization.OFF
     symbols: bool = True
     warnings: WarningLevel = WarningLevel.DEFAULT
@@ -355,14 +397,14 @@ class Project:
     _explicitToolchain: bool = False
 
     # Build hooks
-    preBuildCommands: List[str] = field(default_factory=list)
-    postBuildCommands: List[str] = field(default_factory=list)
-    preLinkCommands: List[str] = field(default_factory=list)
-    postLinkCommands: List[str] = field(default_factory=list)
+    preBuildCommands: List[str] = _LazyDefault(list)
+    postBuildCommands: List[str] = _LazyDefault(list)
+    preLinkCommands: List[str] = _LazyDefault(list)
+    postLinkCommands: List[str] = _LazyDefault(list)
 
     # Platform specific (system: filter)
-    systemDefines: Dict[str, List[str]] = field(default_factory=dict)
-    systemLinks: Dict[str, List[str]] = field(default_factory=dict)
+    systemDefines: Dict[str, List[str]] = _LazyDefault(dict)
+    systemLinks: Dict[str, List[str]] = _LazyDefault(dict)
 
     # Android specifics
     androidApplicationId: str = ""
@@ -371,11 +413,11 @@ class Project:
     androidMinSdk: int = 21
     androidTargetSdk: int = 33
     androidCompileSdk: int = 33
-    androidAbis: List[str] = field(default_factory=list)
+    androidAbis: List[str] = _LazyDefault(list)
     androidProguard: bool = False
-    androidProguardRules: List[str] = field(default_factory=list)
-    androidAssets: List[str] = field(default_factory=list)
-    androidPermissions: List[str] = field(default_factory=list)
+    androidProguardRules: List[str] = _LazyDefault(list)
+    androidAssets: List[str] = _LazyDefault(list)
+    androidPermissions: List[str] = _LazyDefault(list)
     androidNativeActivity: bool = True
     androidAllowRotation: bool = True
     androidStl: str = ""  # "c++_static" | "c++_shared" | "" (auto)
@@ -385,8 +427,8 @@ class Project:
     androidKeystore: str = ""
     androidKeystorePass: str = ""
     androidKeyAlias: str = ""
-    androidJavaFiles: List[str] = field(default_factory=list)
-    androidJavaLibs: List[str] = field(default_factory=list)
+    androidJavaFiles: List[str] = _LazyDefault(list)
+    androidJavaLibs: List[str] = _LazyDefault(list)
 
     # iOS specifics (extended)
     iosBundleId: str = ""
@@ -403,7 +445,7 @@ class Project:
     iosProvisioningProfile: str = ""
 
     # Ressources spécifiques iOS (à copier dans le bundle)
-    iosResources: List[str] = field(default_factory=list)
+    iosResources: List[str] = _LazyDefault(list)
 
     # Pour tvOS, watchOS, iPadOS, visionOS on peut avoir des champs similaires
     tvosMinSdk: str = ""
@@ -412,7 +454,7 @@ class Project:
     visionosMinSdk: str = ""
 
     # Frameworks à embarquer (optionnel)
-    iosEmbedFrameworks: List[str] = field(default_factory=list)
+    iosEmbedFrameworks: List[str] = _LazyDefault(list)
 
     # Xbox specifics
     xboxSigningMode: str = "test"      # test, random, stable
@@ -420,7 +462,7 @@ class Project:
     xboxPublisher: str = "Jenga"
     xboxVersion: str = "1.0.0.0"
     xboxLEKBPath: str = ""
-    xboxAssetChunks: List[str] = field(default_factory=list)
+    xboxAssetChunks: List[str] = _LazyDefault(list)
 
     # Emscripten specifics
     emscriptenShellFile: str = ""      # Custom HTML template (shell file)
@@ -429,7 +471,7 @@ class Project:
     emscriptenInitialMemory: int = 16   # Initial memory in MB
     emscriptenStackSize: int = 5        # Stack size in MB
     emscriptenExportName: str = "Module" # Global export name
-    emscriptenExtraFlags: List[str] = field(default_factory=list)  # Extra emcc flags
+    emscriptenExtraFlags: List[str] = _LazyDefault(list)  # Extra emcc flags
 
     # HarmonyOs
     harmonyMinSdk: str = ""
@@ -444,62 +486,63 @@ class Project:
     harmonyKeyPwd : str = ""
     harmonyKeyAlias : str = ""
     harmonyKeystore : str = ""
-    harmonyResDirs: List[str] = field(default_factory=list)
-    harmonyAssets: List[str] = field(default_factory=list)
+    harmonyResDirs: List[str] = _LazyDefault(list)
+    harmonyAssets: List[str] = _LazyDefault(list)
     # Permissions HarmonyOS (ohos.permission.*) injectees dans module.json5 >
     # requestPermissions. Fusionnees avec les permissions reseau auto si
     # networkenabled(True). Voir harmonypermissions() + Core/FirewallSpec.py.
-    harmonyPermissions: List[str] = field(default_factory=list)
+    harmonyPermissions: List[str] = _LazyDefault(list)
     # Repertoires de sources ArkTS/ETS (.ets) a copier dans entry/src/main/ets.
     # Le builder les cherche via getattr(project, 'harmonyEtsDirs', []).
-    harmonyEtsDirs: List[str] = field(default_factory=list)
+    harmonyEtsDirs: List[str] = _LazyDefault(list)
 
     # Test settings
     isTest: bool = False
     parentProject: Optional[str] = None
-    testOptions: List[str] = field(default_factory=list)
-    testFiles: List[str] = field(default_factory=list)
+    testOptions: List[str] = _LazyDefault(list)
+    testFiles: List[str] = _LazyDefault(list)
     testMainFile: str = ""
     testMainTemplate: str = ""
 
     # Build options (generic)
-    buildOptions: Dict[str, List[str]] = field(default_factory=dict)
+    buildOptions: Dict[str, List[str]] = _LazyDefault(dict)
 
     # Filter context – internal
     _currentFilter: Optional[str] = None
-    _filteredFiles: Dict[str, List[str]] = field(default_factory=dict)
-    _filteredExcludeFiles: Dict[str, List[str]] = field(default_factory=dict)
-    _filteredExcludeMainFiles: Dict[str, List[str]] = field(default_factory=dict)
-    _filteredIncludeDirs: Dict[str, List[str]] = field(default_factory=dict)
-    _filteredLibDirs: Dict[str, List[str]] = field(default_factory=dict)
-    _filteredObjDir: Dict[str, str] = field(default_factory=dict)
-    _filteredTargetDir: Dict[str, str] = field(default_factory=dict)
-    _filteredTargetName: Dict[str, str] = field(default_factory=dict)
-    _filteredPchHeader: Dict[str, str] = field(default_factory=dict)
-    _filteredPchSource: Dict[str, str] = field(default_factory=dict)
-    _filteredDependsOn: Dict[str, List[str]] = field(default_factory=dict)
-    _filteredDependFiles: Dict[str, List[str]] = field(default_factory=dict)
-    _filteredEmbedResources: Dict[str, List[str]] = field(default_factory=dict)
-    _filteredDefines: Dict[str, List[str]] = field(default_factory=dict)
-    _filteredLinks: Dict[str, List[str]] = field(default_factory=dict)
-    _filteredCFlags: Dict[str, List[str]] = field(default_factory=dict)
-    _filteredCxxFlags: Dict[str, List[str]] = field(default_factory=dict)
-    _filteredLdFlags: Dict[str, List[str]] = field(default_factory=dict)
-    _filteredPreBuildCommands: Dict[str, List[str]] = field(default_factory=dict)
-    _filteredPostBuildCommands: Dict[str, List[str]] = field(default_factory=dict)
-    _filteredPreLinkCommands: Dict[str, List[str]] = field(default_factory=dict)
-    _filteredPostLinkCommands: Dict[str, List[str]] = field(default_factory=dict)
-    _filteredRemoveIncludeDirs: Dict[str, List[str]] = field(default_factory=dict)
-    _filteredRemoveLibDirs: Dict[str, List[str]] = field(default_factory=dict)
-    _filteredRemoveLinks: Dict[str, List[str]] = field(default_factory=dict)
-    _filteredRemoveDependsOn: Dict[str, List[str]] = field(default_factory=dict)
-    _filteredRemoveDefines: Dict[str, List[str]] = field(default_factory=dict)
-    _filteredKind: Dict[str, 'ProjectKind'] = field(default_factory=dict)
-    _filteredToolchain: Dict[str, str] = field(default_factory=dict)
-    _filteredOptimize: Dict[str, Optimization] = field(default_factory=dict)
-    _filteredSymbols: Dict[str, bool] = field(default_factory=dict)
-    _filteredWarnings: Dict[str, WarningLevel] = field(default_factory=dict)
-    _filteredRuntime: Dict[str, str] = field(default_factory=dict)
+    _filteredFiles: Dict[str, List[str]] = _LazyDefault(dict)
+    _filteredExcludeFiles: Dict[str, List[str]] = _LazyDefault(dict)
+    _filteredExcludeMainFiles: Dict[str, List[str]] = _LazyDefault(dict)
+    _filteredIncludeDirs: Dict[str, List[str]] = _LazyDefault(dict)
+    _filteredLibDirs: Dict[str, List[str]] = _LazyDefault(dict)
+    _filteredObjDir: Dict[str, str] = _LazyDefault(dict)
+    _filteredTargetDir: Dict[str, str] = _LazyDefault(dict)
+    _filteredTargetName: Dict[str, str] = _LazyDefault(dict)
+    _filteredPchHeader: Dict[str, str] = _LazyDefault(dict)
+    _filteredPchSource: Dict[str, str] = _LazyDefault(dict)
+    _filteredUnityBuild: Dict[str, bool] = _LazyDefault(dict)
+    _filteredDependsOn: Dict[str, List[str]] = _LazyDefault(dict)
+    _filteredDependFiles: Dict[str, List[str]] = _LazyDefault(dict)
+    _filteredEmbedResources: Dict[str, List[str]] = _LazyDefault(dict)
+    _filteredDefines: Dict[str, List[str]] = _LazyDefault(dict)
+    _filteredLinks: Dict[str, List[str]] = _LazyDefault(dict)
+    _filteredCFlags: Dict[str, List[str]] = _LazyDefault(dict)
+    _filteredCxxFlags: Dict[str, List[str]] = _LazyDefault(dict)
+    _filteredLdFlags: Dict[str, List[str]] = _LazyDefault(dict)
+    _filteredPreBuildCommands: Dict[str, List[str]] = _LazyDefault(dict)
+    _filteredPostBuildCommands: Dict[str, List[str]] = _LazyDefault(dict)
+    _filteredPreLinkCommands: Dict[str, List[str]] = _LazyDefault(dict)
+    _filteredPostLinkCommands: Dict[str, List[str]] = _LazyDefault(dict)
+    _filteredRemoveIncludeDirs: Dict[str, List[str]] = _LazyDefault(dict)
+    _filteredRemoveLibDirs: Dict[str, List[str]] = _LazyDefault(dict)
+    _filteredRemoveLinks: Dict[str, List[str]] = _LazyDefault(dict)
+    _filteredRemoveDependsOn: Dict[str, List[str]] = _LazyDefault(dict)
+    _filteredRemoveDefines: Dict[str, List[str]] = _LazyDefault(dict)
+    _filteredKind: Dict[str, 'ProjectKind'] = _LazyDefault(dict)
+    _filteredToolchain: Dict[str, str] = _LazyDefault(dict)
+    _filteredOptimize: Dict[str, Optimization] = _LazyDefault(dict)
+    _filteredSymbols: Dict[str, bool] = _LazyDefault(dict)
+    _filteredWarnings: Dict[str, WarningLevel] = _LazyDefault(dict)
+    _filteredRuntime: Dict[str, str] = _LazyDefault(dict)
 
     # Inclusion metadata
     _external: bool = False
@@ -509,6 +552,16 @@ class Project:
     _inWorkspace: bool = False
     _standalone: bool = False
 
+    def __init__(self, name: str, **fields: Any):
+        self.name = name
+        for key, value in fields.items():
+            if key not in _PROJECT_FIELD_NAMES:
+                raise TypeError(f"Project() got an unexpected keyword argument '{key}'")
+            setattr(self, key, value)
+
+
+_PROJECT_FIELD_NAMES = frozenset(Project.__dataclass_fields__)
+
 
 @dataclass
 class Workspace:
@@ -524,6 +577,7 @@ class Workspace:
     projects: Dict[str, Project] = field(default_factory=dict)
     toolchains: Dict[str, Toolchain] = field(default_factory=dict)
     defaultToolchain: Optional[str] = None
+    linker: str = "auto"         # linker() hors projet : défaut des projets
 
     # Unitest configuration (optional)
     unitestConfig: Optional[UnitestConfig] = None
@@ -1041,18 +1095,9 @@ class include:
                 proj.location = str(self._externalDir)
             elif not Path(proj.location).is_absolute() and '%{' not in proj.location:
                 proj.location = str(self._externalDir / Path(proj.location))
-            proj_base = Path(proj.location) if proj.location else self._externalDir
-
-            # Adjust all path fields
-            # Keep source patterns relative to project location.
-            proj.files = list(proj.files)
-            proj.excludeFiles = list(proj.excludeFiles)
-            proj.excludeMainFiles = list(proj.excludeMainFiles)
-            proj.includeDirs = list(proj.includeDirs)
-            proj.libDirs = list(proj.libDirs)
-            proj.dependFiles = list(proj.dependFiles)
-            proj.embedResources = list(proj.embedResources)
-            proj.testFiles = list(proj.testFiles)
+            # Les chemins (files, includeDirs, ...) restent relatifs à
+            # location : les listes du projet lui appartiennent déjà (le
+            # workspace temporaire est jeté), inutile de les recopier.
 
             # Mark as external
             proj._external = True
@@ -1616,6 +1661,25 @@ def pchsource(source: str) -> None:
         else:
             _currentProject.pchSource = source
 
+# --- Unity (jumbo) build ---
+def unitybuild(enabled: bool = True, batch_size: int = 0) -> None:
+    """
+    Compile the project's sources in batched unity TUs.
+    batch_size = number of sources per generated TU (0 = builder default).
+    """
+    if _currentProject:
+        if _currentFilter:
+            _currentProject._filteredUnityBuild[_currentFilter] = bool(enabled)
+        else:
+            _currentProject.unityBuild = bool(enabled)
+        if batch_size and batch_size > 0:
+            _currentProject.unityBatchSize = int(batch_size)
+
+def unityexclude(patterns: List[str]) -> None:
+    """Keep matching sources out of unity batches (compiled standalone)."""
+    if _currentProject:
+        _currentProject.unityExcludeFiles.extend(patterns)
+
 # --- Build hooks ---
 def prebuild(cmds: List[str]) -> None:
     if _currentProject:
@@ -2060,6 +2124,7 @@ def installeroption(key: str, value) -> None:
         installeroption("autoupdate_url", "https://updates.example.com")
         installeroption("require_admin", True)
         installeroption("install_for_all_users", False)
+        installeroption("compression", "deflate")   # --type jng : payload compresse
 
     Chaque builder (MSI WiX, Inno EXE, DEB, PKG) lit les options qu'il
     reconnait et logue un warning + skip pour les autres. Si une option
@@ -2790,9 +2855,30 @@ def cppcompiler(path: str) -> None:
     if _currentToolchain:
         _currentToolchain.cxxPath = path
 
-def linker(path: str) -> None:
+LINKER_CHOICES = ("auto", "mold", "lld", "bfd", "gold")
+
+
+def linker(value: str) -> None:
+    """
+    Dans un bloc toolchain : chemin de l'éditeur de liens (ldPath).
+
+    Dans un projet (ou au niveau workspace, pour tous les projets) : éditeur
+    de liens choisi par -fuse-ld= sur les builders Linux, Android et Zig.
+        linker("auto")   # défaut : mold, sinon lld, s'il est installé et accepte
+        linker("lld")    # force lld (ou "mold", "gold", "bfd")
+    Un éditeur indisponible ou non supporté par la toolchain laisse le défaut
+    du driver (avertissement au build).
+    """
     if _currentToolchain:
-        _currentToolchain.ldPath = path
+        _currentToolchain.ldPath = value
+        return
+    choice = str(value).strip().lower()
+    if choice not in LINKER_CHOICES:
+        raise ValueError(f"linker() expects one of {', '.join(LINKER_CHOICES)}, got {value!r}")
+    if _currentProject:
+        _currentProject.linker = choice
+    elif _currentWorkspace:
+        _currentWorkspace.linker = choice
 
 def archiver(path: str) -> None:
     if _currentToolchain:
@@ -3929,7 +4015,7 @@ __all__ = [
     'libdirs', 'syslibdirs', 'removelibdirs', 'objdir', 'targetdir', 'targetname',
     'links', 'removelinks', 'dependson', 'removedependson', 'dependfiles', 'embedresources',
     'defines', 'removedefines', 'undefines', 'optimize', 'symbols', 'warnings', 'runtime',
-    'pchheader', 'pchsource',
+    'pchheader', 'pchsource', 'unitybuild', 'unityexclude',
     'prebuild', 'postbuild', 'prelink', 'postlink',
     'usetoolchain',
     'androidsdkpath', 'androidndkpath', 'javajdkpath',
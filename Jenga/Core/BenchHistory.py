@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BenchHistory – Historique des benchmarks et détection de régressions.
+
+  - lit les résultats produits par --benchmark_out, au format Unitest
+    (PerformanceReporter : "performance_report") ou Google Benchmark
+    ("benchmarks", une entrée par répétition) ;
+  - enregistre un résumé par benchmark (moyenne, écart type, min, max,
+    échantillons) pour chaque commit / configuration / plateforme dans
+    <workspace>/.jenga/bench_history.jsonl (une ligne par exécution) ;
+  - compare deux exécutions avec les mêmes règles que
+    BenchmarkComparator::Compare : test z sur les moyennes à partir de
+    30 échantillons, recouvrement des plages [min, max] en dessous.
+
+Toutes les méthodes publiques sont en PascalCase.
+"""
+
+import json
+import math
+import subprocess
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Facteurs de conversion vers la milliseconde (time_unit de Google Benchmark)
+_TIME_UNITS_MS = {"ns": 1e-6, "us": 1e-3, "ms": 1.0, "s": 1e3}
+
+
+@dataclass
+class BenchStats:
+    """Résumé d'un benchmark, en millisecondes."""
+    name: str
+    mean: float
+    stddev: float = 0.0
+    minimum: float = 0.0
+    maximum: float = 0.0
+    samples: int = 1
+
+    def ToDict(self) -> Dict[str, Any]:
+        return {"mean": self.mean, "stddev": self.stddev, "min": self.minimum,
+                "max": self.maximum, "samples": self.samples}
+
+    @staticmethod
+    def FromDict(name: str, data: Dict[str, Any]) -> "BenchStats":
+        return BenchStats(name, float(data["mean"]), float(data.get("stddev", 0.0)),
+                          float(data.get("min", data["mean"])), float(data.get("max", data["mean"])),
+                          int(data.get("samples", 1)))
+
+    @staticmethod
+    def FromSamples(name: str, values: List[float]) -> "BenchStats":
+        n = len(values)
+        mean = sum(values) / n
+        variance = sum((v - mean) ** 2 for v in values) / (n - 1) if n > 1 else 0.0
+        return BenchStats(name, mean, math.sqrt(variance), min(values), max(values), n)
+
+
+@dataclass
+class BenchComparison:
+    name: str
+    baseline: Optional[BenchStats]
+    current: Optional[BenchStats]
+    ratio: float = 1.0            # current / baseline (> 1 : plus lent)
+    confidence: float = 0.0       # 0-1
+    significant: bool = False
+    regression: bool = False
+
+    @property
+    def changePercent(self) -> float:
+        return (self.ratio - 1.0) * 100.0
+
+
+@dataclass
+class BenchRun:
+    commit: str
+    branch: str
+    config: str
+    platform: str
+    project: str
+    timestamp: float
+    benchmarks: Dict[str, BenchStats] = field(default_factory=dict)
+
+    def ToDict(self) -> Dict[str, Any]:
+        return {"commit": self.commit, "branch": self.branch, "config": self.config,
+                "platform": self.platform, "project": self.project, "timestamp": self.timestamp,
+                "benchmarks": {n: s.ToDict() for n, s in self.benchmarks.items()}}
+
+    @staticmethod
+    def FromDict(data: Dict[str, Any]) -> "BenchRun":
+        return BenchRun(data.get("commit", ""), data.get("branch", ""), data.get("config", ""),
+                        data.get("platform", ""), data.get("project", ""), float(data.get("timestamp", 0)),
+                        {n: BenchStats.FromDict(n, s) for n, s in data.get("benchmarks", {}).items()})
+
+
+class BenchHistory:
+    """
+    Usage :
+        history = BenchHistory(workspaceRoot)
+        run = BenchHistory.NewRun(workspaceRoot, config, platform, project,
+                                  BenchHistory.LoadResults(outputFile))
+        baseline = history.FindBaseline("main", config, platform, project)
+        history.Append(run)
+        rows = BenchHistory.Compare(run, baseline, threshold=5.0)
+    """
+
+    def __init__(self, workspaceRoot: Path):
+        self.root = Path(workspaceRoot)
+        self.path = self.root / ".jenga" / "bench_history.jsonl"
+
+    # -----------------------------------------------------------------------
+    # Historique
+    # -----------------------------------------------------------------------
+
+    def Runs(self) -> List[BenchRun]:
+        runs = []
+        try:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            return runs
+        for line in lines:
+            try:
+                runs.append(BenchRun.FromDict(json.loads(line)))
+            except (ValueError, KeyError, TypeError):
+                continue  # ligne tronquée (exécution interrompue)
+        return runs
+
+    def Append(self, run: BenchRun) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(run.ToDict(), sort_keys=True) + "\n")
+
+    def FindBaseline(self, ref: str, config: str, platform: str, project: str) -> Optional[BenchRun]:
+        """
+        Latest run of the same config/platform/project recorded for ref:
+        a git revision (branch, tag, sha), a recorded commit prefix or the
+        branch name the run was recorded on.
+        """
+        commit = GitRevision(self.root, ref)
+        best = None
+        for run in self.Runs():
+            if (run.config, run.platform, run.project) != (config, platform, project):
+                continue
+            if (commit and run.commit == commit) or run.branch == ref or \
+                    (len(ref) >= 7 and run.commit.startswith(ref)):
+                if best is None or run.timestamp >= best.timestamp:
+                    best = run
+        return best
+
+    @staticmethod
+    def NewRun(workspaceRoot: Path, config: str, platform: str, project: str,
+               benchmarks: Dict[str, BenchStats]) -> BenchRun:
+        return BenchRun(GitRevision(workspaceRoot, "HEAD") or "", GitBranch(workspaceRoot) or "",
+                        config, platform, project, time.time(), benchmarks)
+
+    # -----------------------------------------------------------------------
+    # Lecture des résultats
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def LoadResults(path: Path) -> Dict[str, BenchStats]:
+        """Parse a Unitest or Google Benchmark JSON report into per-benchmark stats."""
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        samples: Dict[str, List[float]] = {}
+        if "performance_report" in data:
+            for entry in data["performance_report"].get("benchmarks", []):
+                values = entry.get("samples_ms") or [entry["mean_time_ms"]]
+                samples.setdefault(entry["name"], []).extend(float(v) for v in values)
+        else:
+            for entry in data.get("benchmarks", []):
+                if entry.get("run_type", "iteration") != "iteration" or "real_time" not in entry:
+                    continue  # agrégats (mean, median, stddev) recalculés ici
+                scale = _TIME_UNITS_MS.get(entry.get("time_unit", "ns"), 1e-6)
+                name = entry.get("run_name", entry["name"])
+                samples.setdefault(name, []).append(float(entry["real_time"]) * scale)
+        return {name: BenchStats.FromSamples(name, values) for name, values in samples.items() if values}
+
+    # -----------------------------------------------------------------------
+    # Comparaison
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def CompareStats(current: BenchStats, baseline: BenchStats, threshold: float) -> BenchComparison:
+        """
+        Same statistics as BenchmarkComparator::Compare. A regression is a
+        significant slowdown of more than threshold percent.
+        """
+        ratio = current.mean / baseline.mean if baseline.mean > 1e-12 else 1.0
+        if current.samples >= 30 and baseline.samples >= 30:
+            se = math.sqrt(current.stddev ** 2 / current.samples + baseline.stddev ** 2 / baseline.samples)
+            if se <= 1e-12:
+                significant = abs(current.mean - baseline.mean) > 1e-12
+                confidence = 1.0 if significant else 0.0
+            else:
+                t = abs(current.mean - baseline.mean) / se
+                significant = t > 1.96
+                confidence = math.erf(t / math.sqrt(2.0))
+        else:
+            overlap = BenchHistory._RangeOverlap(current, baseline)
+            significant = overlap < 0.1
+            confidence = 1.0 - overlap
+        regression = significant and (ratio - 1.0) * 100.0 > threshold
+        return BenchComparison(current.name, baseline, current, ratio, confidence, significant, regression)
+
+    @staticmethod
+    def _RangeOverlap(a: BenchStats, b: BenchStats) -> float:
+        start, end = max(a.minimum, b.minimum), min(a.maximum, b.maximum)
+        if start >= end:
+            # Plages disjointes (ou réduites à un même point)
+            return 1.0 if abs(a.minimum - b.minimum) <= 1e-12 and abs(a.maximum - b.maximum) <= 1e-12 else 0.0
+        min_range = min(a.maximum - a.minimum, b.maximum - b.minimum)
+        if min_range <= 1e-12:
+            return 1.0
+        return min(1.0, (end - start) / min_range)
+
+    @staticmethod
+    def Compare(run: BenchRun, baseline: Optional[BenchRun], threshold: float) -> List[BenchComparison]:
+        """
+        Compare every benchmark of run with baseline, ranked: regressions
+        first (largest slowdown first), then by change, then new benchmarks
+        by mean time. Without baseline, ranked by mean time.
+        """
+        rows: List[BenchComparison] = []
+        base = baseline.benchmarks if baseline else {}
+        for name, stats in run.benchmarks.items():
+            if name in base:
+                comparison = BenchHistory.CompareStats(stats, base[name], threshold)
+                comparison.name = name
+                rows.append(comparison)
+            else:
+                rows.append(BenchComparison(name, None, stats))
+        for name, stats in base.items():
+            if name not in run.benchmarks:
+                rows.append(BenchComparison(name, stats, None))
+        rows.sort(key=lambda r: (not r.regression, r.baseline is None or r.current is None,
+                                 -r.changePercent, -(r.current.mean if r.current else 0.0)))
+        return rows
+
+
+def GitRevision(root: Path, ref: str) -> Optional[str]:
+    """Commit sha of ref in the repository containing root, or None."""
+    return _Git(root, ["rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}"])
+
+
+def GitBranch(root: Path) -> Optional[str]:
+    branch = _Git(root, ["rev-parse", "--abbrev-ref", "HEAD"])
+    return branch if branch and branch != "HEAD" else None
+
+
+def _Git(root: Path, args: List[str]) -> Optional[str]:
+    try:
+        result = subprocess.run(["git", *args], cwd=str(root), capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    out = result.stdout.strip()
+    return out if result.returncode == 0 and out else None
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BuildGraph – Cache mémoire du graphe de build, gardé chaud par le daemon.
+
+Un builder résident du daemon y conserve entre deux builds :
+  - les mtimes des sources et headers (stat cache),
+  - les dépendances lues dans les fichiers .d,
+  - la liste des sources de chaque projet (résultat des globs),
+  - les signatures de compilation (flags résolus).
+Le cache ne devine jamais : il n'est branché que quand le FileWatcher du
+daemon tourne, et chaque événement du watcher invalide précisément les
+entrées concernées (OnFileEvent). Un fichier dont le watcher ne signale pas
+les changements (hors de ses racines, sous Build/ ou un répertoire caché,
+include d'un SDK...) est stat() à chaque lecture. Les sorties de build (.o,
+.d) ne sont pas mises en cache : le .d est relu si son mtime a changé.
+
+Toutes les méthodes publiques sont en PascalCase.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+class BuildGraphCache:
+    """État résident partagé par les threads de compilation d'un builder."""
+
+    def __init__(self, covers: Optional[Callable[[str], bool]] = None):
+        # covers(chemin résolu) : True si le watcher en signale les changements
+        self.covers = covers
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Optional[float]] = {}
+        self._resolved: Dict[str, Tuple[str, bool]] = {}
+        self._deps: Dict[str, Tuple[int, List[Path]]] = {}
+        self._sources: Dict[Hashable, List[str]] = {}
+        self._signatures: Dict[Hashable, str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    # -----------------------------------------------------------------------
+    # Lecture
+    # -----------------------------------------------------------------------
+
+    def MTime(self, path: Path) -> Optional[float]:
+        """mtime of a source/header, None when missing (cached until invalidated)."""
+        key, watched = self._Key(path)
+        if not watched:
+            try:
+                return os.stat(key).st_mtime
+            except OSError:
+                return None
+        with self._lock:
+            if key in self._stats:
+                self.hits += 1
+                return self._stats[key]
+        try:
+            mtime: Optional[float] = os.stat(key).st_mtime
+        except OSError:
+            mtime = None
+        with self._lock:
+            self.misses += 1
+            self._stats[key] = mtime
+        return mtime
+
+    def _Key(self, path: Path) -> Tuple[str, bool]:
+        """
+        (chemin résolu, surveillé). Clé commune avec OnFileEvent : un header
+        atteint par un lien symbolique, un '..' ou un chemin relatif (fichiers
+        .d) est invalidé comme son chemin réel. La résolution est mémorisée.
+        """
+        raw = str(path)
+        entry = self._resolved.get(raw)
+        if entry is None:
+            key = str(Path(raw).resolve())
+            entry = (key, self.covers is None or self.covers(key))
+            with self._lock:
+                self._resolved[raw] = entry
+        return entry
+
+    def Dependencies(self, depFile: Path, read: Callable[[], List[Path]]) -> List[Path]:
+        """Parsed .d content, reused while the .d file is unchanged."""
+        key = str(depFile)
+        try:
+            stamp = os.stat(key).st_mtime_ns
+        except OSError:
+            return []
+        with self._lock:
+            cached = self._deps.get(key)
+            if cached and cached[0] == stamp:
+                self.hits += 1
+                return cached[1]
+        deps = read()
+        with self._lock:
+            self.misses += 1
+            self._deps[key] = (stamp, deps)
+        return deps
+
+    def Sources(self, key: Hashable, compute: Callable[[], List[str]]) -> List[str]:
+        """Globbed source list of a project (dropped on any file creation/deletion)."""
+        with self._lock:
+            if key in self._sources:
+                self.hits += 1
+                return list(self._sources[key])
+        files = compute()
+        with self._lock:
+            self.misses += 1
+            self._sources[key] = list(files)
+        return list(files)
+
+    def Signature(self, key: Hashable, compute: Callable[[], str]) -> str:
+        """Compile signature memo (flags only change when the workspace is reloaded)."""
+        with self._lock:
+            if key in self._signatures:
+                self.hits += 1
+                return self._signatures[key]
+        signature = compute()
+        with self._lock:
+            self.misses += 1
+            self._signatures[key] = signature
+        return signature
+
+    # -----------------------------------------------------------------------
+    # Invalidation
+    # -----------------------------------------------------------------------
+
+    def OnFileEvent(self, eventType: str, path: str) -> None:
+        """Apply one FileWatcher event ('created', 'modified', 'deleted', 'moved')."""
+        key = str(Path(path).resolve())
+        prefix = key.rstrip(os.sep) + os.sep
+        with self._lock:
+            for stale in [k for k in self._stats if k == key or k.startswith(prefix)]:
+                del self._stats[stale]
+            if eventType != "modified":
+                # Un fichier apparu/disparu peut changer le résultat d'un glob
+                # ou la cible d'un lien symbolique.
+                self._sources.clear()
+                self._resolved.clear()
+
+    def Clear(self) -> None:
+        with self._lock:
+            self._stats.clear()
+            self._resolved.clear()
+            self._deps.clear()
+            self._sources.clear()
+            self._signatures.clear()
+
+    def Stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "files": len(self._stats),
+                "depfiles": len(self._deps),
+                "projects": len(self._sources),
+                "signatures": len(self._signatures),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
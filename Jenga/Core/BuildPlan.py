@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BuildPlan – Graphe de build complet d'un workspace, sans rien compiler.
+
+Le planner rejoue les étapes de Builder.BuildProject (filtres, toolchain
+du projet, PCH, unity build, objets, câblage des dépendances, link) avec
+Process en mode enregistrement : chaque commande que le builder lancerait
+est capturée telle quelle. Les générateurs (build.ninja,
+compile_commands.json) réutilisent donc exactement les flags des builders,
+quelle que soit la plateforme.
+
+Toutes les méthodes publiques sont en PascalCase.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+from .Api import Project, ProjectKind
+from ..Utils import FileSystem, Process
+
+# Commande enregistrée : (arguments, répertoire de travail)
+Command = Tuple[List[str], Optional[str]]
+
+_LINKED_KINDS = (ProjectKind.CONSOLE_APP, ProjectKind.WINDOWED_APP, ProjectKind.SHARED_LIB,
+                 ProjectKind.STATIC_LIB, ProjectKind.TEST_SUITE)
+
+
+@dataclass
+class PlannedStep:
+    """Une sortie et les commandes qui la produisent."""
+    output: str
+    inputs: List[str] = field(default_factory=list)
+    commands: List[Command] = field(default_factory=list)
+    depfile: str = ""             # fichier .d (-MMD -MF) si le compilateur en produit un
+
+
+@dataclass
+class ProjectPlan:
+    name: str
+    kind: ProjectKind
+    objectDir: str
+    directory: str                # répertoire de travail des commandes pre/post build
+    dependsOn: List[str] = field(default_factory=list)
+    pch: Optional[PlannedStep] = None
+    compiles: List[PlannedStep] = field(default_factory=list)
+    link: Optional[PlannedStep] = None
+    linkDependencies: List[str] = field(default_factory=list)   # sorties des libs dependson()
+    runtimeCopies: List[Tuple[str, str]] = field(default_factory=list)
+    preBuildCommands: List[str] = field(default_factory=list)
+    postBuildCommands: List[str] = field(default_factory=list)
+    moduleSources: List[str] = field(default_factory=list)      # C++20 modules (non planifiés)
+
+
+class BuildPlanner:
+    """
+    Usage :
+        builder = BuildCommand.CreateBuilder(workspace, config, platform, ...)
+        plans = BuildPlanner(builder).Plan(targetProject)
+    """
+
+    def __init__(self, builder):
+        self.builder = builder
+
+    def Plan(self, targetProject: Optional[str] = None,
+             withLink: bool = True) -> Optional[List[ProjectPlan]]:
+        """
+        Plans in build order, or None if the order cannot be resolved.
+        withLink=False skips the link step (compile_commands.json only needs compiles).
+        """
+        builder = self.builder
+        for proj in builder.workspace.projects.values():
+            builder._ApplyProjectFilters(proj)
+        order = builder.ResolveProjectOrder(targetProject)
+        if order is None:
+            return None
+        plans = []
+        for name in order:
+            project = builder.workspace.projects.get(name)
+            if project is not None:
+                plans.append(self.PlanProject(project, withLink))
+        return plans
+
+    def PlanProject(self, project: Project, withLink: bool = True) -> ProjectPlan:
+        builder = self.builder
+        builder._ApplyProjectFilters(project)
+        builder._SelectProjectToolchain(project)
+
+        obj_dir = builder.GetObjectDir(project)
+        plan = ProjectPlan(
+            name=project.name,
+            kind=project.kind,
+            objectDir=str(obj_dir),
+            directory=str(project.location or builder.workspace.location or "."),
+            dependsOn=[d for d in project.dependsOn if d in builder.workspace.projects],
+            preBuildCommands=[self._Expand(project, c) for c in project.preBuildCommands],
+            postBuildCommands=[self._Expand(project, c) for c in project.postBuildCommands],
+        )
+        sources = builder._CollectSourceFiles(project)
+        if not sources:
+            return plan
+        FileSystem.MakeDirectory(obj_dir)
+
+        commands, ok = self._Record(lambda: builder.PreparePCH(project, obj_dir))
+        if not ok:
+            raise RuntimeError(f"Cannot prepare the precompiled header of {project.name}")
+        pch_file = getattr(project, "_jengaPchFile", "")
+        pch_source = getattr(project, "_jengaPchSourceResolved", "")
+        if pch_file and commands:
+            pch_header = getattr(project, "_jengaPchHeaderResolved", "")
+            plan.pch = PlannedStep(pch_file, [p for p in (pch_header, pch_source) if p], commands)
+        if pch_source:
+            pch_src_norm = str(Path(pch_source).resolve())
+            sources = [s for s in sources if str(Path(s).resolve()) != pch_src_norm]
+
+        plan.moduleSources = [s for s in sources if builder.IsModuleFile(s)]
+        regular = [s for s in sources if not builder.IsModuleFile(s)]
+        if regular and builder._IsUnityEnabled(project):
+            regular = builder._ApplyUnityBuild(project, regular, obj_dir)
+
+        dep_file_of = getattr(builder, "GetDependencyFilePath", None)
+        for src in regular:
+            src_path = Path(src)
+            obj_path = str(obj_dir / src_path.with_suffix(builder.GetObjectExtension()).name)
+            commands, _ = self._Record(lambda: builder.Compile(project, str(src_path), obj_path))
+            depfile = str(dep_file_of(obj_path)) if dep_file_of else ""
+            if not any(depfile in args for args, _ in commands if isinstance(args, list)):
+                depfile = ""
+            plan.compiles.append(PlannedStep(obj_path, [str(src_path)], commands, depfile))
+
+        dep_outputs = builder._WireDependencyLinks(project)
+        plan.linkDependencies = list(dep_outputs.values())
+        if withLink and project.kind in _LINKED_KINDS and not plan.moduleSources:
+            target = builder.GetTargetPath(project)
+            objects = [c.output for c in plan.compiles]
+            commands, _ = self._Record(lambda: builder.Link(project, objects, str(target)))
+            plan.link = PlannedStep(str(target), objects, commands)
+            plan.runtimeCopies = [(str(s), str(d)) for s, d in
+                                  builder.GetRuntimeDependencies(project, target, mustExist=False)]
+        return plan
+
+    def _Expand(self, project: Project, command: str) -> str:
+        expander = getattr(self.builder, "_expander", None)
+        if not expander:
+            return command
+        expander.SetProject(project)
+        return expander.Expand(command, recursive=True)
+
+    @staticmethod
+    def _Record(job: Callable) -> Tuple[List[Command], bool]:
+        """Run job() with Process in recording mode; return (commands, success)."""
+        Process.BeginRecording()
+        try:
+            result = job()
+        finally:
+            commands = Process.EndRecording()
+        ok = result if isinstance(result, bool) else getattr(result, "returnCode", 0) == 0
+        return commands, ok
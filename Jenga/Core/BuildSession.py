@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BuildSession – Workspace et builder chargés une seule fois pour une commande
+qui construit puis utilise un artefact (jenga run, jenga deploy).
+
+Avant, ces commandes appelaient BuildCommand.Execute (chargement du
+workspace, builder, détection de toolchain) puis recréaient un builder pour
+GetTargetPath. La session réutilise le même workspace et le même builder
+pour le build et pour la recherche de l'artefact.
+
+ArtifactManifest mémorise dans <workspace>/.jenga/artifacts.json le chemin
+de l'artefact résolu par (action, config, plateforme, projet) avec
+l'empreinte (taille, mtime) des fichiers .jenga qui le décrivent. Tant que
+ces fichiers n'ont pas changé et que l'artefact existe, 'jenga run' (sans
+--build) lance l'exécutable sans recharger le workspace.
+
+Toutes les méthodes publiques sont en PascalCase.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from .._version import __version__
+from ..Utils import Colored, FileSystem
+
+_MANIFEST_VERSION = 1
+
+
+class ArtifactManifest:
+    """
+    Usage :
+        manifest = ArtifactManifest(workspaceRoot)
+        key = ArtifactManifest.Key("run", "Debug", None, None)
+        hit = manifest.Lookup(key)            # {"project", "path", ...} ou None
+        ...
+        manifest.Record(key, project.name, exe_path, jenga_files, {"test": False})
+        manifest.Save()
+    """
+
+    def __init__(self, workspaceRoot: Path):
+        self.path = Path(workspaceRoot) / ".jenga" / "artifacts.json"
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == _MANIFEST_VERSION \
+                and data.get("jenga") == __version__:
+            self._entries = dict(data.get("artifacts", {}))
+
+    @staticmethod
+    def Key(action: str, config: str, platform: Optional[str], project: Optional[str]) -> str:
+        """project/platform None : projet ou plateforme par défaut du workspace."""
+        return "|".join([action, config, platform or "", project or ""]).lower()
+
+    @staticmethod
+    def Stamp(path) -> Optional[List[int]]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return [st.st_size, st.st_mtime_ns]
+
+    def Lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """Entrée encore valide : .jenga inchangés et artefact présent."""
+        entry = self._entries.get(key)
+        if not entry or not os.path.exists(entry.get("path", "")):
+            return None
+        for path, stamp in entry.get("inputs", {}).items():
+            if ArtifactManifest.Stamp(path) != stamp:
+                return None
+        return entry
+
+    def Record(self, key: str, project: str, artifact, inputs: Iterable[str],
+               extra: Optional[Dict[str, Any]] = None) -> None:
+        entry = {
+            "project": project,
+            "path": str(artifact),
+            "inputs": {str(p): ArtifactManifest.Stamp(p) for p in inputs},
+        }
+        entry.update(extra or {})
+        if self._entries.get(key) != entry:
+            self._entries[key] = entry
+            self._dirty = True
+
+    def Save(self) -> None:
+        if not self._dirty:
+            return
+        data = {"version": _MANIFEST_VERSION, "jenga": __version__, "artifacts": self._entries}
+        try:
+            FileSystem.MakeDirectory(self.path.parent)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(data, indent=1, sort_keys=True), encoding="utf-8")
+            os.replace(tmp, self.path)
+            self._dirty = False
+        except OSError as e:
+            Colored.PrintWarning(f"Cannot write artifact manifest {self.path}: {e}")
+
+
+class BuildSession:
+    """
+    Usage :
+        session = BuildSession(entry_file, "Debug", None, action="run")
+        workspace = session.LoadWorkspace()
+        if session.Build(project.name) != 0: ...
+        exe = session.GetBuilder().GetTargetPath(project)
+        session.RecordArtifact(project, exe)
+    """
+
+    def __init__(self, entryFile: Path, config: str, platform: Optional[str], action: str = "build",
+                 verbose: bool = False, extraOptions: Optional[List[str]] = None,
+                 customOptions: Optional[Dict[str, Optional[str]]] = None, workspace: Any = None):
+        self.entryFile = Path(entryFile).resolve()
+        self.workspaceRoot = self.entryFile.parent
+        self.config = config
+        self.platform = platform
+        self.action = action
+        self.verbose = verbose
+        self.extraOptions = list(extraOptions or [])
+        self.customOptions = dict(customOptions or {})
+        self.workspace = workspace
+        self._builder = None
+        self._manifest: Optional[ArtifactManifest] = None
+
+    @property
+    def manifest(self) -> ArtifactManifest:
+        if self._manifest is None:
+            self._manifest = ArtifactManifest(self.workspaceRoot)
+        return self._manifest
+
+    def LoadWorkspace(self) -> Any:
+        """Charge le workspace (une seule fois) ; None en cas d'échec."""
+        if self.workspace is None:
+            from .Loader import Loader
+            self.workspace = Loader(verbose=self.verbose).LoadWorkspace(str(self.entryFile))
+        return self.workspace
+
+    def GetBuilder(self, target: Optional[str] = None):
+        """Builder de la session (créé au premier appel ; lève une exception si impossible)."""
+        if self._builder is None:
+            from ..Commands.Build import BuildCommand
+            workspace = self.LoadWorkspace()
+            if workspace is None:
+                raise RuntimeError("Failed to load workspace.")
+            custom = BuildCommand.ResolveWorkspaceOptions(workspace, self.customOptions)
+            options = BuildCommand.CollectFilterOptions(
+                config=self.config,
+                platform=self.platform,
+                target=target,
+                verbose=self.verbose,
+                no_cache=False,
+                no_daemon=True,
+                extra=[f"action:{self.action}"] + self.extraOptions,
+                custom_option_values=custom
+            )
+            self._builder = BuildCommand.CreateBuilder(workspace, self.config, self.platform, target,
+                                                       self.verbose, action=self.action, options=options)
+        return self._builder
+
+    def Build(self, target: Optional[str] = None) -> int:
+        """Build de target avec le builder de la session (résumé warnings/erreurs comme jenga build)."""
+        from ..Utils.Reporter import Reporter
+        try:
+            builder = self.GetBuilder(target)
+        except Exception as e:
+            Colored.PrintError(f"Cannot create builder: {e}")
+            return 1
+        Reporter.Reset()
+        try:
+            return builder.Build(target)
+        finally:
+            Reporter.PrintCollectedSummary()
+
+    def RecordArtifact(self, project, artifact, requestedProject: Optional[str] = None,
+                       extra: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Mémorise l'artefact de project pour la plateforme demandée ; aussi sous
+        la clé « projet par défaut » quand aucun projet n'a été demandé.
+        """
+        inputs = BuildSession.CollectJengaFiles(self.workspace, self.entryFile)
+        for name in {project.name, requestedProject}:
+            key = ArtifactManifest.Key(self.action, self.config, self.platform, name)
+            self.manifest.Record(key, project.name, artifact, inputs, extra)
+        self.manifest.Save()
+
+    @staticmethod
+    def CollectJengaFiles(workspace, entryFile: Path) -> List[str]:
+        """Fichiers .jenga dont dépend la description (entrée + include())."""
+        files = {str(Path(entryFile).resolve())}
+        items = list(getattr(workspace, "projects", {}).values()) + list(getattr(workspace, "toolchains", {}).values())
+        for item in items:
+            external = getattr(item, "_externalFile", "")
+            if external:
+                files.add(str(Path(external).resolve()))
+        return sorted(files)
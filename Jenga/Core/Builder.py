@@ -61,6 +61,16 @@ PLATFORM_SPECIFIC_EXTENSIONS: Dict[str, str] = {
     '.metal': 'xcode',
 }
 
+# Unity build : extensions regroupables et extension de la TU générée.
+# Objective-C(++) et assembleur restent toujours compilés individuellement.
+UNITY_SOURCE_EXTENSIONS: Dict[str, str] = {
+    '.c':   '.c',
+    '.cpp': '.cpp', '.cc': '.cpp', '.cxx': '.cpp', '.c++': '.cpp',
+}
+
+# Nombre de sources par TU unity quand unitybuild() ne précise pas batch_size.
+UNITY_DEFAULT_BATCH_SIZE = 8
+
 
 class Builder(abc.ABC):
     """
@@ -125,6 +135,28 @@ class Builder(abc.ABC):
         # Parallel compilation: 0 = auto-detect, 1 = sequential, N = N jobs
         self.jobs = 0  # Will be set by BuildCommand.CreateBuilder()
 
+        # Resource-aware throttling (see ResourceLimiter): 0 = auto
+        self.linkJobs = 0
+        self.memoryBudgetMb = 0
+        self.maxLoad = 0.0
+        self.throttle = os.environ.get('JENGA_NO_THROTTLE', '').lower() not in ('1', 'true', 'yes')
+        self._limiter = None
+
+        # Unity build forcé par la CLI (--unity / --no-unity), None = suivre le projet
+        self.unity: Optional[bool] = None
+
+        # Cache résident (BuildGraphCache) branché par le daemon quand son
+        # FileWatcher tourne ; None = tout relire sur disque.
+        self.graphCache = None
+
+        # Restriction du build à ces projets (jenga watch), None = tous
+        self.onlyProjects: Optional[Set[str]] = None
+
+        # Éditeur de liens retenu par projet (ResolveLinker) et durée du
+        # dernier link (secondes, éditeur) rapportée par BuildCoordinator.
+        self._linkerChoices: Dict[str, Optional[str]] = {}
+        self._lastLinkTime: Optional[Tuple[float, str]] = None
+
         self._ValidateHostTarget()
         self._ResolveToolchain()
 
@@ -267,6 +299,105 @@ class Builder(abc.ABC):
             # Fallback si multiprocessing.cpu_count() échoue
             return 1
 
+    def _GetResourceLimiter(self):
+        """
+        Limiteur partagé par tous les jobs de ce builder (créé à la demande).
+        Retourne None si le throttling est désactivé (--no-throttle ou
+        JENGA_NO_THROTTLE=1).
+        """
+        if not self.throttle:
+            return None
+        if self._limiter is None:
+            from .ResourceLimiter import ResourceLimiter
+            max_jobs = self._GetEffectiveJobs()
+            link_jobs = self.linkJobs if self.linkJobs > 0 else max(1, max_jobs // 4)
+            budget_kb = self.memoryBudgetMb * 1024 if self.memoryBudgetMb > 0 else None
+            max_load = self.maxLoad if self.maxLoad > 0 else None
+            stats_root = Path(self.workspace.location) if self.workspace and self.workspace.location else None
+            self._limiter = ResourceLimiter(max_jobs, link_jobs, budget_kb, max_load, stats_root)
+        return self._limiter
+
+    def _RunThrottled(self, kind: str, key: str, job):
+        """
+        Exécute job() quand le limiteur l'autorise et enregistre son pic RSS
+        (mesuré via wait4 sur les processus lancés par ce thread).
+        """
+        limiter = self._GetResourceLimiter()
+        if limiter is None:
+            return job()
+        reserved = limiter.Acquire(kind, key)
+        Process.BeginResourceTracking()
+        try:
+            return job()
+        finally:
+            peak = Process.EndResourceTracking()
+            limiter.Release(kind, key, reserved, peak)
+
+    def _CompileThrottled(self, project: Project, sourceFile: str, objectFile: str) -> ProcessResult:
+        return self._RunThrottled("compile", str(objectFile),
+                                  lambda: self.Compile(project, sourceFile, objectFile))
+
+    def _LinkThrottled(self, project: Project, objectFiles: List[str], outputFile: str) -> bool:
+        return self._RunThrottled("link", str(outputFile),
+                                  lambda: self.Link(project, objectFiles, outputFile))
+
+    # -----------------------------------------------------------------------
+    # Éditeur de liens (-fuse-ld=) : linker("auto"|"mold"|"lld"|"bfd"|"gold")
+    # -----------------------------------------------------------------------
+
+    # Préférence de linker("auto") et choix acceptés par le builder. Vides :
+    # le builder ne passe jamais -fuse-ld= (défaut du driver).
+    AUTO_LINKERS: Tuple[str, ...] = ()
+    SUPPORTED_LINKERS: Tuple[str, ...] = ()
+
+    def ResolveLinker(self, project: Project) -> Optional[str]:
+        """
+        Éditeur de liens à passer au driver par -fuse-ld= pour project, ou None
+        (défaut du driver). Choix : linker() du projet, sinon du workspace,
+        sinon "auto" = premier de AUTO_LINKERS installé et accepté par le
+        driver (sonde -fuse-ld=<nom> -Wl,--version, une fois par processus).
+        Un -fuse-ld= déjà présent dans les ldflags reste prioritaire.
+        """
+        if project.name in self._linkerChoices:
+            return self._linkerChoices[project.name]
+        selected = None
+        choice = (project.linker or getattr(self.workspace, "linker", "") or "auto").lower()
+        ldflags = list(self.toolchain.ldflags or []) + list(project.ldflags or [])
+        if self.SUPPORTED_LINKERS and not any(str(flag).startswith("-fuse-ld=") for flag in ldflags):
+            if choice == "auto":
+                candidates = self.AUTO_LINKERS
+            elif choice in self.SUPPORTED_LINKERS:
+                candidates = (choice,)
+            else:
+                candidates = ()
+                Colored.PrintWarning(f"{project.name}: linker(\"{choice}\") is not supported by "
+                                     f"toolchain {self.toolchain.name}; using its default linker.")
+            selected = next((name for name in candidates if self._ProbeLinker(name)), None)
+            if selected is None and candidates and choice != "auto":
+                Colored.PrintWarning(f"{project.name}: linker \"{choice}\" not found or rejected by "
+                                     f"{self._LinkerDriver()[0]}; using the default linker.")
+        self._linkerChoices[project.name] = selected
+        return selected
+
+    def FuseLdFlags(self, project: Project) -> List[str]:
+        """["-fuse-ld=<nom>"] si ResolveLinker retient un éditeur, sinon []."""
+        name = self.ResolveLinker(project)
+        return [f"-fuse-ld={name}"] if name else []
+
+    def _LinkerDriver(self) -> List[str]:
+        """Driver de l'édition de liens (le vrai compilateur si ccache l'enveloppe)."""
+        return [str(getattr(self.toolchain, "_original_cxxPath", None) or self.toolchain.cxxPath)]
+
+    def _ProbeLinker(self, name: str) -> bool:
+        """Éditeur installé (PATH ou à côté du driver) et accepté par -fuse-ld=."""
+        driver = self._LinkerDriver()
+        driver_dir = Path(driver[0]).parent
+        installed = name in (self.toolchainManager.linkers or ToolchainManager.DetectLinkers()) or any(
+            (driver_dir / (exe + suffix)).is_file()
+            for exe in ToolchainManager.LINKER_EXECUTABLES.get(name, ())
+            for suffix in ("", ".exe"))
+        return installed and ToolchainManager.SupportsFuseLd(driver, name)
+
     # -----------------------------------------------------------------------
     # Méthodes abstraites
     # -----------------------------------------------------------------------
@@ -440,25 +571,16 @@ class Builder(abc.ABC):
             # Linux, et tous les autres Unix-like
             return [".so"]
 
-    def CopyRuntimeDependencies(self, project: Project, appOutputPath: Path) -> None:
+    def GetRuntimeDependencies(self, project: Project, appOutputPath: Path,
+                               mustExist: bool = True) -> List[Tuple[Path, Path]]:
         """
-        Copie toutes les bibliothèques dynamiques (SHARED_LIB) dont dépend
-        un projet CONSOLE_APP / WINDOWED_APP / TEST_SUITE dans le même dossier
-        que l'exécutable/application généré.
-
-        Appelé systématiquement après chaque build de projet application,
-        y compris en build incrémental (quand le link est skipé), afin de
-        garantir que les fichiers runtime sont toujours présents.
-
-        IMPORTANT : on itère sur project.dependsOn et non project.links, car
-        project.links est réécrit avec des chemins absolus par dep_link_map
-        dans BuildProject — workspace.projects.get(chemin_absolu) retourne None.
-
-        Les sous-classes peuvent surcharger cette méthode pour un comportement
-        spécifique (ex: EmscriptenBuilder pour les side modules WASM).
+        Bibliothèques dynamiques dont dépend une application : liste de
+        (fichier produit par le projet SHARED_LIB, copie à côté de l'exécutable).
+        Utilisé par CopyRuntimeDependencies et par le cache de résultats de tests.
+        mustExist=False : sorties attendues, même pas encore construites (BuildPlan).
         """
         if project.kind not in (ProjectKind.CONSOLE_APP, ProjectKind.WINDOWED_APP, ProjectKind.TEST_SUITE):
-            return
+            return []
 
         dest_dir = appOutputPath.parent
         shared_exts = self.GetSharedLibExtensions()
@@ -473,6 +595,7 @@ class Builder(abc.ABC):
             if name not in dep_names_to_check:
                 dep_names_to_check.append(name)
 
+        runtime: List[Tuple[Path, Path]] = []
         for dep_name in dep_names_to_check:
             dep_proj = self.workspace.projects.get(dep_name)
             if not dep_proj or dep_proj.kind != ProjectKind.SHARED_LIB:
@@ -482,7 +605,7 @@ class Builder(abc.ABC):
 
             # Chercher le fichier avec l'extension attendue pour cette plateforme
             candidate = dep_out
-            if not candidate.exists():
+            if mustExist and not candidate.exists():
                 # Essayer toutes les extensions connues pour ce système
                 found = False
                 for ext in shared_exts:
@@ -495,8 +618,27 @@ class Builder(abc.ABC):
                     print(f"[WARNING] Shared lib not found for '{dep_name}': {dep_out}")
                     continue
 
-            dest = dest_dir / candidate.name
+            runtime.append((candidate, dest_dir / candidate.name))
+        return runtime
+
+    def CopyRuntimeDependencies(self, project: Project, appOutputPath: Path) -> None:
+        """
+        Copie toutes les bibliothèques dynamiques (SHARED_LIB) dont dépend
+        un projet CONSOLE_APP / WINDOWED_APP / TEST_SUITE dans le même dossier
+        que l'exécutable/application généré.
+
+        Appelé systématiquement après chaque build de projet application,
+        y compris en build incrémental (quand le link est skipé), afin de
+        garantir que les fichiers runtime sont toujours présents.
 
+        IMPORTANT : on itère sur project.dependsOn et non project.links, car
+        project.links est réécrit avec des chemins absolus par dep_link_map
+        dans BuildProject — workspace.projects.get(chemin_absolu) retourne None.
+
+        Les sous-classes peuvent surcharger cette méthode pour un comportement
+        spécifique (ex: EmscriptenBuilder pour les side modules WASM).
+        """
+        for candidate, dest in self.GetRuntimeDependencies(project, appOutputPath):
             # Copie seulement si absent ou source plus récent
             if not dest.exists() or candidate.stat().st_mtime > dest.stat().st_mtime:
                 try:
@@ -882,6 +1024,7 @@ class Builder(abc.ABC):
                 "targetName": project.targetName,
                 "pchHeader": project.pchHeader,
                 "pchSource": project.pchSource,
+                "unityBuild": getattr(project, "unityBuild", False),
                 "optimize": project.optimize,
                 "symbols": project.symbols,
                 "warnings": project.warnings,
@@ -910,6 +1053,7 @@ class Builder(abc.ABC):
         project.targetName = base["targetName"]
         project.pchHeader = base["pchHeader"]
         project.pchSource = base["pchSource"]
+        project.unityBuild = base.get("unityBuild", False)
         project.optimize = base["optimize"]
         project.symbols = base["symbols"]
         project.warnings = base["warnings"]
@@ -991,6 +1135,9 @@ class Builder(abc.ABC):
         for filter_name, pch_source in getattr(project, "_filteredPchSource", {}).items():
             if self._FilterMatches(filter_name, project):
                 project.pchSource = pch_source
+        for filter_name, unity in getattr(project, "_filteredUnityBuild", {}).items():
+            if self._FilterMatches(filter_name, project):
+                project.unityBuild = unity
 
         for filter_name, k in getattr(project, "_filteredKind", {}).items():
             if self._FilterMatches(filter_name, project):
@@ -1053,6 +1200,12 @@ class Builder(abc.ABC):
         Parse a Make-style .d dependency file and return normalized paths.
         This parser is tolerant to Windows drive letters and escaped colons.
         """
+        cache = getattr(self, "graphCache", None)
+        if cache is not None:
+            return cache.Dependencies(depFile, lambda: self._ReadDependencyFile(depFile, project))
+        return self._ReadDependencyFile(depFile, project)
+
+    def _ReadDependencyFile(self, depFile: Path, project: Project) -> List[Path]:
         if not depFile.exists():
             return []
         try:
@@ -1098,13 +1251,14 @@ class Builder(abc.ABC):
         """
         src = Path(sourceFile)
         obj = Path(objectFile)
-        if not src.exists():
+        src_mtime = self._SourceMTime(src)
+        if src_mtime is None:
             return False
-        if not obj.exists():
+        try:
+            obj_mtime = obj.stat().st_mtime
+        except OSError:
             return True
-
-        obj_mtime = obj.stat().st_mtime
-        if src.stat().st_mtime > obj_mtime:
+        if src_mtime > obj_mtime:
             return True
 
         dep_file = self.GetDependencyFilePath(objectFile)
@@ -1116,12 +1270,8 @@ class Builder(abc.ABC):
             return True
 
         for dep in deps:
-            try:
-                if not dep.exists():
-                    return True
-                if dep.stat().st_mtime > obj_mtime:
-                    return True
-            except OSError:
+            dep_mtime = self._SourceMTime(dep)
+            if dep_mtime is None or dep_mtime > obj_mtime:
                 return True
 
         expected_signature = self._ComputeCompileSignature(project, sourceFile, objectFile)
@@ -1131,6 +1281,16 @@ class Builder(abc.ABC):
 
         return False
 
+    def _SourceMTime(self, path: Path) -> Optional[float]:
+        """mtime of a source or header (None if missing), from the daemon's stat cache when attached."""
+        cache = getattr(self, "graphCache", None)
+        if cache is not None:
+            return cache.MTime(path)
+        try:
+            return path.stat().st_mtime
+        except OSError:
+            return None
+
     def _GetCompileSignaturePath(self, objectFile: str) -> Path:
         """Sidecar file storing the compile signature for an object file."""
         return Path(f"{objectFile}.jenga_sig")
@@ -1158,6 +1318,14 @@ class Builder(abc.ABC):
         Build a deterministic signature for one compile unit.
         Any change in compile-relevant context should invalidate cached objects.
         """
+        cache = getattr(self, "graphCache", None)
+        if cache is not None:
+            key = (project.name, getattr(project, "_jenga_applied_filter_context", ""),
+                   str(getattr(project, "_jengaPchFile", "")), sourceFile, objectFile)
+            return cache.Signature(key, lambda: self._BuildCompileSignature(project, sourceFile, objectFile))
+        return self._BuildCompileSignature(project, sourceFile, objectFile)
+
+    def _BuildCompileSignature(self, project: Project, sourceFile: str, objectFile: str) -> str:
         try:
             module_flags = [str(f) for f in self.GetModuleFlags(project, sourceFile)]
         except Exception:
@@ -1215,6 +1383,120 @@ class Builder(abc.ABC):
         encoded = json.dumps(payload, sort_keys=True, ensure_ascii=True, separators=(",", ":"))
         return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
 
+    # ============================================================
+    # Unity (jumbo) build
+    # ============================================================
+
+    def _IsUnityEnabled(self, project: Project) -> bool:
+        if self.unity is not None:
+            return bool(self.unity)
+        return bool(getattr(project, "unityBuild", False))
+
+    def _PlanUnityBatches(self, project: Project,
+                          sources: List[str]) -> Tuple[List[Tuple[str, List[str]]], List[str]]:
+        """
+        Répartit les sources en lots unity, de façon déterministe.
+        Les sources sont groupées par (répertoire, langage) puis découpées
+        dans l'ordre trié aux fichiers « ancres » (hash du nom multiple de
+        batch_size, soit des lots de batch_size en moyenne ; un lot de plus
+        du double est recoupé à un second niveau d'ancres). Les coupures ne
+        dépendent que des noms : ajouter ou retirer un fichier ne modifie que
+        son lot (ou le scinde/fusionne avec son voisin s'il est une ancre), et
+        modifier un fichier n'invalide que son lot (via le .d de la TU
+        unity). Un lot est nommé d'après son premier membre, pas d'après sa
+        position.
+        Retourne ([(nom_tu, membres)], sources_compilées_seules).
+        """
+        batch_size = int(getattr(project, "unityBatchSize", 0) or 0) or UNITY_DEFAULT_BATCH_SIZE
+        opted_out: Set[str] = set()
+        if getattr(project, "unityExcludeFiles", None):
+            base_dir = self._GetProjectBaseDir(project)
+            for pattern in project.unityExcludeFiles:
+                opted_out.update(str(Path(m).resolve()) for m in self._MatchFilePattern(project, base_dir, pattern))
+
+        groups: Dict[Tuple[str, str], List[str]] = {}
+        standalone: List[str] = []
+        for src in sources:
+            unity_ext = UNITY_SOURCE_EXTENSIONS.get(Path(src).suffix.lower())
+            if unity_ext is None or str(Path(src).resolve()) in opted_out:
+                standalone.append(src)
+                continue
+            groups.setdefault((str(Path(src).resolve().parent), unity_ext), []).append(src)
+
+        batches: List[Tuple[str, List[str]]] = []
+        for (directory, unity_ext) in sorted(groups):
+            members = sorted(groups[(directory, unity_ext)])
+            digest = hashlib.sha1(directory.encode("utf-8")).hexdigest()[:8]
+            keys = {m: int(hashlib.sha1(Path(m).name.encode("utf-8")).hexdigest()[:8], 16) for m in members}
+            chunks: List[List[str]] = []
+            for chunk in self._SplitAtUnityAnchors(members, keys, batch_size, 0):
+                # Lot trop gros : recoupé aux ancres d'un second niveau de hash,
+                # toujours sans dépendre des lots voisins
+                if len(chunk) > 2 * batch_size:
+                    chunks.extend(self._SplitAtUnityAnchors(chunk, keys, batch_size, 1))
+                else:
+                    chunks.append(chunk)
+            for chunk in chunks:
+                if len(chunk) < 2:
+                    standalone.extend(chunk)
+                    continue
+                first = hashlib.sha1(Path(chunk[0]).name.encode("utf-8")).hexdigest()[:8]
+                batches.append((f"unity_{digest}_{first}{unity_ext}", chunk))
+        return batches, sorted(standalone)
+
+    @staticmethod
+    def _SplitAtUnityAnchors(members: List[str], keys: Dict[str, int],
+                             batchSize: int, level: int) -> List[List[str]]:
+        """Coupe la liste triée devant chaque ancre du niveau donné."""
+        chunks: List[List[str]] = []
+        for member in members:
+            if not chunks or keys[member] // batchSize ** level % batchSize == 0:
+                chunks.append([])
+            chunks[-1].append(member)
+        return chunks
+
+    def _WriteUnitySources(self, project: Project, batches: List[Tuple[str, List[str]]],
+                           objDir: Path) -> List[str]:
+        """
+        Écrit les TU unity dans <objdir>/unity. Un fichier inchangé n'est pas
+        réécrit, pour garder son mtime et donc l'objet en cache.
+        """
+        unity_dir = objDir / "unity"
+        FileSystem.MakeDirectory(unity_dir)
+        written: List[str] = []
+        for name, members in batches:
+            content = f"// Generated by Jenga (unity build of {project.name}) - do not edit\n"
+            content += "".join(f'#include "{Path(m).resolve().as_posix()}"\n' for m in members)
+            path = unity_dir / name
+            try:
+                current = path.read_text(encoding="utf-8") if path.exists() else None
+            except OSError:
+                current = None
+            if current != content:
+                path.write_text(content, encoding="utf-8")
+            written.append(str(path))
+
+        # Les lots disparus (fichiers retirés) ne doivent pas rester sur le disque.
+        keep = {Path(p).name for p in written}
+        for stale in unity_dir.iterdir():
+            if stale.is_file() and stale.name.startswith("unity_") and stale.name not in keep:
+                try:
+                    stale.unlink()
+                except OSError:
+                    pass
+        return written
+
+    def _ApplyUnityBuild(self, project: Project, sources: List[str], objDir: Path) -> List[str]:
+        """Remplace les sources groupables par leurs TU unity; renvoie la liste à compiler."""
+        batches, standalone = self._PlanUnityBatches(project, sources)
+        if not batches:
+            return sources
+        unity_sources = self._WriteUnitySources(project, batches, objDir)
+        grouped = sum(len(members) for _, members in batches)
+        Reporter.Info(f"Unity build: {grouped} source(s) in {len(batches)} batch(es), "
+                      f"{len(standalone)} standalone")
+        return unity_sources + standalone
+
     # ============================================================
     # Support modules C++20
     # ============================================================
@@ -1254,10 +1536,80 @@ class Builder(abc.ABC):
         else:  # Clang/GCC
             return ".pcm"
 
+    def _GetModuleScanner(self, project: Project, obj_dir: Path):
+        from .ModuleScanner import ModuleScanner
+        if self.toolchain.compilerFamily == CompilerFamily.MSVC:
+            flags = self._GetModulePCHIncludes(project)
+        else:
+            flags = self._GetCompilerFlagsForModules(project)
+        return ModuleScanner(self.toolchain, flags,
+                             cacheFile=obj_dir / "modules" / "scan_cache.json",
+                             jobs=self._GetEffectiveJobs())
+
+    def _CollectDependencyModuleBMIs(self, project: Project) -> Dict[str, str]:
+        """BMIs exportés par les projets dont dépend ce projet (déjà compilés)."""
+        bmis: Dict[str, str] = {}
+        if not self.workspace:
+            return bmis
+        for dep_name in project.dependsOn:
+            dep_proj = self.workspace.projects.get(dep_name)
+            if dep_proj is not None:
+                bmis.update(getattr(dep_proj, "_jengaModuleBMIs", {}) or {})
+        return bmis
+
+    def _PrecompileModule(self, project: Project, src: Path, bmi_path: Path,
+                          dep_bmis: Dict[str, str]) -> ProcessResult:
+        """Précompile un module; dep_bmis = BMIs des modules qu'il importe."""
+        if self.toolchain.compilerFamily == CompilerFamily.MSVC:
+            # MSVC: cl /std:c++20 /interface module.cppm /Fo module.ifc
+            args = [str(self.toolchain.cxxPath), "/std:c++20", "/interface",
+                    str(src), "/Fo", str(bmi_path)]
+            args.extend(self._GetModulePCHIncludes(project))
+            args.extend(f"/reference:{name}={path}" for name, path in sorted(dep_bmis.items()))
+        elif self.toolchain.compilerFamily == CompilerFamily.GCC:
+            # GCC: g++ -std=c++20 -fmodules-ts -c module.cppm -o module.o
+            # Note: GCC génère directement un .o, pas de BMI séparé
+            # (-x c++ : sans lui, g++ traite .cppm/.ixx comme une entrée du linker)
+            args = [str(self.toolchain.cxxPath), "-std=c++20", "-fmodules-ts",
+                    "-x", "c++", "-c", str(src), "-o", str(bmi_path.with_suffix('.o'))]
+            args.extend(self._GetCompilerFlagsForModules(project))
+        else:  # Clang (défaut)
+            # Clang: clang++ -std=c++20 --precompile module.cppm -o module.pcm
+            args = [str(self.toolchain.cxxPath), "-std=c++20", "--precompile",
+                    str(src), "-o", str(bmi_path)]
+            args.extend(self._GetCompilerFlagsForModules(project))
+            args.extend(f"-fmodule-file={name}={path}" for name, path in sorted(dep_bmis.items()))
+
+        return self._RunThrottled(
+            "compile", str(bmi_path),
+            lambda: Process.ExecuteCommand(args, captureOutput=True, silent=False))
+
+    def _NeedsPrecompileModule(self, project: Project, src: Path, output: Path,
+                               dep_outputs: List[str]) -> bool:
+        """BMI à refaire si absent, plus ancien que la source/les BMIs importés, ou signature changée."""
+        if not output.exists():
+            return True
+        out_mtime = output.stat().st_mtime
+        try:
+            if src.stat().st_mtime > out_mtime:
+                return True
+            for dep in dep_outputs:
+                if Path(dep).stat().st_mtime > out_mtime:
+                    return True
+        except OSError:
+            return True
+        expected = self._ComputeCompileSignature(project, str(src), str(output))
+        return self._ReadCompileSignature(str(output)) != expected
+
     def _PrecompileModules(self, project: Project, module_files: List[str], obj_dir: Path) -> bool:
         """
         Précompile tous les modules C++20 pour générer les BMI.
 
+        Les dépendances entre modules sont scannées (P1689, avec cache), puis
+        les BMI sont compilés en parallèle dans l'ordre topologique du graphe
+        d'imports : un module démarre dès que tous les modules qu'il importe
+        sont prêts.
+
         Args:
             project: Projet en cours
             module_files: Liste des fichiers modules
@@ -1266,45 +1618,111 @@ class Builder(abc.ABC):
         Returns:
             True si succès, False sinon
         """
+        from .ModuleScanner import BuildModuleGraph, TopologicalOrder
+
         bmi_dir = obj_dir / "modules"
         FileSystem.MakeDirectory(bmi_dir)
+        bmi_ext = self._GetBMIExtension()
+        is_gcc = self.toolchain.compilerFamily == CompilerFamily.GCC
 
-        for mod_file in module_files:
-            src = Path(mod_file)
-            mod_name = self._ExtractModuleName(str(src))
-            bmi_ext = self._GetBMIExtension()
-            bmi_path = bmi_dir / f"{src.stem}{bmi_ext}"
+        scanner = self._GetModuleScanner(project, obj_dir)
+        scan = scanner.Scan(module_files)
+        scanner.SaveCache()
+        deps, unresolved = BuildModuleGraph(scan)
+        try:
+            TopologicalOrder(deps)
+        except ValueError as e:
+            Colored.PrintError(str(e))
+            return False
 
-            # Commande de précompilation selon le compilateur
-            if self.toolchain.compilerFamily == CompilerFamily.MSVC:
-                # MSVC: cl /std:c++20 /interface module.cppm /Fo module.ifc
-                args = [str(self.toolchain.cxxPath), "/std:c++20", "/interface",
-                        str(src), "/Fo", str(bmi_path)]
-                args.extend(self._GetModulePCHIncludes(project))
-            elif self.toolchain.compilerFamily == CompilerFamily.GCC:
-                # GCC: g++ -std=c++20 -fmodules-ts -c module.cppm -o module.o
-                # Note: GCC génère directement un .o, pas de BMI séparé
-                args = [str(self.toolchain.cxxPath), "-std=c++20", "-fmodules-ts",
-                        "-c", str(src), "-o", str(bmi_path.with_suffix('.o'))]
-                args.extend(self._GetCompilerFlagsForModules(project))
-            else:  # Clang (défaut)
-                # Clang: clang++ -std=c++20 --precompile module.cppm -o module.pcm
-                args = [str(self.toolchain.cxxPath), "-std=c++20", "--precompile",
-                        str(src), "-o", str(bmi_path)]
-                args.extend(self._GetCompilerFlagsForModules(project))
-
-            # Exécuter la précompilation
-            result = Process.ExecuteCommand(args, captureOutput=True, silent=False)
-            self._lastResult = result
-            if result.returnCode != 0:
-                Colored.PrintError(f"Failed to precompile module: {mod_file}")
-                return False
+        # Modules fournis par les projets dépendants : importables tels quels.
+        external_bmis = self._CollectDependencyModuleBMIs(project)
+        project._jengaModuleBMIs.update(external_bmis)
+        if self.verbose:
+            for src, names in sorted(unresolved.items()):
+                missing = sorted(n for n in names if n not in external_bmis)
+                if missing:
+                    Reporter.Info(f"{Path(src).name}: imports not built by Jenga: {', '.join(missing)}")
+
+        names: Dict[str, str] = {}
+        bmi_paths: Dict[str, Path] = {}
+        for src in module_files:
+            provides = scan[src].provides
+            names[src] = provides[0] if provides else self._ExtractModuleName(src)
+            bmi_paths[src] = bmi_dir / f"{Path(src).stem}{bmi_ext}"
+        project._jengaModuleNames = dict(names)
+
+        def _output(src: str) -> Path:
+            return bmi_paths[src].with_suffix('.o') if is_gcc else bmi_paths[src]
+
+        def _transitive(src: str) -> Set[str]:
+            seen: Set[str] = set()
+            stack = list(deps[src])
+            while stack:
+                d = stack.pop()
+                if d not in seen:
+                    seen.add(d)
+                    stack.extend(deps[d])
+            return seen
+
+        def _build(src: str) -> Optional[ProcessResult]:
+            required = _transitive(src)
+            dep_bmis = {names[d]: str(bmi_paths[d]) for d in required}
+            for name in scan[src].requires:
+                if name in external_bmis:
+                    dep_bmis[name] = external_bmis[name]
+            output = _output(src)
+            if not self._NeedsPrecompileModule(project, Path(src), output,
+                                               [str(_output(d)) for d in required]):
+                return None
+            result = self._PrecompileModule(project, Path(src), bmi_paths[src], dep_bmis)
+            if result.returnCode == 0:
+                self._WriteCompileSignature(
+                    str(output), self._ComputeCompileSignature(project, src, str(output)))
+            return result
 
-            # Stocker le BMI pour utilisation ultérieure
-            project._jengaModuleBMIs[mod_name] = str(bmi_path)
-            Reporter.Success(f"Module '{mod_name}' precompiled -> {bmi_path.name}")
+        pending = {src: set(d) for src, d in deps.items()}
+        dependents: Dict[str, Set[str]] = {src: set() for src in deps}
+        for src, d in deps.items():
+            for dep in d:
+                dependents[dep].add(src)
 
-        return True
+        success = True
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self._GetEffectiveJobs()) as executor:
+            running: Dict[concurrent.futures.Future, str] = {}
+
+            def _submit_ready() -> None:
+                for src in sorted(s for s, d in pending.items() if not d):
+                    del pending[src]
+                    running[executor.submit(_build, src)] = src
+
+            _submit_ready()
+            while running:
+                done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    src = running.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as exc:
+                        Reporter.Error(f"Module precompilation exception for {src}: {exc}")
+                        success = False
+                        continue
+                    if result is not None:
+                        self._lastResult = result
+                        if result.returnCode != 0:
+                            Colored.PrintError(f"Failed to precompile module: {src}")
+                            success = False
+                            continue
+                        Reporter.Success(f"Module '{names[src]}' precompiled -> {bmi_paths[src].name}")
+                    # Stocker le BMI pour utilisation ultérieure
+                    project._jengaModuleBMIs[names[src]] = str(bmi_paths[src])
+                    for child in dependents[src]:
+                        if child in pending:
+                            pending[child].discard(src)
+                if success:
+                    _submit_ready()
+
+        return success and not pending
 
     def _CompileModuleToObject(self, project: Project, moduleFile: str, objectFile: str, obj_dir: Path) -> bool:
         """
@@ -1323,18 +1741,20 @@ class Builder(abc.ABC):
             True si succès, False sinon
         """
         # GCC génère directement un .o, donc on copie juste
+        scanned_name = getattr(project, "_jengaModuleNames", {}).get(moduleFile)
         if self.toolchain.compilerFamily == CompilerFamily.GCC:
-            mod_name = self._ExtractModuleName(moduleFile)
+            mod_name = scanned_name or self._ExtractModuleName(moduleFile)
             bmi_path = project._jengaModuleBMIs.get(mod_name)
-            if bmi_path and Path(bmi_path).exists():
+            gcc_obj = Path(bmi_path).with_suffix('.o') if bmi_path else None
+            if gcc_obj and gcc_obj.exists():
                 # Le .o existe déjà depuis la précompilation
                 import shutil
-                shutil.copy2(bmi_path, objectFile)
+                shutil.copy2(gcc_obj, objectFile)
                 return True
             return False
 
         # Pour Clang/MSVC: compiler le BMI en objet
-        mod_name = self._ExtractModuleName(moduleFile)
+        mod_name = scanned_name or self._ExtractModuleName(moduleFile)
         bmi_path = project._jengaModuleBMIs.get(mod_name)
 
         if not bmi_path or not Path(bmi_path).exists():
@@ -1670,15 +2090,8 @@ class Builder(abc.ABC):
     #         logger.PrintResultBox(True)
     #         return True
 
-    def BuildProject(self, project: Project) -> bool:
-        # Check if project is already compiled for this platform/arch context
-        if self.state.IsProjectCompiled(project.name, self.platform, self.targetArch.value if self.targetArch else ""):
-            return True
-
-        # Apply filter(system/config) materialization before any build decision.
-        self._ApplyProjectFilters(project)
-
-        # Re-resolve toolchain if filter changed project.toolchain
+    def _SelectProjectToolchain(self, project: Project) -> None:
+        """Bascule sur la toolchain explicite du projet (après filtres) si elle existe."""
         if project._explicitToolchain and project.toolchain:
             tc = self.workspace.toolchains.get(project.toolchain)
             if not tc:
@@ -1689,6 +2102,62 @@ class Builder(abc.ABC):
                 if hasattr(self, '_PrepareNDKToolchain'):
                     self._PrepareNDKToolchain()
 
+    def _WireDependencyLinks(self, project: Project) -> Dict[str, str]:
+        """
+        Ajoute les bibliothèques locales de dependson() à libDirs/links.
+        Retourne {projet dépendance: chemin de sa sortie}.
+        """
+        dep_link_map: Dict[str, str] = {}
+        for dep_name in project.dependsOn:
+            dep_proj = self.workspace.projects.get(dep_name)
+            if not dep_proj:
+                continue
+            if dep_proj.kind not in (ProjectKind.STATIC_LIB, ProjectKind.SHARED_LIB):
+                continue
+            dep_dir = str(self.GetTargetDir(dep_proj))
+            dep_out = str(self.GetTargetPath(dep_proj))
+            if dep_dir not in project.libDirs:
+                project.libDirs.append(dep_dir)
+            dep_link_map[dep_name] = dep_out
+
+        if dep_link_map:
+            new_links: List[str] = []
+            seen: set[str] = set()
+
+            for link in project.links:
+                # Skip WINDOWED_APP/CONSOLE_APP deps — they produce executables, not linkable libraries
+                dep_for_link = self.workspace.projects.get(link)
+                if dep_for_link and dep_for_link.kind in (ProjectKind.CONSOLE_APP, ProjectKind.WINDOWED_APP):
+                    continue
+                resolved = dep_link_map.get(link, link)
+                if resolved not in seen:
+                    new_links.append(resolved)
+                    seen.add(resolved)
+
+            missing_dep_outputs: List[str] = []
+            for dep_out in dep_link_map.values():
+                if dep_out not in seen:
+                    missing_dep_outputs.append(dep_out)
+                    seen.add(dep_out)
+
+            # Preserve explicit project link order first (important for GNU-like
+            # one-pass linkers). Only append missing dependency outputs.
+            project.links = new_links + missing_dep_outputs
+        return dep_link_map
+
+    def BuildProject(self, project: Project) -> bool:
+        self._lastLinkTime = None
+
+        # Check if project is already compiled for this platform/arch context
+        if self.state.IsProjectCompiled(project.name, self.platform, self.targetArch.value if self.targetArch else ""):
+            return True
+
+        # Apply filter(system/config) materialization before any build decision.
+        self._ApplyProjectFilters(project)
+
+        # Re-resolve toolchain if filter changed project.toolchain
+        self._SelectProjectToolchain(project)
+
         # Create logger with project info
         kind_str = project.kind.name if hasattr(project.kind, 'name') else str(project.kind)
         workspace_root = self.workspace.location if self.workspace else None
@@ -1718,6 +2187,8 @@ class Builder(abc.ABC):
         # ===== Support modules C++20 =====
         module_files = [s for s in sources if self.IsModuleFile(s)]
         regular_files = [s for s in sources if not self.IsModuleFile(s)]
+        if regular_files and self._IsUnityEnabled(project):
+            regular_files = self._ApplyUnityBuild(project, regular_files, obj_dir)
 
         project._jengaModuleBMIs = {}
 
@@ -1736,21 +2207,23 @@ class Builder(abc.ABC):
         object_files = []
         success = True
 
-        # Compile modules to object files
-        for mod_file in module_files:
-            src_path = Path(mod_file)
-            obj_name = src_path.with_suffix(self.GetObjectExtension()).name
-            obj_path = obj_dir / obj_name
-
+        # Compile modules to object files (BMIs are ready: units are independent)
+        module_objs = [str(obj_dir / Path(m).with_suffix(self.GetObjectExtension()).name) for m in module_files]
+        if module_files:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self._GetEffectiveJobs()) as executor:
+                module_ok = list(executor.map(
+                    lambda pair: self._CompileModuleToObject(project, pair[0], pair[1], obj_dir),
+                    zip(module_files, module_objs)))
+        else:
+            module_ok = []
+        for mod_file, obj_path, ok in zip(module_files, module_objs, module_ok):
             # _CompileModuleToObject retourne bool pour l'instant, on garde
-            if self._CompileModuleToObject(project, str(src_path), str(obj_path), obj_dir):
-                object_files.append(str(obj_path))
-                self.state.AddProjectOutput(project.name, str(obj_path))
-                logger.LogCompile(str(src_path), None)  # Pas de ProcessResult pour module
+            logger.LogCompile(mod_file, None)  # Pas de ProcessResult pour module
+            if ok:
+                object_files.append(obj_path)
+                self.state.AddProjectOutput(project.name, obj_path)
             else:
-                logger.LogCompile(str(src_path), None)
                 success = False
-                break
 
         if not success:
             self.state.MarkProjectCompiled(project.name, success=False, platform=self.platform,
@@ -1774,7 +2247,7 @@ class Builder(abc.ABC):
                     logger.LogCached(str(src_path))
                     continue
 
-                result = self.Compile(project, str(src_path), str(obj_path))
+                result = self._CompileThrottled(project, str(src_path), str(obj_path))
                 if result.returnCode == 0:
                     signature = self._ComputeCompileSignature(project, str(src_path), str(obj_path))
                     self._WriteCompileSignature(str(obj_path), signature)
@@ -1800,7 +2273,7 @@ class Builder(abc.ABC):
                         cached_files.append((str(src_path), str(obj_path)))
                         continue
 
-                    future = executor.submit(self.Compile, project, str(src_path), str(obj_path))
+                    future = executor.submit(self._CompileThrottled, project, str(src_path), str(obj_path))
                     future_to_paths[future] = (str(src_path), str(obj_path))
 
                 # Log cached files immediately
@@ -1839,42 +2312,7 @@ class Builder(abc.ABC):
             logger.LogUpToDate()
 
         # Auto-wire local library dependencies for link phase
-        dep_link_map: Dict[str, str] = {}
-        for dep_name in project.dependsOn:
-            dep_proj = self.workspace.projects.get(dep_name)
-            if not dep_proj:
-                continue
-            if dep_proj.kind not in (ProjectKind.STATIC_LIB, ProjectKind.SHARED_LIB):
-                continue
-            dep_dir = str(self.GetTargetDir(dep_proj))
-            dep_out = str(self.GetTargetPath(dep_proj))
-            if dep_dir not in project.libDirs:
-                project.libDirs.append(dep_dir)
-            dep_link_map[dep_name] = dep_out
-
-        if dep_link_map:
-            new_links: List[str] = []
-            seen: set[str] = set()
-
-            for link in project.links:
-                # Skip WINDOWED_APP/CONSOLE_APP deps — they produce executables, not linkable libraries
-                dep_for_link = self.workspace.projects.get(link)
-                if dep_for_link and dep_for_link.kind in (ProjectKind.CONSOLE_APP, ProjectKind.WINDOWED_APP):
-                    continue
-                resolved = dep_link_map.get(link, link)
-                if resolved not in seen:
-                    new_links.append(resolved)
-                    seen.add(resolved)
-
-            missing_dep_outputs: List[str] = []
-            for dep_out in dep_link_map.values():
-                if dep_out not in seen:
-                    missing_dep_outputs.append(dep_out)
-                    seen.add(dep_out)
-
-            # Preserve explicit project link order first (important for GNU-like
-            # one-pass linkers). Only append missing dependency outputs.
-            project.links = new_links + missing_dep_outputs
+        self._WireDependencyLinks(project)
 
         if project.kind in (ProjectKind.CONSOLE_APP, ProjectKind.WINDOWED_APP,
                             ProjectKind.SHARED_LIB, ProjectKind.STATIC_LIB,
@@ -1883,7 +2321,13 @@ class Builder(abc.ABC):
             FileSystem.MakeDirectory(target_path.parent)
 
             # Link - capture ProcessResult pour afficher les erreurs
-            link_ok = self.Link(project, object_files, str(target_path))
+            link_start = time.perf_counter()
+            link_ok = self._LinkThrottled(project, object_files, str(target_path))
+            if project.kind == ProjectKind.STATIC_LIB:
+                link_tool = "ar"
+            else:
+                link_tool = self.ResolveLinker(project) or "default"
+            self._lastLinkTime = (time.perf_counter() - link_start, link_tool)
             logger.LogLink(str(target_path), self._lastResult)  # Affiche les erreurs de linking si le linking échoue
 
             self.CopyRuntimeDependencies(project, target_path)
@@ -1948,36 +2392,48 @@ class Builder(abc.ABC):
             exts.extend(['.lib', '.a'])
         return exts
 
+    def _GetProjectBaseDir(self, project: Project) -> Path:
+        """Directory against which relative file patterns of a project are matched."""
+        workspace_base = Path(self.workspace.location).resolve() if self.workspace and self.workspace.location else Path.cwd()
+        if not project.location:
+            return workspace_base
+        base_dir_str = project.location
+        if self._expander:
+            self._expander.SetProject(project)
+            base_dir_str = self._expander.Expand(base_dir_str, recursive=True)
+        base_dir_path = Path(base_dir_str)
+        if not base_dir_path.is_absolute():
+            base_dir_path = workspace_base / base_dir_path
+        return base_dir_path.resolve()
+
+    def _MatchFilePattern(self, project: Project, baseDir: Path, pattern: str) -> List[str]:
+        """Expand one files()/excludefiles() pattern to the matching file paths."""
+        expanded_pattern = pattern
+        if self._expander:
+            self._expander.SetProject(project)
+            expanded_pattern = self._expander.Expand(pattern, recursive=True)
+        p = Path(expanded_pattern)
+        if p.is_absolute():
+            if any(ch in expanded_pattern for ch in ("*", "?", "[")):
+                return [m for m in glob.glob(expanded_pattern, recursive=True) if Path(m).is_file()]
+            if p.exists():
+                return [str(p)]
+            return []
+        return FileSystem.ListFiles(baseDir, pattern=expanded_pattern, recursive=True, fullPath=True)
+
     def _CollectSourceFiles(self, project: Project) -> List[str]:
+        cache = getattr(self, "graphCache", None)
+        if cache is not None:
+            key = (project.name, getattr(project, "_jenga_applied_filter_context", ""))
+            return cache.Sources(key, lambda: self._GlobSourceFiles(project))
+        return self._GlobSourceFiles(project)
+
+    def _GlobSourceFiles(self, project: Project) -> List[str]:
         files = []
-        workspace_base = Path(self.workspace.location).resolve() if self.workspace and self.workspace.location else Path.cwd()
-        if project.location:
-            base_dir_str = project.location
-            if self._expander:
-                self._expander.SetProject(project)
-                base_dir_str = self._expander.Expand(base_dir_str, recursive=True)
-            base_dir_path = Path(base_dir_str)
-            if not base_dir_path.is_absolute():
-                base_dir_path = workspace_base / base_dir_path
-            base_dir = base_dir_path.resolve()
-        else:
-            base_dir = workspace_base
+        base_dir = self._GetProjectBaseDir(project)
         src_exts = self.GetSourceFileExtensions(project.language)
         for pattern in project.files:
-            expanded_pattern = pattern
-            if self._expander:
-                self._expander.SetProject(project)
-                expanded_pattern = self._expander.Expand(pattern, recursive=True)
-            p = Path(expanded_pattern)
-            if p.is_absolute():
-                if any(ch in expanded_pattern for ch in ("*", "?", "[")):
-                    matched = [m for m in glob.glob(expanded_pattern, recursive=True) if Path(m).is_file()]
-                elif p.exists():
-                    matched = [str(p)]
-                else:
-                    matched = []
-            else:
-                matched = FileSystem.ListFiles(base_dir, pattern=expanded_pattern, recursive=True, fullPath=True)
+            matched = self._MatchFilePattern(project, base_dir, pattern)
             for f in matched:
                 # Exclure silencieusement les fichiers platform-spécifiques
                 # (.ts, .ets, .swift, .java, .kt...) — ils sont gérés par
@@ -1990,21 +2446,7 @@ class Builder(abc.ABC):
                     files.append(f)
         exclude = set()
         for pattern in project.excludeFiles:
-            expanded_pattern = pattern
-            if self._expander:
-                self._expander.SetProject(project)
-                expanded_pattern = self._expander.Expand(pattern, recursive=True)
-            p = Path(expanded_pattern)
-            if p.is_absolute():
-                if any(ch in expanded_pattern for ch in ("*", "?", "[")):
-                    matched = [m for m in glob.glob(expanded_pattern, recursive=True) if Path(m).is_file()]
-                elif p.exists():
-                    matched = [str(p)]
-                else:
-                    matched = []
-            else:
-                matched = FileSystem.ListFiles(base_dir, pattern=expanded_pattern, recursive=True, fullPath=True)
-            exclude.update(matched)
+            exclude.update(self._MatchFilePattern(project, base_dir, pattern))
         files = [f for f in files if f not in exclude]
         files.sort()
         return files
@@ -2059,14 +2501,12 @@ class Builder(abc.ABC):
         )
         return [proj_name for proj_name in order if proj_name not in blocked_set]
 
-    def Build(self, targetProject: Optional[str] = None) -> int:
-        from ..Utils.Reporter import BuildCoordinator
-
-        # Materialize all context-dependent filters before dependency resolution.
-        for proj in self.workspace.projects.values():
-            self._ApplyProjectFilters(proj)
-
-        # Resolve build order
+    def ResolveProjectOrder(self, targetProject: Optional[str] = None) -> Optional[List[str]]:
+        """
+        Ordre de build (dépendances d'abord) après politique des tests
+        unitaires et --only-projects. None si la résolution échoue (erreur
+        déjà affichée).
+        """
         try:
             order = DependencyResolver.ResolveBuildOrder(self.workspace, targetProject)
         except ValueError as e:
@@ -2077,11 +2517,26 @@ class Builder(abc.ABC):
                 Reporter.Info("Available projects: " + ", ".join(available))
             else:
                 Reporter.Info("This workspace declares no project.")
-            return 1
+            return None
         except RuntimeError as e:
             Reporter.Error(f"Dependency resolution failed: {e}")
-            return 1
+            return None
         order = self._ApplyUnitTestCompilationPolicy(order, targetProject)
+        if order is None:
+            return None
+        if self.onlyProjects is not None:
+            order = [name for name in order if name in self.onlyProjects]
+        return order
+
+    def Build(self, targetProject: Optional[str] = None) -> int:
+        from ..Utils.Reporter import BuildCoordinator
+
+        # Materialize all context-dependent filters before dependency resolution.
+        for proj in self.workspace.projects.values():
+            self._ApplyProjectFilters(proj)
+
+        # Resolve build order
+        order = self.ResolveProjectOrder(targetProject)
         if order is None:
             return 1
         if not order:
@@ -2130,6 +2585,8 @@ class Builder(abc.ABC):
             last_logger = getattr(self, '_last_logger', None)
             if last_logger:
                 coordinator.AccumulateStats(last_logger.errors_count, last_logger.warnings_count)
+            if self._lastLinkTime is not None:
+                coordinator.RecordLinkTime(proj_name, *self._lastLinkTime)
             for cmd in proj.postBuildCommands:
                 expanded_cmd = cmd
                 if self._expander:
@@ -2140,9 +2597,16 @@ class Builder(abc.ABC):
                 success_count += 1
             else:
                 fail_count += 1
-                if not self.verbose:
+                if not self.verbose or Process.IsCancelled():
                     break
 
+        if Process.IsCancelled():
+            Reporter.Error("Build cancelled.")
+
+        # Persist learned peak RSS for the next build's throttling decisions
+        if self._limiter is not None:
+            self._limiter.SaveStats()
+
         # Print footer
         coordinator.PrintFooter()
 
@@ -43,6 +43,10 @@ class AndroidBuilder(Builder):
       - Assets et ressources multi-dossiers
     """
 
+    # Le NDK (r22+) lie déjà avec lld ; "auto" le force pour les NDK plus anciens.
+    AUTO_LINKERS = ("lld",)
+    SUPPORTED_LINKERS = ("lld", "mold")
+
     def __init__(self, workspace, config, platform, targetOs, targetArch, targetEnv=None, verbose=False,
                  action: str = "build", options: Optional[List[str]] = None):
         super().__init__(workspace, config, platform, targetOs, targetArch, targetEnv, verbose, action=action, options=options)
@@ -459,6 +463,7 @@ class AndroidBuilder(Builder):
                 skip_next = True
                 continue
             filtered_flags.append(flag)
+        args.extend(self.FuseLdFlags(project))
         args.extend(filtered_flags)
 
         # Ajouter les objets
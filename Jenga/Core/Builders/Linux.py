@@ -19,6 +19,10 @@ class LinuxBuilder(Builder):
     Builder pour Linux (ELF).
     """
 
+    # mold puis lld : bien plus rapides que GNU ld sur les gros exécutables.
+    AUTO_LINKERS = ("mold", "lld")
+    SUPPORTED_LINKERS = ("mold", "lld", "gold", "bfd")
+
     def __init__(self, workspace, config, platform, targetOs, targetArch, targetEnv=None, verbose=False):
         super().__init__(workspace, config, platform, targetOs, targetArch, targetEnv, verbose)
         self.is_gcc = self.toolchain.compilerFamily == CompilerFamily.GCC
@@ -133,6 +137,7 @@ class LinuxBuilder(Builder):
             args = [linker, "-o", str(out)]
             if project.kind == ProjectKind.SHARED_LIB:
                 args.append("-shared")
+            args.extend(self.FuseLdFlags(project))
 
             # Object files first.
             args.extend(objectFiles)
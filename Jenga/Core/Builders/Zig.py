@@ -20,6 +20,9 @@ class ZigBuilder(Builder):
     Zig uses different command syntax: zig c++ / zig cc instead of traditional flags.
     """
 
+    # Zig lie avec son LLD embarqué : "auto" le garde, seul lld est accepté.
+    SUPPORTED_LINKERS = ("lld",)
+
     def GetObjectExtension(self) -> str:
         return ".o"
 
@@ -43,6 +46,9 @@ class ZigBuilder(Builder):
             return ".exe"
         return ""
 
+    def _ProbeLinker(self, name: str) -> bool:
+        return name == "lld"
+
     def Compile(self, project: Project, sourceFile: str, objectFile: str) -> ProcessResult:
         src = Path(sourceFile)
         obj = Path(objectFile)
@@ -106,6 +112,7 @@ class ZigBuilder(Builder):
         args.extend(["-o", str(out)])
 
         # Linker flags
+        args.extend(self.FuseLdFlags(project))
         args.extend(self._GetLinkerFlags(project))
 
         # Library directories
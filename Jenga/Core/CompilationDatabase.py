@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CompilationDatabase – compile_commands.json pour clangd, clang-tidy, etc.
+
+Les entrées viennent du BuildPlan : les arguments sont ceux que le Compile
+du builder passerait au compilateur (enregistrés, jamais exécutés). La mise
+à jour est incrémentale :
+  - seules les entrées des projets planifiés sont remplacées (une entrée
+    appartient au projet dont l'objectDir contient son "output") ; celles
+    des autres projets (build --target partiel) sont conservées ;
+  - les entrées sont triées (file, output) pour un fichier stable ;
+  - le fichier n'est réécrit (atomiquement) que si son contenu change, pour
+    ne pas relancer l'indexation de clangd sur une grosse base.
+
+Toutes les méthodes publiques sont en PascalCase.
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .BuildPlan import PlannedStep, ProjectPlan
+
+Entry = Dict[str, Any]
+
+
+@dataclass
+class CompilationDatabaseUpdate:
+    """Résultat d'une mise à jour de compile_commands.json."""
+    path: str
+    entries: int = 0
+    added: int = 0
+    changed: int = 0
+    removed: int = 0
+    written: bool = False
+
+
+class CompilationDatabase:
+    """
+    Usage :
+        plans = BuildPlanner(builder).Plan(target, withLink=False)
+        update = CompilationDatabase(workspace_dir / "compile_commands.json").Update(plans, workspace_dir)
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def Load(self) -> List[Entry]:
+        """Entrées existantes ([] si le fichier est absent ou illisible)."""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return []
+        return [e for e in data if isinstance(e, dict) and "file" in e] if isinstance(data, list) else []
+
+    def Update(self, plans: List[ProjectPlan], directory) -> CompilationDatabaseUpdate:
+        """
+        Remplace les entrées des projets de plans par leurs commandes de
+        compilation. directory : répertoire des commandes sans cwd propre.
+        """
+        directory = str(Path(directory).resolve())
+        fresh: Dict[Tuple[str, str], Entry] = {}
+        for plan in plans:
+            steps = ([plan.pch] if plan.pch else []) + plan.compiles
+            for step in steps:
+                entry = CompilationDatabase.MakeEntry(step, directory)
+                if entry is not None:
+                    fresh[(entry["file"], entry.get("output", ""))] = entry
+
+        owned = [CompilationDatabase._DirPrefix(p.objectDir) for p in plans]
+        previous: Dict[Tuple[str, str], Entry] = {}
+        kept: Dict[Tuple[str, str], Entry] = {}
+        for entry in self.Load():
+            key = (entry["file"], entry.get("output", ""))
+            previous[key] = entry
+            output = key[1].replace("\\", "/")
+            if not any(output.startswith(prefix) for prefix in owned):
+                kept[key] = entry
+
+        merged = dict(kept)
+        merged.update(fresh)
+        result = CompilationDatabaseUpdate(str(self.path), entries=len(merged))
+        for key, entry in merged.items():
+            if key not in previous:
+                result.added += 1
+            elif previous[key] != entry:
+                result.changed += 1
+        result.removed = sum(1 for key in previous if key not in merged)
+
+        ordered = [merged[key] for key in sorted(merged)]
+        text = json.dumps(ordered, indent=2, ensure_ascii=False) + "\n"
+        try:
+            current = self.path.read_text(encoding="utf-8")
+        except OSError:
+            current = None
+        if text != current:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            tmp.write_text(text, encoding="utf-8")
+            os.replace(tmp, self.path)
+            result.written = True
+        return result
+
+    @staticmethod
+    def MakeEntry(step: PlannedStep, directory: str) -> Optional[Entry]:
+        """Entrée JSON d'une étape de compilation (première commande enregistrée)."""
+        if not step.commands or not step.inputs:
+            return None
+        args, cwd = step.commands[0]
+        work_dir = str(Path(directory, cwd).resolve()) if cwd else directory
+        if isinstance(args, list):
+            # PCH MSVC : le source .cpp est l'entrée compilée, pas l'en-tête
+            source = next((i for i in step.inputs if i in args), step.inputs[0])
+            entry: Entry = {"directory": work_dir, "arguments": [str(a) for a in args]}
+        else:
+            source = step.inputs[0]
+            entry = {"directory": work_dir, "command": str(args)}
+        entry["file"] = str(Path(work_dir, source)) if not Path(source).is_absolute() else source
+        entry["output"] = step.output
+        return entry
+
+    @staticmethod
+    def _DirPrefix(path: str) -> str:
+        return path.replace("\\", "/").rstrip("/") + "/"
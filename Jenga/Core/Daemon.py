@@ -6,9 +6,17 @@ Daemon – Processus en arrière‑plan pour accélérer les commandes Jenga.
 Architecture robuste :
   - Détachement complet du terminal (daemonization) sur Unix
   - Processus détaché sur Windows (CREATE_NO_WINDOW / DETACHED_PROCESS)
-  - Socket TCP localhost avec port aléatoire
+  - Socket Unix (.jenga/daemon/daemon.sock) sur POSIX, TCP localhost sinon
   - Persistance du workspace en mémoire et mise à jour incrémentale
-  - Communication RPC JSON
+  - Builders résidents par (config, plateforme, options) avec graphe de build
+    chaud (BuildGraphCache), invalidé par les événements du FileWatcher
+  - Communication RPC JSON par trames (une trame = un objet JSON + '\n') :
+      client → daemon : {"command", "args", "id"}   (+ {"command": "cancel"})
+      daemon → client : {"type": "output", "stream", "data", "id"}*  puis
+                        {"type": "result", "status", ..., "id"}
+    La sortie du build est diffusée en direct, plusieurs requêtes et
+    plusieurs clients sont servis en parallèle, et l'annulation tue les
+    compilateurs en cours.
   - Gestion des signaux (SIGTERM, SIGINT)
   - Fichier d'information PID/port pour les clients
   - Logs redirigés vers .jenga/daemon/daemon.{out,err}
@@ -25,6 +33,7 @@ import atexit
 from pathlib import Path
 from typing import Dict, Any, Optional, Callable
 from dataclasses import dataclass
+from contextlib import contextmanager
 import queue
 import subprocess
 import tempfile
@@ -35,6 +44,8 @@ from .Loader import Loader
 from .Cache import Cache
 from .Watcher import FileWatcher
 from .Incremental import Incremental
+from .BuildGraph import BuildGraphCache
+from .WatchPipeline import WatchPipeline
 from .._version import __version__
 
 
@@ -51,6 +62,86 @@ class DaemonInfo:
     entry_file: str
     start_time: float
     version: str = __version__
+    socket: str = ""
+
+
+# ---------------------------------------------------------------------------
+# Protocole à trames (JSON délimité par des fins de ligne)
+# ---------------------------------------------------------------------------
+
+def _SendFrame(sock: socket.socket, frame: Dict[str, Any]) -> None:
+    """Envoie une trame complète (json.dumps n'émet jamais de '\\n' brut)."""
+    sock.sendall(json.dumps(frame).encode('utf-8') + b'\n')
+
+
+class _FrameReader:
+    """Découpe le flux d'un socket en trames JSON."""
+
+    def __init__(self, sock: socket.socket):
+        self._sock = sock
+        self._buffer = b''
+
+    def ReadFrame(self) -> Optional[Dict[str, Any]]:
+        """Prochaine trame, None en fin de flux. ValueError si JSON invalide."""
+        while b'\n' not in self._buffer:
+            chunk = self._sock.recv(65536)
+            if not chunk:
+                return None
+            self._buffer += chunk
+        line, self._buffer = self._buffer.split(b'\n', 1)
+        return json.loads(line.decode('utf-8'))
+
+
+class _OutputRouter:
+    """
+    Remplace sys.stdout/sys.stderr dans le daemon : pendant une commande,
+    chaque ligne écrite est envoyée au client sous forme de trame 'output' ;
+    le reste du temps, la sortie va au flux d'origine (logs du daemon).
+    """
+
+    def __init__(self, stream, name: str):
+        self._stream = stream
+        self._name = name
+        self._sink: Optional[Callable[[str, str], None]] = None
+        self._pending = ''
+        self._lock = threading.Lock()
+
+    @property
+    def encoding(self):
+        return getattr(self._stream, 'encoding', 'utf-8')
+
+    def isatty(self) -> bool:
+        return False
+
+    def SetSink(self, sink: Optional[Callable[[str, str], None]]) -> None:
+        self.flush()
+        with self._lock:
+            self._sink = sink
+
+    def write(self, text: str) -> int:
+        with self._lock:
+            sink = self._sink
+            if sink is None:
+                return self._stream.write(text)
+            self._pending += text
+            if '\n' not in self._pending:
+                return len(text)
+            complete, self._pending = self._pending.rsplit('\n', 1)
+        try:
+            sink(self._name, complete + '\n')
+        except OSError:
+            pass  # client parti : la commande continue jusqu'à l'annulation
+        return len(text)
+
+    def flush(self) -> None:
+        with self._lock:
+            sink, pending, self._pending = self._sink, self._pending, ''
+        if sink is not None and pending:
+            try:
+                sink(self._name, pending)
+            except OSError:
+                pass
+        self._stream.flush()
 
 
 class Daemon:
@@ -61,6 +152,10 @@ class Daemon:
 
     _DAEMON_DIR = Path(".jenga") / "daemon"
     _INFO_FILE = "daemon.json"
+    _SOCKET_FILE = "daemon.sock"
+
+    # Commandes longues : exécutées une à la fois, sortie diffusée, annulables
+    _EXCLUSIVE_COMMANDS = ('build', 'clean', 'run', 'test')
 
     def __init__(self, workspace_root: Path, entry_file: Path):
         self.workspace_root = workspace_root.resolve()
@@ -71,8 +166,22 @@ class Daemon:
         self._server_socket = None
         self._running = False
         self._port = None
+        self._socket_path: Optional[Path] = None
+        self._activeRequest: Optional[str] = None
+        self._cancelled: set = set()
+        # Commandes longues en attente du verrou de build (annulables avant démarrage)
+        self._queuedRequests: set = set()
+        self._cancelLock = threading.Lock()
+        self._stdout: Optional[_OutputRouter] = None
+        self._stderr: Optional[_OutputRouter] = None
+        # Rebuild automatique (jenga watch) et clients qui suivent sa sortie
+        self._pipeline: Optional[WatchPipeline] = None
+        self._watchFollowers: Dict[str, Any] = {}
         self._watcher = None
         self._lock = threading.RLock()
+        # Builders résidents, clé = contexte de build sérialisé
+        self._builders: Dict[str, Any] = {}
+        self._buildLock = threading.Lock()
         self._start_time = time.time()
 
         # Répertoire du daemon
@@ -88,19 +197,22 @@ class Daemon:
         if not self._LoadWorkspace():
             return False
 
-        # Trouver un port libre
-        self._port = self._FindFreePort()
-        if self._port is None:
-            Colored.PrintError("No free port available.")
-            return False
-
-        # Créer le socket serveur
-        self._server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self._server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        self._server_socket.bind(('127.0.0.1', self._port))
-        self._server_socket.listen(5)
+        # Créer le socket serveur (Unix sur POSIX, TCP localhost sinon)
+        if not self._BindUnixSocket():
+            self._port = self._FindFreePort()
+            if self._port is None:
+                Colored.PrintError("No free port available.")
+                return False
+            self._server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            self._server_socket.bind(('127.0.0.1', self._port))
+        self._server_socket.listen(16)
         self._server_socket.settimeout(1.0)
 
+        # Sorties redirigées vers le client de la commande en cours
+        self._stdout = sys.stdout = _OutputRouter(sys.stdout, 'stdout')
+        self._stderr = sys.stderr = _OutputRouter(sys.stderr, 'stderr')
+
         self._running = True
 
         # Écrire les informations du daemon
@@ -113,13 +225,37 @@ class Daemon:
         # Installer les gestionnaires de signaux
         self._InstallSignalHandlers()
 
+        # Watcher permanent : c'est lui qui garde les builders résidents exacts
+        self._StartWatcher({})
+
+        endpoint = f"socket {self._socket_path}" if self._socket_path else f"port {self._port}"
         Colored.PrintSuccess(
-            f"Daemon started on port {self._port} (PID: {os.getpid()})\n"
+            f"Daemon started on {endpoint} (PID: {os.getpid()})\n"
             f"  Workspace: {self.workspace_root}\n"
             f"  Entry: {self.entry_file}"
         )
         return True
 
+    def _BindUnixSocket(self) -> bool:
+        """Écoute sur .jenga/daemon/daemon.sock (False si indisponible)."""
+        if sys.platform == 'win32' or not hasattr(socket, 'AF_UNIX'):
+            return False
+        path = self._daemon_dir / self._SOCKET_FILE
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            if path.exists():
+                path.unlink()   # socket d'un daemon précédent
+            sock.bind(str(path))
+            os.chmod(str(path), 0o600)
+        except OSError:
+            # Chemin trop long (limite sun_path ~104-108 octets) ou FS sans sockets
+            sock.close()
+            return False
+        self._server_socket = sock
+        self._socket_path = path
+        self._port = 0
+        return True
+
     def _LoadWorkspace(self) -> bool:
         """Charge le workspace depuis le cache ou le fichier source."""
         self.workspace = self.cache.LoadWorkspace(self.entry_file, self.loader)
@@ -155,36 +291,115 @@ class Daemon:
                     Colored.PrintError(f"Accept error: {e}")
 
     def _HandleClient(self, client_socket: socket.socket):
-        """Traite une requête JSON et renvoie une réponse."""
+        """
+        Sert une connexion : chaque requête est exécutée dans son propre
+        thread (ce qui laisse passer un 'cancel' pendant un build) et les
+        trames de réponse sont sérialisées par un verrou d'envoi.
+        """
+        client_socket.settimeout(None)
+        reader = _FrameReader(client_socket)
+        send_lock = threading.Lock()
+        pending: Dict[str, threading.Thread] = {}
+
+        def send(frame: Dict[str, Any]) -> None:
+            with send_lock:
+                _SendFrame(client_socket, frame)
+
         try:
-            data = client_socket.recv(65536)
-            if not data:
-                return
-            request = json.loads(data.decode('utf-8'))
-            response = self._ExecuteCommand(request)
-            client_socket.send(json.dumps(response).encode('utf-8'))
-        except json.JSONDecodeError:
-            client_socket.send(json.dumps({
-                'status': 'error',
-                'message': 'Invalid JSON'
-            }).encode('utf-8'))
-        except Exception as e:
-            try:
-                client_socket.send(json.dumps({
-                    'status': 'error',
-                    'message': str(e)
-                }).encode('utf-8'))
-            except:
-                pass
+            while self._running:
+                try:
+                    request = reader.ReadFrame()
+                except ValueError:
+                    send({'type': 'result', 'status': 'error', 'message': 'Invalid JSON'})
+                    continue
+                if request is None:
+                    break
+                cmd_id = request.setdefault('id', str(uuid.uuid4()))
+                worker = threading.Thread(target=self._ServeRequest, args=(request, send), daemon=True)
+                pending[cmd_id] = worker
+                worker.start()
+        except OSError:
+            pass
         finally:
+            # Client déconnecté (Ctrl+C, crash) : ses commandes en cours sont annulées
+            for cmd_id, worker in pending.items():
+                if worker.is_alive():
+                    self._Cancel(cmd_id)
+            for worker in pending.values():
+                worker.join()
             client_socket.close()
 
-    def _ExecuteCommand(self, request: Dict[str, Any]) -> Dict[str, Any]:
-        """Exécute une commande interne."""
+    def _ServeRequest(self, request: Dict[str, Any], send: Callable[[Dict[str, Any]], None]):
+        cmd_id = request['id']
+        output = lambda stream, data: send({'type': 'output', 'stream': stream, 'data': data, 'id': cmd_id})
+        response = self._ExecuteCommand(request, output)
+        try:
+            send({**response, 'type': 'result', 'id': cmd_id})
+        except OSError:
+            pass
+
+    @contextmanager
+    def _ExclusiveCommand(self, cmd_id: str, output: Optional[Callable[[str, str], None]]):
+        """Une commande longue à la fois ; sa sortie part vers son client."""
+        with self._cancelLock:
+            self._queuedRequests.add(cmd_id)
+        with self._buildLock:
+            with self._cancelLock:
+                self._queuedRequests.discard(cmd_id)
+                if cmd_id in self._cancelled:
+                    # Annulée pendant l'attente du verrou : jamais démarrée
+                    raise RuntimeError('Cancelled by client')
+                Process.ResetCancel()
+                self._activeRequest = cmd_id
+            routed = output is not None and self._stdout is not None
+            if routed:
+                self._stdout.SetSink(output)
+                self._stderr.SetSink(output)
+            try:
+                yield
+            finally:
+                if routed:
+                    self._stdout.SetSink(None)
+                    self._stderr.SetSink(None)
+                self._activeRequest = None
+                Process.ResetCancel()
+
+    def _Cancel(self, target: Optional[str]) -> Dict:
+        """Annule la commande longue en cours (ou seulement 'target' si précisé)."""
+        follower = self._watchFollowers.pop(target, None) if target else None
+        if follower is not None:
+            follower[1].set()   # fin du suivi d'un 'jenga watch'
+            return {'status': 'ok', 'cancelled': True, 'killed': 0}
+        with self._cancelLock:
+            if target and target in self._queuedRequests:
+                self._cancelled.add(target)
+                return {'status': 'ok', 'cancelled': True, 'killed': 0}
+            active = self._activeRequest
+            if active is None or (target and target != active):
+                return {'status': 'ok', 'cancelled': False}
+            self._cancelled.add(active)
+        killed = Process.CancelAll()
+        return {'status': 'ok', 'cancelled': True, 'killed': killed}
+
+    def _ExecuteCommand(self, request: Dict[str, Any],
+                        output: Optional[Callable[[str, str], None]] = None) -> Dict[str, Any]:
+        """Exécute une commande interne (output : diffusion de la sortie au client)."""
         cmd = request.get('command')
         args = request.get('args', {})
         cmd_id = request.get('id', str(uuid.uuid4()))
 
+        if cmd in self._EXCLUSIVE_COMMANDS:
+            try:
+                with self._ExclusiveCommand(cmd_id, output):
+                    response = self._ExecuteCommand({**request, 'command': '_' + cmd})
+            except Exception as e:
+                response = {'status': 'error', 'message': str(e)}
+            if cmd_id in self._cancelled:
+                self._cancelled.discard(cmd_id)
+                response = {**response, 'status': 'error', 'cancelled': True,
+                            'message': 'Cancelled by client'}
+            return {**response, 'id': cmd_id}
+
         try:
             # Commandes de base
             if cmd == 'ping':
@@ -199,20 +414,26 @@ class Daemon:
                     changed = self.cache.UpdateIncremental(
                         self.entry_file, self.loader, self.workspace
                     )
+                    self._DropBuilders()
                 return {'status': 'ok', 'changed': changed, 'id': cmd_id}
             elif cmd == 'watch_start':
-                return {**self._StartWatcher(args), 'id': cmd_id}
+                return {**self._StartWatcher(args, cmd_id, output), 'id': cmd_id}
             elif cmd == 'watch_stop':
-                return {**self._StopWatcher(), 'id': cmd_id}
-
-            # Commandes de build
-            elif cmd == 'build':
+                if args.get('all'):
+                    self._StopAutoBuild()
+                    return {**self._StopWatcher(), 'id': cmd_id}
+                return {**self._StopAutoBuild(), 'id': cmd_id}
+            elif cmd == 'cancel':
+                return {**self._Cancel(args.get('target')), 'id': cmd_id}
+
+            # Commandes de build (appelées via _ExclusiveCommand)
+            elif cmd == '_build':
                 return {**self._Build(args), 'id': cmd_id}
-            elif cmd == 'clean':
+            elif cmd == '_clean':
                 return {**self._Clean(args), 'id': cmd_id}
-            elif cmd == 'run':
+            elif cmd == '_run':
                 return {**self._Run(args), 'id': cmd_id}
-            elif cmd == 'test':
+            elif cmd == '_test':
                 return {**self._Test(args), 'id': cmd_id}
             else:
                 return {
@@ -268,25 +489,95 @@ class Daemon:
                 target=target,
                 verbose=verbose,
                 action=action,
-                options=options
+                options=options,
+                jobs=int(args.get('jobs', 0) or 0),
+                resourceOptions=args.get('resources'),
+                unity=args.get('unity')
             )
         else:
-            builder = BuildCommand.CreateBuilder(
-                self.workspace, config, platform, target, verbose,
-                action=action,
-                options=options
-            )
+            start = time.perf_counter()
+            self._AwaitFileEvents()
+            builder = self._GetBuilder(config, platform, target, action, options,
+                                       int(args.get('jobs', 0) or 0),
+                                       args.get('unity'), args.get('resources'))
+            builder.verbose = verbose
+            builder.state.Reset()
             return_code = builder.Build(target)
+            if args.get('compdb'):
+                BuildCommand.WriteCompilationDatabase(builder, target,
+                                                      self.workspace_root / "compile_commands.json")
+            return {
+                'status': 'ok' if return_code == 0 else 'error',
+                'return_code': return_code,
+                'elapsed_ms': round((time.perf_counter() - start) * 1000.0, 1)
+            }
         return {
             'status': 'ok' if return_code == 0 else 'error',
             'return_code': return_code
         }
 
+    def _GetBuilder(self, config, platform, target, action, options, jobs, unity, resources):
+        """
+        Retourne le builder résident de ce contexte (créé au premier build).
+        La détection de toolchain, les filtres appliqués et le BuildGraphCache
+        sont ainsi conservés d'un build à l'autre.
+        """
+        from ..Commands.Build import BuildCommand
+        key = json.dumps([config, platform, target, action, sorted(options or []),
+                          jobs, unity, resources or {}], sort_keys=True, default=str)
+        with self._lock:
+            builder = self._builders.get(key)
+            if builder is None:
+                builder = BuildCommand.CreateBuilder(
+                    self.workspace, config, platform, target, False,
+                    action=action,
+                    options=options,
+                    jobs=jobs,
+                    unity=unity,
+                    **(resources or {})
+                )
+                self._builders[key] = builder
+            if self._IsWatcherExact() and builder.graphCache is None:
+                builder.graphCache = BuildGraphCache(self._watcher.Covers)
+            return builder
+
+    def _DropBuilders(self):
+        """Oublie les builders résidents (workspace rechargé)."""
+        with self._lock:
+            self._builders.clear()
+
+    def _IsWatcherExact(self) -> bool:
+        # Le polling voit les changements avec jusqu'à une période de retard,
+        # et la livraison de watchdog ne peut pas être attendue : un stat
+        # cache serait alors périmé au moment du build. Seul inotify, dont la
+        # file est vidée avant chaque build (_AwaitFileEvents), permet de
+        # garder le graphe en mémoire.
+        watcher = self._watcher
+        return bool(watcher and watcher.CanSync())
+
+    def _AwaitFileEvents(self) -> None:
+        """Avant un build : les sauvegardes déjà faites ont invalidé le cache."""
+        watcher = self._watcher
+        if watcher is not None and watcher.CanSync() and not watcher.Sync():
+            # Événements pas encore livrés : le cache ne peut pas être cru
+            with self._lock:
+                for builder in self._builders.values():
+                    if builder.graphCache is not None:
+                        builder.graphCache.Clear()
+
     def _Clean(self, args: Dict) -> Dict:
         """Exécute clean."""
         from ..Commands.Clean import CleanCommand
-        cmd = CleanCommand()
-        return_code = cmd.Execute(self.workspace, args)
+        argv = ['--no-daemon', '--jenga-file', str(self.entry_file)]
+        for key in ('config', 'platform', 'project'):
+            if args.get(key):
+                argv += [f'--{key}', str(args[key])]
+        for key in ('all', 'stale', 'dry_run'):
+            if args.get(key):
+                argv.append('--' + key.replace('_', '-'))
+        if args.get('jobs'):
+            argv += ['--jobs', str(args['jobs'])]
+        return_code = CleanCommand.Execute(argv)
         return {'status': 'ok' if return_code == 0 else 'error', 'return_code': return_code}
 
     def _Run(self, args: Dict) -> Dict:
@@ -299,33 +590,136 @@ class Daemon:
     def _Test(self, args: Dict) -> Dict:
         """Exécute test."""
         from ..Commands.Test import TestCommand
-        cmd = TestCommand()
-        return_code = cmd.Execute(self.workspace, args)
+        argv = ['--no-daemon', '--jenga-file', str(self.entry_file)]
+        for key in ('config', 'platform', 'project', 'jobs', 'timeout', 'shard', 'junit'):
+            if args.get(key):
+                argv += [f'--{key}', str(args[key])]
+        for key in ('no_build', 'no_test_cache', 'verbose'):
+            if args.get(key):
+                argv.append('--' + key.replace('_', '-'))
+        return_code = TestCommand.Execute(argv)
         return {'status': 'ok' if return_code == 0 else 'error', 'return_code': return_code}
 
-    def _StartWatcher(self, args: Dict) -> Dict:
-        """Démarre le watcher de fichiers."""
-        if self._watcher:
+    def _StartWatcher(self, args: Dict, cmd_id: Optional[str] = None,
+                      output: Optional[Callable[[str, str], None]] = None) -> Dict:
+        """
+        Démarre le watcher de fichiers (s'il ne tourne pas déjà) et, avec
+        args['rebuild'], le rebuild automatique ciblé. Avec args['follow'],
+        la requête reste ouverte et reçoit la sortie des rebuilds jusqu'à
+        son annulation (Ctrl+C du client) ou 'watch_stop'.
+        """
+        if not self._watcher:
+            self._watcher = FileWatcher(use_polling=args.get('polling', False))
+            self._watcher.AddIgnorePattern(str(self.workspace_root / "Build"))
+            self._watcher.AddWatch(self.workspace_root)
+            self._watcher.AddCallback(self._OnFileChanged)
+            self._watcher.Start()
+        elif not args.get('rebuild'):
             return {'status': 'error', 'message': 'Watcher already running'}
+        if not args.get('rebuild'):
+            return {'status': 'ok', 'message': 'Watcher started'}
+
+        self._StartAutoBuild(args)
+        if not (args.get('follow') and cmd_id and output):
+            return {'status': 'ok', 'message': 'Watcher started with automatic rebuild'}
+        done = threading.Event()
+        self._watchFollowers[cmd_id] = (output, done)
+        while self._running and not done.wait(1.0):
+            pass
+        self._watchFollowers.pop(cmd_id, None)
+        return {'status': 'ok', 'message': 'Watch stopped'}
 
-        self._watcher = FileWatcher(use_polling=args.get('polling', False))
-        self._watcher.AddWatch(self.workspace_root)
+    def _StartAutoBuild(self, args: Dict) -> None:
+        from ..Commands.Build import BuildCommand
+        self._StopAutoBuild()
+        config = args.get('config') or 'Debug'
+        platform = args.get('platform')
+        options = BuildCommand.CollectFilterOptions(
+            config=config, platform=platform, target=None,
+            verbose=bool(args.get('verbose', False)),
+            no_cache=False, no_daemon=False, extra=["action:build"]
+        )
+        get_builder = lambda: self._GetBuilder(config, platform, None, 'build', options,
+                                               int(args.get('jobs', 0) or 0), None, None)
 
-        def on_change(event_type, path):
-            Colored.PrintInfo(f"[daemon] File changed: {path}")
+        def run_build(projects, build_id):
+            try:
+                with self._ExclusiveCommand(build_id, self._WatchOutput):
+                    self._AwaitFileEvents()
+                    builder = get_builder()
+                    builder.state.Reset()
+                    builder.onlyProjects = projects
+                    try:
+                        return builder.Build()
+                    finally:
+                        builder.onlyProjects = None
+            finally:
+                self._cancelled.discard(build_id)
+
+        self._pipeline = WatchPipeline(get_builder, run_build, lambda build_id: self._Cancel(build_id),
+                                       debounce=float(args.get('debounce', 0.3)))
+        self._pipeline.Start()
+        self._pipeline.RequestBuild()
+
+    def _StopAutoBuild(self) -> Dict:
+        pipeline, self._pipeline = self._pipeline, None
+        for output, done in list(self._watchFollowers.values()):
+            done.set()
+        self._watchFollowers.clear()
+        if pipeline is None:
+            return {'status': 'error', 'message': 'No automatic rebuild running'}
+        pipeline.Stop()
+        return {'status': 'ok', 'message': 'Automatic rebuild stopped'}
+
+    def _WatchOutput(self, stream: str, data: str) -> None:
+        """Sortie d'un rebuild automatique : vers les clients 'watch', sinon le log."""
+        followers = list(self._watchFollowers.items())
+        for cmd_id, (output, done) in followers:
+            try:
+                output(stream, data)
+            except OSError:
+                self._watchFollowers.pop(cmd_id, None)
+                done.set()
+        if not followers:
+            router = self._stderr if stream == 'stderr' else self._stdout
+            router._stream.write(data)
+
+    def _OnFileChanged(self, event_type: str, path: str):
+        """Invalide précisément l'état résident touché par un événement."""
+        self._InvalidateResidentState(event_type, path)
+        pipeline = self._pipeline
+        if pipeline is not None:
+            pipeline.OnFileEvent(event_type, path)
+
+    def _InvalidateResidentState(self, event_type: str, path: str):
+        p = Path(path)
+        build_dir = self.workspace_root / "Build"
+        if p == build_dir or build_dir in p.parents:
+            return  # sorties de build : relues via le mtime des .d
+        if p.suffix == ".jenga":
+            Colored.PrintInfo(f"[daemon] Workspace file changed: {path}")
             with self._lock:
                 self.cache.UpdateIncremental(self.entry_file, self.loader, self.workspace)
-            # TODO: option pour rebuild automatique
-
-        self._watcher.AddCallback(on_change)
-        self._watcher.Start()
-        return {'status': 'ok', 'message': 'Watcher started'}
+                reloaded = self.loader.LoadWorkspace(str(self.entry_file))
+                if reloaded is not None:
+                    self.workspace = reloaded
+                self._DropBuilders()
+            return
+        with self._lock:
+            builders = list(self._builders.values())
+        for builder in builders:
+            if builder.graphCache is not None:
+                builder.graphCache.OnFileEvent(event_type, path)
 
     def _StopWatcher(self) -> Dict:
         """Arrête le watcher."""
         if self._watcher:
             self._watcher.Stop()
             self._watcher = None
+            # Sans événements, le cache ne peut plus être tenu à jour.
+            with self._lock:
+                for builder in self._builders.values():
+                    builder.graphCache = None
             return {'status': 'ok', 'message': 'Watcher stopped'}
         return {'status': 'error', 'message': 'No watcher running'}
 
@@ -341,7 +735,8 @@ class Daemon:
             workspace_root=str(self.workspace_root),
             entry_file=str(self.entry_file),
             start_time=self._start_time,
-            version=__version__
+            version=__version__,
+            socket=str(self._socket_path) if self._socket_path else ""
         )
         info_path = self._daemon_dir / self._INFO_FILE
         FileSystem.WriteFile(info_path, json.dumps(info.__dict__, indent=2))
@@ -357,10 +752,16 @@ class Daemon:
             'status': 'ok',
             'pid': os.getpid(),
             'port': self._port,
+            'socket': str(self._socket_path) if self._socket_path else None,
+            'active_request': self._activeRequest,
             'workspace': str(self.workspace_root),
             'entry': str(self.entry_file),
             'uptime': time.time() - self._start_time,
-            'watcher_active': self._watcher is not None and self._watcher._running
+            'watcher_active': self._watcher is not None and self._watcher._running,
+            'auto_rebuild': self._pipeline is not None,
+            'builders': len(self._builders),
+            'graph_cache': [b.graphCache.Stats() for b in self._builders.values()
+                            if b.graphCache is not None]
         }
 
     # -----------------------------------------------------------------------
@@ -383,10 +784,19 @@ class Daemon:
         if not self._running:
             return
         self._running = False
+        if self._pipeline is not None:
+            self._StopAutoBuild()
         if self._watcher:
             self._watcher.Stop()
+        if self._activeRequest is not None:
+            Process.CancelAll()
         if self._server_socket:
             self._server_socket.close()
+        if self._socket_path is not None:
+            try:
+                self._socket_path.unlink()
+            except OSError:
+                pass
         self._RemoveDaemonInfo()
         Colored.PrintInfo("Daemon stopped.")
 
@@ -474,33 +884,76 @@ class DaemonClient:
                 os.kill(self._daemon_info.pid, 0)
             except OSError:
                 return False
-        # Vérifier que le port répond
+        # Vérifier que le socket répond
         try:
-            with socket.create_connection(('127.0.0.1', self._daemon_info.port), timeout=0.5):
+            with self._Connect(0.5):
                 pass
             return True
-        except:
+        except OSError:
             return False
 
-    def SendCommand(self, command: str, args: Dict = None, timeout: float = 30.0) -> Dict:
+    def _Connect(self, timeout: Optional[float]) -> socket.socket:
+        info = self._daemon_info
+        if info.socket and hasattr(socket, 'AF_UNIX'):
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(timeout)
+            try:
+                sock.connect(info.socket)
+            except OSError:
+                sock.close()
+                raise
+            return sock
+        return socket.create_connection(('127.0.0.1', info.port), timeout=timeout)
+
+    @staticmethod
+    def _PrintOutput(stream: str, data: str) -> None:
+        target = sys.stderr if stream == 'stderr' else sys.stdout
+        target.write(data)
+        target.flush()
+
+    def SendCommand(self, command: str, args: Dict = None, timeout: float = 30.0,
+                    onOutput: Optional[Callable[[str, str], None]] = None) -> Dict:
         """
-        Envoie une commande au daemon et retourne la réponse.
+        Envoie une commande au daemon et retourne la trame résultat.
+        La sortie diffusée par le daemon est passée à onOutput(stream, data)
+        (par défaut : écrite sur le terminal). timeout borne la connexion et
+        les commandes courtes ; les commandes longues (build, clean, run,
+        test) attendent sans limite et Ctrl+C les annule côté daemon.
         Lève une exception si le daemon n'est pas disponible.
         """
         if not self.IsAvailable():
             raise ConnectionError("Daemon is not running or unreachable")
+        onOutput = onOutput or self._PrintOutput
+
+        with self._Connect(timeout) as s:
+            streaming = command in Daemon._EXCLUSIVE_COMMANDS or bool((args or {}).get('follow'))
+            s.settimeout(None if streaming else timeout)
+            request_id = str(uuid.uuid4())
+            _SendFrame(s, {'command': command, 'args': args or {}, 'id': request_id})
+            reader = _FrameReader(s)
+            try:
+                return self._WaitResult(reader, request_id, onOutput)
+            except KeyboardInterrupt:
+                # Annuler côté daemon puis récupérer le résultat final du build
+                try:
+                    _SendFrame(s, {'command': 'cancel', 'args': {'target': request_id},
+                                   'id': str(uuid.uuid4())})
+                    s.settimeout(10.0)
+                    return self._WaitResult(reader, request_id, onOutput)
+                except (OSError, ValueError, ConnectionError):
+                    return {'status': 'error', 'cancelled': True, 'message': 'Cancelled by client'}
 
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.settimeout(timeout)
-            s.connect(('127.0.0.1', self._daemon_info.port))
-            request = {
-                'command': command,
-                'args': args or {},
-                'id': str(uuid.uuid4())
-            }
-            s.send(json.dumps(request).encode('utf-8'))
-            response = s.recv(65536)
-            return json.loads(response.decode('utf-8'))
+    @staticmethod
+    def _WaitResult(reader: _FrameReader, request_id: str,
+                    onOutput: Callable[[str, str], None]) -> Dict:
+        while True:
+            frame = reader.ReadFrame()
+            if frame is None:
+                raise ConnectionError("Daemon closed the connection")
+            if frame.get('type') == 'output':
+                onOutput(frame.get('stream', 'stdout'), frame.get('data', ''))
+            elif frame.get('id') == request_id:
+                return frame
 
 
 # ---------------------------------------------------------------------------
@@ -671,6 +1124,7 @@ def DaemonStatus(workspace_root: Path) -> Dict:
                 'running': True,
                 'pid': response.get('pid'),
                 'port': response.get('port'),
+                'socket': response.get('socket'),
                 'uptime': response.get('uptime'),
                 'watcher': response.get('watcher_active')
             }
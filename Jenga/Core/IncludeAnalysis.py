@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+IncludeAnalysis – Coût des headers d'un workspace.
+Agrège les fichiers .d produits par les builds (un par objet) et, quand ils
+existent, les traces clang -ftime-trace (<objet>.json) pour classer les
+headers selon :
+  - le nombre de TU qui les incluent,
+  - leur coût de parsing cumulé (événements "Source" de la trace, inclusifs),
+  - leur coût d'instanciation de templates : temps propre des événements
+    InstantiateClass/InstantiateFunction, attribué au header qui définit le
+    template (argument "file", émis par clang 19+ avec -ftime-trace-verbose ;
+    sans lui, seul le total par TU est connu),
+  - leur fan-out d'inclusion transitif (#include résolus parmi les headers connus),
+  - l'impact d'une modification (objets invalidés et temps de recompilation).
+Le rapport sert à choisir le pchheader ou les headers à découper.
+
+Toutes les méthodes publiques sont en PascalCase.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+_SOURCE_EXTENSIONS = {'.c', '.cpp', '.cc', '.cxx', '.c++', '.m', '.mm'}
+
+_INCLUDE_RE = re.compile(r'^\s*#\s*include\s*[<"]([^>"]+)[>"]', re.M)
+
+_INSTANTIATE_EVENTS = ("InstantiateClass", "InstantiateFunction")
+
+# Critères de tri acceptés par Analyze()/la CLI.
+SORT_KEYS = ("impact", "tus", "parse", "instantiate", "fanout")
+
+
+class IncludeAnalyzer:
+    """
+    Usage :
+        analyzer = IncludeAnalyzer()
+        analyzer.AddUnit(objectFile, deps)          # deps issus de _ParseDependencyFile
+        analyzer.AddTimeTrace(objectFile, trace)    # optionnel
+        report = analyzer.Analyze(sortBy="impact")
+    """
+
+    def __init__(self):
+        self._units: Dict[str, Dict[str, Any]] = {}
+        self._parseUs: Dict[str, float] = {}
+        self._compileUs: Dict[str, float] = {}
+        self._instantiateUs: Dict[str, float] = {}
+        self._headerInstantiateUs: Dict[str, float] = {}
+
+    # -----------------------------------------------------------------------
+    # Collecte
+    # -----------------------------------------------------------------------
+
+    def AddUnit(self, objectFile: str, deps: List[Path]) -> None:
+        """Register one object; the first .d prerequisite is its source file."""
+        if not deps:
+            return
+        paths = [str(Path(d)) for d in deps]
+        source = paths[0]
+        # Les sources incluses par une TU unity ne sont pas des headers.
+        headers = sorted({p for p in paths[1:]
+                          if p != source and Path(p).suffix.lower() not in _SOURCE_EXTENSIONS})
+        self._units[str(objectFile)] = {"source": source, "headers": headers}
+
+    def AddTimeTrace(self, objectFile: str, trace: Dict[str, Any]) -> None:
+        """Fold one clang -ftime-trace document into the per-header costs."""
+        obj = str(objectFile)
+        instantiations: List[Dict[str, Any]] = []
+        for event in trace.get("traceEvents", []) or []:
+            name = event.get("name")
+            dur = float(event.get("dur", 0) or 0)
+            if name in _INSTANTIATE_EVENTS:
+                instantiations.append(event)
+            elif name == "Source":
+                header = (event.get("args") or {}).get("detail")
+                if header:
+                    key = str(Path(header))
+                    self._parseUs[key] = self._parseUs.get(key, 0.0) + dur
+            elif name == "Total ExecuteCompiler":
+                self._compileUs[obj] = dur
+            elif name in ("Total InstantiateFunction", "Total InstantiateClass"):
+                self._instantiateUs[obj] = self._instantiateUs.get(obj, 0.0) + dur
+        for header, selfUs in self._InstantiationSelfTimes(instantiations).items():
+            self._headerInstantiateUs[header] = self._headerInstantiateUs.get(header, 0.0) + selfUs
+
+    @staticmethod
+    def _InstantiationSelfTimes(events: List[Dict[str, Any]]) -> Dict[str, float]:
+        """
+        Temps propre (durée moins instanciations imbriquées) par header
+        définissant le template. Les événements sans argument "file" ne
+        sont pas attribués, mais leur durée reste déduite de leur parent.
+        """
+        selfUs: Dict[str, float] = {}
+        by_thread: Dict[Any, List[Dict[str, Any]]] = {}
+        for event in events:
+            by_thread.setdefault(event.get("tid"), []).append(event)
+        for thread_events in by_thread.values():
+            thread_events.sort(key=lambda e: (float(e.get("ts", 0) or 0), -float(e.get("dur", 0) or 0)))
+            stack: List[List[Any]] = []     # [fin, header, temps propre]
+
+            def close(entry):
+                if entry[1]:
+                    selfUs[entry[1]] = selfUs.get(entry[1], 0.0) + max(0.0, entry[2])
+
+            for event in thread_events:
+                start = float(event.get("ts", 0) or 0)
+                dur = float(event.get("dur", 0) or 0)
+                while stack and stack[-1][0] <= start:
+                    close(stack.pop())
+                if stack:
+                    stack[-1][2] -= dur
+                location = str((event.get("args") or {}).get("file") or "")
+                header = str(Path(re.sub(r":\d+(:\d+)?$", "", location))) if location else ""
+                stack.append([start + dur, header, dur])
+            while stack:
+                close(stack.pop())
+        return selfUs
+
+    @property
+    def unitCount(self) -> int:
+        return len(self._units)
+
+    # -----------------------------------------------------------------------
+    # Graphe d'inclusion
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def _ReadIncludes(header: str) -> List[str]:
+        try:
+            text = Path(header).read_text(encoding="utf-8", errors="ignore")
+        except OSError:
+            return []
+        return _INCLUDE_RE.findall(text)
+
+    def BuildIncludeGraph(self) -> Dict[str, Set[str]]:
+        """
+        Direct include edges between known headers. An '#include "x/y.h"' is
+        resolved to a header seen in the .d data whose path ends with it,
+        preferring the including file's directory.
+        """
+        known: Set[str] = set()
+        for unit in self._units.values():
+            known.update(unit["headers"])
+        by_name: Dict[str, List[str]] = {}
+        for header in known:
+            by_name.setdefault(Path(header).name, []).append(header)
+
+        graph: Dict[str, Set[str]] = {}
+        for header in sorted(known):
+            edges: Set[str] = set()
+            here = Path(header).parent
+            for spelled in self._ReadIncludes(header):
+                spelled_posix = spelled.replace("\\", "/")
+                candidates = [c for c in by_name.get(Path(spelled_posix).name, [])
+                              if Path(c).as_posix().endswith("/" + spelled_posix) or Path(c).as_posix() == spelled_posix]
+                if not candidates:
+                    continue
+                local = [c for c in candidates if Path(c).parent == here]
+                target = sorted(local or candidates)[0]
+                if target != header:
+                    edges.add(target)
+            graph[header] = edges
+        return graph
+
+    @staticmethod
+    def _TransitiveCounts(graph: Dict[str, Set[str]]) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for start in graph:
+            seen: Set[str] = set()
+            stack = list(graph[start])
+            while stack:
+                node = stack.pop()
+                if node in seen or node == start:
+                    continue
+                seen.add(node)
+                stack.extend(graph.get(node, ()))
+            counts[start] = len(seen)
+        return counts
+
+    # -----------------------------------------------------------------------
+    # Rapport
+    # -----------------------------------------------------------------------
+
+    def Analyze(self, sortBy: str = "impact") -> Dict[str, Any]:
+        """Return the machine-readable report (headers ranked by sortBy)."""
+        if sortBy not in SORT_KEYS:
+            raise ValueError(f"Unknown sort key '{sortBy}' (expected one of {', '.join(SORT_KEYS)})")
+
+        included_by: Dict[str, List[str]] = {}
+        for obj, unit in self._units.items():
+            for header in unit["headers"]:
+                included_by.setdefault(header, []).append(obj)
+        fanout = self._TransitiveCounts(self.BuildIncludeGraph())
+        has_timing = bool(self._compileUs)
+
+        headers: List[Dict[str, Any]] = []
+        for header, objs in included_by.items():
+            rebuild_us = sum(self._compileUs.get(o, 0.0) for o in objs)
+            headers.append({
+                "header": header,
+                "tus": len(objs),
+                "parseMs": round(self._parseUs.get(header, 0.0) / 1000.0, 3),
+                "instantiateMs": round(self._headerInstantiateUs.get(header, 0.0) / 1000.0, 3),
+                "fanout": fanout.get(header, 0),
+                "invalidatedObjects": len(objs),
+                "rebuildMs": round(rebuild_us / 1000.0, 3) if has_timing else None,
+            })
+
+        def _key(row: Dict[str, Any]):
+            if sortBy == "tus":
+                primary = row["tus"]
+            elif sortBy == "parse":
+                primary = row["parseMs"]
+            elif sortBy == "instantiate":
+                primary = row["instantiateMs"]
+            elif sortBy == "fanout":
+                primary = row["fanout"]
+            else:
+                primary = row["rebuildMs"] if has_timing else row["invalidatedObjects"]
+            return (-primary, -row["tus"], row["header"])
+
+        headers.sort(key=_key)
+
+        units = []
+        for obj in sorted(self._units):
+            unit = self._units[obj]
+            units.append({
+                "object": obj,
+                "source": unit["source"],
+                "headers": len(unit["headers"]),
+                "compileMs": round(self._compileUs[obj] / 1000.0, 3) if obj in self._compileUs else None,
+                "instantiateMs": round(self._instantiateUs[obj] / 1000.0, 3) if obj in self._instantiateUs else None,
+            })
+
+        return {
+            "version": 1,
+            "sortBy": sortBy,
+            "unitCount": len(self._units),
+            "timeTraceUnits": len(self._compileUs),
+            "headers": headers,
+            "units": units,
+        }
+
+    @staticmethod
+    def WriteReport(report: Dict[str, Any], outputFile: Path) -> None:
+        outputFile = Path(outputFile)
+        outputFile.parent.mkdir(parents=True, exist_ok=True)
+        outputFile.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    @staticmethod
+    def FormatRows(report: Dict[str, Any], top: int = 20,
+                   root: Optional[Path] = None) -> List[List[str]]:
+        """Rows for Display.PrintTable (paths shown relative to root when possible)."""
+        rows: List[List[str]] = []
+        for entry in report["headers"][:max(0, top)]:
+            shown = entry["header"]
+            if root is not None:
+                try:
+                    shown = str(Path(shown).relative_to(root))
+                except ValueError:
+                    pass
+            rows.append([
+                shown,
+                str(entry["tus"]),
+                str(entry["fanout"]),
+                f"{entry['parseMs']:.1f}" if entry["parseMs"] else "-",
+                f"{entry['instantiateMs']:.1f}" if entry["instantiateMs"] else "-",
+                f"{entry['rebuildMs']:.1f}" if entry["rebuildMs"] is not None else "-",
+            ])
+        return rows
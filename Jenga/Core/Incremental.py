@@ -6,14 +6,32 @@ Calcule les empreintes des fichiers sources, des flags de compilation,
 et des dépendances (headers). Compare avec l'état précédent (BuildState)
 pour déterminer si un projet ou un fichier doit être recompilé.
 
+Empreinte en deux niveaux :
+  1. signature stat (mtime_ns, taille, inode, ctime_ns) : si elle est égale
+     à celle enregistrée avec le hash, le fichier est considéré inchangé
+     sans être relu ;
+  2. sinon, hash du contenu (xxh3_128 si le module xxhash est installé,
+     BLAKE2b sinon), calculé en parallèle pour tous les fichiers à vérifier.
+     Un fichier seulement « touché » (même contenu) voit sa signature
+     rafraîchie dans l'état, qui la persiste avec le hash.
+
 Toutes les méthodes publiques sont en PascalCase.
 """
 
 import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Set, Optional, Any, Tuple
+from typing import List, Dict, Set, Optional, Any, Tuple, Iterable
 from functools import lru_cache
 
+try:
+    import xxhash  # type: ignore
+    _XXHASH_OK = True
+except ImportError:
+    xxhash = None  # type: ignore
+    _XXHASH_OK = False
+
 from ..Utils import FileSystem
 from .Api import Project
 from .State import BuildState
@@ -32,13 +50,109 @@ class Incremental:
     # Hachage de contenu
     # -----------------------------------------------------------------------
 
+    # Algorithme des empreintes de contenu (non cryptographique suffit)
+    HASH_ALGORITHM = "xxh3_128" if _XXHASH_OK else "blake2b"
+    _READ_SIZE = 1 << 20
+
     @staticmethod
-    def ComputeFileHash(filepath: str, algorithm: str = "sha256") -> str:
+    def ComputeFileHash(filepath: str, algorithm: Optional[str] = None) -> str:
         """
         Calcule le hash d'un fichier. Utilisé pour détecter les changements.
-        Par défaut sha256, plus fiable que mtime seul.
+        Par défaut HASH_ALGORITHM (xxh3_128 ou BLAKE2b 128 bits) ; tout nom
+        accepté par hashlib reste possible (ex. "sha256").
         """
-        return FileSystem.ComputeFileHash(filepath, algorithm)
+        algorithm = algorithm or Incremental.HASH_ALGORITHM
+        if algorithm == "xxh3_128" and _XXHASH_OK:
+            hasher = xxhash.xxh3_128()
+        elif algorithm == "blake2b":
+            hasher = hashlib.blake2b(digest_size=16)
+        else:
+            return FileSystem.ComputeFileHash(filepath, algorithm)
+        buf = bytearray(Incremental._READ_SIZE)
+        view = memoryview(buf)
+        with open(filepath, "rb", buffering=0) as f:
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                hasher.update(view[:n])
+        return hasher.hexdigest()
+
+    @staticmethod
+    def StatSignature(st: os.stat_result) -> Tuple[int, int, int, int]:
+        """Signature rapide d'un fichier : (mtime_ns, size, inode, ctime_ns)."""
+        return (st.st_mtime_ns, st.st_size, st.st_ino, st.st_ctime_ns)
+
+    @staticmethod
+    def HashFiles(paths: Iterable[str], jobs: int = 0) -> Dict[str, Optional[str]]:
+        """
+        Hash de contenu de plusieurs fichiers, en parallèle (hashlib et xxhash
+        relâchent le GIL). None pour un fichier illisible.
+        """
+        paths = list(paths)
+
+        def one(path: str) -> Optional[str]:
+            try:
+                return Incremental.ComputeFileHash(path)
+            except OSError:
+                return None
+        if len(paths) < 2:
+            return {p: one(p) for p in paths}
+        workers = jobs if jobs > 0 else min(32, (os.cpu_count() or 1) + 4)
+        with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+            return dict(zip(paths, pool.map(one, paths)))
+
+    @staticmethod
+    def ChangedFiles(state: BuildState, paths: Iterable[str], jobs: int = 0) -> Set[str]:
+        """
+        Fichiers de paths dont le contenu diffère de l'état enregistré (ou
+        absents de l'état / supprimés). Seuls ceux dont la signature stat a
+        changé sont relus ; ceux dont le contenu est identique voient leur
+        signature mise à jour dans state. Les fichiers modifiés ne sont pas
+        enregistrés : c'est RecordFiles(), après un build réussi, qui le fait.
+        """
+        changed: Set[str] = set()
+        toHash: Dict[str, Tuple[os.stat_result, Any]] = {}
+        for path in dict.fromkeys(paths):
+            try:
+                st = os.stat(path)
+            except OSError:
+                changed.add(path)
+                continue
+            record = state.GetFileState(path)
+            if record is None:
+                changed.add(path)
+            elif record.stat is None or tuple(record.stat) != Incremental.StatSignature(st):
+                toHash[path] = (st, record)
+
+        for path, digest in Incremental.HashFiles(toHash, jobs).items():
+            st, record = toHash[path]
+            if digest is None or digest != record.hash:
+                changed.add(path)
+            else:
+                state.UpdateFileState(path, digest, st.st_mtime, Incremental.StatSignature(st))
+        return changed
+
+    @staticmethod
+    def RecordFiles(state: BuildState, paths: Iterable[str], jobs: int = 0) -> None:
+        """
+        Enregistre l'empreinte (hash + signature stat) des fichiers d'un build
+        réussi ; un fichier dont la signature n'a pas changé n'est pas relu.
+        """
+        toHash: Dict[str, os.stat_result] = {}
+        for path in dict.fromkeys(paths):
+            try:
+                st = os.stat(path)
+            except OSError:
+                state.RemoveFileState(path)
+                continue
+            record = state.GetFileState(path)
+            if record is None or record.stat is None or tuple(record.stat) != Incremental.StatSignature(st):
+                toHash[path] = st
+        for path, digest in Incremental.HashFiles(toHash, jobs).items():
+            st = toHash[path]
+            if digest is not None:
+                state.UpdateFileState(path, digest, st.st_mtime, Incremental.StatSignature(st))
 
     @staticmethod
     def ComputeStringHash(content: str, algorithm: str = "sha256") -> str:
@@ -99,28 +213,15 @@ class Incremental:
         if state.GetProjectFlagsHash(project.name) != current_flags_hash:
             return True
 
-        # Vérifier les fichiers sources
+        # Fichiers sources (un source manquant sera traité plus tard) et
+        # dépendances (headers) enregistrées : un header supprimé force le rebuild
+        paths = []
         for src in project.files:
-            # Résoudre le chemin absolu
             src_path = Incremental._ResolvePath(src, project.location)
-            if not src_path.exists():
-                continue  # fichier manquant ? On le traitera plus tard
-            current_hash = Incremental.ComputeFileHash(str(src_path))
-            if state.HasFileChanged(str(src_path), current_hash, src_path.stat().st_mtime):
-                return True
-
-        # Vérifier les dépendances (headers) enregistrées
-        deps = state.GetProjectDependencies(project.name)
-        for dep in deps:
-            dep_path = Path(dep)
-            if not dep_path.exists():
-                # Le fichier a été supprimé – doit recompiler
-                return True
-            current_hash = Incremental.ComputeFileHash(str(dep_path))
-            if state.HasFileChanged(dep, current_hash, dep_path.stat().st_mtime):
-                return True
-
-        return False
+            if src_path.exists():
+                paths.append(str(src_path))
+        paths.extend(state.GetProjectDependencies(project.name))
+        return bool(Incremental.ChangedFiles(state, paths))
 
     @staticmethod
     def NeedRecompileSource(source_file: str,
@@ -145,12 +246,8 @@ class Incremental:
         if src_mtime > obj_mtime:
             return True
 
-        # Vérifier hash si disponible dans l'état
-        current_hash = Incremental.ComputeFileHash(str(src_path))
-        if state.HasFileChanged(str(src_path), current_hash, src_mtime):
-            return True
-
-        return False
+        # Vérifier l'empreinte enregistrée (hash seulement si la signature stat a changé)
+        return bool(Incremental.ChangedFiles(state, [str(src_path)]))
 
     @staticmethod
     def _ResolvePath(path: str, base: Optional[str]) -> Path:
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Inotify – Backend Linux natif du FileWatcher (ctypes, sans dépendance).
+
+  - une surveillance inotify par répertoire, ajoutée récursivement au
+    démarrage puis à chaque création/déplacement de répertoire ; les
+    répertoires ignorés ne sont jamais parcourus
+  - les événements lus ensemble sont fusionnés par chemin (une rafale
+    d'écritures = un seul 'modified', créé puis supprimé = rien)
+  - en cas de débordement de la file noyau (IN_Q_OVERFLOW), les
+    surveillances sont resynchronisées et un événement 'overflow' est émis
+    pour chaque racine : le consommateur doit alors tout réévaluer.
+
+Toutes les méthodes publiques sont en PascalCase.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional
+
+from ..Utils import Colored
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_EXCL_UNLINK = 0x04000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+               IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR | IN_EXCL_UNLINK)
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+_libc = None
+
+
+def _Libc():
+    global _libc
+    if _libc is None:
+        lib = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        lib.inotify_init1.argtypes = [ctypes.c_int]
+        lib.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        lib.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        _libc = lib
+    return _libc
+
+
+def IsAvailable() -> bool:
+    """True on Linux when libc exposes inotify."""
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        return hasattr(_Libc(), "inotify_init1")
+    except OSError:
+        return False
+
+
+def CoalesceEvent(pending: Dict[str, str], path: str, kind: str) -> None:
+    """Merge one event into the pending batch (ordered dict path -> kind)."""
+    previous = pending.get(path)
+    if previous == "created" and kind == "deleted":
+        del pending[path]               # fichier temporaire : rien à signaler
+    elif previous == "created" and kind == "modified":
+        pass
+    elif previous == "deleted" and kind == "created":
+        pending[path] = "modified"      # remplacement atomique (écriture + rename)
+    else:
+        pending.pop(path, None)
+        pending[path] = kind
+
+
+class InotifyWatcher:
+    """
+    Usage :
+        watcher = InotifyWatcher(roots, shouldIgnore, notify)
+        watcher.Start()   # OSError si inotify est indisponible
+        ...
+        watcher.Stop()
+    notify(event_type, path) reçoit 'created', 'modified', 'deleted' ou 'overflow'.
+    """
+
+    def __init__(self, roots: Iterable[str], shouldIgnore: Callable[[str], bool],
+                 notify: Callable[[str, str], None], coalesceDelay: float = 0.02):
+        self.roots = [os.path.abspath(r) for r in roots]
+        self.shouldIgnore = shouldIgnore
+        self.notify = notify
+        self.coalesceDelay = coalesceDelay
+        self._fd = -1
+        self._wds: Dict[int, str] = {}
+        self._paths: Dict[str, int] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._limitWarned = False
+        self._buffer = b""
+        # Lot lu mais pas encore entièrement notifié (voir Sync)
+        self._idle = threading.Condition()
+        self._delivering = False
+
+    # -----------------------------------------------------------------------
+    # Cycle de vie
+    # -----------------------------------------------------------------------
+
+    def Start(self) -> None:
+        fd = _Libc().inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_init1 failed: {os.strerror(err)}")
+        self._fd = fd
+        for root in self.roots:
+            self._AddTree(root, None)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._ReadLoop, daemon=True)
+        self._thread.start()
+
+    def Stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+        self._wds.clear()
+        self._paths.clear()
+
+    def Sync(self, timeout: float = 2.0) -> bool:
+        """
+        Wait until every event already queued by the kernel has been passed
+        to notify (the kernel queues them before write() returns): a build
+        requested right after a save then sees its invalidation. False on
+        timeout.
+        """
+        deadline = time.monotonic() + timeout
+        with self._idle:
+            while True:
+                if not self._delivering:
+                    try:
+                        readable, _, _ = select.select([self._fd], [], [], 0)
+                    except (OSError, ValueError):
+                        return True
+                    if not readable:
+                        return True
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._stop.is_set():
+                    return False
+                self._idle.wait(min(remaining, 0.05))
+
+    def IsWatched(self, directory: str) -> bool:
+        return directory in self._paths
+
+    @property
+    def watchCount(self) -> int:
+        return len(self._wds)
+
+    # -----------------------------------------------------------------------
+    # Surveillances
+    # -----------------------------------------------------------------------
+
+    def _AddWatch(self, directory: str) -> bool:
+        wd = _Libc().inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err == errno.ENOSPC and not self._limitWarned:
+                self._limitWarned = True
+                Colored.PrintWarning(
+                    "inotify watch limit reached, some directories are not watched "
+                    "(raise fs.inotify.max_user_watches).")
+            return False
+        self._wds[wd] = directory
+        self._paths[directory] = wd
+        return True
+
+    def _AddTree(self, root: str, created: Optional[Dict[str, str]]) -> None:
+        """Watch root and its subdirectories; report their files in 'created' if given."""
+        stack = [root]
+        while stack:
+            directory = stack.pop()
+            if not self._AddWatch(directory):
+                continue
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                if self.shouldIgnore(entry.path):
+                    continue
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if is_dir:
+                    if not entry.name.startswith("."):
+                        stack.append(entry.path)
+                        if created is not None:
+                            CoalesceEvent(created, entry.path, "created")
+                elif created is not None:
+                    CoalesceEvent(created, entry.path, "created")
+
+    def _ForgetTree(self, directory: str) -> None:
+        prefix = directory.rstrip(os.sep) + os.sep
+        for path in [p for p in self._paths if p == directory or p.startswith(prefix)]:
+            wd = self._paths.pop(path)
+            self._wds.pop(wd, None)
+            _Libc().inotify_rm_watch(self._fd, wd)
+
+    # -----------------------------------------------------------------------
+    # Lecture des événements
+    # -----------------------------------------------------------------------
+
+    def _ReadLoop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                readable, _, _ = select.select([self._fd], [], [], 0.25)
+            except (OSError, ValueError):
+                return
+            if not readable:
+                continue
+            with self._idle:
+                self._delivering = True
+            try:
+                # Laisser arriver la fin d'une rafale (sauvegarde IDE, git checkout)
+                time.sleep(self.coalesceDelay)
+                try:
+                    events, overflow = self._ReadEvents()
+                except OSError:
+                    return
+                if overflow:
+                    self._Resync()
+                for path, kind in events.items():
+                    self.notify(kind, path)
+                if overflow:
+                    for root in self.roots:
+                        self.notify("overflow", root)
+            finally:
+                with self._idle:
+                    self._delivering = False
+                    self._idle.notify_all()
+
+    def _ReadEvents(self):
+        data = self._buffer
+        while True:
+            try:
+                chunk = os.read(self._fd, 65536)
+            except BlockingIOError:
+                break
+            if not chunk:
+                break
+            data += chunk
+        pending: Dict[str, str] = {}
+        overflow = False
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            end = offset + _EVENT_HEADER.size + length
+            if end > len(data):
+                break
+            name = data[offset + _EVENT_HEADER.size:end].rstrip(b"\0")
+            offset = end
+            if mask & IN_Q_OVERFLOW:
+                overflow = True
+                continue
+            self._HandleEvent(wd, mask, os.fsdecode(name), pending)
+        self._buffer = data[offset:]
+        return pending, overflow
+
+    def _HandleEvent(self, wd: int, mask: int, name: str, pending: Dict[str, str]) -> None:
+        directory = self._wds.get(wd)
+        if directory is None:
+            return
+        if mask & IN_IGNORED:
+            self._wds.pop(wd, None)
+            if self._paths.get(directory) == wd:
+                del self._paths[directory]
+            return
+        if not name:
+            return  # DELETE_SELF / MOVE_SELF : signalé par le répertoire parent
+        path = os.path.join(directory, name)
+        if self.shouldIgnore(path):
+            return
+        if mask & IN_ISDIR:
+            if mask & (IN_CREATE | IN_MOVED_TO):
+                CoalesceEvent(pending, path, "created")
+                if not name.startswith("."):
+                    self._AddTree(path, pending)
+            elif mask & (IN_DELETE | IN_MOVED_FROM):
+                CoalesceEvent(pending, path, "deleted")
+                self._ForgetTree(path)
+            return
+        if mask & (IN_CREATE | IN_MOVED_TO):
+            CoalesceEvent(pending, path, "created")
+        elif mask & (IN_DELETE | IN_MOVED_FROM):
+            CoalesceEvent(pending, path, "deleted")
+        elif mask & (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE):
+            CoalesceEvent(pending, path, "modified")
+
+    def _Resync(self) -> None:
+        """After a queue overflow: re-add watches (idempotent) for every directory."""
+        self._buffer = b""
+        for root in self.roots:
+            self._AddTree(root, None)
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ModuleScanner – Scan des dépendances de modules C++20 (format P1689).
+Pour chaque unité de module, détermine le module fourni et les modules
+importés, via l'outil natif du compilateur :
+  - Clang : clang-scan-deps -format=p1689
+  - GCC   : -fdeps-format=p1689r5 (GCC >= 14)
+  - MSVC  : /scanDependencies
+À défaut (outil absent, compilateur trop ancien), un scan lexical des
+déclarations 'export module' / 'import' est utilisé.
+
+Les résultats sont mis en cache par signature de fichier (chemin, mtime,
+taille, commande de scan) et le graphe d'imports est ordonné par Kahn.
+Toutes les méthodes publiques sont en PascalCase.
+"""
+
+import concurrent.futures
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from Jenga.Core.Api import CompilerFamily, Toolchain
+from ..Utils import Process
+
+
+@dataclass
+class ModuleScanResult:
+    """Modules fournis et requis par une unité de traduction."""
+    source: str
+    provides: List[str] = field(default_factory=list)
+    requires: List[str] = field(default_factory=list)
+    method: str = "lexical"
+
+
+# ---------------------------------------------------------------------------
+# Parsing P1689 et scan lexical
+# ---------------------------------------------------------------------------
+
+def ParseP1689(data: Dict) -> Tuple[List[str], List[str]]:
+    """Extract (provides, requires) logical names from a P1689 document."""
+    provides: List[str] = []
+    requires: List[str] = []
+    for rule in data.get("rules", []) or []:
+        for entry in rule.get("provides", []) or []:
+            name = entry.get("logical-name")
+            if name and name not in provides:
+                provides.append(name)
+        for entry in rule.get("requires", []) or []:
+            name = entry.get("logical-name")
+            if name and name not in requires:
+                requires.append(name)
+    return provides, requires
+
+
+# Toolchains basées sur Clang : scan via clang-scan-deps.
+_CLANG_FAMILIES = (CompilerFamily.CLANG, CompilerFamily.APPLE_CLANG,
+                   CompilerFamily.ANDROID_NDK, CompilerFamily.EMSCRIPTEN)
+
+_COMMENT_RE = re.compile(r"//[^\n]*|/\*.*?\*/", re.S)
+_MODULE_DECL_RE = re.compile(r"^\s*(?:export\s+)?module\s+([\w.]+(?::[\w.]+)?)\s*;", re.M)
+_IMPORT_RE = re.compile(r"^\s*(?:export\s+)?import\s+([\w.]*(?::[\w.]+)?)\s*;", re.M)
+
+
+def LexicalScan(sourceFile: str) -> Tuple[List[str], List[str]]:
+    """
+    Fallback scan reading 'export module X;' / 'import Y;' declarations.
+    Header units (import <x>; import "x";) are ignored, partitions
+    ('import :part;') are qualified with the primary module name.
+    """
+    try:
+        text = Path(sourceFile).read_text(encoding="utf-8", errors="ignore")
+    except OSError:
+        return [], []
+    text = _COMMENT_RE.sub("", text)
+
+    provides: List[str] = []
+    primary = ""
+    for match in _MODULE_DECL_RE.finditer(text):
+        name = match.group(1)
+        if not primary:
+            primary = name.split(":", 1)[0]
+        if match.group(0).lstrip().startswith("export") and name not in provides:
+            provides.append(name)
+
+    requires: List[str] = []
+    for match in _IMPORT_RE.finditer(text):
+        name = match.group(1)
+        if name.startswith(":"):
+            if not primary:
+                continue
+            name = primary + name
+        if name and name not in requires and name not in provides:
+            requires.append(name)
+    return provides, requires
+
+
+# ---------------------------------------------------------------------------
+# Graphe d'imports
+# ---------------------------------------------------------------------------
+
+def BuildModuleGraph(results: Dict[str, ModuleScanResult]) -> Tuple[Dict[str, Set[str]], Dict[str, Set[str]]]:
+    """
+    Build the source-level import graph.
+    Returns (deps, unresolved): deps[src] = sources src depends on inside the
+    scanned set, unresolved[src] = imported names nobody in the set provides
+    (std modules, modules of dependency projects...).
+    """
+    providers: Dict[str, str] = {}
+    for src, res in results.items():
+        for name in res.provides:
+            providers[name] = src
+
+    deps: Dict[str, Set[str]] = {src: set() for src in results}
+    unresolved: Dict[str, Set[str]] = {src: set() for src in results}
+    for src, res in results.items():
+        for name in res.requires:
+            provider = providers.get(name)
+            if provider is None:
+                unresolved[src].add(name)
+            elif provider != src:
+                deps[src].add(provider)
+    return deps, unresolved
+
+
+def TopologicalOrder(deps: Dict[str, Set[str]]) -> List[str]:
+    """Kahn ordering of the graph (sorted for determinism). Raises ValueError on cycle."""
+    remaining = {node: set(d) for node, d in deps.items()}
+    order: List[str] = []
+    ready = sorted(node for node, d in remaining.items() if not d)
+    while ready:
+        node = ready.pop(0)
+        order.append(node)
+        del remaining[node]
+        for other, d in remaining.items():
+            if node in d:
+                d.discard(node)
+                if not d:
+                    ready.append(other)
+        ready.sort()
+    if remaining:
+        raise ValueError("Cyclic module imports between: " + ", ".join(sorted(Path(n).name for n in remaining)))
+    return order
+
+
+# ---------------------------------------------------------------------------
+# Scanner
+# ---------------------------------------------------------------------------
+
+class ModuleScanner:
+    """
+    Scanne un ensemble de fichiers modules en parallèle, avec cache disque.
+    Usage :
+        scanner = ModuleScanner(toolchain, flags, cacheFile, jobs)
+        results = scanner.Scan(module_files)
+        scanner.SaveCache()
+    """
+
+    _CACHE_VERSION = 1
+
+    def __init__(self, toolchain: Toolchain, flags: List[str],
+                 cacheFile: Optional[Path] = None, jobs: int = 1):
+        self.toolchain = toolchain
+        self.flags = [str(f) for f in flags]
+        self.cacheFile = Path(cacheFile) if cacheFile else None
+        self.jobs = max(1, int(jobs))
+        self._cache: Dict[str, Dict] = {}
+        self._dirty = False
+        self._scanDepsPath: Optional[str] = None
+        self._nativeAvailable: Optional[bool] = None
+        self._LoadCache()
+
+    # -----------------------------------------------------------------------
+    # Cache
+    # -----------------------------------------------------------------------
+
+    def _LoadCache(self) -> None:
+        if not self.cacheFile or not self.cacheFile.exists():
+            return
+        try:
+            data = json.loads(self.cacheFile.read_text(encoding="utf-8"))
+            if data.get("version") == self._CACHE_VERSION:
+                self._cache = dict(data.get("entries", {}))
+        except (OSError, ValueError, AttributeError):
+            self._cache = {}
+
+    def SaveCache(self) -> None:
+        """Persist scan results (best effort)."""
+        if not self.cacheFile or not self._dirty:
+            return
+        try:
+            self.cacheFile.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.cacheFile.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"version": self._CACHE_VERSION, "entries": self._cache},
+                                      sort_keys=True), encoding="utf-8")
+            os.replace(tmp, self.cacheFile)
+            self._dirty = False
+        except OSError:
+            pass
+
+    def _Signature(self, sourceFile: str) -> str:
+        st = os.stat(sourceFile)
+        payload = json.dumps({
+            "source": str(Path(sourceFile).resolve()),
+            "mtime": st.st_mtime_ns,
+            "size": st.st_size,
+            "cxx": str(self.toolchain.cxxPath or ""),
+            "family": str(getattr(self.toolchain.compilerFamily, "value", "")),
+            "flags": self.flags,
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    # -----------------------------------------------------------------------
+    # Scan
+    # -----------------------------------------------------------------------
+
+    def Scan(self, sourceFiles: List[str]) -> Dict[str, ModuleScanResult]:
+        """Scan every file (cache hits first, misses in parallel)."""
+        results: Dict[str, ModuleScanResult] = {}
+        misses: List[Tuple[str, str]] = []
+        for src in sourceFiles:
+            try:
+                sig = self._Signature(src)
+            except OSError:
+                results[src] = ModuleScanResult(src)
+                continue
+            entry = self._cache.get(str(Path(src).resolve()))
+            if entry and entry.get("sig") == sig:
+                results[src] = ModuleScanResult(src, list(entry.get("provides", [])),
+                                                list(entry.get("requires", [])),
+                                                entry.get("method", "lexical"))
+            else:
+                misses.append((src, sig))
+
+        if misses:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(self.jobs, len(misses))) as executor:
+                scanned = list(executor.map(lambda item: self.ScanFile(item[0]), misses))
+            for (src, sig), res in zip(misses, scanned):
+                results[src] = res
+                self._cache[str(Path(src).resolve())] = {
+                    "sig": sig, "provides": res.provides,
+                    "requires": res.requires, "method": res.method,
+                }
+                self._dirty = True
+        return results
+
+    def ScanFile(self, sourceFile: str) -> ModuleScanResult:
+        """Scan one file with the compiler's P1689 support, else lexically."""
+        if self._nativeAvailable is not False:
+            try:
+                data = self._RunNativeScan(sourceFile)
+            except (OSError, ValueError):
+                data = None
+            if data is not None:
+                provides, requires = ParseP1689(data)
+                return ModuleScanResult(sourceFile, provides, requires, "p1689")
+            # Un échec sur le premier fichier signifie en général un outil
+            # absent ou trop ancien : inutile de réessayer pour les suivants.
+            if self._nativeAvailable is None:
+                self._nativeAvailable = False
+        provides, requires = LexicalScan(sourceFile)
+        return ModuleScanResult(sourceFile, provides, requires, "lexical")
+
+    def _FindClangScanDeps(self) -> Optional[str]:
+        if self._scanDepsPath is None:
+            cxx = Path(str(self.toolchain.cxxPath or ""))
+            suffix = ".exe" if cxx.suffix.lower() == ".exe" else ""
+            sibling = cxx.parent / f"clang-scan-deps{suffix}"
+            if cxx.parent != Path(".") and sibling.exists():
+                self._scanDepsPath = str(sibling)
+            else:
+                self._scanDepsPath = shutil.which("clang-scan-deps") or ""
+        return self._scanDepsPath or None
+
+    def _RunNativeScan(self, sourceFile: str) -> Optional[Dict]:
+        family = self.toolchain.compilerFamily
+        cxx = str(self.toolchain.cxxPath or "")
+        if not cxx:
+            return None
+
+        if family in _CLANG_FAMILIES:
+            scan_deps = self._FindClangScanDeps()
+            if not scan_deps:
+                return None
+            obj = str(Path(sourceFile).with_suffix(".o"))
+            args = [scan_deps, "-format=p1689", "--", cxx, "-std=c++20", *self.flags,
+                    "-x", "c++-module", "-c", sourceFile, "-o", obj]
+            result = Process.ExecuteCommand(args, captureOutput=True, silent=True)
+            if result.returnCode != 0:
+                return None
+            return json.loads(result.stdout)
+
+        with tempfile.TemporaryDirectory(prefix="jenga_scan_") as tmp:
+            ddi = Path(tmp) / "scan.ddi"
+            if family == CompilerFamily.GCC:
+                args = [cxx, "-std=c++20", "-fmodules-ts", *self.flags,
+                        "-E", "-x", "c++", sourceFile,
+                        "-MT", str(ddi), "-MD", "-MF", str(ddi) + ".d",
+                        "-fdeps-format=p1689r5", f"-fdeps-file={ddi}",
+                        f"-fdeps-target={Path(sourceFile).with_suffix('.o').name}",
+                        "-o", str(Path(tmp) / "scan.i")]
+            elif family == CompilerFamily.MSVC:
+                args = [cxx, "/nologo", "/std:c++20", "/TP", *self.flags,
+                        "/scanDependencies", str(ddi), sourceFile]
+            else:
+                return None
+            result = Process.ExecuteCommand(args, captureOutput=True, silent=True)
+            if result.returnCode != 0 or not ddi.exists():
+                return None
+            return json.loads(ddi.read_text(encoding="utf-8"))
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ResourceLimiter – Limitation adaptative des jobs de compilation et de link.
+
+Le nombre de jobs (_GetEffectiveJobs) n'est qu'une borne haute : avant de
+lancer un job, le limiteur vérifie
+  - la mémoire disponible (/proc/meminfo, MemAvailable),
+  - le load average (os.getloadavg),
+  - la mémoire prévue pour le job, apprise des builds précédents
+    (pic RSS mesuré via wait4 et persisté dans .jenga/peak_rss.json),
+et retient le job tant que la mémoire prévue dépasserait le budget. Les
+jobs admis dont le processus n'a pas encore atteint sa réservation (RSS via
+/proc/<pid>/statm) sont déduits de MemAvailable, qui ne les reflète pas.
+Les links disposent de leur propre limite de concurrence (plus petite).
+
+Un job est toujours admis quand aucun autre n'est en cours : le limiteur
+ralentit un build, il ne le bloque jamais.
+
+Toutes les méthodes publiques sont en PascalCase.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from ..Utils import Process
+
+# Prévisions par défaut quand un fichier n'a jamais été mesuré (KiB).
+DEFAULT_COMPILE_RSS_KB = 256 * 1024
+DEFAULT_LINK_RSS_KB = 1024 * 1024
+
+# Mémoire laissée libre pour le système et les autres processus (KiB).
+SYSTEM_RESERVE_KB = 512 * 1024
+
+
+def ReadAvailableMemoryKb() -> Optional[int]:
+    """Return MemAvailable from /proc/meminfo in KiB, or None when unknown."""
+    try:
+        with open("/proc/meminfo", "r", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def ReadProcessRssKb(pid: int) -> Optional[int]:
+    """Return the current resident set of a process in KiB, or None when unknown."""
+    try:
+        with open(f"/proc/{pid}/statm", "r", encoding="ascii") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * (os.sysconf("SC_PAGE_SIZE") // 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def ReadLoadAverage() -> Optional[float]:
+    """Return the 1-minute load average, or None when unavailable."""
+    try:
+        return os.getloadavg()[0]
+    except (AttributeError, OSError):
+        return None
+
+
+class ResourceLimiter:
+    """
+    Sémaphore adaptatif partagé par les threads de compilation d'un builder.
+    Usage :
+        limiter.Acquire("compile", objPath)
+        try: ... finally: limiter.Release("compile", objPath, peakRssKb)
+    """
+
+    _STATS_FILE = Path(".jenga") / "peak_rss.json"
+
+    def __init__(self,
+                 maxJobs: int,
+                 maxLinkJobs: int = 1,
+                 memoryBudgetKb: Optional[int] = None,
+                 maxLoad: Optional[float] = None,
+                 statsRoot: Optional[Path] = None,
+                 pollInterval: float = 0.25):
+        self.maxJobs = max(1, int(maxJobs))
+        self.maxLinkJobs = max(1, min(int(maxLinkJobs), self.maxJobs))
+        self.memoryBudgetKb = memoryBudgetKb
+        self.maxLoad = maxLoad
+        self.pollInterval = pollInterval
+        self._statsPath = (Path(statsRoot) / self._STATS_FILE) if statsRoot else None
+
+        self._cond = threading.Condition()
+        self._running: Dict[str, int] = {"compile": 0, "link": 0}
+        self._reservedKb = 0
+        self._jobs: Dict[int, int] = {}     # thread du job -> KiB réservés
+        self._peaks: Dict[str, int] = {}
+        self._dirty = False
+        self._LoadStats()
+
+    # -----------------------------------------------------------------------
+    # Prévision mémoire
+    # -----------------------------------------------------------------------
+
+    def PredictKb(self, kind: str, key: str) -> int:
+        """Predicted peak RSS for a job: last measurement, else a per-kind default."""
+        known = self._peaks.get(key)
+        if known:
+            return known
+        return DEFAULT_LINK_RSS_KB if kind == "link" else DEFAULT_COMPILE_RSS_KB
+
+    def _CanStart(self, kind: str, predictedKb: int) -> bool:
+        total_running = self._running["compile"] + self._running["link"]
+        if total_running == 0:
+            return True
+        if total_running >= self.maxJobs:
+            return False
+        if kind == "link" and self._running["link"] >= self.maxLinkJobs:
+            return False
+
+        if self.memoryBudgetKb is not None and self._reservedKb + predictedKb > self.memoryBudgetKb:
+            return False
+        available = ReadAvailableMemoryKb()
+        if available is not None and predictedKb > available - SYSTEM_RESERVE_KB - self._PendingKb():
+            return False
+
+        if self.maxLoad is not None:
+            load = ReadLoadAverage()
+            if load is not None and load >= self.maxLoad:
+                return False
+        return True
+
+    def _PendingKb(self) -> int:
+        """
+        Part des réservations que MemAvailable ne reflète pas encore : pour
+        chaque job en cours, réservé moins RSS actuel de son processus (tout
+        le réservé si le processus n'est pas lancé). Un job déjà à son pic
+        n'est ainsi pas compté deux fois.
+        """
+        pending = 0
+        for thread_id, reserved in self._jobs.items():
+            pid = Process.TrackedPid(thread_id)
+            rss = ReadProcessRssKb(pid) if pid is not None else None
+            pending += max(0, reserved - (rss or 0))
+        return pending
+
+    # -----------------------------------------------------------------------
+    # Acquisition / libération
+    # -----------------------------------------------------------------------
+
+    def Acquire(self, kind: str, key: str) -> int:
+        """
+        Block until a job of the given kind may start; return the reserved
+        KiB. The job runs on the calling thread, which also calls Release().
+        """
+        predicted = self.PredictKb(kind, key)
+        with self._cond:
+            # wait() avec timeout : la mémoire libre et la charge évoluent
+            # aussi sans Release() (autres processus de la machine).
+            while not self._CanStart(kind, predicted):
+                self._cond.wait(self.pollInterval)
+            self._running[kind] += 1
+            self._reservedKb += predicted
+            self._jobs[threading.get_ident()] = predicted
+        return predicted
+
+    def Release(self, kind: str, key: str, reservedKb: int, peakRssKb: int = 0) -> None:
+        """Free a slot and remember the measured peak RSS for the next build."""
+        with self._cond:
+            self._running[kind] = max(0, self._running[kind] - 1)
+            self._reservedKb = max(0, self._reservedKb - reservedKb)
+            self._jobs.pop(threading.get_ident(), None)
+            if peakRssKb > 0 and self._peaks.get(key) != peakRssKb:
+                self._peaks[key] = int(peakRssKb)
+                self._dirty = True
+            self._cond.notify_all()
+
+    # -----------------------------------------------------------------------
+    # Persistance des mesures
+    # -----------------------------------------------------------------------
+
+    def _LoadStats(self) -> None:
+        if not self._statsPath or not self._statsPath.exists():
+            return
+        try:
+            data = json.loads(self._statsPath.read_text(encoding="utf-8"))
+            self._peaks = {str(k): int(v) for k, v in data.get("peaks", {}).items()}
+        except (OSError, ValueError, AttributeError):
+            self._peaks = {}
+
+    def SaveStats(self) -> None:
+        """Persist learned peaks (best effort)."""
+        if not self._statsPath or not self._dirty:
+            return
+        try:
+            self._statsPath.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._statsPath.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"version": 1, "peaks": self._peaks}, sort_keys=True),
+                           encoding="utf-8")
+            os.replace(tmp, self._statsPath)
+            self._dirty = False
+        except OSError:
+            pass
@@ -9,13 +9,20 @@ Contient :
   - Dépendances découvertes (par projet)
   - Fichiers objets produits
 
-Peut être sérialisé/désérialisé pour reprise de build.
+Peut être sérialisé/désérialisé pour reprise de build :
+  - state.db (ou tout autre suffixe) : base SQLite compacte (StateStore),
+    mise à jour incrémentale par Flush() et lue paresseusement par projet ;
+  - *.json : ancien format JSON complet (compatibilité, export).
+Les méthodes sont protégées par un verrou : des projets compilés en
+parallèle peuvent mettre à jour le même état.
 Toutes les méthodes publiques sont en PascalCase.
 """
 
+import os
+import threading
 import time
-from typing import Dict, Set, List, Optional, Any
-from dataclasses import dataclass, field, asdict
+from typing import Dict, Set, List, Optional, Any, Tuple
+from dataclasses import dataclass, field
 from pathlib import Path
 import json
 
@@ -25,10 +32,15 @@ from Jenga.Core import Api
 
 @dataclass
 class FileState:
-    """État d'un fichier source : hash et timestamp."""
+    """
+    État d'un fichier source : hash et timestamp. stat : signature
+    (mtime_ns, size, inode, ctime_ns) relevée avec le hash ; tant qu'elle
+    est identique, Incremental réutilise le hash sans relire le fichier.
+    """
     hash: str
     mtime: float
     checked: float = field(default_factory=time.time)
+    stat: Optional[Tuple[int, int, int, int]] = None
 
 
 class BuildState:
@@ -58,12 +70,25 @@ class BuildState:
 
         # Flags de configuration (pour savoir si le projet doit être recompilé)
         self._configHash: Optional[str] = None
+        self._projectFlagsHash: Dict[str, str] = {}
 
         # NEW: Track compiled projects per (project, platform, arch) context
         # Format: "ProjectName:platform:arch" → prevents ABI conflicts in multi-ABI builds
         self._compiledProjectsPerContext: Set[str] = set()
         self._failedProjectsPerContext: Set[str] = set()
 
+        # Persistance incrémentale (Attach / Load d'une base StateStore)
+        self._lock = threading.RLock()
+        self._store = None
+        self._loadedProjects: Set[str] = set()   # deps/sorties déjà lues depuis le store
+        self._storeMisses: Set[str] = set()      # fichiers absents du store (évite de requêter à nouveau)
+        self._outputsCleared = False             # Reset() : sorties du store ignorées et effacées
+        self._dirtyFiles: Set[str] = set()
+        self._dirtyDeps: Set[str] = set()
+        self._dirtyOutputs: Set[str] = set()
+        self._dirtyProjects = False
+        self._dirtyFlags: Set[str] = set()
+
     # -----------------------------------------------------------------------
     # Gestion des projets
     # -----------------------------------------------------------------------
@@ -91,17 +116,19 @@ class BuildState:
         """Marque un projet comme compilé (ou échoué) pour un contexte donné."""
         key = self._GetProjectKey(projectName, platform, targetArch)
 
-        if success:
-            # Legacy (for backward compat - some code may still check compiledProjects)
-            self.compiledProjects.add(projectName)
-            self.failedProjects.discard(projectName)
+        with self._lock:
+            if success:
+                # Legacy (for backward compat - some code may still check compiledProjects)
+                self.compiledProjects.add(projectName)
+                self.failedProjects.discard(projectName)
 
-            # NEW: Context-aware tracking
-            self._compiledProjectsPerContext.add(key)
-            self._failedProjectsPerContext.discard(key)
-        else:
-            self.failedProjects.add(projectName)
-            self._failedProjectsPerContext.add(key)
+                # NEW: Context-aware tracking
+                self._compiledProjectsPerContext.add(key)
+                self._failedProjectsPerContext.discard(key)
+            else:
+                self.failedProjects.add(projectName)
+                self._failedProjectsPerContext.add(key)
+            self._dirtyProjects = True
 
     def IsProjectCompiled(self, projectName: str, platform: Optional[str] = None, targetArch: Optional[str] = None) -> bool:
         """Vérifie si un projet a été compilé pour un contexte donné."""
@@ -115,6 +142,23 @@ class BuildState:
         # No context specified → check both (for backward compatibility)
         return key in self._compiledProjectsPerContext or projectName in self.compiledProjects
 
+    def RemoveProjectFromCompiled(self, projectName: str) -> None:
+        """Oublie qu'un projet a été compilé (tous contextes), ex. après nettoyage."""
+        with self._lock:
+            self.compiledProjects.discard(projectName)
+            prefix = projectName + ":"
+            self._compiledProjectsPerContext = {
+                k for k in self._compiledProjectsPerContext if k != projectName and not k.startswith(prefix)}
+            self._dirtyProjects = True
+
+    def SetProjectFlagsHash(self, projectName: str, flagsHash: str) -> None:
+        with self._lock:
+            self._projectFlagsHash[projectName] = flagsHash
+            self._dirtyFlags.add(projectName)
+
+    def GetProjectFlagsHash(self, projectName: str) -> Optional[str]:
+        return self._projectFlagsHash.get(projectName)
+
     def HasProjectFailed(self, projectName: str, platform: Optional[str] = None, targetArch: Optional[str] = None) -> bool:
         """Vérifie si un projet a échoué pour un contexte donné."""
         key = self._GetProjectKey(projectName, platform, targetArch)
@@ -124,10 +168,17 @@ class BuildState:
 
     def Reset(self) -> None:
         """Réinitialise l'état pour un nouveau build."""
-        self.compiledProjects.clear()
-        self.failedProjects.clear()
-        self.startTime = time.time()
-        self.endTime = None
+        with self._lock:
+            self.compiledProjects.clear()
+            self.failedProjects.clear()
+            self._compiledProjectsPerContext.clear()
+            self._failedProjectsPerContext.clear()
+            self._projectOutputs.clear()
+            self._dirtyOutputs.clear()
+            self._outputsCleared = True
+            self._dirtyProjects = True
+            self.startTime = time.time()
+            self.endTime = None
 
     def Finish(self) -> None:
         self.endTime = time.time()
@@ -142,27 +193,41 @@ class BuildState:
     # Gestion des fichiers et hash
     # -----------------------------------------------------------------------
 
-    def UpdateFileState(self, filepath: str, filehash: str, mtime: float) -> None:
+    def UpdateFileState(self, filepath: str, filehash: str, mtime: float,
+                        stat: Optional[Tuple[int, int, int, int]] = None) -> None:
         """Met à jour l'état d'un fichier."""
-        self._fileStates[filepath] = FileState(hash=filehash, mtime=mtime)
+        with self._lock:
+            self._fileStates[filepath] = FileState(hash=filehash, mtime=mtime, stat=stat)
+            self._dirtyFiles.add(filepath)
 
     def GetFileState(self, filepath: str) -> Optional[FileState]:
-        return self._fileStates.get(filepath)
+        with self._lock:
+            state = self._fileStates.get(filepath)
+            if state is None and self._store is not None and filepath not in self._dirtyFiles \
+                    and filepath not in self._storeMisses:
+                row = self._store.LoadFileState(filepath)
+                if row is None:
+                    self._storeMisses.add(filepath)
+                else:
+                    state = self._fileStates[filepath] = FileState(hash=row[0], mtime=row[1], stat=row[2])
+            return state
 
     def GetFileHash(self, filepath: str) -> Optional[str]:
-        state = self._fileStates.get(filepath)
+        state = self.GetFileState(filepath)
         return state.hash if state else None
 
     def HasFileChanged(self, filepath: str, currentHash: str, currentMtime: float) -> bool:
         """Compare avec l'état enregistré."""
-        state = self._fileStates.get(filepath)
+        state = self.GetFileState(filepath)
         if state is None:
             return True  # jamais vu
         return state.hash != currentHash or state.mtime != currentMtime
 
     def RemoveFileState(self, filepath: str) -> None:
         """Supprime l'état d'un fichier (s'il a été effacé)."""
-        self._fileStates.pop(filepath, None)
+        with self._lock:
+            self._fileStates.pop(filepath, None)
+            self._dirtyFiles.add(filepath)
 
     # -----------------------------------------------------------------------
     # Gestion des dépendances
@@ -170,30 +235,53 @@ class BuildState:
 
     def SetProjectDependencies(self, projectName: str, dependencies: Set[str]) -> None:
         """Enregistre l'ensemble des fichiers (headers) dont dépend un projet."""
-        self._projectDeps[projectName] = set(dependencies)
+        with self._lock:
+            self._LoadProject(projectName)
+            self._projectDeps[projectName] = set(dependencies)
+            self._dirtyDeps.add(projectName)
 
     def GetProjectDependencies(self, projectName: str) -> Set[str]:
-        return self._projectDeps.get(projectName, set())
+        with self._lock:
+            self._LoadProject(projectName)
+            return self._projectDeps.get(projectName, set())
+
+    def AddProjectDependencies(self, projectName: str, sourceFile: str, dependencies: Set[str]) -> None:
+        """Ajoute les dépendances découvertes pour un source (fichier .d)."""
+        with self._lock:
+            self._LoadProject(projectName)
+            self._projectDeps.setdefault(projectName, set()).update(dependencies)
+            self._dirtyDeps.add(projectName)
 
     def AddProjectDependency(self, projectName: str, dependency: str) -> None:
-        if projectName not in self._projectDeps:
-            self._projectDeps[projectName] = set()
-        self._projectDeps[projectName].add(dependency)
+        with self._lock:
+            self._LoadProject(projectName)
+            if projectName not in self._projectDeps:
+                self._projectDeps[projectName] = set()
+            self._projectDeps[projectName].add(dependency)
+            self._dirtyDeps.add(projectName)
 
     # -----------------------------------------------------------------------
     # Gestion des sorties
     # -----------------------------------------------------------------------
 
     def AddProjectOutput(self, projectName: str, outputFile: str) -> None:
-        if projectName not in self._projectOutputs:
-            self._projectOutputs[projectName] = []
-        self._projectOutputs[projectName].append(outputFile)
+        with self._lock:
+            self._LoadProject(projectName)
+            if projectName not in self._projectOutputs:
+                self._projectOutputs[projectName] = []
+            self._projectOutputs[projectName].append(outputFile)
+            self._dirtyOutputs.add(projectName)
 
     def GetProjectOutputs(self, projectName: str) -> List[str]:
-        return self._projectOutputs.get(projectName, [])
+        with self._lock:
+            self._LoadProject(projectName)
+            return self._projectOutputs.get(projectName, [])
 
     def ClearProjectOutputs(self, projectName: str) -> None:
-        self._projectOutputs.pop(projectName, None)
+        with self._lock:
+            self._LoadProject(projectName)
+            self._projectOutputs.pop(projectName, None)
+            self._dirtyOutputs.add(projectName)
 
     # -----------------------------------------------------------------------
     # Sérialisation / désérialisation
@@ -201,27 +289,66 @@ class BuildState:
 
     def ToDict(self) -> Dict[str, Any]:
         """Convertit l'état en dictionnaire sérialisable JSON."""
-        return {
-            'workspaceName': self.workspaceName,
-            'compiledProjects': list(self.compiledProjects),
-            'failedProjects': list(self.failedProjects),
-            'startTime': self.startTime,
-            'endTime': self.endTime,
-            'fileStates': {k: asdict(v) for k, v in self._fileStates.items()},
-            'projectDeps': {k: list(v) for k, v in self._projectDeps.items()},
-            'projectOutputs': self._projectOutputs,
-        }
+        with self._lock:
+            self._LoadAll()
+            return {
+                'workspaceName': self.workspaceName,
+                'compiledProjects': list(self.compiledProjects),
+                'failedProjects': list(self.failedProjects),
+                'startTime': self.startTime,
+                'endTime': self.endTime,
+                'fileStates': {k: {'hash': v.hash, 'mtime': v.mtime, 'stat': v.stat}
+                               for k, v in self._fileStates.items()},
+                'projectDeps': {k: list(v) for k, v in self._projectDeps.items()},
+                'projectOutputs': self._projectOutputs,
+                'projectFlagsHash': self._projectFlagsHash,
+            }
 
     def Save(self, path: Path) -> None:
-        """Sauvegarde l'état dans un fichier JSON."""
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(self.ToDict(), f, indent=2)
+        """
+        Sauvegarde l'état. *.json : fichier JSON complet (compact) ; autre
+        suffixe : base StateStore, où seules les modifications depuis la
+        dernière sauvegarde sont écrites.
+        """
+        path = Path(path)
+        if path.suffix.lower() == ".json":
+            tmp = path.with_name(path.name + ".tmp")
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(self.ToDict(), f, separators=(',', ':'))
+            os.replace(tmp, path)
+            return
+        self.Attach(path)
+        self.Flush()
 
     @classmethod
     def Load(cls, path: Path, workspace: Any) -> Optional['BuildState']:
-        """Charge un état depuis un fichier JSON."""
+        """
+        Charge un état (JSON ou StateStore selon le suffixe). Depuis une base,
+        seuls les ensembles de projets sont lus ; fichiers, dépendances et
+        sorties le sont à la demande, projet par projet.
+        """
+        path = Path(path)
         if not path.exists():
             return None
+        if path.suffix.lower() != ".json":
+            from .StateStore import BuildStateStore, PROJECT_SETS
+            import sqlite3
+            try:
+                store = BuildStateStore(path)
+                meta = store.LoadMeta()
+                sets = store.LoadProjectSets()
+            except sqlite3.Error as e:
+                print(f"Failed to load build state: {e}")
+                return None
+            state = cls(workspace, meta.get('platform', ''), meta.get('targetArch', ''))
+            state.workspaceName = meta.get('workspaceName', 'unknown')
+            state.startTime = float(meta.get('startTime') or time.time())
+            state.endTime = float(meta['endTime']) if meta.get('endTime') else None
+            for kind, attr in PROJECT_SETS.items():
+                setattr(state, attr, sets.get(kind, set()))
+            state._projectFlagsHash = {k[len('flags:'):]: v for k, v in meta.items() if k.startswith('flags:')}
+            state._store = store
+            return state
         try:
             with open(path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
@@ -234,14 +361,113 @@ class BuildState:
 
             # Reconstruire les FileState
             for fp, fs in data.get('fileStates', {}).items():
-                state._fileStates[fp] = FileState(**fs)
+                fs = FileState(**fs)
+                fs.stat = tuple(fs.stat) if fs.stat else None
+                state._fileStates[fp] = fs
 
             # Dépendances
             for proj, deps in data.get('projectDeps', {}).items():
                 state._projectDeps[proj] = set(deps)
 
             state._projectOutputs = data.get('projectOutputs', {})
+            state._projectFlagsHash = data.get('projectFlagsHash', {})
             return state
         except Exception as e:
             print(f"Failed to load build state: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    # -----------------------------------------------------------------------
+    # Persistance incrémentale (StateStore)
+    # -----------------------------------------------------------------------
+
+    def Attach(self, path: Path) -> None:
+        """
+        Associe l'état à la base path : tout ce qui est en mémoire y sera écrit
+        au prochain Flush() ; le reste de la base est lu à la demande.
+        """
+        from .StateStore import BuildStateStore
+        path = Path(path)
+        with self._lock:
+            if self._store is not None and self._store.path.resolve() == path.resolve():
+                return
+            self._LoadAll()
+            if self._store is not None:
+                self._store.Close()
+            self._store = BuildStateStore(path)
+            self._loadedProjects = set(self._projectDeps) | set(self._projectOutputs)
+            self._storeMisses.clear()
+            self._dirtyFiles = set(self._fileStates)
+            self._dirtyDeps = set(self._projectDeps)
+            self._dirtyOutputs = set(self._projectOutputs)
+            self._outputsCleared = False
+            self._dirtyProjects = True
+            self._dirtyFlags = set(self._projectFlagsHash)
+
+    def Flush(self) -> None:
+        """Écrit dans la base les modifications faites depuis le dernier Flush()."""
+        from .StateStore import PROJECT_SETS
+        with self._lock:
+            if self._store is None:
+                return
+            files = {}
+            for fp in self._dirtyFiles:
+                st = self._fileStates.get(fp)
+                files[fp] = (st.hash, st.mtime, st.stat) if st is not None else None
+            meta = {
+                'workspaceName': self.workspaceName,
+                'platform': self.platform or '',
+                'targetArch': self.targetArch or '',
+                'startTime': repr(self.startTime),
+                'endTime': repr(self.endTime) if self.endTime else '',
+            }
+            meta.update({f'flags:{p}': self._projectFlagsHash[p] for p in self._dirtyFlags})
+            self._store.Write(
+                meta=meta,
+                files=files,
+                deps={p: self._projectDeps.get(p) for p in self._dirtyDeps},
+                outputs={p: self._projectOutputs.get(p) for p in self._dirtyOutputs},
+                projectSets={kind: getattr(self, attr) for kind, attr in PROJECT_SETS.items()}
+                if self._dirtyProjects else None,
+                clearOutputs=self._outputsCleared,
+            )
+            self._dirtyFiles.clear()
+            self._dirtyDeps.clear()
+            self._dirtyOutputs.clear()
+            self._dirtyProjects = False
+            self._dirtyFlags.clear()
+            self._outputsCleared = False
+
+    def Close(self) -> None:
+        """Flush() puis ferme la base associée."""
+        with self._lock:
+            if self._store is not None:
+                self.Flush()
+                self._store.Close()
+                self._store = None
+
+    def _LoadProject(self, projectName: str) -> None:
+        """Lit (une fois) dépendances, sorties et état des fichiers d'un projet."""
+        if self._store is None or projectName in self._loadedProjects:
+            return
+        self._loadedProjects.add(projectName)
+        if projectName not in self._projectDeps:
+            deps = self._store.LoadProjectDependencies(projectName)
+            if deps is not None:
+                self._projectDeps[projectName] = deps
+        if not self._outputsCleared and projectName not in self._projectOutputs:
+            outputs = self._store.LoadProjectOutputs(projectName)
+            if outputs is not None:
+                self._projectOutputs[projectName] = outputs
+        for fp, (filehash, mtime, stat) in self._store.LoadFileStates(projectName).items():
+            if fp not in self._fileStates and fp not in self._dirtyFiles:
+                self._fileStates[fp] = FileState(hash=filehash, mtime=mtime, stat=stat)
+
+    def _LoadAll(self) -> None:
+        """Lit tout le contenu du store (export JSON, changement de base)."""
+        if self._store is None:
+            return
+        for project in self._store.ListProjects():
+            self._LoadProject(project)
+        for fp, (filehash, mtime, stat) in self._store.LoadFileStates().items():
+            if fp not in self._fileStates and fp not in self._dirtyFiles:
+                self._fileStates[fp] = FileState(hash=filehash, mtime=mtime, stat=stat)
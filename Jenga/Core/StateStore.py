@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+StateStore – Persistance compacte de BuildState (SQLite).
+
+Le format JSON (indent=2, un dict FileState par fichier, listes de
+dépendances répétant les chemins complets) devient vite énorme et doit être
+entièrement relu au démarrage et réécrit à la fin. Ici :
+  - chaque chemin est interné une seule fois (répertoire dans dirs, nom
+    dans paths) ; fichiers, dépendances et sorties ne stockent que son
+    identifiant entier ;
+  - les hash hexadécimaux sont stockés en BLOB (moitié de la taille) ;
+  - le timestamp 'checked' n'est pas persisté (propre à l'exécution) ;
+    la signature stat (mtime_ns, taille, inode, ctime_ns) l'est, pour que
+    Incremental ne rehash que les fichiers dont elle a changé ;
+  - les écritures sont incrémentales : BuildState.Flush() n'envoie que ce
+    qui a changé, dans une seule transaction ;
+  - la lecture est paresseuse : dépendances, sorties et état des fichiers
+    d'un projet ne sont lus qu'au premier accès à ce projet ;
+  - WAL + busy timeout : plusieurs builds (threads ou processus) peuvent
+    lire et écrire le même fichier sans le corrompre.
+
+Toutes les méthodes publiques sont en PascalCase.
+"""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ..Utils import FileSystem
+
+_STORE_VERSION = "2"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS dirs (id INTEGER PRIMARY KEY, path TEXT NOT NULL UNIQUE);
+CREATE TABLE IF NOT EXISTS paths (id INTEGER PRIMARY KEY, dirId INTEGER NOT NULL, name TEXT NOT NULL,
+                                  UNIQUE (dirId, name));
+CREATE TABLE IF NOT EXISTS files (pathId INTEGER PRIMARY KEY, hash BLOB NOT NULL, mtime REAL NOT NULL,
+                                  mtimeNs INTEGER, size INTEGER, inode INTEGER, ctimeNs INTEGER);
+CREATE TABLE IF NOT EXISTS deps (project TEXT NOT NULL, pathId INTEGER NOT NULL,
+                                 PRIMARY KEY (project, pathId)) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS outputs (project TEXT NOT NULL, seq INTEGER NOT NULL, pathId INTEGER NOT NULL,
+                                    PRIMARY KEY (project, seq)) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS projects (kind TEXT NOT NULL, key TEXT NOT NULL,
+                                     PRIMARY KEY (kind, key)) WITHOUT ROWID;
+"""
+
+# Chemin complet d'une ligne de paths (alias p) : répertoire interné + nom
+_PATH = "r.path || p.name"
+_JOIN_PATH = "JOIN paths p ON p.id = {0}.pathId JOIN dirs r ON r.id = p.dirId"
+_FILE_COLUMNS = "f.hash, f.mtime, f.mtimeNs, f.size, f.inode, f.ctimeNs"
+
+# (hash, mtime, stat) d'un fichier ; stat = (mtime_ns, size, inode, ctime_ns) ou None
+FileRow = Tuple[str, float, Optional[Tuple[int, int, int, int]]]
+
+# Ensembles de projets persistés (kind -> attribut de BuildState)
+PROJECT_SETS = {
+    "compiled": "compiledProjects",
+    "failed": "failedProjects",
+    "compiledCtx": "_compiledProjectsPerContext",
+    "failedCtx": "_failedProjectsPerContext",
+}
+
+
+class BuildStateStore:
+    """
+    Usage :
+        store = BuildStateStore(workspace_dir / ".jenga" / "state.db")
+        deps = store.LoadProjectDependencies("App")
+        store.Write(files={"a.cpp": ("ab12...", 1712.0, None)}, deps={"App": {"a.h"}})
+        store.Close()
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        FileSystem.MakeDirectory(self.path.parent)
+        self._lock = threading.RLock()
+        self._dirIds: Dict[str, int] = {}
+        self._pathIds: Dict[str, int] = {}
+        self._conn = sqlite3.connect(str(self.path), timeout=30.0, isolation_level=None,
+                                     check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._lock:
+            self._conn.executescript(_SCHEMA)
+            if self._GetMeta("version") not in (None, _STORE_VERSION):
+                # Format incompatible : on repart d'un état vide
+                for table in ("dirs", "paths", "files", "deps", "outputs", "projects", "meta"):
+                    self._conn.execute(f"DROP TABLE {table}")
+                self._conn.executescript(_SCHEMA)
+            self._conn.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (_STORE_VERSION,))
+
+    # -----------------------------------------------------------------------
+    # Encodage
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def EncodeHash(value: str):
+        """Hash hexadécimal minuscule -> bytes (moitié de la taille) ; autre valeur inchangée."""
+        try:
+            raw = bytes.fromhex(value)
+        except (TypeError, ValueError):
+            return value
+        return raw if raw and raw.hex() == value else value
+
+    @staticmethod
+    def DecodeHash(value) -> str:
+        return value.hex() if isinstance(value, bytes) else str(value)
+
+    @staticmethod
+    def SplitPath(path: str) -> Tuple[str, str]:
+        """(répertoire avec séparateur final, nom) : répertoire + nom == path."""
+        i = max(path.rfind("/"), path.rfind("\\")) + 1
+        return path[:i], path[i:]
+
+    def _InternPaths(self, paths: Iterable[str]) -> None:
+        """
+        Identifiants des chemins (à appeler dans une transaction d'écriture) :
+        les noms déjà connus d'un répertoire sont lus en une requête, les
+        nouveaux insérés en un executemany avec des id consécutifs.
+        """
+        byDir: Dict[str, List[str]] = {}
+        for path in set(paths):
+            if path not in self._pathIds:
+                directory, name = BuildStateStore.SplitPath(path)
+                byDir.setdefault(directory, []).append(name)
+        if not byDir:
+            return
+        conn = self._conn
+        rows = []
+        nextId = conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM paths").fetchone()[0]
+        for directory, names in byDir.items():
+            dirId = self._dirIds.get(directory)
+            if dirId is None:
+                conn.execute("INSERT OR IGNORE INTO dirs (path) VALUES (?)", (directory,))
+                dirId = conn.execute("SELECT id FROM dirs WHERE path = ?", (directory,)).fetchone()[0]
+                self._dirIds[directory] = dirId
+            known = dict(conn.execute("SELECT name, id FROM paths WHERE dirId = ?", (dirId,)))
+            for name, pid in known.items():
+                self._pathIds[directory + name] = pid
+            for name in names:
+                if name not in known:
+                    rows.append((nextId, dirId, name))
+                    self._pathIds[directory + name] = nextId
+                    nextId += 1
+        conn.executemany("INSERT INTO paths VALUES (?, ?, ?)", rows)
+
+    def _GetMeta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    # -----------------------------------------------------------------------
+    # Lecture
+    # -----------------------------------------------------------------------
+
+    def LoadMeta(self) -> Dict[str, str]:
+        with self._lock:
+            return dict(self._conn.execute("SELECT key, value FROM meta"))
+
+    def LoadProjectSets(self) -> Dict[str, Set[str]]:
+        """kind -> ensemble de projets (petit : lu en entier à l'ouverture)."""
+        sets: Dict[str, Set[str]] = {kind: set() for kind in PROJECT_SETS}
+        with self._lock:
+            for kind, key in self._conn.execute("SELECT kind, key FROM projects"):
+                sets.setdefault(kind, set()).add(key)
+        return sets
+
+    @staticmethod
+    def _FileRow(row) -> FileRow:
+        stat = tuple(row[2:6]) if row[2] is not None else None
+        return BuildStateStore.DecodeHash(row[0]), row[1], stat
+
+    def LoadFileState(self, path: str) -> Optional[FileRow]:
+        """(hash, mtime, stat) ; stat = (mtime_ns, size, inode, ctime_ns) ou None."""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_FILE_COLUMNS} FROM files f {_JOIN_PATH.format('f')} WHERE r.path = ? AND p.name = ?",
+                BuildStateStore.SplitPath(path)).fetchone()
+        return BuildStateStore._FileRow(row) if row else None
+
+    def LoadFileStates(self, project: Optional[str] = None) -> Dict[str, FileRow]:
+        """État des fichiers ; limité aux dépendances de project si donné."""
+        query = f"SELECT {_PATH}, {_FILE_COLUMNS} FROM files f {_JOIN_PATH.format('f')}"
+        args: Tuple = ()
+        if project is not None:
+            query += " JOIN deps d ON d.pathId = f.pathId WHERE d.project = ?"
+            args = (project,)
+        with self._lock:
+            rows = self._conn.execute(query, args).fetchall()
+        return {row[0]: BuildStateStore._FileRow(row[1:]) for row in rows}
+
+    def LoadProjectDependencies(self, project: str) -> Optional[Set[str]]:
+        """None si le projet n'a aucune dépendance enregistrée."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_PATH} FROM deps d {_JOIN_PATH.format('d')} WHERE d.project = ?",
+                (project,)).fetchall()
+        return {row[0] for row in rows} if rows else None
+
+    def LoadProjectOutputs(self, project: str) -> Optional[List[str]]:
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_PATH} FROM outputs o {_JOIN_PATH.format('o')} WHERE o.project = ? ORDER BY o.seq", (project,)).fetchall()
+        return [row[0] for row in rows] if rows else None
+
+    def ListProjects(self) -> Set[str]:
+        """Projets ayant des dépendances ou des sorties enregistrées."""
+        with self._lock:
+            rows = self._conn.execute("SELECT project FROM deps UNION SELECT project FROM outputs").fetchall()
+        return {row[0] for row in rows}
+
+    # -----------------------------------------------------------------------
+    # Écriture
+    # -----------------------------------------------------------------------
+
+    def Write(self, meta: Optional[Dict[str, str]] = None,
+              files: Optional[Dict[str, Optional[FileRow]]] = None,
+              deps: Optional[Dict[str, Optional[Iterable[str]]]] = None,
+              outputs: Optional[Dict[str, Optional[List[str]]]] = None,
+              projectSets: Optional[Dict[str, Iterable[str]]] = None,
+              clearOutputs: bool = False) -> None:
+        """
+        Applique un lot de modifications dans une seule transaction.
+        Une valeur None (fichier, dépendances, sorties) supprime l'entrée ;
+        projectSets remplace entièrement les ensembles donnés ; clearOutputs
+        efface toutes les sorties avant d'écrire celles de outputs.
+        """
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._InternPaths(list(files or ()) +
+                                  [p for group in (deps, outputs) for paths in (group or {}).values()
+                                   for p in (paths or ())])
+                for key, value in (meta or {}).items():
+                    conn.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, value))
+                files = files or {}
+                conn.executemany("DELETE FROM files WHERE pathId = ?",
+                                 [(self._pathIds[p],) for p, st in files.items() if st is None])
+                conn.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?)",
+                                 [(self._pathIds[p], BuildStateStore.EncodeHash(st[0]), st[1])
+                                  + tuple(st[2] or (None,) * 4)
+                                  for p, st in files.items() if st is not None])
+                for project, paths in (deps or {}).items():
+                    conn.execute("DELETE FROM deps WHERE project = ?", (project,))
+                    if paths:
+                        conn.executemany("INSERT OR IGNORE INTO deps VALUES (?, ?)",
+                                         [(project, self._pathIds[p]) for p in paths])
+                if clearOutputs:
+                    conn.execute("DELETE FROM outputs")
+                for project, paths in (outputs or {}).items():
+                    conn.execute("DELETE FROM outputs WHERE project = ?", (project,))
+                    if paths:
+                        conn.executemany("INSERT INTO outputs VALUES (?, ?, ?)",
+                                         [(project, i, self._pathIds[p]) for i, p in enumerate(paths)])
+                for kind, keys in (projectSets or {}).items():
+                    conn.execute("DELETE FROM projects WHERE kind = ?", (kind,))
+                    conn.executemany("INSERT INTO projects VALUES (?, ?)", [(kind, k) for k in keys])
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                # Les identifiants internés dans la transaction annulée sont invalides
+                self._dirIds.clear()
+                self._pathIds.clear()
+                raise
+
+    def Close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+TestCache – Résultats de tests mis en cache (comme les « cached test results » de Bazel).
+
+L'empreinte d'une suite de tests couvre tout ce qui peut changer son
+résultat sans passer par le build :
+  - l'exécutable de test,
+  - les bibliothèques dynamiques copiées à côté (CopyRuntimeDependencies),
+  - les fichiers de données déclarés par dependfiles(),
+  - les testoptions() et le contexte (config, plateforme).
+Seules les exécutions réussies sont enregistrées : une suite dont
+l'empreinte est inchangée depuis son dernier succès n'est pas relancée.
+
+Le cache vit dans <workspace>/.jenga/test_cache.json. Les hash de contenu
+sont mémorisés par (taille, mtime) pour ne pas relire les binaires
+inchangés à chaque 'jenga test'.
+
+Toutes les méthodes publiques sont en PascalCase.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..Utils import FileSystem
+
+_CACHE_VERSION = 1
+
+
+class TestResultCache:
+    """
+    Usage :
+        cache = TestResultCache(workspaceRoot)
+        fp = cache.Fingerprint([exe, *libs, *data], options, context)
+        entry = cache.Lookup(key, fp)      # None => exécuter
+        ...
+        cache.Record(key, fp, duration)    # après un succès
+        cache.Save()
+    """
+
+    def __init__(self, workspaceRoot: Path):
+        self.path = Path(workspaceRoot) / ".jenga" / "test_cache.json"
+        self._lock = threading.Lock()
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._hashes: Dict[str, List[Any]] = {}
+        self._dirty = False
+        self._Load()
+
+    def _Load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION:
+            return
+        self._results = dict(data.get("results", {}))
+        self._hashes = dict(data.get("hashes", {}))
+
+    def Save(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {"version": _CACHE_VERSION, "results": self._results, "hashes": self._hashes}
+            self._dirty = False
+        FileSystem.MakeDirectory(self.path.parent)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, indent=1, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    # -----------------------------------------------------------------------
+    # Empreintes
+    # -----------------------------------------------------------------------
+
+    def FileHash(self, path: Path) -> str:
+        """Content hash of a file, reused while its size and mtime are unchanged."""
+        key = str(Path(path).resolve())
+        try:
+            st = os.stat(key)
+        except OSError:
+            return "missing"
+        stamp = [st.st_size, st.st_mtime_ns]
+        with self._lock:
+            cached = self._hashes.get(key)
+            if cached and cached[:2] == stamp:
+                return cached[2]
+        digest = FileSystem.ComputeFileHash(key, "sha256")
+        with self._lock:
+            self._hashes[key] = stamp + [digest]
+            self._dirty = True
+        return digest
+
+    def Fingerprint(self, files: Iterable[Path], options: Iterable[str], context: Iterable[str]) -> str:
+        """Fingerprint of the inputs of one test executable (file order does not matter)."""
+        h = hashlib.sha256()
+        for part in context:
+            h.update(f"ctx:{part}\n".encode("utf-8"))
+        for opt in options:
+            h.update(f"opt:{opt}\n".encode("utf-8"))
+        for path in sorted({str(Path(f).resolve()) for f in files}):
+            h.update(f"file:{path}:{self.FileHash(Path(path))}\n".encode("utf-8"))
+        return h.hexdigest()
+
+    # -----------------------------------------------------------------------
+    # Résultats
+    # -----------------------------------------------------------------------
+
+    def Lookup(self, key: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """Last passing result for key if it was recorded with this fingerprint."""
+        with self._lock:
+            entry = self._results.get(key)
+        if entry and entry.get("fingerprint") == fingerprint:
+            return entry
+        return None
+
+    def Record(self, key: str, fingerprint: str, duration: float) -> None:
+        with self._lock:
+            self._results[key] = {"fingerprint": fingerprint, "duration": duration, "timestamp": time.time()}
+            self._dirty = True
+
+    def Forget(self, key: str) -> None:
+        with self._lock:
+            if self._results.pop(key, None) is not None:
+                self._dirty = True
@@ -9,6 +9,7 @@ Fournit des mÃ©thodes pour :
 """
 
 import os
+import subprocess
 import sys
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple, Any
@@ -25,10 +26,24 @@ class ToolchainManager:
     Peut Ãªtre instanciÃ© pour un workspace ou utilisÃ© statiquement.
     """
 
+    # Éditeurs de liens sélectionnables par -fuse-ld=<nom> : exécutables cherchés.
+    LINKER_EXECUTABLES: Dict[str, Tuple[str, ...]] = {
+        "mold": ("ld.mold", "mold"),
+        "lld": ("ld.lld",),
+        "gold": ("ld.gold",),
+        "bfd": ("ld.bfd",),
+    }
+
+    # Sondes partagées par le processus (daemon compris) : une seule fois par
+    # PATH pour les exécutables, par (driver, éditeur) pour -fuse-ld.
+    _linkerCache: Dict[Tuple[str, str], Optional[str]] = {}
+    _fuseLdCache: Dict[Tuple[str, str], bool] = {}
+
     def __init__(self, workspace: Optional[Any] = None):
         self.workspace = workspace
         self._detected: Dict[str, Toolchain] = {}
         self._cache: Dict[Tuple[TargetOS, TargetArch, Optional[TargetEnv]], Optional[str]] = {}
+        self.linkers: Dict[str, str] = {}
 
     def _GetCompilersRoot(self, workspace: Optional[Any] = None) -> Optional[Path]:
         wks = workspace or self.workspace
@@ -689,6 +704,9 @@ class ToolchainManager:
             if "zig-windows-x86_64" in toolchains and "zig-windows-x64" not in toolchains:
                 toolchains["zig-windows-x64"] = self._CloneToolchainWithName(toolchains["zig-windows-x86_64"], "zig-windows-x64")
 
+            # 6) Éditeurs de liens rapides (mold, lld) pour -fuse-ld=.
+            self.linkers = self.DetectLinkers()
+
             self._detected = toolchains
             return toolchains
         finally:
@@ -738,6 +756,39 @@ class ToolchainManager:
             self._cache[cache_key] = selected
         return selected
 
+    @staticmethod
+    def DetectLinkers() -> Dict[str, str]:
+        """Éditeurs de liens installés {nom: chemin} parmi LINKER_EXECUTABLES."""
+        path_env = os.environ.get("PATH", "")
+        found: Dict[str, str] = {}
+        for name, executables in ToolchainManager.LINKER_EXECUTABLES.items():
+            key = (path_env, name)
+            if key not in ToolchainManager._linkerCache:
+                ToolchainManager._linkerCache[key] = next(
+                    (p for p in (Process.Which(exe) for exe in executables) if p), None)
+            if ToolchainManager._linkerCache[key]:
+                found[name] = ToolchainManager._linkerCache[key]
+        return found
+
+    @staticmethod
+    def SupportsFuseLd(driver: List[str], name: str) -> bool:
+        """
+        True si le driver (gcc/clang, avec ses arguments de cible) accepte
+        -fuse-ld=<name> : on lui fait lancer '<éditeur> --version'. Lancé
+        directement (hors Process.ExecuteCommand) pour rester une vraie sonde
+        pendant l'enregistrement des commandes du BuildPlan.
+        """
+        key = ("\0".join(str(a) for a in driver), name)
+        if key not in ToolchainManager._fuseLdCache:
+            try:
+                probe = subprocess.run(list(driver) + [f"-fuse-ld={name}", "-Wl,--version"],
+                                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                       stdin=subprocess.DEVNULL, timeout=30)
+                ToolchainManager._fuseLdCache[key] = probe.returncode == 0
+            except (OSError, subprocess.SubprocessError):
+                ToolchainManager._fuseLdCache[key] = False
+        return ToolchainManager._fuseLdCache[key]
+
     def GetToolchain(self, name: str) -> Optional[Toolchain]:
         return self._detected.get(name)
 
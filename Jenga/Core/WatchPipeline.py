@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WatchPipeline – Rebuild automatique ciblé pour 'jenga watch'.
+
+Chaîne de traitement des événements du FileWatcher :
+  1. filtrage : sorties de build (Build/, objdir, targetdir), .jenga/, .git/
+  2. anti-rebond : les événements sont regroupés jusqu'à un silence de
+     'debounce' secondes (au plus 'maxDelay' après le premier)
+  3. projets affectés : index des sources (globs des projets) + graphe
+     inverse des headers (fichiers .d du dernier build), puis fermeture
+     sur les projets dépendants ; un fichier .jenga impose un build complet
+  4. build : seuls les projets affectés sont reconstruits ; si de nouvelles
+     modifications arrivent pendant un build, il est annulé et relancé avec
+     l'union des projets en attente.
+
+Toutes les méthodes publiques sont en PascalCase.
+"""
+
+import copy
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from ..Utils import Colored, Process
+
+# Répertoires jamais pertinents pour un rebuild
+_IGNORED_PARTS = {'.git', '.jenga', '__pycache__'}
+
+
+# ---------------------------------------------------------------------------
+# Index chemins -> projets
+# ---------------------------------------------------------------------------
+
+def _UserProjects(builder) -> List:
+    """
+    Copies filtrées des projets utilisateur. L'index est calculé sur le
+    thread d'anti-rebond, hors du verrou du daemon : les Project vivants
+    peuvent servir au build en cours et ne doivent pas être re-filtrés.
+    """
+    projects = []
+    for name, project in builder.workspace.projects.items():
+        if name.startswith("__"):
+            continue
+        snapshot = copy.copy(project)
+        builder._ApplyProjectFilters(snapshot)
+        projects.append(snapshot)
+    return projects
+
+
+def BuildSourceIndex(builder) -> Dict[str, Set[str]]:
+    """Resolved source path -> names of the projects that compile it."""
+    index: Dict[str, Set[str]] = {}
+    for project in _UserProjects(builder):
+        for src in builder._CollectSourceFiles(project):
+            index.setdefault(str(Path(src).resolve()), set()).add(project.name)
+    return index
+
+
+def BuildHeaderIndex(builder) -> Dict[str, Set[str]]:
+    """Dependency path (from the .d files of the last build) -> projects whose objects use it."""
+    index: Dict[str, Set[str]] = {}
+    for project in _UserProjects(builder):
+        obj_dir = builder.GetObjectDir(project)
+        if not obj_dir.is_dir():
+            continue
+        for dep_file in obj_dir.rglob("*.d"):
+            for dep in builder._ParseDependencyFile(dep_file, project):
+                index.setdefault(str(dep), set()).add(project.name)
+    return index
+
+
+def AddDependents(workspace, names: Iterable[str]) -> Set[str]:
+    """Close a set of projects over the projects that (transitively) depend on them."""
+    result = set(names)
+    changed = True
+    while changed:
+        changed = False
+        for name, project in workspace.projects.items():
+            if name not in result and any(dep in result for dep in project.dependsOn):
+                result.add(name)
+                changed = True
+    return result
+
+
+def OutputDirectories(builder) -> List[Path]:
+    """Directories written by the build (events there never trigger a rebuild)."""
+    dirs = {Path(builder.workspace.location).resolve() / "Build"}
+    for project in _UserProjects(builder):
+        dirs.add(builder.GetObjectDir(project))
+        dirs.add(builder.GetTargetDir(project))
+    return sorted(dirs)
+
+
+# ---------------------------------------------------------------------------
+# Pipeline
+# ---------------------------------------------------------------------------
+
+class WatchPipeline:
+    """
+    Usage :
+        pipeline = WatchPipeline(getBuilder)
+        watcher.AddCallback(pipeline.OnFileEvent)
+        pipeline.Start()
+    getBuilder() retourne le builder de référence (recréé par l'appelant
+    après un rechargement du workspace). runBuild(projects, buildId) et
+    cancelBuild(buildId) permettent au daemon d'exécuter les builds sous
+    son propre verrou ; par défaut le builder est utilisé directement.
+    projects=None signifie « tout le workspace ».
+    """
+
+    def __init__(self, getBuilder: Callable[[], object],
+                 runBuild: Optional[Callable[[Optional[Set[str]], str], int]] = None,
+                 cancelBuild: Optional[Callable[[str], None]] = None,
+                 onWorkspaceChanged: Optional[Callable[[], None]] = None,
+                 debounce: float = 0.3, maxDelay: float = 2.0):
+        self.getBuilder = getBuilder
+        self.runBuild = runBuild or self._RunBuilder
+        self.cancelBuild = cancelBuild or self._CancelBuilder
+        self.onWorkspaceChanged = onWorkspaceChanged
+        self.debounce = debounce
+        self.maxDelay = maxDelay
+
+        self._cond = threading.Condition()
+        self._events: Dict[str, str] = {}
+        self._firstEvent = 0.0
+        self._lastEvent = 0.0
+        self._queued: Optional[Set[str]] = set()   # None = build complet
+        self._hasQueued = False
+        self._currentId: Optional[str] = None
+        self._currentProjects: Optional[Set[str]] = set()
+        self._knownSources: Dict[str, Set[str]] = {}
+        self._ignoredDirs: List[Path] = []
+        self._running = False
+        self._threads: List[threading.Thread] = []
+
+    # -----------------------------------------------------------------------
+    # Cycle de vie
+    # -----------------------------------------------------------------------
+
+    def Start(self) -> None:
+        self._RefreshIndex()
+        self._running = True
+        for target in (self._DebounceLoop, self._BuildLoop):
+            thread = threading.Thread(target=target, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def Stop(self) -> None:
+        with self._cond:
+            self._running = False
+            build_id = self._currentId
+            self._cond.notify_all()
+        if build_id is not None:
+            self.cancelBuild(build_id)
+        for thread in self._threads:
+            thread.join(timeout=5)
+        self._threads = []
+
+    # -----------------------------------------------------------------------
+    # Événements
+    # -----------------------------------------------------------------------
+
+    def IsIgnored(self, path: str) -> bool:
+        p = Path(path)
+        if _IGNORED_PARTS.intersection(p.parts):
+            return True
+        return any(p == d or d in p.parents for d in self._ignoredDirs)
+
+    def OnFileEvent(self, eventType: str, path: str) -> None:
+        """FileWatcher callback: record the event and restart the quiet period."""
+        try:
+            path = str(Path(path).resolve())
+        except OSError:
+            pass
+        if self.IsIgnored(path):
+            return
+        with self._cond:
+            now = time.monotonic()
+            if not self._events:
+                self._firstEvent = now
+            self._lastEvent = now
+            self._events[path] = eventType
+            self._cond.notify_all()
+
+    def _DebounceLoop(self) -> None:
+        while True:
+            with self._cond:
+                while self._running:
+                    if self._events:
+                        now = time.monotonic()
+                        due = min(self._lastEvent + self.debounce, self._firstEvent + self.maxDelay)
+                        if now >= due:
+                            break
+                        self._cond.wait(due - now)
+                    else:
+                        self._cond.wait()
+                if not self._running:
+                    return
+                batch, self._events = self._events, {}
+            try:
+                self._Schedule(self.ComputeAffected(batch))
+            except Exception as e:
+                Colored.PrintError(f"[watch] Failed to analyze changes: {e}")
+
+    # -----------------------------------------------------------------------
+    # Projets affectés
+    # -----------------------------------------------------------------------
+
+    def _RefreshIndex(self) -> None:
+        builder = self.getBuilder()
+        self._knownSources = BuildSourceIndex(builder)
+        self._ignoredDirs = OutputDirectories(builder)
+
+    def ComputeAffected(self, batch: Dict[str, str]) -> Optional[Set[str]]:
+        """
+        Map changed paths to the projects to rebuild (dependents included).
+        Returns None for a full rebuild (workspace file changed or events
+        lost), an empty set when nothing built depends on the changes.
+        """
+        if any(kind == "overflow" for kind in batch.values()):
+            # File inotify saturée : des événements sont perdus, tout rebâtir
+            self._RefreshIndex()
+            return None
+        if any(Path(p).suffix == ".jenga" for p in batch):
+            if self.onWorkspaceChanged is not None:
+                self.onWorkspaceChanged()
+            self._RefreshIndex()
+            return None
+
+        previous = self._knownSources
+        if any(kind != "modified" for kind in batch.values()):
+            # Création/suppression : les globs peuvent donner un autre résultat
+            self._RefreshIndex()
+        builder = self.getBuilder()
+        headers = BuildHeaderIndex(builder)
+
+        affected: Set[str] = set()
+        for path in batch:
+            affected |= self._knownSources.get(path, set())
+            affected |= previous.get(path, set())
+            affected |= headers.get(path, set())
+        if not affected:
+            return set()
+        return AddDependents(builder.workspace, affected)
+
+    # -----------------------------------------------------------------------
+    # Builds
+    # -----------------------------------------------------------------------
+
+    def RequestBuild(self, projects: Optional[Set[str]] = None) -> None:
+        """Queue a build (None = whole workspace), e.g. the initial one."""
+        self._Schedule(projects)
+
+    def _Schedule(self, projects: Optional[Set[str]]) -> None:
+        if projects is not None and not projects:
+            return
+        with self._cond:
+            if self._queued is not None:
+                self._queued = None if projects is None else self._queued | projects
+            self._hasQueued = True
+            build_id = self._currentId
+            if build_id is not None:
+                # Build périmé : on l'annule, ses projets repartent avec le suivant
+                current = self._currentProjects
+                self._queued = None if (current is None or self._queued is None) else self._queued | current
+            self._cond.notify_all()
+        if build_id is not None:
+            Colored.PrintInfo("[watch] New changes, restarting build...")
+            self.cancelBuild(build_id)
+
+    def _BuildLoop(self) -> None:
+        while True:
+            with self._cond:
+                while self._running and not self._hasQueued:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                projects, self._queued, self._hasQueued = self._queued, set(), False
+                build_id = str(uuid.uuid4())
+                self._currentId, self._currentProjects = build_id, projects
+            shown = "all projects" if projects is None else ", ".join(sorted(projects))
+            Colored.PrintInfo(f"[watch] Rebuilding {shown}")
+            try:
+                self.runBuild(projects, build_id)
+            except Exception as e:
+                Colored.PrintError(f"[watch] Build error: {e}")
+            finally:
+                with self._cond:
+                    self._currentId = None
+                    self._currentProjects = set()
+
+    def _CancelBuilder(self, buildId: str) -> None:
+        with self._cond:
+            if self._currentId == buildId:
+                Process.CancelAll()
+
+    def _RunBuilder(self, projects: Optional[Set[str]], buildId: str) -> int:
+        Process.ResetCancel()
+        builder = self.getBuilder()
+        builder.state.Reset()
+        builder.onlyProjects = projects
+        try:
+            return builder.Build()
+        finally:
+            builder.onlyProjects = None
+            Process.ResetCancel()
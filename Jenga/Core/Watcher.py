@@ -3,7 +3,13 @@
 """
 Watcher – Surveillance des fichiers .jenga et des sources.
 Notifie des changements (création, modification, suppression) via des callbacks.
-Utilise watchdog si disponible, sinon polling.
+Backends, par ordre de préférence :
+  - inotify natif sous Linux (ctypes, voir Inotify.py) : seul backend dont
+    la livraison peut être attendue (Sync)
+  - watchdog (si installé)
+  - polling incrémental : seuls les répertoires dont le mtime a changé sont
+    relistés, les autres ne coûtent qu'un stat par fichier connu, et les
+    chemins ignorés ne sont jamais parcourus.
 
 Toutes les méthodes publiques sont en PascalCase.
 """
@@ -15,6 +21,7 @@ from typing import Set, List, Callable, Optional, Union
 from threading import Thread, Event
 
 from ..Utils import Colored, FileSystem
+from . import Inotify
 
 # ✅ Import absolu cohérent avec l'API utilisateur
 from Jenga.Core import Api
@@ -38,6 +45,9 @@ class FileWatcher:
         self._watchdog_available = False
         self._Observer = None
         self._FileSystemEventHandler = None
+        self._inotify = None
+        # Backend effectif ('watchdog', 'inotify' ou 'polling'), fixé par Start()
+        self.backend = "polling"
 
         if not use_polling:
             try:
@@ -47,11 +57,12 @@ class FileWatcher:
                 self._FileSystemEventHandler = FileSystemEventHandler
                 self._watchdog_available = True
             except ImportError:
-                Colored.PrintWarning(
-                    "watchdog module not installed. Falling back to polling mode.\n"
-                    "Install watchdog for better performance: pip install watchdog"
-                )
-                self.use_polling = True
+                if not Inotify.IsAvailable():
+                    Colored.PrintWarning(
+                        "watchdog module not installed. Falling back to polling mode.\n"
+                        "Install watchdog for better performance: pip install watchdog"
+                    )
+                    self.use_polling = True
 
     # -----------------------------------------------------------------------
     # Gestion des callbacks et des chemins
@@ -61,7 +72,8 @@ class FileWatcher:
         """
         Ajoute un callback qui sera appelé sur chaque événement.
         Signature: callback(event_type: str, path: str)
-        event_type: 'created', 'modified', 'deleted'
+        event_type: 'created', 'modified', 'deleted', ou 'overflow' (backend
+        inotify : des événements ont été perdus sous path, tout réévaluer)
         """
         self._callbacks.append(callback)
 
@@ -74,14 +86,17 @@ class FileWatcher:
             Colored.PrintWarning(f"Path does not exist, cannot watch: {p}")
 
     def AddIgnorePattern(self, pattern: str) -> None:
-        """Ajoute un pattern de fichiers/dossiers à ignorer."""
+        """Ajoute un pattern de fichiers/dossiers à ignorer (un chemin absolu ignore tout son sous-arbre)."""
         self._ignore_patterns.append(pattern)
 
     def _ShouldIgnore(self, path: str) -> bool:
         """Vérifie si un chemin doit être ignoré."""
         p = Path(path)
         for pattern in self._ignore_patterns:
-            if pattern.startswith('*'):
+            if os.path.isabs(pattern):
+                if path == pattern or path.startswith(pattern.rstrip(os.sep) + os.sep):
+                    return True
+            elif pattern.startswith('*'):
                 if p.name.endswith(pattern[1:]):
                     return True
             elif pattern in p.parts:
@@ -125,6 +140,24 @@ class FileWatcher:
             self._observer.schedule(handler, path, recursive=True)
         self._observer.start()
 
+    # -----------------------------------------------------------------------
+    # Mode inotify (Linux, sans dépendance)
+    # -----------------------------------------------------------------------
+
+    def _StartInotify(self) -> bool:
+        """Démarre le backend inotify ; False si indisponible (limite atteinte, etc.)."""
+        if not all(Path(p).is_dir() for p in self._watch_paths):
+            return False   # surveillance de fichiers isolés : polling
+        watcher = Inotify.InotifyWatcher(self._watch_paths, self._ShouldIgnore, self._Notify)
+        try:
+            watcher.Start()
+        except OSError as e:
+            Colored.PrintWarning(f"inotify unavailable ({e}), falling back to polling.")
+            watcher.Stop()
+            return False
+        self._inotify = watcher
+        return True
+
     # -----------------------------------------------------------------------
     # Mode polling (fallback)
     # -----------------------------------------------------------------------
@@ -132,54 +165,116 @@ class FileWatcher:
     def _StartPolling(self) -> None:
         """Démarre la surveillance par polling."""
         self._snapshots = {}
+        self._dirStates = {}
+
+        def poll_once():
+            for path_str in self._watch_paths:
+                path = Path(path_str)
+                if path.is_dir():
+                    self._PollDirectory(path)
+                elif path.is_file() or path_str in self._snapshots:
+                    self._PollFile(path)
+
+        # État de référence pris avant le retour de Start()
+        for path_str in self._watch_paths:
+            if Path(path_str).is_file():
+                try:
+                    self._snapshots[path_str] = Path(path_str).stat().st_mtime
+                except OSError:
+                    pass
+        poll_once()
 
         def poll_loop():
-            while not self._stop_event.is_set():
-                for path_str in self._watch_paths:
-                    path = Path(path_str)
-                    if path.is_dir():
-                        self._PollDirectory(path)
-                    elif path.is_file():
-                        self._PollFile(path)
-                self._stop_event.wait(self.polling_interval)
+            while not self._stop_event.wait(self.polling_interval):
+                poll_once()
 
         self._thread = Thread(target=poll_loop, daemon=True)
         self._thread.start()
 
     def _PollDirectory(self, path: Path) -> None:
-        """Surveille un répertoire par polling."""
-        current_files = {}
-        for root, dirs, files in os.walk(path):
-            # Ignorer les réperoires cachés
-            dirs[:] = [d for d in dirs if not d.startswith('.')]
-            for file in files:
-                if file.startswith('.'):
+        """Surveille une arborescence par polling (premier passage = référence)."""
+        root = str(path)
+        self._ScanDirectory(root, notify=root in self._dirStates, isNew=False)
+
+    def _ScanDirectory(self, directory: str, notify: bool, isNew: bool) -> None:
+        """
+        Un répertoire dont le mtime n'a pas changé a la même liste d'entrées :
+        on ne stat alors que ses fichiers connus, sans le relister.
+        État : _dirStates[dir] = (mtime_ns, {fichier: mtime_ns}, [sous-répertoires]).
+        """
+        try:
+            dir_mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            self._ForgetDirectory(directory, notify)
+            return
+        state = self._dirStates.get(directory)
+
+        if state is not None and state[0] == dir_mtime:
+            files = state[1]
+            for name, old_mtime in list(files.items()):
+                full = os.path.join(directory, name)
+                try:
+                    mtime = os.stat(full).st_mtime_ns
+                except OSError:
+                    del files[name]
+                    if notify:
+                        self._Notify('deleted', full)
                     continue
-                full_path = Path(root) / file
-                if self._ShouldIgnore(str(full_path)):
+                if mtime != old_mtime:
+                    files[name] = mtime
+                    if notify:
+                        self._Notify('modified', full)
+            subdirs = state[2]
+        else:
+            files = {}
+            subdirs = []
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                entries = []
+            for entry in entries:
+                # Ignorer les fichiers/répertoires cachés et les patterns avant de descendre
+                if entry.name.startswith('.') or self._ShouldIgnore(entry.path):
                     continue
                 try:
-                    mtime = full_path.stat().st_mtime
-                    current_files[str(full_path)] = mtime
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                    elif entry.is_file():
+                        files[entry.name] = entry.stat().st_mtime_ns
                 except OSError:
                     continue
-
-        snapshot_key = str(path)
-        old_snapshot = self._snapshots.get(snapshot_key, {})
-
-        # Détection des créations/modifications
-        for fp, mtime in current_files.items():
-            if fp not in old_snapshot:
-                self._Notify('created', fp)
-            elif old_snapshot[fp] != mtime:
-                self._Notify('modified', fp)
-
-        # Détection des suppressions
-        for fp in old_snapshot:
-            if fp not in current_files:
-                self._Notify('deleted', fp)
-
-        self._snapshots[snapshot_key] = current_files
+            if notify:
+                old_files = state[1] if state is not None else {}
+                for name, mtime in files.items():
+                    full = os.path.join(directory, name)
+                    if isNew or name not in old_files:
+                        self._Notify('created', full)
+                    elif old_files[name] != mtime:
+                        self._Notify('modified', full)
+                for name in old_files:
+                    if name not in files:
+                        self._Notify('deleted', os.path.join(directory, name))
+                if state is not None:
+                    for name in state[2]:
+                        if name not in subdirs:
+                            self._ForgetDirectory(os.path.join(directory, name), notify)
+            self._dirStates[directory] = (dir_mtime, files, subdirs)
+
+        old_subdirs = set(state[2]) if state is not None else set()
+        for name in subdirs:
+            sub = os.path.join(directory, name)
+            self._ScanDirectory(sub, notify, isNew or (notify and name not in old_subdirs))
+
+    def _ForgetDirectory(self, directory: str, notify: bool) -> None:
+        """Répertoire disparu : signale la suppression de tous ses fichiers connus."""
+        state = self._dirStates.pop(directory, None)
+        if state is None:
+            return
+        if notify:
+            for name in state[1]:
+                self._Notify('deleted', os.path.join(directory, name))
+        for name in state[2]:
+            self._ForgetDirectory(os.path.join(directory, name), notify)
 
     def _PollFile(self, path: Path) -> None:
         """Surveille un fichier unique par polling."""
@@ -210,9 +305,13 @@ class FileWatcher:
         self._running = True
         self._stop_event.clear()
 
-        if not self.use_polling and self._watchdog_available:
+        if not self.use_polling and Inotify.IsAvailable() and self._StartInotify():
+            self.backend = "inotify"
+        elif not self.use_polling and self._watchdog_available:
+            self.backend = "watchdog"
             self._StartWatchdog()
         else:
+            self.backend = "polling"
             self._StartPolling()
 
     def Stop(self) -> None:
@@ -222,9 +321,42 @@ class FileWatcher:
         if hasattr(self, '_observer'):
             self._observer.stop()
             self._observer.join()
+        if self._inotify is not None:
+            self._inotify.Stop()
+            self._inotify = None
         if self._thread:
             self._thread.join(timeout=2)
 
+    def Covers(self, path: Union[str, Path]) -> bool:
+        """
+        True si un changement de path (chemin résolu) produit un événement :
+        sous une racine surveillée, hors patterns ignorés et hors des
+        répertoires et fichiers cachés, que les backends ne parcourent pas.
+        """
+        path = str(path)
+        for root in self._watch_paths:
+            if path == root or path.startswith(root.rstrip(os.sep) + os.sep):
+                relative = Path(os.path.relpath(path, root)).parts
+                if self._ShouldIgnore(path) or any(part.startswith('.') for part in relative):
+                    return False
+                # inotify : le répertoire peut manquer (limite de surveillances)
+                inotify = self._inotify
+                return inotify is None or inotify.IsWatched(os.path.dirname(path))
+        return False
+
+    def CanSync(self) -> bool:
+        """True si Sync() garantit la livraison des événements déjà survenus."""
+        return self._running and self._inotify is not None
+
+    def Sync(self, timeout: float = 2.0) -> bool:
+        """
+        Attend que les événements des modifications déjà faites aient été
+        passés aux callbacks (backend inotify ; False ailleurs ou si le délai
+        expire).
+        """
+        inotify = self._inotify
+        return inotify is not None and inotify.Sync(timeout)
+
     def _Notify(self, event_type: str, path: str) -> None:
         """Appelle tous les callbacks avec l'événement."""
         for callback in self._callbacks:
@@ -5,8 +5,12 @@ Builder — construit un installateur self-extracting Jenga.
 
 Étapes :
   1. Compile le stub C (Jenga/Tools/Installer/Stub/Installer.c) en binaire natif.
-  2. Construit le payload : manifeste (texte) + archive (entrées de fichiers).
-  3. Concatène : [stub] + [payload] + [trailer 48 octets] -> installateur final.
+  2. Écrit en flux : [stub] + [payload] + [trailer 80 octets] -> installateur
+     final. Le payload (manifeste + archive) est produit fichier par fichier,
+     par blocs de 1 Mio : CRC32 et SHA-256 sont calculés au fil de l'écriture,
+     la mémoire reste constante quelle que soit la taille du payload.
+  3. Archive : entrées stockées telles quelles, compressées (deflate, option)
+     ou dédupliquées (fichier identique à une entrée précédente).
 
 Format détaillé : voir DESIGN.md. Aucune dépendance externe (stdlib seulement).
 
@@ -25,9 +29,24 @@ import zlib
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-MAGIC = b"JNGINST1"           # 8 octets
+MAGIC = b"JNGINST2"           # 8 octets
 TRAILER_SIZE = 80            # 48 (entetes) + 32 (SHA-256 du payload)
 
+# Méthodes de stockage d'une entrée de l'archive (cf. DESIGN.md §2).
+METHOD_STORED = 0            # size octets bruts
+METHOD_DEFLATE = 1           # blocs deflate brut indépendants
+METHOD_DUPLICATE = 2         # copie d'une entrée déjà extraite
+BLOCK_SIZE = 1 << 20         # taille maximale (brute) d'un bloc
+
+COMPRESSION_METHODS = ("none", "deflate")
+
+# Extensions déjà compressées : stockées telles quelles même en mode deflate.
+_PRECOMPRESSED_EXTENSIONS = frozenset({
+    ".zip", ".gz", ".tgz", ".bz2", ".xz", ".zst", ".7z", ".rar", ".cab",
+    ".jar", ".apk", ".png", ".jpg", ".jpeg", ".gif", ".webp", ".ktx2",
+    ".mp3", ".ogg", ".opus", ".mp4", ".webm", ".mkv",
+})
+
 # Une entrée de fichier à embarquer : (arcName, cheminAbsolu, modePosix)
 FileEntry = Tuple[str, str, int]
 
@@ -161,23 +180,119 @@ def RenderManifest(manifest: Dict[str, str]) -> str:
     return "\n".join(lines) + "\n"
 
 
-def _BuildArchive(files: List[FileEntry]) -> Tuple[bytes, int]:
-    """Construit l'archive binaire. Retourne (octets, nombre_d_entrees)."""
-    buf = bytearray()
-    count = 0
-    for arc_name, abs_path, mode in files:
-        path = Path(abs_path)
-        if not path.is_file():
+def _CheckFiles(files: List[FileEntry]) -> List[int]:
+    """Vérifie que chaque fichier existe ; retourne leurs tailles (même ordre)."""
+    sizes = []
+    for _arc_name, abs_path, _mode in files:
+        if not Path(abs_path).is_file():
             raise BuilderError(f"Fichier introuvable pour l'archive : {abs_path}")
-        data = path.read_bytes()
-        name_bytes = arc_name.replace("\\", "/").encode("utf-8")
-        buf += struct.pack("<I", len(name_bytes))
-        buf += name_bytes
-        buf += struct.pack("<I", int(mode) & 0xFFFFFFFF)
-        buf += struct.pack("<Q", len(data))
-        buf += data
-        count += 1
-    return bytes(buf), count
+        sizes.append(os.path.getsize(abs_path))
+    return sizes
+
+
+def _FileDigest(abs_path: str) -> bytes:
+    digest = hashlib.blake2b()
+    buf = bytearray(BLOCK_SIZE)
+    view = memoryview(buf)
+    with open(abs_path, "rb") as f:
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            digest.update(view[:n])
+    return digest.digest()
+
+
+def _FindDuplicates(files: List[FileEntry], sizes: List[int]) -> Dict[int, str]:
+    """Entrées identiques à une entrée précédente : {index: arcName_source}.
+
+    Seuls les fichiers de même taille sont hachés (BLAKE2b, en flux) ; la
+    source est toujours la première occurrence, déjà extraite par le stub."""
+    by_size: Dict[int, List[int]] = {}
+    for index, size in enumerate(sizes):
+        if size > 0:
+            by_size.setdefault(size, []).append(index)
+    duplicates: Dict[int, str] = {}
+    for indices in by_size.values():
+        if len(indices) < 2:
+            continue
+        first_by_digest: Dict[bytes, int] = {}
+        for index in indices:
+            digest = _FileDigest(files[index][1])
+            first = first_by_digest.setdefault(digest, index)
+            if first != index and _ArcName(files[first][0]) != _ArcName(files[index][0]):
+                duplicates[index] = _ArcName(files[first][0])
+    return duplicates
+
+
+def _ArcName(arc_name: str) -> str:
+    return arc_name.replace("\\", "/")
+
+
+class _PayloadWriter:
+    """Écrit le payload en flux en tenant à jour son CRC32 et son SHA-256."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.crc = 0
+        self.sha256 = hashlib.sha256()
+
+    def Write(self, data) -> None:
+        self.stream.write(data)
+        self.crc = zlib.crc32(data, self.crc)
+        self.sha256.update(data)
+
+
+def _WriteArchive(writer: _PayloadWriter, files: List[FileEntry], sizes: List[int],
+                  duplicates: Dict[int, str], compression: str, level: int,
+                  verbose: bool = False) -> int:
+    """Écrit l'archive entrée par entrée (blocs de BLOCK_SIZE au plus en
+    mémoire). Retourne le nombre d'entrées."""
+    buf = bytearray(BLOCK_SIZE)
+    view = memoryview(buf)
+    for index, (arc_name, abs_path, mode) in enumerate(files):
+        name_bytes = _ArcName(arc_name).encode("utf-8")
+        size = sizes[index]
+        source = duplicates.get(index)
+        if source is not None:
+            method = METHOD_DUPLICATE
+        elif compression == "deflate" and size > 0 \
+                and Path(abs_path).suffix.lower() not in _PRECOMPRESSED_EXTENSIONS:
+            method = METHOD_DEFLATE
+        else:
+            method = METHOD_STORED
+        writer.Write(struct.pack("<I", len(name_bytes)) + name_bytes
+                     + struct.pack("<IQI", int(mode) & 0xFFFFFFFF, size, method))
+        if method == METHOD_DUPLICATE:
+            source_bytes = source.encode("utf-8")
+            writer.Write(struct.pack("<I", len(source_bytes)) + source_bytes)
+            if verbose:
+                print(f"  = {arc_name} (identique à {source})")
+            continue
+
+        written = 0
+        with open(abs_path, "rb") as f:
+            while written < size:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                n = min(n, size - written)
+                block = view[:n]
+                if method == METHOD_STORED:
+                    writer.Write(block)
+                else:
+                    packer = zlib.compressobj(level, zlib.DEFLATED, -15)
+                    packed = packer.compress(block) + packer.flush()
+                    if len(packed) >= n:
+                        writer.Write(struct.pack("<II", n, n))
+                        writer.Write(block)
+                    else:
+                        writer.Write(struct.pack("<II", n, len(packed)))
+                        writer.Write(packed)
+                written += n
+        if written != size:
+            raise BuilderError(f"Fichier modifié pendant l'empaquetage : {abs_path}")
+    return len(files)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -192,7 +307,9 @@ def BuildInstaller(files: List[FileEntry],
                    platform: Optional[str] = None,
                    require_admin: bool = False,
                    icon_path: Optional[str] = None,
-                   sign_options: Optional[Dict[str, str]] = None) -> Path:
+                   sign_options: Optional[Dict[str, str]] = None,
+                   compression: str = "none",
+                   compression_level: int = 6) -> Path:
     """
     Construit un installateur self-extracting.
 
@@ -206,6 +323,8 @@ def BuildInstaller(files: List[FileEntry],
     icon_path    : icône à embarquer dans le stub Windows (optionnel).
     sign_options : infos de signature de code (cf. Signing.SignBinary) ; sans
                    certificat, l'installateur est produit mais non signé.
+    compression  : "none" (défaut, payload en clair : cf. DESIGN.md §9) ou
+                   "deflate" (par bloc, décompressé par le stub).
     Retourne le chemin de l'installateur.
     """
     output = Path(output)
@@ -213,46 +332,59 @@ def BuildInstaller(files: List[FileEntry],
     stub_src = Path(stub_src) if stub_src else (Path(__file__).parent / "Stub" / "Installer.c")
     if not stub_src.is_file():
         raise BuilderError(f"Source du stub introuvable : {stub_src}")
+    compression = (compression or "none").lower()
+    if compression not in COMPRESSION_METHODS:
+        raise BuilderError(
+            f"Compression inconnue : {compression} (attendu : {', '.join(COMPRESSION_METHODS)}). "
+            "Le stub ne sait décompresser que deflate.")
 
-    # 1. Compiler le stub dans un emplacement temporaire (avec ressource Windows).
-    with tempfile.TemporaryDirectory() as td:
-        stub_bin = Path(td) / ("stub.exe" if os.name == "nt" else "stub")
-        CompileStub(stub_src, stub_bin, cc=cc, verbose=verbose,
-                    manifest=manifest, require_admin=require_admin, icon_path=icon_path)
-        stub_bytes = stub_bin.read_bytes()
-
-    # 2. Manifeste + archive.
+    # 1. Fichiers : existence, tailles et doublons (hachés seulement si même taille).
+    sizes = _CheckFiles(files)
+    duplicates = _FindDuplicates(files, sizes)
     manifest_bytes = RenderManifest(manifest).encode("utf-8")
-    archive_bytes, entry_count = _BuildArchive(files)
-
-    # 3. Offsets ABSOLUS dans le fichier final (le payload suit le stub).
-    manifest_off = len(stub_bytes)
-    archive_off = manifest_off + len(manifest_bytes)
-    payload = manifest_bytes + archive_bytes
-    crc = zlib.crc32(payload) & 0xFFFFFFFF
-    # SHA-256 du payload : vérifié par le stub avant extraction (anti-tampering).
-    sha256 = hashlib.sha256(payload).digest()    # 32 octets
-
-    # 4. Trailer 80 octets : magic(8) + 4×u64 + crc(u32) + reserved(u32) + sha256(32).
-    trailer = (MAGIC
-               + struct.pack("<QQQQ", manifest_off, len(manifest_bytes), archive_off, entry_count)
-               + struct.pack("<II", crc, 0)
-               + sha256)
-    assert len(trailer) == TRAILER_SIZE, f"trailer={len(trailer)}"
-
-    # 5. Écriture : stub + payload + trailer.
-    output.parent.mkdir(parents=True, exist_ok=True)
-    with open(output, "wb") as f:
-        f.write(stub_bytes)
-        f.write(payload)
-        f.write(trailer)
 
-    # 6. Exécutable sur Unix.
+    # 2. Compiler le stub puis écrire stub + payload + trailer dans un fichier
+    #    temporaire (remplacé atomiquement : pas d'installateur tronqué).
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp_output = output.with_name(output.name + ".tmp")
+    try:
+        with tempfile.TemporaryDirectory() as td:
+            stub_bin = Path(td) / ("stub.exe" if os.name == "nt" else "stub")
+            CompileStub(stub_src, stub_bin, cc=cc, verbose=verbose,
+                        manifest=manifest, require_admin=require_admin, icon_path=icon_path)
+            with open(tmp_output, "wb") as f:
+                with open(stub_bin, "rb") as stub:
+                    shutil.copyfileobj(stub, f, BLOCK_SIZE)
+
+                # 3. Offsets ABSOLUS dans le fichier final (le payload suit le stub).
+                manifest_off = f.tell()
+                archive_off = manifest_off + len(manifest_bytes)
+                writer = _PayloadWriter(f)
+                writer.Write(manifest_bytes)
+                entry_count = _WriteArchive(writer, files, sizes, duplicates,
+                                            compression, compression_level, verbose)
+
+                # 4. Trailer 80 octets : magic(8) + 4×u64 + crc(u32) + reserved(u32)
+                #    + sha256(32). Le SHA-256 est vérifié par le stub avant extraction.
+                trailer = (MAGIC
+                           + struct.pack("<QQQQ", manifest_off, len(manifest_bytes),
+                                         archive_off, entry_count)
+                           + struct.pack("<II", writer.crc & 0xFFFFFFFF, 0)
+                           + writer.sha256.digest())
+                assert len(trailer) == TRAILER_SIZE, f"trailer={len(trailer)}"
+                f.write(trailer)
+        os.replace(tmp_output, output)
+    except BaseException:
+        if tmp_output.exists():
+            tmp_output.unlink()
+        raise
+
+    # 5. Exécutable sur Unix.
     if os.name != "nt":
         import stat as _stat
         output.chmod(output.stat().st_mode | _stat.S_IEXEC | _stat.S_IXGRP | _stat.S_IXOTH)
 
-    # 7. Signature de code (anti-faux-positifs AV) — uniquement si certificat fourni.
+    # 6. Signature de code (anti-faux-positifs AV) — uniquement si certificat fourni.
     from .Signing import SignBinary, HasSigningInfo, SigningError
     if HasSigningInfo(sign_options):
         try:
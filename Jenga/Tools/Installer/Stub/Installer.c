@@ -7,6 +7,10 @@
  * SHA-256 du payload (anti-tampering), extrait les fichiers vers le dossier
  * d'installation, configure le pare-feu et ecrit un desinstalleur.
  *
+ * Les entrees de l'archive sont stockees, compressees par blocs deflate
+ * (decompresses ici par un inflate autonome) ou dedupliquees (copie d'une
+ * entree deja extraite). L'extraction se fait par blocs de 1 Mio au plus.
+ *
  * Format : voir Jenga/Tools/Installer/DESIGN.md.
  * Edite par Rihen — fait partie de Jenga.
  *
@@ -15,6 +19,9 @@
  *
  * C99 portable. Specificites OS isolees par #ifdef (_WIN32 / __APPLE__ / autre).
  */
+#ifndef _WIN32
+  #define _FILE_OFFSET_BITS 64    /* fseeko/ftello 64 bits : payloads > 2 Go */
+#endif
 #include <stdio.h>
 #include <stdlib.h>
 #include <string.h>
@@ -29,6 +36,8 @@
   #include <objbase.h>            /* CoInitialize, CoCreateInstance */
   #define PATH_SEP '\\'
   #define MKDIR(p) _mkdir(p)
+  #define FSEEK64(f, o, w) _fseeki64((f), (__int64)(o), (w))
+  #define FTELL64(f) ((int64_t)_ftelli64(f))
 #else
   #include <unistd.h>
   #include <sys/stat.h>
@@ -36,15 +45,23 @@
   #include <errno.h>
   #define PATH_SEP '/'
   #define MKDIR(p) mkdir((p), 0755)
+  #define FSEEK64(f, o, w) fseeko((f), (off_t)(o), (w))
+  #define FTELL64(f) ((int64_t)ftello(f))
   #ifdef __APPLE__
     #include <mach-o/dyld.h>
   #endif
 #endif
 
-#define TRAILER_MAGIC "JNGINST1"
+#define TRAILER_MAGIC "JNGINST2"
 #define TRAILER_SIZE  80    /* 48 (entetes) + 32 (SHA-256 du payload) */
 #define PATH_MAX_LEN  4096
 
+/* Methodes de stockage d'une entree (cf. Builder.py METHOD_*). */
+#define METHOD_STORED    0
+#define METHOD_DEFLATE   1
+#define METHOD_DUPLICATE 2
+#define BLOCK_SIZE       (1u << 20)   /* taille brute maximale d'un bloc */
+
 /* ----------------------------------------------------------------------- */
 /* Lecture little-endian portable                                          */
 /* ----------------------------------------------------------------------- */
@@ -147,6 +164,192 @@ static void Sha256Final(Sha256Ctx *ctx, uint8_t hash[32]) {
             hash[i * 4 + k] = (uint8_t)(ctx->state[i] >> (24 - k * 8));
 }
 
+/* ----------------------------------------------------------------------- */
+/* Inflate (RFC 1951) autonome, tampon -> tampon. Chaque bloc de l'archive  */
+/* est un flux deflate brut independant (< BLOCK_SIZE octets decompresses), */
+/* decode avec des arbres de Huffman canoniques (a la tinf, domaine public). */
+/* ----------------------------------------------------------------------- */
+typedef struct {
+    uint16_t counts[16];      /* nombre de codes par longueur */
+    uint16_t symbols[288];    /* symboles tries par code */
+} InflateTree;
+
+typedef struct {
+    const unsigned char *src, *srcEnd;
+    uint32_t bitBuf;
+    int bitCount;
+    unsigned char *dst;
+    size_t dstLen, dstCap;
+    int error;
+} InflateState;
+
+static const uint16_t INFLATE_LEN_BASE[29] = {
+    3, 4, 5, 6, 7, 8, 9, 10, 11, 13, 15, 17, 19, 23, 27, 31,
+    35, 43, 51, 59, 67, 83, 99, 115, 131, 163, 195, 227, 258
+};
+static const uint8_t INFLATE_LEN_EXTRA[29] = {
+    0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2,
+    3, 3, 3, 3, 4, 4, 4, 4, 5, 5, 5, 5, 0
+};
+static const uint16_t INFLATE_DIST_BASE[30] = {
+    1, 2, 3, 4, 5, 7, 9, 13, 17, 25, 33, 49, 65, 97, 129, 193,
+    257, 385, 513, 769, 1025, 1537, 2049, 3073, 4097, 6145, 8193, 12289, 16385, 24577
+};
+static const uint8_t INFLATE_DIST_EXTRA[30] = {
+    0, 0, 0, 0, 1, 1, 2, 2, 3, 3, 4, 4, 5, 5, 6, 6,
+    7, 7, 8, 8, 9, 9, 10, 10, 11, 11, 12, 12, 13, 13
+};
+static const uint8_t INFLATE_CLEN_ORDER[19] = {
+    16, 17, 18, 0, 8, 7, 9, 6, 10, 5, 11, 4, 12, 3, 13, 2, 14, 1, 15
+};
+
+static uint32_t InflateBits(InflateState *s, int n) {
+    uint32_t value = 0;
+    for (int i = 0; i < n; ++i) {
+        if (s->bitCount == 0) {
+            if (s->src >= s->srcEnd) { s->error = 1; return 0; }
+            s->bitBuf = *s->src++;
+            s->bitCount = 8;
+        }
+        value |= (s->bitBuf & 1u) << i;
+        s->bitBuf >>= 1;
+        s->bitCount--;
+    }
+    return value;
+}
+
+static void InflateBuildTree(InflateTree *t, const uint8_t *lengths, int num) {
+    uint16_t offsets[16];
+    uint16_t sum = 0;
+    memset(t->counts, 0, sizeof(t->counts));
+    for (int i = 0; i < num; ++i) t->counts[lengths[i]]++;
+    t->counts[0] = 0;
+    for (int i = 0; i < 16; ++i) { offsets[i] = sum; sum += t->counts[i]; }
+    for (int i = 0; i < num; ++i)
+        if (lengths[i]) t->symbols[offsets[lengths[i]]++] = (uint16_t)i;
+}
+
+static int InflateDecodeSymbol(InflateState *s, const InflateTree *t) {
+    int sum = 0, cur = 0, len = 0;
+    do {
+        cur = 2 * cur + (int)InflateBits(s, 1);
+        if (s->error || ++len > 15) return -1;
+        sum += t->counts[len];
+        cur -= t->counts[len];
+    } while (cur >= 0);
+    return t->symbols[sum + cur];
+}
+
+static int InflateCodes(InflateState *s, const InflateTree *lt, const InflateTree *dt) {
+    for (;;) {
+        int sym = InflateDecodeSymbol(s, lt);
+        if (sym < 0) return -1;
+        if (sym < 256) {
+            if (s->dstLen >= s->dstCap) return -1;
+            s->dst[s->dstLen++] = (unsigned char)sym;
+        } else if (sym == 256) {
+            return 0;
+        } else {
+            sym -= 257;
+            if (sym >= 29) return -1;
+            size_t len = INFLATE_LEN_BASE[sym] + InflateBits(s, INFLATE_LEN_EXTRA[sym]);
+            int distSym = InflateDecodeSymbol(s, dt);
+            if (distSym < 0 || distSym >= 30) return -1;
+            size_t dist = INFLATE_DIST_BASE[distSym] + InflateBits(s, INFLATE_DIST_EXTRA[distSym]);
+            if (s->error || dist > s->dstLen || len > s->dstCap - s->dstLen) return -1;
+            for (size_t i = 0; i < len; ++i, ++s->dstLen)
+                s->dst[s->dstLen] = s->dst[s->dstLen - dist];
+        }
+    }
+}
+
+static int InflateStored(InflateState *s) {
+    s->bitCount = 0;                           /* aligne sur l'octet suivant */
+    if (s->srcEnd - s->src < 4) return -1;
+    uint32_t len = (uint32_t)s->src[0] | ((uint32_t)s->src[1] << 8);
+    uint32_t nlen = (uint32_t)s->src[2] | ((uint32_t)s->src[3] << 8);
+    s->src += 4;
+    if (len != (~nlen & 0xFFFFu) || (size_t)(s->srcEnd - s->src) < len ||
+        len > s->dstCap - s->dstLen) return -1;
+    memcpy(s->dst + s->dstLen, s->src, len);
+    s->src += len;
+    s->dstLen += len;
+    return 0;
+}
+
+static int InflateDynamicTrees(InflateState *s, InflateTree *lt, InflateTree *dt) {
+    uint8_t lengths[288 + 32];
+    InflateTree codeTree;
+    int hlit = (int)InflateBits(s, 5) + 257;
+    int hdist = (int)InflateBits(s, 5) + 1;
+    int hclen = (int)InflateBits(s, 4) + 4;
+    if (hlit > 286 || hdist > 30) return -1;
+    memset(lengths, 0, 19);
+    for (int i = 0; i < hclen; ++i) lengths[INFLATE_CLEN_ORDER[i]] = (uint8_t)InflateBits(s, 3);
+    InflateBuildTree(&codeTree, lengths, 19);
+    for (int num = 0; num < hlit + hdist; ) {
+        int sym = InflateDecodeSymbol(s, &codeTree);
+        uint8_t prev = 0;
+        int repeat;
+        if (sym < 0) return -1;
+        if (sym < 16) { lengths[num++] = (uint8_t)sym; continue; }
+        if (sym == 16) {
+            if (num == 0) return -1;
+            prev = lengths[num - 1];
+            repeat = 3 + (int)InflateBits(s, 2);
+        } else if (sym == 17) {
+            repeat = 3 + (int)InflateBits(s, 3);
+        } else {
+            repeat = 11 + (int)InflateBits(s, 7);
+        }
+        if (num + repeat > hlit + hdist) return -1;
+        while (repeat-- > 0) lengths[num++] = prev;
+    }
+    if (s->error || lengths[256] == 0) return -1;
+    InflateBuildTree(lt, lengths, hlit);
+    InflateBuildTree(dt, lengths + hlit, hdist);
+    return 0;
+}
+
+/* Decompresse src (flux deflate brut complet) dans dst. Retourne le nombre
+ * d'octets produits, ou -1 si le flux est invalide ou depasse dstCap. */
+static long Inflate(const unsigned char *src, size_t srcLen, unsigned char *dst, size_t dstCap) {
+    InflateState s;
+    InflateTree lt, dt;
+    int final;
+    s.src = src; s.srcEnd = src + srcLen;
+    s.bitBuf = 0; s.bitCount = 0;
+    s.dst = dst; s.dstLen = 0; s.dstCap = dstCap;
+    s.error = 0;
+    do {
+        final = (int)InflateBits(&s, 1);
+        int type = (int)InflateBits(&s, 2);
+        int rc;
+        if (s.error) return -1;
+        if (type == 0) {
+            rc = InflateStored(&s);
+        } else if (type == 1) {
+            uint8_t lengths[288 + 30];
+            int i = 0;
+            for (; i < 144; ++i) lengths[i] = 8;
+            for (; i < 256; ++i) lengths[i] = 9;
+            for (; i < 280; ++i) lengths[i] = 7;
+            for (; i < 288; ++i) lengths[i] = 8;
+            for (; i < 288 + 30; ++i) lengths[i] = 5;
+            InflateBuildTree(&lt, lengths, 288);
+            InflateBuildTree(&dt, lengths + 288, 30);
+            rc = InflateCodes(&s, &lt, &dt);
+        } else if (type == 2) {
+            rc = InflateDynamicTrees(&s, &lt, &dt);
+            if (rc == 0) rc = InflateCodes(&s, &lt, &dt);
+        } else {
+            rc = -1;
+        }
+        if (rc != 0 || s.error) return -1;
+    } while (!final);
+    return (long)s.dstLen;
+}
+
 /* ----------------------------------------------------------------------- */
 /* Chemin du binaire courant                                               */
 /* ----------------------------------------------------------------------- */
@@ -269,24 +472,73 @@ static void ReplacePlaceholder(char *buf, size_t bufSize, const char *token, con
 /* ----------------------------------------------------------------------- */
 /* Extraction de l'archive : lit `entries` fichiers depuis fp (positionne  */
 /* au debut de l'archive). Ecrit la liste des fichiers poses dans `listFp`. */
+/* Memoire constante : deux tampons de BLOCK_SIZE, quel que soit le payload. */
 /* ----------------------------------------------------------------------- */
+
+/* Copie `size` octets de `in` vers `out` par blocs de BLOCK_SIZE au plus. */
+static int CopyStream(FILE *in, FILE *out, uint64_t size, unsigned char *buf) {
+    while (size > 0) {
+        size_t want = size < BLOCK_SIZE ? (size_t)size : BLOCK_SIZE;
+        if (fread(buf, 1, want, in) != want) return -1;
+        if (fwrite(buf, 1, want, out) != want) return -1;
+        size -= want;
+    }
+    return 0;
+}
+
+/* Decompresse une entree deflate : blocs (raw u32, packed u32, donnees). */
+static int InflateEntry(FILE *fp, FILE *out, uint64_t size,
+                        unsigned char *inBuf, unsigned char *outBuf) {
+    while (size > 0) {
+        unsigned char header[8];
+        if (fread(header, 1, 8, fp) != 8) return -1;
+        uint32_t raw = RdU32(header), packed = RdU32(header + 4);
+        if (raw == 0 || raw > BLOCK_SIZE || raw > size || packed > raw) return -1;
+        if (fread(inBuf, 1, packed, fp) != packed) return -1;
+        if (packed == raw) {                      /* bloc incompressible */
+            if (fwrite(inBuf, 1, raw, out) != raw) return -1;
+        } else {
+            if (Inflate(inBuf, packed, outBuf, raw) != (long)raw) return -1;
+            if (fwrite(outBuf, 1, raw, out) != raw) return -1;
+        }
+        size -= raw;
+    }
+    return 0;
+}
+
 static int ExtractArchive(FILE *fp, uint64_t entries, const char *destDir,
                           FILE *listFp, int verbose) {
-    char path[PATH_MAX_LEN], full[PATH_MAX_LEN];
-    char *dataBuf = NULL;
-    size_t dataBufCap = 0;
+    char path[PATH_MAX_LEN], full[PATH_MAX_LEN], source[PATH_MAX_LEN];
+    unsigned char *inBuf = (unsigned char *)malloc(BLOCK_SIZE);
+    unsigned char *outBuf = (unsigned char *)malloc(BLOCK_SIZE);
+    int rc = -1;
+    if (!inBuf || !outBuf) goto done;
 
     for (uint64_t e = 0; e < entries; ++e) {
         unsigned char u32b[4], u64b[8];
-        if (fread(u32b, 1, 4, fp) != 4) { free(dataBuf); return -1; }
+        if (fread(u32b, 1, 4, fp) != 4) goto done;
         uint32_t pathLen = RdU32(u32b);
-        if (pathLen == 0 || pathLen >= sizeof(path)) { free(dataBuf); return -1; }
-        if (fread(path, 1, pathLen, fp) != pathLen) { free(dataBuf); return -1; }
+        if (pathLen == 0 || pathLen >= sizeof(path)) goto done;
+        if (fread(path, 1, pathLen, fp) != pathLen) goto done;
         path[pathLen] = '\0';
-        if (fread(u32b, 1, 4, fp) != 4) { free(dataBuf); return -1; }
+        if (fread(u32b, 1, 4, fp) != 4) goto done;
         uint32_t mode = RdU32(u32b);
-        if (fread(u64b, 1, 8, fp) != 8) { free(dataBuf); return -1; }
+        if (fread(u64b, 1, 8, fp) != 8) goto done;
         uint64_t size = RdU64(u64b);
+        if (fread(u32b, 1, 4, fp) != 4) goto done;
+        uint32_t method = RdU32(u32b);
+
+        source[0] = '\0';
+        if (method == METHOD_DUPLICATE) {
+            if (fread(u32b, 1, 4, fp) != 4) goto done;
+            uint32_t sourceLen = RdU32(u32b);
+            if (sourceLen == 0 || sourceLen >= sizeof(path)) goto done;
+            if (fread(source, 1, sourceLen, fp) != sourceLen) goto done;
+            source[sourceLen] = '\0';
+        } else if (method != METHOD_STORED && method != METHOD_DEFLATE) {
+            fprintf(stderr, "  [ERREUR] methode de stockage inconnue (%u) : %s\n", method, path);
+            goto done;
+        }
 
         snprintf(full, sizeof(full), "%s%c%s", destDir, PATH_SEP, path);
         ToNativeSep(full);
@@ -300,17 +552,23 @@ static int ExtractArchive(FILE *fp, uint64_t entries, const char *destDir,
         MkdirP(parent);
 
         FILE *out = fopen(full, "wb");
-        if (!out) { fprintf(stderr, "  [ERREUR] ecriture %s\n", full); free(dataBuf); return -1; }
-        if (size > dataBufCap) {
-            char *grown = (char *)realloc(dataBuf, (size_t)size);
-            if (!grown) { fclose(out); free(dataBuf); return -1; }
-            dataBuf = grown; dataBufCap = (size_t)size;
-        }
-        if (size > 0) {
-            if (fread(dataBuf, 1, (size_t)size, fp) != size) { fclose(out); free(dataBuf); return -1; }
-            fwrite(dataBuf, 1, (size_t)size, out);
+        if (!out) { fprintf(stderr, "  [ERREUR] ecriture %s\n", full); goto done; }
+        int entryRc;
+        if (method == METHOD_STORED) {
+            entryRc = CopyStream(fp, out, size, inBuf);
+        } else if (method == METHOD_DEFLATE) {
+            entryRc = InflateEntry(fp, out, size, inBuf, outBuf);
+        } else {
+            /* doublon : recopie du fichier deja extrait */
+            char sourceFull[PATH_MAX_LEN];
+            snprintf(sourceFull, sizeof(sourceFull), "%s%c%s", destDir, PATH_SEP, source);
+            ToNativeSep(sourceFull);
+            FILE *in = fopen(sourceFull, "rb");
+            entryRc = in ? CopyStream(in, out, size, inBuf) : -1;
+            if (in) fclose(in);
         }
-        fclose(out);
+        if (fclose(out) != 0) entryRc = -1;
+        if (entryRc != 0) { fprintf(stderr, "  [ERREUR] extraction %s\n", path); goto done; }
 
 #ifndef _WIN32
         if (mode != 0) chmod(full, (mode_t)mode);
@@ -320,8 +578,11 @@ static int ExtractArchive(FILE *fp, uint64_t entries, const char *destDir,
         if (listFp) fprintf(listFp, "%s\n", path);
         if (verbose) printf("  + %s\n", path);
     }
-    free(dataBuf);
-    return 0;
+    rc = 0;
+done:
+    free(inBuf);
+    free(outBuf);
+    return rc;
 }
 
 /* ----------------------------------------------------------------------- */
@@ -493,8 +754,8 @@ int main(int argc, char **argv) {
     FILE *fp = fopen(selfPath, "rb");
     if (!fp) { fprintf(stderr, "ouverture self KO\n"); return 1; }
 
-    /* 2. trailer (48 derniers octets) */
-    if (fseek(fp, -TRAILER_SIZE, SEEK_END) != 0) { fclose(fp); return 1; }
+    /* 2. trailer (80 derniers octets) */
+    if (FSEEK64(fp, -TRAILER_SIZE, SEEK_END) != 0) { fclose(fp); return 1; }
     unsigned char trailer[TRAILER_SIZE];
     if (fread(trailer, 1, TRAILER_SIZE, fp) != TRAILER_SIZE) { fclose(fp); return 1; }
     if (memcmp(trailer, TRAILER_MAGIC, 8) != 0) {
@@ -510,8 +771,8 @@ int main(int argc, char **argv) {
     /* 2b. Verification d'integrite (anti-tampering) : on recalcule le SHA-256
      * du payload (de manifestOff jusqu'au debut du trailer) et on le compare
      * a celui stocke. Si le binaire a ete altere/infecte -> refus. */
-    fseek(fp, 0, SEEK_END);
-    long fileSize = ftell(fp);
+    FSEEK64(fp, 0, SEEK_END);
+    int64_t fileSize = FTELL64(fp);
     if (fileSize <= 0 || (uint64_t)fileSize < manifestOff + TRAILER_SIZE) {
         fprintf(stderr, "Fichier installateur invalide.\n");
         fclose(fp); return 1;
@@ -519,9 +780,9 @@ int main(int argc, char **argv) {
     {
         Sha256Ctx shaCtx;
         Sha256Init(&shaCtx);
-        fseek(fp, (long)manifestOff, SEEK_SET);
+        FSEEK64(fp, manifestOff, SEEK_SET);
         uint64_t remaining = (uint64_t)fileSize - TRAILER_SIZE - manifestOff;
-        unsigned char chunk[8192];
+        unsigned char chunk[65536];
         while (remaining > 0) {
             size_t want = remaining < sizeof(chunk) ? (size_t)remaining : sizeof(chunk);
             size_t got = fread(chunk, 1, want, fp);
@@ -541,7 +802,7 @@ int main(int argc, char **argv) {
     /* 3. manifeste */
     char *manifest = (char *)malloc((size_t)manifestSz + 1);
     if (!manifest) { fclose(fp); return 1; }
-    fseek(fp, (long)manifestOff, SEEK_SET);
+    FSEEK64(fp, manifestOff, SEEK_SET);
     if (fread(manifest, 1, (size_t)manifestSz, fp) != manifestSz) { free(manifest); fclose(fp); return 1; }
     manifest[manifestSz] = '\0';
 
@@ -587,7 +848,7 @@ int main(int argc, char **argv) {
     FILE *listFp = fopen(listPath, "wb");
 
     /* 5. extraction */
-    fseek(fp, (long)archiveOff, SEEK_SET);
+    FSEEK64(fp, archiveOff, SEEK_SET);
     int rc = ExtractArchive(fp, archiveEnt, destDir, listFp, !silent);
     if (listFp) fclose(listFp);
     fclose(fp);
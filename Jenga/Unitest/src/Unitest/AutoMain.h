@@ -33,7 +33,7 @@ int main(int argc, char** argv) { \
 // Cela permet à l'utilisateur de simplement inclure AutoMain.h
 // sans avoir à écrire de code supplémentaire
 #ifdef UNIT_TEST_AUTO_DEFINE_MAIN
-UNIT_TEST_SIMPLE_MAIN()
+UNIT_TEST_AUTO_MAIN()
 #endif
 
 #else
@@ -7,6 +7,7 @@
 namespace nkentseu {
     namespace test {
         void PerformanceReporter::OnBenchmarkComplete(const benchmark::BenchmarkResult& result) {
+            std::lock_guard<std::mutex> lock(mMutex);
             PerformanceTestEntry entry;
             entry.mTestName = result.mName;
             entry.mBenchmarkResult = result;
@@ -24,6 +25,7 @@ namespace nkentseu {
         }
         
         void PerformanceReporter::OnProfileComplete(const std::vector<profiler::ProfileStatistics>& stats) {
+            std::lock_guard<std::mutex> lock(mMutex);
             if (!mCurrentTestName.empty()) {
                 for (auto& entry : mPerformanceData) {
                     if (entry.mTestName == mCurrentTestName) {
@@ -66,7 +68,12 @@ namespace nkentseu {
                 file << "        \"mode\": \"" << entry.mBenchmarkResult.mMode << "\",\n";
                 file << "        \"performance_regression\": " 
                      << (entry.mPerformanceRegression ? "true" : "false") << ",\n";
-                file << "        \"regression_percentage\": " << entry.mRegressionPercentage << "\n";
+                file << "        \"regression_percentage\": " << entry.mRegressionPercentage << ",\n";
+                file << "        \"samples_ms\": [";
+                for (size_t s = 0; s < entry.mBenchmarkResult.mSamples.size(); ++s) {
+                    file << (s ? ", " : "") << entry.mBenchmarkResult.mSamples[s];
+                }
+                file << "]\n";
                 file << "      }";
                 
                 if (i < mPerformanceData.size() - 1) {
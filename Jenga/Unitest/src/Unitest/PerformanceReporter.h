@@ -7,6 +7,7 @@
 #include <map>
 #include <fstream>
 #include <iomanip>
+#include <mutex>
 
 namespace nkentseu {
     namespace test {
@@ -41,6 +42,7 @@ namespace nkentseu {
                 std::vector<PerformanceTestEntry> mPerformanceData;
                 std::map<std::string, benchmark::BenchmarkResult> mBaselineData;
                 std::string mCurrentTestName;
+                std::mutex mMutex; // les benchmarks peuvent tourner dans le pool de workers
         };
     }
 }
\ No newline at end of file
@@ -5,7 +5,7 @@ namespace nkentseu
     namespace test
     {
         // Définition des variables statiques
-        TestCase* TestAssert::sCurrentTest = nullptr;
+        thread_local TestCase* TestAssert::sCurrentTest = nullptr;
         bool TestAssert::sStopOnFailure = false;
     } // namespace test
     
@@ -195,7 +195,8 @@ namespace nkentseu {
 
         class TestAssert {
             public:
-                static TestCase* sCurrentTest;
+                // Test en cours sur ce thread (les tests parallèles ont chacun le leur)
+                static thread_local TestCase* sCurrentTest;
                 static bool sStopOnFailure;
                 
                 struct Timer {
@@ -36,7 +36,8 @@ namespace nkentseu {
             template<typename T>
             class TestCaseRegistrar : public ITestCaseRegistrar {
                 public:
-                    TestCaseRegistrar(const std::string& testName) : mTestName(testName) {
+                    TestCaseRegistrar(const std::string& testName, bool serial = false)
+                        : mTestName(testName), mSerial(serial) {
                         // Deferred registration - just store the registrar
                         TestCaseAutoRegistrar::GetInstance().AddRegistrar(this);
                     }
@@ -45,6 +46,7 @@ namespace nkentseu {
                     
                 private:
                     std::string mTestName;
+                    bool mSerial;   // opt-out de l'exécution parallèle
                     template<typename U> friend class TestCaseRegistrar;
             };
         }
@@ -11,7 +11,7 @@ namespace nkentseu {
                 // Use fully qualified name to access TestRunner from parent namespace
                 nkentseu::test::TestRunner::GetInstance().AddTestCase(mTestName, []() {
                     return std::make_unique<T>();
-                });
+                }, mSerial);
             }
 
             // RegisterAll implementation is in TestCase.cpp to ensure it's compiled
@@ -17,7 +17,8 @@ namespace nkentseu {
             std::vector<std::string> mTestExclusions;
             std::string mOutputFormat;
             std::string mReportFile;
-            int mThreadCount;
+            std::string mBenchmarkOutFile; // rapport JSON des benchmarks (lu par 'jenga bench')
+            int mThreadCount;      // workers du pool si mRunInParallel (0 = nb de coeurs)
             int mRepeatCount;
             
             TestConfiguration() 
@@ -18,6 +18,20 @@ void ClassName##TestName##TestCase::Run()
 
 #define TEST(TestName) TEST_CASE(Default, TestName)
 
+// Variante pour les tests qui touchent un état global : jamais exécutés en
+// parallèle avec d'autres tests (ils passent avant le pool de workers).
+#define TEST_CASE_SERIAL(ClassName, TestName) \
+class ClassName##TestName##TestCase : public nkentseu::test::TestCase { \
+public: \
+    ClassName##TestName##TestCase() : TestCase(#ClassName "_" #TestName) {} \
+    void Run() override; \
+}; \
+static nkentseu::test::detail::TestCaseRegistrar<ClassName##TestName##TestCase> \
+    gRegistrar_##ClassName##_##TestName##TestCase(#ClassName "_" #TestName, true); \
+void ClassName##TestName##TestCase::Run()
+
+#define TEST_SERIAL(TestName) TEST_CASE_SERIAL(Default, TestName)
+
 #define TEST_FIXTURE(FixtureClass, TestName) \
 class TestName##TestCase : public FixtureClass { \
 public: \
@@ -28,6 +42,16 @@ static nkentseu::test::detail::TestCaseRegistrar<TestName##TestCase> \
     gRegistrar_##TestName##TestCase(#TestName); \
 void TestName##TestCase::Run()
 
+#define TEST_FIXTURE_SERIAL(FixtureClass, TestName) \
+class TestName##TestCase : public FixtureClass { \
+public: \
+    TestName##TestCase() : FixtureClass(#TestName) {} \
+    void Run() override; \
+}; \
+static nkentseu::test::detail::TestCaseRegistrar<TestName##TestCase> \
+    gRegistrar_##TestName##TestCase(#TestName, true); \
+void TestName##TestCase::Run()
+
 // Macros d'assertion de base
 #define ASSERT_EQUAL(expected, actual) \
     nkentseu::test::TestAssert::Equal((expected), (actual), "", __FILE__, __LINE__, #expected " == " #actual)
@@ -58,8 +58,22 @@ namespace nkentseu {
         }
         
         void TestRunner::AddTestCase(const std::string& name,
-                                   std::function<std::unique_ptr<TestCase>()> factory) {
+                                   std::function<std::unique_ptr<TestCase>()> factory,
+                                   bool serial) {
             mTestFactories[name] = std::move(factory);
+            SetSerial(name, serial);
+        }
+        
+        void TestRunner::SetSerial(const std::string& name, bool serial) {
+            if (serial) {
+                mSerialTests.insert(name);
+            } else {
+                mSerialTests.erase(name);
+            }
+        }
+        
+        bool TestRunner::IsSerial(const std::string& name) const {
+            return mSerialTests.count(name) != 0;
         }
         
         bool TestRunner::RunAllTests() {
@@ -73,12 +87,16 @@ namespace nkentseu {
         bool TestRunner::RunTests(const std::vector<std::string>& testNames) {
             Reset();
             
-            mStatistics.mTotalTestCases = 0;
+            // Tests à exécuter, dans l'ordre demandé ; les autres sont ignorés
+            std::vector<std::string> selected;
             for (const auto& testName : testNames) {
-                if (ShouldRunTest(testName)) {
-                    mStatistics.mTotalTestCases++;
+                if (!ShouldRunTest(testName)) {
+                    mStatistics.mSkippedTestCases++;
+                } else if (mTestFactories.find(testName) != mTestFactories.end()) {
+                    selected.push_back(testName);
                 }
             }
+            mStatistics.mTotalTestCases = selected.size();
             
             // Notifier le début des tests
             for (auto& reporter : mReporters) {
@@ -87,63 +105,21 @@ namespace nkentseu {
             
             std::vector<UnitTestDataEntry> results;
             
-            if (mConfig.mRunInParallel && mConfig.mThreadCount > 1) {
-                // Exécution parallèle
-                std::vector<std::future<UnitTestDataEntry>> futures;
-                std::mutex resultsMutex;
-                
-                for (const auto& testName : testNames) {
-                    if (!ShouldRunTest(testName)) {
-                        continue;
-                    }
-                    
-                    auto it = mTestFactories.find(testName);
-                    if (it == mTestFactories.end()) {
-                        continue;
-                    }
-                    
-                    futures.emplace_back(std::async(std::launch::async, 
-                        [this, &testName, &it, &resultsMutex]() {
-                            auto result = RunSingleTest(testName, it->second);
-                            
-                            std::lock_guard<std::mutex> lock(resultsMutex);
-                            mCompletedTests++;
-                            for (auto& reporter : mReporters) {
-                                reporter->OnTestCaseComplete(result);
-                            }
-                            return result;
-                        }));
-                }
-                
-                for (auto& future : futures) {
-                    results.push_back(future.get());
-                }
+            if (mConfig.mRunInParallel && mConfig.mThreadCount != 1 && selected.size() > 1) {
+                RunParallel(selected, results);
             } else {
                 // Exécution séquentielle
-                for (const auto& testName : testNames) {
-                    if (!ShouldRunTest(testName)) {
-                        UnitTestDataEntry skippedResult;
-                        skippedResult.mTestName = testName;
-                        skippedResult.mSkipped = true;
-                        skippedResult.mSkipReason = "Filtered out";
-                        skippedResult.mSuccess = true;
-                        mStatistics.mSkippedTestCases++;
-                        continue;
+                for (const auto& testName : selected) {
+                    auto result = RunSingleTest(testName, mTestFactories[testName]);
+                    results.push_back(result);
+                    
+                    mCompletedTests++;
+                    for (auto& reporter : mReporters) {
+                        reporter->OnTestCaseComplete(result);
                     }
                     
-                    auto it = mTestFactories.find(testName);
-                    if (it != mTestFactories.end()) {
-                        auto result = RunSingleTest(testName, it->second);
-                        results.push_back(result);
-                        
-                        mCompletedTests++;
-                        for (auto& reporter : mReporters) {
-                            reporter->OnTestCaseComplete(result);
-                        }
-                        
-                        if (mConfig.mStopOnFirstFailure && !result.mSuccess) {
-                            break;
-                        }
+                    if (mConfig.mStopOnFirstFailure && !result.mSuccess) {
+                        break;
                     }
                 }
             }
@@ -161,6 +137,88 @@ namespace nkentseu {
             return mStatistics.mFailedTestCases == 0;
         }
         
+        void TestRunner::RunParallel(const std::vector<std::string>& testNames,
+                                     std::vector<UnitTestDataEntry>& results) {
+            // Pool de workers : chaque worker prend le prochain test libre. Les
+            // résultats sont rangés à l'indice du test et transmis aux reporters
+            // dans l'ordre des tests (même sortie qu'une exécution séquentielle).
+            const size_t count = testNames.size();
+            std::vector<UnitTestDataEntry> slots(count);
+            std::vector<bool> done(count, false);
+            size_t nextToReport = 0;
+            std::mutex reportMutex;
+            std::atomic<bool> stop(false);
+            
+            auto complete = [&](size_t index, UnitTestDataEntry&& result) {
+                std::lock_guard<std::mutex> lock(reportMutex);
+                if (mConfig.mStopOnFirstFailure && !result.mSuccess) {
+                    stop = true;
+                }
+                slots[index] = std::move(result);
+                done[index] = true;
+                mCompletedTests++;
+                while (nextToReport < count && done[nextToReport]) {
+                    for (auto& reporter : mReporters) {
+                        reporter->OnTestCaseComplete(slots[nextToReport]);
+                    }
+                    nextToReport++;
+                }
+            };
+            
+            // Les tests marqués série passent d'abord, seuls, sur ce thread
+            std::vector<size_t> pooled;
+            for (size_t i = 0; i < count; ++i) {
+                if (!IsSerial(testNames[i])) {
+                    pooled.push_back(i);
+                } else if (!stop) {
+                    complete(i, RunSingleTest(testNames[i], mTestFactories.at(testNames[i])));
+                }
+            }
+            
+            size_t workers = mConfig.mThreadCount > 0
+                ? static_cast<size_t>(mConfig.mThreadCount)
+                : static_cast<size_t>(std::thread::hardware_concurrency());
+            if (workers == 0) {
+                workers = 1;
+            }
+            if (workers > pooled.size()) {
+                workers = pooled.size();
+            }
+            
+            std::atomic<size_t> next(0);
+            auto worker = [&]() {
+                while (!stop) {
+                    size_t slot = next++;
+                    if (slot >= pooled.size()) {
+                        break;
+                    }
+                    size_t index = pooled[slot];
+                    complete(index, RunSingleTest(testNames[index], mTestFactories.at(testNames[index])));
+                }
+            };
+            
+            std::vector<std::thread> threads;
+            for (size_t i = 0; i < workers; ++i) {
+                threads.emplace_back(worker);
+            }
+            for (auto& thread : threads) {
+                thread.join();
+            }
+            
+            // Après un arrêt sur échec, seuls les tests exécutés sont rapportés
+            std::lock_guard<std::mutex> lock(reportMutex);
+            for (size_t i = 0; i < count; ++i) {
+                if (done[i]) {
+                    if (i >= nextToReport) {
+                        for (auto& reporter : mReporters) {
+                            reporter->OnTestCaseComplete(slots[i]);
+                        }
+                    }
+                    results.push_back(std::move(slots[i]));
+                }
+            }
+        }
+        
         bool TestRunner::ShouldRunTest(const std::string& testName) const {
             // Vérifier les exclusions
             for (const auto& exclusion : mConfig.mTestExclusions) {
@@ -344,8 +402,11 @@ namespace nkentseu {
                         std::cout << "  --filter=PATTERN        Run tests matching pattern\n";
                         std::cout << "  --exclude=PATTERN       Exclude tests matching pattern\n";
                         std::cout << "  --parallel[=N]          Run tests in parallel (N threads)\n";
+                        std::cout << "  --jobs N, -j N          Same as --parallel=N (0 = all cores, 1 = sequential)\n";
                         std::cout << "  --repeat=N              Repeat tests N times\n";
                         std::cout << "  --report=FILE           Generate report file\n";
+                        std::cout << "  --benchmark_out=FILE    Write benchmark results as JSON\n";
+                        std::cout << "  --benchmark_repetitions=N  Same as --repeat=N\n";
                         return 0;
                     } else if (arg == "--verbose" || arg == "-v") {
                         config.mVerboseOutput = true;
@@ -366,14 +427,24 @@ namespace nkentseu {
                         config.mTestExclusions.push_back(arg.substr(10));
                     } else if (arg == "--parallel") {
                         config.mRunInParallel = true;
-                        config.mThreadCount = std::thread::hardware_concurrency();
+                        config.mThreadCount = 0;
                     } else if (arg.find("--parallel=") == 0) {
                         config.mRunInParallel = true;
                         config.mThreadCount = std::stoi(arg.substr(11));
+                    } else if (arg.find("--jobs=") == 0) {
+                        config.mThreadCount = std::stoi(arg.substr(7));
+                        config.mRunInParallel = config.mThreadCount != 1;
+                    } else if ((arg == "--jobs" || arg == "-j") && i + 1 < argc) {
+                        config.mThreadCount = std::stoi(argv[++i]);
+                        config.mRunInParallel = config.mThreadCount != 1;
                     } else if (arg.find("--repeat=") == 0) {
                         config.mRepeatCount = std::stoi(arg.substr(9));
                     } else if (arg.find("--report=") == 0) {
                         config.mReportFile = arg.substr(9);
+                    } else if (arg.find("--benchmark_out=") == 0) {
+                        config.mBenchmarkOutFile = arg.substr(16);
+                    } else if (arg.find("--benchmark_repetitions=") == 0) {
+                        config.mRepeatCount = std::stoi(arg.substr(24));
                     }
                 }
             }
@@ -388,6 +459,9 @@ namespace nkentseu {
             auto& runner = TestRunner::GetInstance();
             runner.Configure(config);
             runner.SetDefaultReporters();
+            if (!config.mBenchmarkOutFile.empty()) {
+                runner.EnablePerformanceTracking(true);
+            }
             
             bool success = true;
             for (int i = 0; i < config.mRepeatCount; ++i) {
@@ -401,6 +475,10 @@ namespace nkentseu {
                 }
             }
             
+            if (!config.mBenchmarkOutFile.empty() && runner.GetPerformanceReporter()) {
+                runner.GetPerformanceReporter()->GeneratePerformanceReport(config.mBenchmarkOutFile);
+            }
+            
             return success ? 0 : 1;
         }
     }
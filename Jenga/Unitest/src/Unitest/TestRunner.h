@@ -4,6 +4,7 @@
 #include <functional>
 #include <string>
 #include <map>
+#include <set>
 #include <chrono>
 #include <mutex>
 #include <atomic>
@@ -30,7 +31,11 @@ namespace nkentseu {
                 const TestConfiguration& GetConfiguration() const { return mConfig; }
                 
                 void AddTestCase(const std::string& name, 
-                            std::function<std::unique_ptr<TestCase>()> factory);
+                            std::function<std::unique_ptr<TestCase>()> factory,
+                            bool serial = false);
+                // Exclut un test du pool parallèle (état global, fichiers partagés...)
+                void SetSerial(const std::string& name, bool serial = true);
+                bool IsSerial(const std::string& name) const;
                 
                 bool RunAllTests();
                 bool RunTests(const std::vector<std::string>& testNames);
@@ -66,11 +71,14 @@ namespace nkentseu {
                 bool ShouldRunTest(const std::string& testName) const;
                 UnitTestDataEntry RunSingleTest(const std::string& name, 
                                             std::function<std::unique_ptr<TestCase>()>& factory);
+                void RunParallel(const std::vector<std::string>& testNames,
+                                 std::vector<UnitTestDataEntry>& results);
                 
                 void UpdateStatistics(const UnitTestDataEntry& result);
                 void CalculateAverages();
                 
                 std::map<std::string, std::function<std::unique_ptr<TestCase>()>> mTestFactories;
+                std::set<std::string> mSerialTests;
                 std::vector<std::shared_ptr<ITestReporter>> mReporters;
                 std::vector<UnitTestDataEntry> mResults;
                 TestConfiguration mConfig;
@@ -7,6 +7,8 @@ All public methods are PascalCase; private helpers are module‑level functions.
 
 import os
 import shutil
+import threading
+import concurrent.futures
 import hashlib
 import tempfile
 from pathlib import Path
@@ -214,6 +216,104 @@ class FileSystem:
                     raise OSError(f"Directory not empty: {path}. Use recursive=True.")
                 raise
 
+    @staticmethod
+    def RemoveTreeParallel(path: Union[str, Path], jobs: int = 0,
+                           onProgress: Optional[Callable[[int], None]] = None) -> int:
+        """
+        Remove a directory tree using a thread pool (one scandir task per
+        directory, files unlinked by the task that lists them), then the
+        emptied directories deepest first. Much faster than shutil.rmtree on
+        Build/ trees with many objects. Returns the number of files removed;
+        onProgress(count) is called as files go.
+        """
+        root = Path(path)
+        if not root.exists():
+            return 0
+        if root.is_symlink() or not root.is_dir():
+            root.unlink()
+            return 1
+
+        lock = threading.Lock()
+        removed = [0]
+        directories: List[str] = [str(root)]
+
+        def _Unlink(filePath: str) -> bool:
+            try:
+                os.unlink(filePath)
+                return True
+            except FileNotFoundError:
+                return False
+            except PermissionError:
+                try:
+                    os.chmod(filePath, stat.S_IWRITE)
+                    os.unlink(filePath)
+                    return True
+                except OSError:
+                    return False
+            except OSError:
+                return False
+
+        def _Scan(directory: str) -> List[str]:
+            subdirs: List[str] = []
+            count = 0
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        try:
+                            is_dir = entry.is_dir(follow_symlinks=False)
+                        except OSError:
+                            is_dir = False
+                        if is_dir:
+                            subdirs.append(entry.path)
+                        elif _Unlink(entry.path):
+                            count += 1
+            except OSError:
+                return []
+            with lock:
+                removed[0] += count
+                directories.extend(subdirs)
+                total = removed[0]
+            if onProgress is not None and count:
+                onProgress(total)
+            return subdirs
+
+        workers = jobs if jobs and jobs > 0 else min(32, (os.cpu_count() or 1) * 2)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            running = {executor.submit(_Scan, str(root))}
+            while running:
+                done, running = concurrent.futures.wait(
+                    running, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    for subdir in future.result():
+                        running.add(executor.submit(_Scan, subdir))
+
+        # Les répertoires sont vides : du plus profond au plus haut
+        for directory in sorted(directories, key=lambda d: d.count(os.sep), reverse=True):
+            try:
+                os.rmdir(directory)
+            except OSError:
+                pass
+        if root.exists():
+            # Fichiers verrouillés ou apparus pendant la suppression
+            shutil.rmtree(root, onerror=_HandleRemoveReadonly if os.name == 'nt' else None)
+        return removed[0]
+
+    @staticmethod
+    def RemoveFiles(paths: List[Union[str, Path]], jobs: int = 0) -> int:
+        """Remove many files concurrently; returns how many were removed."""
+        def _Remove(p: Union[str, Path]) -> bool:
+            try:
+                FileSystem.RemoveFile(p)
+                return True
+            except OSError:
+                return False
+
+        if not paths:
+            return 0
+        workers = jobs if jobs and jobs > 0 else min(32, (os.cpu_count() or 1) * 2)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            return sum(executor.map(_Remove, paths))
+
     @staticmethod
     def RemoveFile(path: Union[str, Path], ignoreErrors: bool = False) -> None:
         """Remove a single file."""
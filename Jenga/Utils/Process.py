@@ -10,10 +10,24 @@ import shlex
 import os
 import signal
 import sys
+import time
 import shutil
 from typing import List, Optional, Union, Dict, Any
 from pathlib import Path
-from threading import Timer
+from threading import Timer, Thread, local, Event, Lock, get_ident
+
+# Etat par thread : suivi optionnel du pic mémoire (RSS) des sous-processus,
+# activé par le ResourceLimiter autour d'un job de compilation/link.
+_threadState = local()
+
+# Annulation globale (daemon : requête 'cancel', Ctrl+C côté client) :
+# les processus en cours sont tués et les suivants ne sont pas lancés.
+_cancelEvent = Event()
+_activeLock = Lock()
+_activeProcesses: set = set()
+# Processus en cours des threads suivis (thread -> pid), lus par le
+# ResourceLimiter pour connaître la mémoire déjà occupée par un job.
+_trackedPids: Dict[int, int] = {}
 
 # ---------------------------------------------------------------------------
 # Private helpers (module level) – _PascalCase
@@ -35,17 +49,76 @@ def _KillProcess(proc: subprocess.Popen) -> None:
         except AttributeError:
             proc.kill()
 
+def _KillQuietly(proc: subprocess.Popen) -> None:
+    """Kill a process that may already have exited (or has no own group)."""
+    try:
+        _KillProcess(proc)
+    except OSError:
+        try:
+            proc.kill()
+        except OSError:
+            pass
+
+def _StatusToReturnCode(status: int) -> int:
+    """Convert a raw wait status into a Popen-style return code."""
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+def _NormalizeMaxRss(maxrss: int) -> int:
+    """ru_maxrss is in KiB on Linux but in bytes on macOS; return KiB."""
+    if sys.platform == "darwin":
+        return int(maxrss // 1024)
+    return int(maxrss)
+
+def _CommunicateWithRusage(proc: subprocess.Popen, input: Optional[str]):
+    """
+    Equivalent of proc.communicate() that reaps the child with os.wait4()
+    so that its resource usage (peak RSS) is available.
+    Returns (stdout, stderr, peakRssKb).
+    """
+    chunks: Dict[str, List[str]] = {"stdout": [], "stderr": []}
+    readers = []
+    for name in ("stdout", "stderr"):
+        stream = getattr(proc, name)
+        if stream is None:
+            continue
+        reader = Thread(target=lambda s=stream, n=name: chunks[n].append(s.read()), daemon=True)
+        reader.start()
+        readers.append(reader)
+
+    if proc.stdin is not None:
+        try:
+            if input:
+                proc.stdin.write(input)
+            proc.stdin.close()
+        except (BrokenPipeError, OSError):
+            pass
+
+    _, status, usage = os.wait4(proc.pid, 0)
+    for reader in readers:
+        reader.join()
+    for name in ("stdout", "stderr"):
+        stream = getattr(proc, name)
+        if stream is not None:
+            stream.close()
+    proc.returncode = _StatusToReturnCode(status)
+    return "".join(chunks["stdout"]), "".join(chunks["stderr"]), _NormalizeMaxRss(usage.ru_maxrss)
+
 # ---------------------------------------------------------------------------
 # ProcessResult – Dataclass (camelCase fields)
 # ---------------------------------------------------------------------------
 
 class ProcessResult:
     """Result of a command execution."""
-    def __init__(self, returnCode: int, stdout: str, stderr: str, command: str):
+    def __init__(self, returnCode: int, stdout: str, stderr: str, command: str,
+                 peakRssKb: int = 0):
         self.returnCode = returnCode
         self.stdout = stdout
         self.stderr = stderr
         self.command = command
+        # Pic mémoire du processus (KiB), 0 si non mesuré.
+        self.peakRssKb = peakRssKb
 
     @property
     def succeeded(self) -> bool:
@@ -75,6 +148,7 @@ class Process:
         check: bool = False,
         input: Optional[str] = None,
         silent: bool = False,
+        collectRusage: bool = False,
     ) -> ProcessResult:
         """
         Execute a command and return result.
@@ -83,8 +157,18 @@ class Process:
         - check: raise exception if return code != 0.
         - input: string to pass to stdin.
         - silent: if captureOutput=False, suppress output to parent streams.
+        - collectRusage: reap the child with wait4() and report its peak RSS
+          (POSIX only; also enabled by BeginResourceTracking() on this thread).
         """
         cmd_str = _FormatCommand(args)
+        if _cancelEvent.is_set():
+            return ProcessResult(-signal.SIGTERM, "", "Cancelled", cmd_str)
+        recording = getattr(_threadState, "recording", None)
+        if recording is not None:
+            recording.append(([str(a) for a in args] if isinstance(args, list) else args,
+                              str(cwd) if cwd else None))
+            return ProcessResult(0, "", "", cmd_str)
+        collectRusage = (collectRusage or getattr(_threadState, "tracking", False)) and hasattr(os, "wait4")
 
         env_dict = os.environ.copy()
         if env:
@@ -128,14 +212,29 @@ class Process:
         except FileNotFoundError as e:
             raise FileNotFoundError(f"Command not found: {cmd_str}") from e
 
+        with _activeLock:
+            _activeProcesses.add(proc)
+            if collectRusage:
+                _trackedPids[get_ident()] = proc.pid
+        if _cancelEvent.is_set():
+            _KillQuietly(proc)
+
         timer = None
         if timeout is not None:
             timer = Timer(timeout, _KillProcess, [proc])
             timer.daemon = True
             timer.start()
 
+        peak_rss_kb = 0
         try:
-            stdout_data, stderr_data = proc.communicate(input=input, timeout=timeout)
+            if collectRusage:
+                started = time.monotonic()
+                stdout_data, stderr_data, peak_rss_kb = _CommunicateWithRusage(proc, input)
+                if timeout is not None and proc.returncode < 0 and time.monotonic() - started >= timeout:
+                    raise TimeoutError(f"Command timed out after {timeout}s: {cmd_str}")
+                _threadState.peakRssKb = max(getattr(_threadState, "peakRssKb", 0), peak_rss_kb)
+            else:
+                stdout_data, stderr_data = proc.communicate(input=input, timeout=timeout)
         except subprocess.TimeoutExpired:
             _KillProcess(proc)
             proc.wait()
@@ -143,8 +242,13 @@ class Process:
         finally:
             if timer is not None:
                 timer.cancel()
+            with _activeLock:
+                _activeProcesses.discard(proc)
+                if _trackedPids.get(get_ident()) == proc.pid:
+                    del _trackedPids[get_ident()]
 
-        result = ProcessResult(proc.returncode, stdout_data or "", stderr_data or "", cmd_str)
+        result = ProcessResult(proc.returncode, stdout_data or "", stderr_data or "", cmd_str,
+                               peakRssKb=peak_rss_kb)
 
         if check and result.failed:
             raise subprocess.CalledProcessError(
@@ -156,6 +260,66 @@ class Process:
 
         return result
 
+    @staticmethod
+    def BeginResourceTracking() -> None:
+        """
+        Collect peak RSS (via wait4) for every command run by the current
+        thread until EndResourceTracking() is called.
+        """
+        _threadState.tracking = True
+        _threadState.peakRssKb = 0
+
+    @staticmethod
+    def EndResourceTracking() -> int:
+        """Stop tracking on the current thread; return the highest peak RSS seen (KiB)."""
+        peak = int(getattr(_threadState, "peakRssKb", 0))
+        _threadState.tracking = False
+        _threadState.peakRssKb = 0
+        return peak
+
+    @staticmethod
+    def TrackedPid(threadId: int) -> Optional[int]:
+        """Pid of the command run right now by a thread under resource tracking."""
+        with _activeLock:
+            return _trackedPids.get(threadId)
+
+    @staticmethod
+    def BeginRecording() -> None:
+        """
+        Record the commands ExecuteCommand is asked to run on the current
+        thread instead of running them (each one reports success) until
+        EndRecording(). Used to capture the exact command lines of a builder.
+        """
+        _threadState.recording = []
+
+    @staticmethod
+    def EndRecording() -> List[tuple]:
+        """Stop recording on the current thread; return the (args, cwd) recorded."""
+        recorded = getattr(_threadState, "recording", None) or []
+        _threadState.recording = None
+        return recorded
+
+    @staticmethod
+    def CancelAll() -> int:
+        """
+        Kill every command currently run by ExecuteCommand and make further
+        calls fail immediately until ResetCancel(). Returns the number killed.
+        """
+        _cancelEvent.set()
+        with _activeLock:
+            procs = list(_activeProcesses)
+        for proc in procs:
+            _KillQuietly(proc)
+        return len(procs)
+
+    @staticmethod
+    def ResetCancel() -> None:
+        _cancelEvent.clear()
+
+    @staticmethod
+    def IsCancelled() -> bool:
+        return _cancelEvent.is_set()
+
     @staticmethod
     def Run(args: Union[str, List[str]], **kwargs) -> int:
         """
@@ -875,6 +875,9 @@ class BuildLogger:
 class BuildCoordinator:
     """Coordinates the overall build process with beautiful headers and footers."""
 
+    # Projets listés (les plus lents) sous "Link Time" dans le footer
+    LINK_TIMES_SHOWN = 10
+
     def __init__(self, workspace_name: str, config: str, target_os: str, target_arch: str, toolchain: str = ""):
         self.workspace_name = workspace_name
         self.config = config
@@ -887,6 +890,7 @@ class BuildCoordinator:
         self._projects_failed = 0
         self._total_errors = 0
         self._total_warnings = 0
+        self._link_times: List[tuple] = []   # (project, seconds, linker)
 
     def PrintHeader(self, build_order: List[tuple], cache_status: str = None) -> None:
         """Print the global build header with build order visualization.
@@ -965,6 +969,14 @@ class BuildCoordinator:
 
         print(Colored.Colorize("Time:          ", color='cyan') + f" {elapsed_str}")
 
+        if self._link_times:
+            total_link = sum(seconds for _, seconds, _ in self._link_times)
+            print(Colored.Colorize("Link Time:     ", color='cyan') + f" {total_link:.2f}s")
+            slowest = sorted(self._link_times, key=lambda item: item[1], reverse=True)
+            for name, seconds, linker in slowest[:self.LINK_TIMES_SHOWN]:
+                tool = Colored.Colorize(f"({linker})", dim=True) if linker else ""
+                print(f"  {name:<28} {seconds:7.2f}s  {tool}")
+
         if success:
             status_text = Colored.Colorize("✓ SUCCESS", color='green', bold=True)
         else:
@@ -984,3 +996,7 @@ class BuildCoordinator:
         """Accumulate error/warning counts from a project build."""
         self._total_errors += errors
         self._total_warnings += warnings
+
+    def RecordLinkTime(self, project_name: str, seconds: float, linker: str = "") -> None:
+        """Record the link (or archive) time of a project, shown in the footer."""
+        self._link_times.append((project_name, seconds, linker))
@@ -36,7 +36,7 @@ from .Core.Api import (
     libdirs, syslibdirs, removelibdirs, objdir, targetdir, targetname,
     links, removelinks, dependson, removedependson, dependfiles, embedresources,
     defines, removedefines, undefines, optimize, symbols, warnings, runtime,
-    pchheader, pchsource,
+    pchheader, pchsource, unitybuild, unityexclude,
     prebuild, postbuild, prelink, postlink,
     usetoolchain,
     androidsdkpath, androidndkpath, javajdkpath,
@@ -98,7 +98,7 @@ __all__ = [
     'libdirs', 'syslibdirs', 'removelibdirs', 'objdir', 'targetdir', 'targetname',
     'links', 'removelinks', 'dependson', 'removedependson', 'dependfiles', 'embedresources',
     'defines', 'removedefines', 'undefines', 'optimize', 'symbols', 'warnings', 'runtime',
-    'pchheader', 'pchsource',
+    'pchheader', 'pchsource', 'unitybuild', 'unityexclude',
     'prebuild', 'postbuild', 'prelink', 'postlink',
     'usetoolchain',
     'androidsdkpath', 'androidndkpath', 'javajdkpath',
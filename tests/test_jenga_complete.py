@@ -21,6 +21,7 @@ Usage :
   python tests/test_jenga_complete.py
 """
 import sys
+import time
 import os
 import tempfile
 import json
@@ -1231,6 +1232,1571 @@ class TestXboxIntegration:
         ast.parse(example.read_text(encoding="utf-8"), filename=str(example))
 
 
+# ===========================================================================
+# 15. ResourceLimiter (throttling mémoire / charge)
+# ===========================================================================
+
+class TestResourceLimiter:
+    """Limitation adaptative des jobs de compilation et de link."""
+
+    def _limiter(self, **kw):
+        from Jenga.Core.ResourceLimiter import ResourceLimiter
+        kw.setdefault("maxJobs", 4)
+        kw.setdefault("pollInterval", 0.01)
+        return ResourceLimiter(**kw)
+
+    def test_first_job_always_admitted(self):
+        lim = self._limiter(memoryBudgetKb=1)
+        reserved = lim.Acquire("compile", "a.o")
+        assert reserved > 1
+        lim.Release("compile", "a.o", reserved)
+
+    def test_budget_holds_second_job(self):
+        lim = self._limiter(memoryBudgetKb=300 * 1024)
+        reserved = lim.Acquire("compile", "a.o")
+        assert not lim._CanStart("compile", lim.PredictKb("compile", "b.o"))
+        lim.Release("compile", "a.o", reserved)
+        assert lim._CanStart("compile", lim.PredictKb("compile", "b.o"))
+
+    def test_burst_admission_counts_reservations(self, monkeypatch):
+        from Jenga.Core import ResourceLimiter as module
+        lim = self._limiter()
+        predicted = lim.PredictKb("compile", "a.o")
+        monkeypatch.setattr(module, "ReadAvailableMemoryKb",
+                            lambda: module.SYSTEM_RESERVE_KB + predicted * 3 // 2)
+        reserved = lim.Acquire("compile", "a.o")
+        assert not lim._CanStart("compile", predicted)
+        lim.Release("compile", "a.o", reserved)
+
+    def test_resident_jobs_not_counted_twice(self, monkeypatch):
+        import threading
+        from Jenga.Core import ResourceLimiter as module
+        from Jenga.Utils import Process
+        lim = self._limiter()
+        predicted = lim.PredictKb("compile", "a.o")
+        monkeypatch.setattr(module, "ReadAvailableMemoryKb",
+                            lambda: module.SYSTEM_RESERVE_KB + predicted * 3 // 2)
+        reserved = lim.Acquire("compile", "a.o")
+        me = threading.get_ident()
+        monkeypatch.setattr(Process, "TrackedPid", staticmethod(lambda tid: 4242 if tid == me else None))
+        monkeypatch.setattr(module, "ReadProcessRssKb", lambda pid: predicted)
+        assert lim._CanStart("compile", predicted)      # déjà dans MemAvailable
+        monkeypatch.setattr(module, "ReadProcessRssKb", lambda pid: predicted // 4)
+        assert not lim._CanStart("compile", predicted)  # encore en croissance
+        lim.Release("compile", "a.o", reserved)
+
+    @pytest.mark.skipif(not os.path.exists("/proc/self/statm"), reason="needs /proc")
+    def test_running_command_rss_is_visible(self):
+        import threading
+        from Jenga.Core.ResourceLimiter import ReadProcessRssKb
+        from Jenga.Utils import Process
+        seen = []
+        me = threading.get_ident()
+
+        def watch():
+            for _ in range(100):
+                pid = Process.TrackedPid(me)
+                if pid is not None:
+                    seen.append(ReadProcessRssKb(pid))
+                    return
+                time.sleep(0.02)
+        watcher = threading.Thread(target=watch)
+        Process.BeginResourceTracking()
+        try:
+            watcher.start()
+            Process.ExecuteCommand([sys.executable, "-c", "import time; time.sleep(1)"])
+        finally:
+            Process.EndResourceTracking()
+        watcher.join()
+        assert seen and seen[0] > 0
+        assert Process.TrackedPid(me) is None
+
+    def test_link_limit(self):
+        lim = self._limiter(maxLinkJobs=1)
+        lim.memoryBudgetKb = None
+        reserved = lim.Acquire("link", "app")
+        assert not lim._CanStart("link", 1)
+        lim.Release("link", "app", reserved)
+
+    def test_peaks_persisted(self, tmp_path):
+        lim = self._limiter(statsRoot=tmp_path)
+        reserved = lim.Acquire("compile", "big.o")
+        lim.Release("compile", "big.o", reserved, peakRssKb=4321)
+        lim.SaveStats()
+        assert (tmp_path / ".jenga" / "peak_rss.json").is_file()
+        assert self._limiter(statsRoot=tmp_path).PredictKb("compile", "big.o") == 4321
+
+    @pytest.mark.skipif(not hasattr(os, "wait4"), reason="wait4 unavailable")
+    def test_process_reports_peak_rss(self):
+        from Jenga.Utils.Process import Process
+        Process.BeginResourceTracking()
+        result = Process.ExecuteCommand([sys.executable, "-c", "print('ok')"])
+        peak = Process.EndResourceTracking()
+        assert result.returnCode == 0 and result.stdout.strip() == "ok"
+        assert result.peakRssKb > 0 and peak == result.peakRssKb
+
+
+# ===========================================================================
+# 16. Unity (jumbo) build
+# ===========================================================================
+
+class TestUnityBuild:
+    """Regroupement déterministe des sources en TU unity."""
+
+    def _setup(self, names):
+        b = _make_builder(TargetOS.LINUX, TargetArch.X86_64)
+        b.unity = None
+        b._expander = None
+        src_dir = Path(b.workspace.location) / "src"
+        src_dir.mkdir()
+        for n in names:
+            (src_dir / n).write_text("int x_%s;\n" % Path(n).stem, encoding="utf-8")
+        proj = Project(name="U", location=str(src_dir))
+        return b, proj, [str(src_dir / n) for n in sorted(names)]
+
+    def test_dsl_unitybuild(self):
+        _reset()
+        with workspace("W"):
+            with project("P"):
+                unitybuild(batch_size=4)
+                unityexclude(["main.cpp"])
+                prj = Api._currentProject
+        assert prj.unityBuild is True
+        assert prj.unityBatchSize == 4
+        assert prj.unityExcludeFiles == ["main.cpp"]
+
+    def test_batches_are_stable_and_split_by_language(self):
+        names = [f"s{i:02d}.cpp" for i in range(16)] + [f"s{i:02d}.c" for i in range(16)] + ["f.m"]
+        b, proj, sources = self._setup(names)
+        proj.unityBatchSize = 4
+        batches, standalone = b._PlanUnityBatches(proj, sources)
+        members = [m for _, ms in batches for m in ms]
+        assert len(batches) >= 4
+        assert "f.m" in [Path(s).name for s in standalone]
+        assert all(Path(m).suffix == Path(name).suffix for name, ms in batches for m in ms)
+        assert all(2 <= len(ms) <= 8 for _, ms in batches)
+        assert sorted(members + standalone) == sorted(sources)
+        assert b._PlanUnityBatches(proj, list(reversed(sources))) == (batches, standalone)
+        assert len(members) == len(set(members))
+
+    def test_adding_a_file_changes_only_its_batch(self):
+        names = [f"s{i:03d}.cpp" for i in range(0, 120, 2)]
+        b, proj, sources = self._setup(names)
+        proj.unityBatchSize = 4
+        before, _ = b._PlanUnityBatches(proj, sources)
+        src_dir = Path(sources[0]).parent
+        for i in range(1, 120, 10):
+            added = src_dir / f"s{i:03d}.cpp"
+            added.write_text("", encoding="utf-8")
+            after, _ = b._PlanUnityBatches(proj, sources + [str(added)])
+            assert len([batch for batch in before if batch not in after]) <= 1
+
+    def test_opted_out_files_stay_standalone(self):
+        b, proj, sources = self._setup(["a.cpp", "b.cpp", "main.cpp"])
+        proj.unityExcludeFiles = ["main.cpp"]
+        batches, standalone = b._PlanUnityBatches(proj, sources)
+        assert [Path(s).name for s in standalone] == ["main.cpp"]
+        assert len(batches) == 1 and len(batches[0][1]) == 2
+
+    def test_unity_sources_not_rewritten_when_unchanged(self, tmp_path):
+        b, proj, sources = self._setup(["a.cpp", "b.cpp"])
+        to_compile = b._ApplyUnityBuild(proj, sources, tmp_path)
+        assert len(to_compile) == 1
+        unity_file = Path(to_compile[0])
+        assert '#include "' in unity_file.read_text(encoding="utf-8")
+        mtime = unity_file.stat().st_mtime_ns
+        assert b._ApplyUnityBuild(proj, sources, tmp_path) == to_compile
+        assert unity_file.stat().st_mtime_ns == mtime
+
+    def test_cli_override(self):
+        b, proj, _ = self._setup([])
+        assert b._IsUnityEnabled(proj) is False
+        b.unity = True
+        assert b._IsUnityEnabled(proj) is True
+        proj.unityBuild = True
+        b.unity = False
+        assert b._IsUnityEnabled(proj) is False
+
+
+# ===========================================================================
+# 17. C++20 module scanning (P1689 / graphe d'imports)
+# ===========================================================================
+
+class TestModuleScanner:
+    """Scan des modules, graphe d'imports et cache de scan."""
+
+    def _write(self, tmp_path, name, text):
+        path = tmp_path / name
+        path.write_text(text, encoding="utf-8")
+        return str(path)
+
+    def test_parse_p1689(self):
+        from Jenga.Core.ModuleScanner import ParseP1689
+        data = {"version": 1, "revision": 0, "rules": [{
+            "primary-output": "b.o",
+            "provides": [{"logical-name": "b", "is-interface": True}],
+            "requires": [{"logical-name": "a"}, {"logical-name": "std"}],
+        }]}
+        assert ParseP1689(data) == (["b"], ["a", "std"])
+
+    def test_lexical_scan_partitions_and_header_units(self, tmp_path):
+        from Jenga.Core.ModuleScanner import LexicalScan
+        src = self._write(tmp_path, "m.cppm",
+                          "module;\n#include <vector>\nexport module app.core;\n"
+                          "// import commented;\nimport :detail;\nexport import util;\n"
+                          "import <string>;\n")
+        assert LexicalScan(src) == (["app.core"], ["app.core:detail", "util"])
+
+    def test_graph_order_and_cycle(self):
+        from Jenga.Core.ModuleScanner import (ModuleScanResult, BuildModuleGraph,
+                                              TopologicalOrder)
+        scan = {
+            "c.cppm": ModuleScanResult("c.cppm", ["c"], ["a", "b"]),
+            "b.cppm": ModuleScanResult("b.cppm", ["b"], ["a", "std"]),
+            "a.cppm": ModuleScanResult("a.cppm", ["a"], []),
+        }
+        deps, unresolved = BuildModuleGraph(scan)
+        assert TopologicalOrder(deps) == ["a.cppm", "b.cppm", "c.cppm"]
+        assert unresolved["b.cppm"] == {"std"}
+        scan["a.cppm"].requires = ["c"]
+        with pytest.raises(ValueError):
+            TopologicalOrder(BuildModuleGraph(scan)[0])
+
+    def test_scan_cache_roundtrip(self, tmp_path):
+        from Jenga.Core.ModuleScanner import ModuleScanner
+        src = self._write(tmp_path, "a.cppm", "export module a;\n")
+        tc = Toolchain(name="none", compilerFamily=CompilerFamily.GCC, cxxPath="")
+        cache = tmp_path / "scan.json"
+        scanner = ModuleScanner(tc, [], cacheFile=cache, jobs=2)
+        assert scanner.Scan([src])[src].provides == ["a"]
+        scanner.SaveCache()
+        again = ModuleScanner(tc, [], cacheFile=cache)
+        again.ScanFile = None  # a cache hit must not rescan
+        assert again.Scan([src])[src].provides == ["a"]
+
+
+# ===========================================================================
+# 18. jenga analyze includes (IncludeAnalyzer)
+# ===========================================================================
+
+class TestIncludeAnalyzer:
+    """Classement des headers à partir des .d et des traces -ftime-trace."""
+
+    def _tree(self, tmp_path):
+        inc = tmp_path / "include"
+        inc.mkdir()
+        (inc / "a.h").write_text('#pragma once\n#include "b.h"\n', encoding="utf-8")
+        (inc / "b.h").write_text('#pragma once\n#include "c.h"\n', encoding="utf-8")
+        (inc / "c.h").write_text("#pragma once\n", encoding="utf-8")
+        return inc
+
+    def test_counts_and_fanout(self, tmp_path):
+        from Jenga.Core.IncludeAnalysis import IncludeAnalyzer
+        inc = self._tree(tmp_path)
+        an = IncludeAnalyzer()
+        an.AddUnit("x.o", [tmp_path / "x.cpp", inc / "a.h", inc / "b.h", inc / "c.h"])
+        an.AddUnit("y.o", [tmp_path / "y.cpp", inc / "c.h"])
+        report = an.Analyze(sortBy="tus")
+        rows = {Path(r["header"]).name: r for r in report["headers"]}
+        assert report["headers"][0]["header"].endswith("c.h")
+        assert rows["c.h"]["tus"] == 2
+        assert rows["a.h"]["fanout"] == 2 and rows["c.h"]["fanout"] == 0
+        assert rows["a.h"]["rebuildMs"] is None
+
+    def test_time_trace_costs(self, tmp_path):
+        from Jenga.Core.IncludeAnalysis import IncludeAnalyzer
+        inc = self._tree(tmp_path)
+        an = IncludeAnalyzer()
+        an.AddUnit("x.o", [tmp_path / "x.cpp", inc / "a.h"])
+        an.AddUnit("y.o", [tmp_path / "y.cpp", inc / "c.h"])
+        an.AddTimeTrace("x.o", {"traceEvents": [
+            {"name": "Source", "dur": 4000, "args": {"detail": str(inc / "a.h")}},
+            {"name": "Total ExecuteCompiler", "dur": 90000},
+        ]})
+        an.AddTimeTrace("y.o", {"traceEvents": [{"name": "Total ExecuteCompiler", "dur": 10000}]})
+        report = an.Analyze()
+        assert report["headers"][0]["header"].endswith("a.h")
+        assert report["headers"][0]["parseMs"] == 4.0
+        assert report["headers"][0]["rebuildMs"] == 90.0
+
+    def test_instantiation_attributed_to_defining_header(self, tmp_path):
+        from Jenga.Core.IncludeAnalysis import IncludeAnalyzer
+        inc = self._tree(tmp_path)
+        an = IncludeAnalyzer()
+        an.AddUnit("x.o", [tmp_path / "x.cpp", inc / "a.h", inc / "c.h"])
+        an.AddTimeTrace("x.o", {"traceEvents": [
+            # vector<T> (a.h) instancie Node<T> (c.h) : seul le temps propre compte
+            {"name": "InstantiateClass", "ts": 100, "dur": 5000, "tid": 1,
+             "args": {"detail": "vector<int>", "file": f"{inc / 'a.h'}:12"}},
+            {"name": "InstantiateClass", "ts": 200, "dur": 3000, "tid": 1,
+             "args": {"detail": "Node<int>", "file": str(inc / "c.h"), "line": 4}},
+            {"name": "InstantiateFunction", "ts": 6000, "dur": 1000, "tid": 1,
+             "args": {"detail": "f<int>"}},
+        ]})
+        rows = {Path(r["header"]).name: r for r in an.Analyze(sortBy="instantiate")["headers"]}
+        assert rows["a.h"]["instantiateMs"] == 2.0
+        assert rows["c.h"]["instantiateMs"] == 3.0
+
+    def test_unity_sources_are_not_headers(self, tmp_path):
+        from Jenga.Core.IncludeAnalysis import IncludeAnalyzer
+        an = IncludeAnalyzer()
+        an.AddUnit("unity_0.o", [tmp_path / "unity_0.cpp", tmp_path / "a.cpp", tmp_path / "a.h"])
+        assert [Path(r["header"]).name for r in an.Analyze()["headers"]] == ["a.h"]
+
+    def test_command_registered(self):
+        from Jenga.Commands import COMMANDS
+        assert "analyze" in COMMANDS
+
+
+# ===========================================================================
+# 19. Daemon build graph cache (BuildGraphCache)
+# ===========================================================================
+
+class TestBuildGraphCache:
+    """Graphe de build résident du daemon, invalidé par les événements du watcher."""
+
+    def test_mtime_cached_until_event(self, tmp_path):
+        from Jenga.Core.BuildGraph import BuildGraphCache
+        src = tmp_path / "a.cpp"
+        src.write_text("int a;")
+        cache = BuildGraphCache()
+        first = cache.MTime(src)
+        os.utime(src, (first + 10, first + 10))
+        assert cache.MTime(src) == first
+        cache.OnFileEvent("modified", str(src))
+        assert cache.MTime(src) == first + 10
+        assert cache.MTime(tmp_path / "missing.h") is None
+
+    def test_mtime_invalidated_through_unresolved_paths(self, tmp_path):
+        from Jenga.Core.BuildGraph import BuildGraphCache
+        (tmp_path / "inc").mkdir()
+        header = tmp_path / "inc" / "a.h"
+        header.write_text("")
+        (tmp_path / "link").symlink_to(tmp_path / "inc")
+        dotted = tmp_path / "inc" / ".." / "inc" / "a.h"
+        linked = tmp_path / "link" / "a.h"
+        cache = BuildGraphCache()
+        first = cache.MTime(dotted)
+        assert cache.MTime(linked) == first
+        os.utime(header, (first + 10, first + 10))
+        cache.OnFileEvent("modified", str(header))
+        assert cache.MTime(dotted) == first + 10
+        assert cache.MTime(linked) == first + 10
+
+    def test_unwatched_paths_are_never_cached(self, tmp_path):
+        from Jenga.Core.BuildGraph import BuildGraphCache
+        header = tmp_path / "sdk.h"
+        header.write_text("")
+        cache = BuildGraphCache(covers=lambda path: False)
+        first = cache.MTime(header)
+        os.utime(header, (first + 10, first + 10))
+        assert cache.MTime(header) == first + 10
+        assert cache.Stats()["files"] == 0
+
+    def test_dependencies_follow_depfile_mtime(self, tmp_path):
+        from Jenga.Core.BuildGraph import BuildGraphCache
+        dep = tmp_path / "a.o.d"
+        dep.write_text("a.o: a.cpp")
+        cache = BuildGraphCache()
+        reads = []
+        read = lambda: reads.append(1) or [Path("a.cpp")]
+        cache.Dependencies(dep, read)
+        cache.Dependencies(dep, read)
+        assert len(reads) == 1
+        st = dep.stat()
+        os.utime(dep, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        cache.Dependencies(dep, read)
+        assert len(reads) == 2
+
+    def test_sources_dropped_on_creation_only(self, tmp_path):
+        from Jenga.Core.BuildGraph import BuildGraphCache
+        cache = BuildGraphCache()
+        calls = []
+        compute = lambda: calls.append(1) or ["a.cpp"]
+        cache.Sources(("P", "ctx"), compute)
+        cache.OnFileEvent("modified", str(tmp_path / "a.cpp"))
+        cache.Sources(("P", "ctx"), compute)
+        assert len(calls) == 1
+        cache.OnFileEvent("created", str(tmp_path / "b.cpp"))
+        cache.Sources(("P", "ctx"), compute)
+        assert len(calls) == 2
+
+    def test_state_reset_clears_context_tracking(self):
+        from Jenga.Core.State import BuildState
+        state = BuildState(workspace=None)
+        state._compiledProjectsPerContext.add("P|ctx")
+        state._projectOutputs["P"] = ["out"]
+        state.Reset()
+        assert not state._compiledProjectsPerContext
+        assert not state._projectOutputs
+
+
+# ===========================================================================
+# 20. Daemon RPC à trames (streaming, annulation)
+# ===========================================================================
+
+class TestDaemonProtocol:
+    """Trames JSON délimitées, sortie diffusée et annulation des processus."""
+
+    def test_frames_roundtrip_over_split_chunks(self):
+        import socket
+        from Jenga.Core.Daemon import _FrameReader, _SendFrame
+        a, b = socket.socketpair()
+        try:
+            _SendFrame(a, {"command": "ping", "args": {"text": "x\ny"}})
+            _SendFrame(a, {"command": "status"})
+            a.shutdown(socket.SHUT_WR)
+            reader = _FrameReader(b)
+            assert reader.ReadFrame()["args"]["text"] == "x\ny"
+            assert reader.ReadFrame()["command"] == "status"
+            assert reader.ReadFrame() is None
+        finally:
+            a.close()
+            b.close()
+
+    def test_output_router_sends_complete_lines(self):
+        import io
+        from Jenga.Core.Daemon import _OutputRouter
+        original = io.StringIO()
+        router = _OutputRouter(original, "stdout")
+        frames = []
+        router.SetSink(lambda stream, data: frames.append((stream, data)))
+        router.write("Compiling ")
+        router.write("a.cpp\nLinking")
+        router.SetSink(None)
+        router.write("daemon log\n")
+        assert frames == [("stdout", "Compiling a.cpp\n"), ("stdout", "Linking")]
+        assert original.getvalue() == "daemon log\n"
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="uses POSIX sleep")
+    def test_cancel_kills_running_command(self):
+        import threading
+        from Jenga.Utils import Process
+        results = []
+        worker = threading.Thread(target=lambda: results.append(Process.ExecuteCommand(["sleep", "30"])))
+        started = time.time()
+        worker.start()
+        try:
+            time.sleep(0.3)
+            assert Process.CancelAll() == 1
+            worker.join(timeout=5)
+            assert results and results[0].failed
+            assert time.time() - started < 5
+            assert Process.ExecuteCommand(["true"]).stderr == "Cancelled"
+        finally:
+            Process.ResetCancel()
+        assert Process.ExecuteCommand(["true"]).succeeded
+
+    def test_cancel_targets_only_active_request(self, tmp_path):
+        from Jenga.Core.Daemon import Daemon
+        daemon = Daemon(tmp_path, tmp_path / "ws.jenga")
+        daemon._activeRequest = "build-1"
+        assert daemon._Cancel("other")["cancelled"] is False
+        daemon._activeRequest = None
+        assert daemon._Cancel(None)["cancelled"] is False
+
+    def test_cancel_while_queued_prevents_start(self, tmp_path):
+        import threading
+        from Jenga.Core.Daemon import Daemon
+        daemon = Daemon(tmp_path, tmp_path / "ws.jenga")
+        started = []
+        daemon._Build = lambda args: started.append(1) or {'status': 'ok'}
+        responses = []
+        with daemon._buildLock:
+            worker = threading.Thread(target=lambda: responses.append(
+                daemon._ExecuteCommand({'command': 'build', 'id': 'build-2'})))
+            worker.start()
+            while 'build-2' not in daemon._queuedRequests:
+                time.sleep(0.01)
+            assert daemon._Cancel("build-2")["cancelled"] is True
+        worker.join(timeout=5)
+        assert not started
+        assert responses[0]['cancelled'] is True
+        assert 'build-2' not in daemon._cancelled
+
+
+# ===========================================================================
+# 21. jenga watch : rebuild ciblé avec anti-rebond (WatchPipeline)
+# ===========================================================================
+
+class TestWatchPipeline:
+    """Chemins modifiés -> projets affectés -> un seul build regroupé."""
+
+    def _builder(self, tmp_path):
+        from types import SimpleNamespace
+        (tmp_path / "lib").mkdir()
+        (tmp_path / "app").mkdir()
+        lib_src, app_src = tmp_path / "lib" / "lib.cpp", tmp_path / "app" / "main.cpp"
+        header = tmp_path / "lib" / "lib.h"
+        for f in (lib_src, app_src, header):
+            f.write_text("")
+        obj = tmp_path / "Build" / "Obj"
+        (obj / "App").mkdir(parents=True)
+        (obj / "App" / "main.o.d").write_text("")
+        projects = {
+            "Lib": SimpleNamespace(name="Lib", dependsOn=[]),
+            "App": SimpleNamespace(name="App", dependsOn=["Lib"]),
+            "Tool": SimpleNamespace(name="Tool", dependsOn=[]),
+        }
+        sources = {"Lib": [str(lib_src)], "App": [str(app_src)], "Tool": []}
+        builder = SimpleNamespace(
+            workspace=SimpleNamespace(projects=projects, location=str(tmp_path)),
+            _ApplyProjectFilters=lambda p: None,
+            _CollectSourceFiles=lambda p: list(sources[p.name]),
+            GetObjectDir=lambda p: obj / p.name,
+            GetTargetDir=lambda p: tmp_path / "Build" / "Bin" / p.name,
+            _ParseDependencyFile=lambda d, p: [app_src, header],
+        )
+        return builder, lib_src, app_src, header
+
+    def test_affected_projects_include_dependents_and_header_users(self, tmp_path):
+        from Jenga.Core.WatchPipeline import WatchPipeline
+        builder, lib_src, app_src, header = self._builder(tmp_path)
+        pipeline = WatchPipeline(lambda: builder)
+        pipeline._RefreshIndex()
+        assert pipeline.ComputeAffected({str(lib_src): "modified"}) == {"Lib", "App"}
+        assert pipeline.ComputeAffected({str(app_src): "modified"}) == {"App"}
+        assert pipeline.ComputeAffected({str(header): "modified"}) == {"App"}
+        assert pipeline.ComputeAffected({str(tmp_path / "README.md"): "modified"}) == set()
+        assert pipeline.ComputeAffected({str(tmp_path / "ws.jenga"): "modified"}) is None
+
+    def test_event_queue_overflow_gives_full_rebuild(self, tmp_path):
+        from Jenga.Core.WatchPipeline import WatchPipeline
+        builder, *_ = self._builder(tmp_path)
+        pipeline = WatchPipeline(lambda: builder)
+        pipeline._RefreshIndex()
+        assert pipeline.ComputeAffected({str(tmp_path): "overflow"}) is None
+
+    def test_index_never_filters_live_projects(self, tmp_path):
+        from Jenga.Core.WatchPipeline import WatchPipeline
+        builder, lib_src, *_ = self._builder(tmp_path)
+        builder._ApplyProjectFilters = lambda p: setattr(p, "filtered", True)
+        pipeline = WatchPipeline(lambda: builder)
+        pipeline._RefreshIndex()
+        assert pipeline.ComputeAffected({str(lib_src): "created"}) == {"Lib", "App"}
+        assert not any(hasattr(p, "filtered") for p in builder.workspace.projects.values())
+
+    def test_build_outputs_are_ignored(self, tmp_path):
+        from Jenga.Core.WatchPipeline import WatchPipeline
+        builder, *_ = self._builder(tmp_path)
+        pipeline = WatchPipeline(lambda: builder)
+        pipeline._RefreshIndex()
+        assert pipeline.IsIgnored(str(tmp_path.resolve() / "Build" / "Obj" / "App" / "main.o"))
+        assert not pipeline.IsIgnored(str(tmp_path.resolve() / "app" / "main.cpp"))
+
+    def test_burst_of_events_gives_one_build(self, tmp_path):
+        import threading
+        from Jenga.Core.WatchPipeline import WatchPipeline
+        builder, lib_src, app_src, _ = self._builder(tmp_path)
+        builds = []
+        done = threading.Event()
+        pipeline = WatchPipeline(lambda: builder,
+                                 runBuild=lambda projects, _id: builds.append(projects) or done.set(),
+                                 debounce=0.1)
+        pipeline.Start()
+        try:
+            for _ in range(10):
+                pipeline.OnFileEvent("modified", str(app_src))
+            pipeline.OnFileEvent("modified", str(lib_src))
+            assert done.wait(3)
+            time.sleep(0.3)
+        finally:
+            pipeline.Stop()
+        assert builds == [{"Lib", "App"}]
+
+    def test_polling_watcher_starts_from_baseline(self, tmp_path):
+        from Jenga.Core.Watcher import FileWatcher
+        (tmp_path / "a.cpp").write_text("")
+        events = []
+        watcher = FileWatcher(use_polling=True, polling_interval=0.05)
+        watcher.AddWatch(tmp_path)
+        watcher.AddCallback(lambda kind, path: events.append((kind, Path(path).name)))
+        watcher.Start()
+        try:
+            time.sleep(0.15)
+            assert events == []
+            (tmp_path / "b.cpp").write_text("")
+            time.sleep(0.3)
+        finally:
+            watcher.Stop()
+        assert ("created", "b.cpp") in events
+
+
+# ===========================================================================
+# 22. FileWatcher : backend inotify natif et polling incrémental
+# ===========================================================================
+
+class TestFileWatcherBackends:
+    """inotify (ctypes) sous Linux, polling fondé sur les mtimes de répertoires."""
+
+    def _collect(self, watcher):
+        events = []
+        watcher.AddCallback(lambda kind, path: events.append((kind, Path(path).name)))
+        return events
+
+    def test_coalesce_rules(self):
+        from Jenga.Core.Inotify import CoalesceEvent
+        pending = {}
+        CoalesceEvent(pending, "a", "created")
+        CoalesceEvent(pending, "a", "modified")
+        CoalesceEvent(pending, "b", "created")
+        CoalesceEvent(pending, "b", "deleted")
+        CoalesceEvent(pending, "c", "deleted")
+        CoalesceEvent(pending, "c", "created")
+        assert pending == {"a": "created", "c": "modified"}
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+    def test_inotify_backend_tracks_new_directories(self, tmp_path):
+        from Jenga.Core.Watcher import FileWatcher
+        watcher = FileWatcher()
+        (tmp_path / "src").mkdir()
+        watcher.AddWatch(tmp_path)
+        events = self._collect(watcher)
+        watcher.Start()
+        try:
+            assert watcher.backend == "inotify"
+            (tmp_path / "src" / "a.cpp").write_text("1")
+            (tmp_path / "src" / "sub").mkdir()
+            time.sleep(0.3)
+            (tmp_path / "src" / "sub" / "b.cpp").write_text("2")
+            time.sleep(0.3)
+        finally:
+            watcher.Stop()
+        assert ("created", "a.cpp") in events
+        assert ("created", "b.cpp") in events
+        assert ("modified", "a.cpp") not in events   # coalescé avec la création
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+    def test_sync_waits_for_pending_events(self, tmp_path):
+        from Jenga.Core.Watcher import FileWatcher
+        (tmp_path / "src").mkdir()
+        (tmp_path / ".hidden").mkdir()
+        (tmp_path / "Build").mkdir()
+        watcher = FileWatcher()
+        watcher.AddIgnorePattern(str(tmp_path.resolve() / "Build"))
+        watcher.AddWatch(tmp_path)
+        events = self._collect(watcher)
+        watcher.Start()
+        try:
+            assert watcher.CanSync()
+            watcher._inotify.coalesceDelay = 0.3
+            (tmp_path / "src" / "a.cpp").write_text("1")
+            assert watcher.Sync()
+            assert ("created", "a.cpp") in events
+            root = tmp_path.resolve()
+            assert watcher.Covers(str(root / "src" / "a.cpp"))
+            assert not watcher.Covers(str(root / ".hidden" / "a.h"))
+            assert not watcher.Covers(str(root / "Build" / "a.o.d"))
+            assert not watcher.Covers(str(root.parent / "shared" / "a.h"))
+        finally:
+            watcher.Stop()
+        assert not watcher.CanSync()
+
+    def test_polling_detects_changes_and_skips_ignored_trees(self, tmp_path, monkeypatch):
+        import os as _os
+        from Jenga.Core.Watcher import FileWatcher
+        (tmp_path / "src").mkdir()
+        (tmp_path / "Build" / "Obj").mkdir(parents=True)
+        src = tmp_path / "src" / "a.cpp"
+        src.write_text("1")
+        watcher = FileWatcher(use_polling=True)
+        watcher.AddIgnorePattern(str(tmp_path.resolve() / "Build"))
+        watcher.AddWatch(tmp_path)
+        events = self._collect(watcher)
+        scanned = []
+        real_scandir = _os.scandir
+        monkeypatch.setattr(_os, "scandir", lambda p: scanned.append(str(p)) or real_scandir(p))
+        watcher._StartPolling = lambda: None       # passages pilotés par le test
+        watcher.Start()
+        watcher._snapshots, watcher._dirStates = {}, {}
+        root = tmp_path.resolve()
+        watcher._PollDirectory(root)
+        assert not any("Build" in p for p in scanned)
+        scanned.clear()
+        st = src.stat()
+        _os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        watcher._PollDirectory(root)
+        assert scanned == []                       # aucun répertoire relisté
+        (tmp_path / "src" / "b.cpp").write_text("2")
+        watcher._PollDirectory(root)
+        assert events == [("modified", "a.cpp"), ("created", "b.cpp")]
+
+
+# ===========================================================================
+# 23. jenga clean : suppression parallèle et --stale
+# ===========================================================================
+
+class TestCleanCommand:
+    """Suppression parallèle des arborescences et garbage collection des artefacts périmés."""
+
+    def test_remove_tree_parallel(self, tmp_path):
+        from Jenga.Utils.FileSystem import FileSystem
+        root = tmp_path / "Build"
+        for i in range(5):
+            sub = root / f"p{i}" / "deep"
+            sub.mkdir(parents=True)
+            for j in range(20):
+                (sub / f"f{j}.o").write_text("x")
+        progress = []
+        assert FileSystem.RemoveTreeParallel(root, jobs=4, onProgress=progress.append) == 100
+        assert not root.exists()
+        assert progress and max(progress) == 100
+        assert FileSystem.RemoveTreeParallel(root) == 0
+
+    def test_find_stale_artifacts(self, tmp_path):
+        from Jenga.Commands.Clean import CleanCommand, _ExpectedArtifacts
+        obj = tmp_path / "obj"
+        (obj / "unity").mkdir(parents=True)
+        (obj / "modules").mkdir()
+        for name in ("main.o", "main.o.d", "main.o.jenga_sig", "old.o", "old.o.d",
+                     "old.o.jenga_sig", "old.json", "App.pch", "Gone.pch", "notes.txt",
+                     "unity/unity_ab_0.cpp", "unity/unity_cd_0.cpp", "unity_ab_0.o",
+                     "modules/math.pcm", "modules/math.o", "modules/dead.pcm",
+                     "modules/scan_cache.json"):
+            (obj / name).write_text("x")
+        artifacts = _ExpectedArtifacts(objects={"main.o", "unity_ab_0.o", "math.o"},
+                                       modules={"math"}, unity={"unity_ab_0.cpp"}, pch={"App"})
+        stale = sorted(str(Path(p).relative_to(obj).as_posix())
+                       for p in CleanCommand.FindStaleArtifacts(obj, artifacts))
+        assert stale == ["Gone.pch", "modules/dead.pcm", "old.json", "old.o", "old.o.d",
+                         "old.o.jenga_sig", "unity/unity_cd_0.cpp"]
+
+    def test_project_selection_keeps_shared_objdir_objects(self, tmp_path):
+        from types import SimpleNamespace
+        from Jenga.Commands.Clean import CleanCommand
+        obj = tmp_path / "obj"
+        obj.mkdir()
+        for name in ("a.o", "b.o", "old.o"):
+            (obj / name).write_text("x")
+        sources = {"A": [str(tmp_path / "a.cpp")], "B": [str(tmp_path / "b.cpp")]}
+        projects = {name: SimpleNamespace(name=name) for name in sources}
+        builder = SimpleNamespace(
+            GetObjectExtension=lambda: ".o",
+            _ApplyProjectFilters=lambda p: None,
+            GetObjectDir=lambda p: obj,
+            _CollectSourceFiles=lambda p: sources[p.name],
+            IsModuleFile=lambda s: False,
+            _PlanUnityBatches=lambda p, srcs: ([], list(srcs)))
+        workspace = SimpleNamespace(projects=projects)
+        stale = CleanCommand.CollectStaleArtifacts(builder, workspace, [projects["A"]])
+        assert stale == {os.path.join(str(obj), "old.o")}
+
+    def test_find_orphan_directories(self, tmp_path):
+        from types import SimpleNamespace
+        from Jenga.Commands.Clean import CleanCommand
+        ctx = tmp_path / "Build" / "Obj" / "Debug"
+        for name in ("App", "Old"):
+            (ctx / name).mkdir(parents=True)
+        project = SimpleNamespace(name="App", targetName="")
+        workspace = SimpleNamespace(projects={"App": project})
+        builder = SimpleNamespace(
+            _GetProjectBaseDir=lambda p: tmp_path.resolve() / "app",
+            _ApplyProjectFilters=lambda p: None,
+            GetObjectDir=lambda p: ctx.resolve() / "App",
+            GetTargetDir=lambda p: tmp_path.resolve() / "app" / "bin")
+        orphans = CleanCommand.FindOrphanDirectories(builder, workspace, tmp_path)
+        assert orphans == [str(ctx.resolve() / "Old")]
+
+
+# ===========================================================================
+# 24. jenga test : exécution parallèle, timeout et sharding
+# ===========================================================================
+
+class TestTestCommandRunner:
+    """Répartition des suites (--shard) et exécution avec timeout."""
+
+    def test_parse_shard(self):
+        from Jenga.Commands.Test import TestCommand
+        assert TestCommand.ParseShard("2/4") == (2, 4)
+        for bad in ("0/4", "5/4", "1/0", "a/b", "3"):
+            with pytest.raises(ValueError):
+                TestCommand.ParseShard(bad)
+
+    def test_shards_partition_projects(self):
+        from Jenga.Commands.Test import TestCommand
+        names = ["C_Tests", "A_Tests", "E_Tests", "B_Tests", "D_Tests"]
+        shards = [TestCommand.SelectShard(names, i, 3) for i in (1, 2, 3)]
+        assert sorted(sum(shards, [])) == sorted(names)
+        assert shards[0] == ["A_Tests", "D_Tests"]
+        assert TestCommand.SelectShard(list(reversed(names)), 1, 3) == shards[0]
+
+    def test_run_executable_pass_fail_timeout(self):
+        from Jenga.Commands.Test import TestCommand
+        ok = TestCommand.RunTestExecutable("ok", [sys.executable, "-c", "print('fine')"], None)
+        assert ok["result"] == "pass" and "fine" in ok["output"]
+        failed = TestCommand.RunTestExecutable(
+            "ko", [sys.executable, "-c", "import sys; print('boom'); sys.exit(3)"], None)
+        assert failed["result"] == "fail" and failed["message"].startswith("Exit code 3")
+        assert "boom" in failed["message"]
+        slow = TestCommand.RunTestExecutable("slow", [sys.executable, "-c", "import time; time.sleep(5)"], 0.5)
+        assert slow["result"] == "fail" and slow["timedOut"] and slow["duration"] < 4
+
+
+# ===========================================================================
+# 25. jenga test : résultats de tests en cache
+# ===========================================================================
+
+class TestTestResultCache:
+    """Empreinte des entrées d'une suite et réutilisation des succès."""
+
+    def test_fingerprint_tracks_inputs(self, tmp_path):
+        from Jenga.Core.TestCache import TestResultCache
+        exe, data = tmp_path / "suite.bin", tmp_path / "data.txt"
+        exe.write_bytes(b"binary-v1")
+        data.write_text("input")
+        cache = TestResultCache(tmp_path)
+        base = cache.Fingerprint([exe, data], ["--fast"], ["Debug"])
+        assert cache.Fingerprint([data, exe], ["--fast"], ["Debug"]) == base
+        assert cache.Fingerprint([exe, data], ["--slow"], ["Debug"]) != base
+        assert cache.Fingerprint([exe, data], ["--fast"], ["Release"]) != base
+        data.write_text("changed input")
+        assert cache.Fingerprint([exe, data], ["--fast"], ["Debug"]) != base
+        exe.unlink()
+        assert cache.Fingerprint([exe, data], ["--fast"], ["Debug"]) != base
+
+    def test_lookup_record_and_persistence(self, tmp_path):
+        from Jenga.Core.TestCache import TestResultCache
+        cache = TestResultCache(tmp_path)
+        assert cache.Lookup("Debug|App_Tests", "fp1") is None
+        cache.Record("Debug|App_Tests", "fp1", 1.5)
+        cache.Save()
+        reloaded = TestResultCache(tmp_path)
+        assert reloaded.Lookup("Debug|App_Tests", "fp1")["duration"] == 1.5
+        assert reloaded.Lookup("Debug|App_Tests", "fp2") is None
+        reloaded.Forget("Debug|App_Tests")
+        assert reloaded.Lookup("Debug|App_Tests", "fp1") is None
+
+    def test_unknown_runtime_dependencies_disable_cache(self, tmp_path):
+        from types import SimpleNamespace
+        from Jenga.Commands.Test import TestCommand
+
+        def fail(project, exe):
+            raise RuntimeError("toolchain missing")
+        builder = SimpleNamespace(GetRuntimeDependencies=fail)
+        project = SimpleNamespace(name="App_Tests", dependFiles=[])
+        assert TestCommand.CollectTestInputs(builder, project, tmp_path / "suite.bin") is None
+
+
+# ===========================================================================
+# 26. jenga bench : historique, baseline et régressions
+# ===========================================================================
+
+class TestBenchHistory:
+    """Lecture des résultats, comparaison statistique et historique local."""
+
+    def test_load_unitest_and_google_benchmark_reports(self, tmp_path):
+        from Jenga.Core.BenchHistory import BenchHistory
+        unitest = tmp_path / "unitest.json"
+        unitest.write_text(json.dumps({"performance_report": {"benchmarks": [
+            {"name": "Sort", "mean_time_ms": 2.0, "samples_ms": [1.0, 2.0, 3.0]}]}}))
+        stats = BenchHistory.LoadResults(unitest)["Sort"]
+        assert stats.mean == 2.0 and stats.samples == 3 and stats.minimum == 1.0
+        google = tmp_path / "google.json"
+        google.write_text(json.dumps({"benchmarks": [
+            {"name": "BM_Hash", "run_name": "BM_Hash", "run_type": "iteration", "real_time": 1000, "time_unit": "ns"},
+            {"name": "BM_Hash", "run_name": "BM_Hash", "run_type": "iteration", "real_time": 3000, "time_unit": "ns"},
+            {"name": "BM_Hash_mean", "run_name": "BM_Hash", "run_type": "aggregate", "real_time": 2000, "time_unit": "ns"}]}))
+        stats = BenchHistory.LoadResults(google)["BM_Hash"]
+        assert stats.samples == 2 and abs(stats.mean - 0.002) < 1e-12
+
+    def test_regression_needs_significance_and_threshold(self):
+        from Jenga.Core.BenchHistory import BenchHistory, BenchStats
+        base = BenchStats.FromSamples("b", [1.0 + 0.01 * (i % 5) for i in range(50)])
+        slow = BenchStats.FromSamples("b", [1.2 + 0.01 * (i % 5) for i in range(50)])
+        noisy = BenchStats.FromSamples("b", [1.0 + 0.5 * (i % 2) for i in range(50)])
+        assert BenchHistory.CompareStats(slow, base, 5.0).regression
+        assert not BenchHistory.CompareStats(slow, base, 30.0).regression
+        assert not BenchHistory.CompareStats(base, slow, 5.0).regression
+        few_base = BenchStats.FromSamples("b", [1.0, 1.1, 1.2])
+        few_same = BenchStats.FromSamples("b", [1.05, 1.1, 1.15])
+        assert not BenchHistory.CompareStats(few_same, few_base, 5.0).significant
+        assert BenchHistory.CompareStats(noisy, base, 5.0).ratio > 1.0
+
+    def test_history_baseline_and_ranking(self, tmp_path):
+        from Jenga.Core.BenchHistory import BenchHistory, BenchRun, BenchStats
+        history = BenchHistory(tmp_path)
+        stats = lambda mean: BenchStats("x", mean, 0.0, mean, mean, 1)
+        old = BenchRun("a" * 40, "main", "Release", "linux-x86_64", "Bench", 1.0,
+                       {"A": stats(1.0), "B": stats(1.0), "Gone": stats(1.0)})
+        other = BenchRun("b" * 40, "main", "Debug", "linux-x86_64", "Bench", 2.0, {"A": stats(9.0)})
+        history.Append(old)
+        history.Append(other)
+        baseline = history.FindBaseline("main", "Release", "linux-x86_64", "Bench")
+        assert baseline is not None and baseline.commit == "a" * 40
+        assert history.FindBaseline("a" * 8, "Release", "linux-x86_64", "Bench").commit == "a" * 40
+        assert history.FindBaseline("feature", "Release", "linux-x86_64", "Bench") is None
+        run = BenchRun("c" * 40, "dev", "Release", "linux-x86_64", "Bench", 3.0,
+                       {"A": stats(1.5), "B": stats(3.0), "New": stats(1.0)})
+        rows = BenchHistory.Compare(run, baseline, 5.0)
+        assert [r.name for r in rows[:2]] == ["B", "A"] and rows[0].regression
+        assert {r.name for r in rows[2:]} == {"New", "Gone"}
+
+
+# ===========================================================================
+# 27. jenga selfbench : workspaces synthétiques et compilateur factice
+# ===========================================================================
+
+@pytest.mark.skipif(os.name == "nt", reason="stub compiler invoked with GCC-style arguments")
+class TestSelfBench:
+    """Génération d'un workspace synthétique et mesure de toutes les phases."""
+
+    def test_generate_and_time_all_phases(self, tmp_path):
+        from Jenga.Commands.SelfBench import SelfBenchCommand
+        entry = SelfBenchCommand.GenerateWorkspace(tmp_path / "wks", projects=2, files=3, depth=3, filters=2)
+        assert (tmp_path / "wks" / "Lib000" / "include" / "Lib000" / "chain_2.h").exists()
+        timings = SelfBenchCommand.RunScale(entry, repeat=1)
+        assert set(timings) == {"load", "filters", "collect_sources", "expand_variables", "cold_build",
+                                "noop_build", "single_change_build", "clean"}
+        assert all(value >= 0 for value in timings.values())
+        deps = list((tmp_path / "wks" / "Build").rglob("file_0000.o.d"))
+        assert deps and "chain_2.h" in deps[0].read_text()
+
+
+# ===========================================================================
+# 28. jenga docs : extraction parallèle et incrémentale
+# ===========================================================================
+
+class TestDocsIncrementalExtraction:
+    """Cache de parsing par hash de contenu et parsing sur pool de processus."""
+
+    @staticmethod
+    def _write_headers(directory, count):
+        directory.mkdir(parents=True, exist_ok=True)
+        for i in range(count):
+            (directory / f"h{i}.h").write_text(
+                f"/**\n * @brief Function {i}.\n * @param a value\n */\nint Func{i}(int a);\n")
+
+    def test_only_changed_files_are_parsed(self, tmp_path):
+        from Jenga.Commands.Docs import DocumentationExtractor
+        src = tmp_path / "include"
+        self._write_headers(src, 3)
+        cache_file = tmp_path / "docs.pickle"
+
+        def extract():
+            extractor = DocumentationExtractor("P", tmp_path, jobs=1, cache_file=cache_file)
+            return extractor, extractor.extract([src])
+
+        first, doc = extract()
+        assert first.parsed_count == 3 and doc.stats["functions"] == 3
+        second, doc = extract()
+        assert second.parsed_count == 0 and doc.stats["functions"] == 3
+        (src / "h1.h").write_text("/** @brief Renamed. */\nint Renamed(int a);\n")
+        (src / "h2.h").unlink()
+        third, doc = extract()
+        assert third.parsed_count == 1
+        assert sorted(doc.by_name) == ["Func0", "Renamed"]
+
+    def test_process_pool_matches_sequential(self, tmp_path):
+        from Jenga.Commands.Docs import DocumentationExtractor
+        src = tmp_path / "include"
+        self._write_headers(src / "sub", 40)
+        sequential = DocumentationExtractor("P", tmp_path, jobs=1).extract([src])
+        parallel = DocumentationExtractor("P", tmp_path, jobs=2).extract([src])
+        assert [f.relative_path for f in parallel.files] == [f.relative_path for f in sequential.files]
+        assert parallel.stats == sequential.stats
+
+
+# ===========================================================================
+# 29. jenga docs : écritures incrémentales et index de recherche fragmenté
+# ===========================================================================
+
+class TestDocsIncrementalSite:
+    """Pages réécrites seulement si leur contenu change, index inversé par préfixe."""
+
+    @staticmethod
+    def _generate(tmp_path, src):
+        from Jenga.Commands.Docs import DocumentationExtractor, MarkdownGenerator
+        doc = DocumentationExtractor("P", tmp_path, jobs=1).extract([src])
+        gen = MarkdownGenerator(doc)
+        gen.generate(tmp_path / "site")
+        return gen
+
+    def test_only_affected_pages_are_rewritten(self, tmp_path):
+        src = tmp_path / "include"
+        TestDocsIncrementalExtraction._write_headers(src, 3)
+        first = self._generate(tmp_path, src)
+        assert "files/h1.h.md" in first.written and first.unchanged == 0
+        assert self._generate(tmp_path, src).written == []
+
+        (src / "h1.h").write_text("/**\n * @brief Function one.\n * @param a value\n */\nint Func1(int a);\n")
+        changed = set(self._generate(tmp_path, src).written)
+        assert "files/h1.h.md" in changed and "search.md" in changed
+        assert "files/h0.h.md" not in changed and "files/h2.h.md" not in changed
+
+        (src / "h2.h").unlink()
+        third = self._generate(tmp_path, src)
+        assert "files/h2.h.md" in third.removed
+        assert not (tmp_path / "site" / "files" / "h2.h.md").exists()
+
+    def test_search_index_is_sharded_by_prefix(self, tmp_path):
+        import json
+        src = tmp_path / "include"
+        src.mkdir()
+        (src / "a.h").write_text("/** @brief Parse the input. */\nint ParseValue(int a);\n")
+        self._generate(tmp_path, src)
+        search = tmp_path / "site" / "search"
+        index = json.loads((search / "index.json").read_text(encoding="utf-8"))
+        assert index["documents"] == 1 and {"pa", "va", "in"} <= set(index["shards"])
+        shard = json.loads((search / "pa.json").read_text(encoding="utf-8"))
+        [doc_id] = shard["terms"]["parsevalue"]
+        assert shard["terms"]["parse"] == [doc_id]
+        assert shard["docs"][doc_id][0] == "ParseValue"
+        assert (tmp_path / "site" / "search.html").is_file()
+
+    def test_new_element_touches_only_its_shards(self, tmp_path):
+        src = tmp_path / "include"
+        TestDocsIncrementalExtraction._write_headers(src, 3)
+        self._generate(tmp_path, src)
+        (src / "a.h").write_text("/** @brief Aardvark. */\nint Aardvark(int a);\n")
+        written = self._generate(tmp_path, src).written
+        shards = {Path(w).name for w in written if w.startswith("search/")}
+        assert shards and shards <= {"index.json", "aa.json"}
+
+
+# ===========================================================================
+# 30. jenga gen --ninja : graphe natif à partir du BuildPlan
+# ===========================================================================
+
+class TestNinjaGenerator:
+    """Commandes du builder enregistrées (Process) puis écrites en arêtes ninja."""
+
+    def test_process_recording_does_not_run_commands(self, tmp_path):
+        from Jenga.Utils.Process import Process
+        marker = tmp_path / "ran"
+        Process.BeginRecording()
+        try:
+            result = Process.ExecuteCommand(["touch", str(marker)], cwd=tmp_path)
+        finally:
+            recorded = Process.EndRecording()
+        assert result.returnCode == 0 and not marker.exists()
+        assert recorded == [(["touch", str(marker)], str(tmp_path))]
+
+    def test_command_template_substitutes_paths(self):
+        from Jenga.Commands.Gen import GenCommand
+        commands = [(["g++", "-c", "-o", "/o/a.o", "-MF", "/o/a.o.d", "-DV=$x", "/s/a.cpp"], None)]
+        cmd = GenCommand._NinjaCommand(commands, {"/s/a.cpp": "$in", "/o/a.o": "$out", "/o/a.o.d": "$dep_file"},
+                                       windows=False)
+        assert cmd == "g++ -c -o $out -MF $dep_file '-DV=$$x' $in"
+        assert GenCommand._NinjaEscapePath("C:/My Dir/a.o") == "C$:/My$ Dir/a.o"
+
+    @pytest.mark.skipif(os.name == "nt", reason="stub compiler invoked with GCC-style arguments")
+    def test_generates_per_file_edges(self, tmp_path):
+        from Jenga.Commands.Gen import GenCommand
+        from Jenga.Commands.SelfBench import SelfBenchCommand
+        entry = SelfBenchCommand.GenerateWorkspace(tmp_path / "wks", projects=2, files=3, depth=2, filters=1)
+        assert GenCommand.Execute(["--ninja", "--jenga-file", str(entry), "-o", str(tmp_path / "out")]) == 0
+        ninja = (tmp_path / "out" / "build.ninja").read_text(encoding="utf-8")
+        compile_edges = [l for l in ninja.splitlines() if l.startswith("build ") and ": cc_" in l]
+        assert len(compile_edges) == 6
+        assert "  deps = gcc" in ninja and "  depfile = $dep_file" in ninja
+        assert "pool link_pool" in ninja and "  pool = link_pool" in ninja
+        assert "  generator = 1" in ninja and f"build build.ninja: regen {entry.resolve()}" in ninja
+        assert not list((tmp_path / "wks").rglob("*.o")), "generation must not compile anything"
+
+
+# ===========================================================================
+# 31. compile_commands.json : gen --compdb / build --compdb
+# ===========================================================================
+
+class TestCompilationDatabase:
+    """Entrées issues du BuildPlan, mises à jour incrémentales par projet."""
+
+    @staticmethod
+    def _Plan(name, obj_dir, sources):
+        from Jenga.Core.Api import ProjectKind
+        from Jenga.Core.BuildPlan import PlannedStep, ProjectPlan
+        plan = ProjectPlan(name=name, kind=ProjectKind.STATIC_LIB, objectDir=obj_dir, directory="/w")
+        for src in sources:
+            obj = f"{obj_dir}/{Path(src).stem}.o"
+            plan.compiles.append(PlannedStep(obj, [src], [(["cc", "-c", "-o", obj, src], None)]))
+        return plan
+
+    def test_update_replaces_only_planned_projects(self, tmp_path):
+        from Jenga.Core.CompilationDatabase import CompilationDatabase
+        db = CompilationDatabase(tmp_path / "compile_commands.json")
+        first = db.Update([self._Plan("A", "/w/obj/A", ["/w/a1.c", "/w/a2.c"]),
+                           self._Plan("B", "/w/obj/B", ["/w/b.c"])], tmp_path)
+        assert (first.entries, first.added, first.written) == (3, 3, True)
+        entry = next(e for e in db.Load() if e["file"] == "/w/b.c")
+        assert entry == {"directory": str(tmp_path.resolve()), "arguments": ["cc", "-c", "-o", "/w/obj/B/b.o", "/w/b.c"],
+                         "file": "/w/b.c", "output": "/w/obj/B/b.o"}
+
+        # build --target A : a2.c supprimé, les entrées de B sont conservées
+        second = db.Update([self._Plan("A", "/w/obj/A", ["/w/a1.c"])], tmp_path)
+        assert (second.entries, second.removed, second.written) == (2, 1, True)
+        assert sorted(e["file"] for e in db.Load()) == ["/w/a1.c", "/w/b.c"]
+
+    def test_unchanged_database_is_not_rewritten(self, tmp_path):
+        from Jenga.Core.CompilationDatabase import CompilationDatabase
+        db = CompilationDatabase(tmp_path / "compile_commands.json")
+        plans = [self._Plan("A", "/w/obj/A", ["/w/a.c"])]
+        db.Update(plans, tmp_path)
+        os.utime(db.path, (1, 1))
+        update = db.Update(plans, tmp_path)
+        assert not update.written and update.added == update.changed == update.removed == 0
+        assert db.path.stat().st_mtime == 1
+
+    @pytest.mark.skipif(os.name == "nt", reason="stub compiler invoked with GCC-style arguments")
+    def test_gen_compdb_records_builder_commands(self, tmp_path):
+        from Jenga.Commands.Gen import GenCommand
+        from Jenga.Commands.SelfBench import SelfBenchCommand
+        entry = SelfBenchCommand.GenerateWorkspace(tmp_path / "wks", projects=2, files=3, depth=2, filters=1)
+        assert GenCommand.Execute(["--compdb", "--jenga-file", str(entry), "-o", str(tmp_path / "out")]) == 0
+        entries = json.loads((tmp_path / "out" / "compile_commands.json").read_text(encoding="utf-8"))
+        assert len(entries) == 6
+        for e in entries:
+            assert e["arguments"][-1] == e["file"] and e["output"] in e["arguments"]
+        assert not list((tmp_path / "wks").rglob("*.o")), "generation must not compile anything"
+
+
+# ===========================================================================
+# 32. Démarrage de la CLI : commandes importées à la demande
+# ===========================================================================
+
+class TestLazyCommandImports:
+    """Le registre ne charge que le module de la commande exécutée."""
+
+    # Budget d'import (µs, cumulé -X importtime) du paquet Jenga.Commands seul
+    COMMANDS_IMPORT_BUDGET_US = 20_000
+
+    @staticmethod
+    def _ImportTimes(code):
+        import subprocess
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=str(ROOT),
+                              capture_output=True, text=True, check=True)
+        times = {}
+        for line in proc.stderr.splitlines():
+            parts = line.split("|")
+            if len(parts) == 3 and parts[1].strip().isdigit():
+                times[parts[2].strip()] = int(parts[1])
+        return times
+
+    def test_cli_startup_imports_no_command_module(self):
+        times = self._ImportTimes("import Jenga.Jenga")
+        loaded = sorted(m for m in times if m.startswith("Jenga.Commands."))
+        assert loaded == ["Jenga.Commands.Registry"]
+        assert "urllib.request" not in times, "Install/Package must not be imported at startup"
+        assert times["Jenga.Commands"] < self.COMMANDS_IMPORT_BUDGET_US
+
+    def test_running_a_command_imports_only_its_module(self):
+        import subprocess
+        code = ("import sys; from Jenga.Commands import get_command_class; get_command_class('b'); "
+                "print(' '.join(sorted(m for m in sys.modules if m.startswith('Jenga.Commands.'))))")
+        out = subprocess.run([sys.executable, "-c", code], cwd=str(ROOT), capture_output=True,
+                             text=True, check=True).stdout.split()
+        assert out == ["Jenga.Commands.Build", "Jenga.Commands.Registry"]
+
+    def test_registry_and_exports_resolve_lazily(self):
+        from Jenga.Commands import COMMANDS, DocsCommand, get_command_class
+        from Jenga.Commands.Docs import DocsCommand as Direct
+        assert DocsCommand is Direct and COMMANDS["docs"] is Direct
+        assert get_command_class("d") is Direct and "selfbench" in COMMANDS
+        assert get_command_class("nope") is None and COMMANDS.get("nope") is None
+
+
+# ===========================================================================
+# 33. Session de build partagée et manifeste des artefacts (run / deploy)
+# ===========================================================================
+
+class TestBuildSession:
+    """Un seul workspace/builder par commande ; 'jenga run' résout l'exécutable sans recharger."""
+
+    def test_manifest_entry_invalidated_by_jenga_change(self, tmp_path):
+        from Jenga.Core.BuildSession import ArtifactManifest
+        jenga_file = tmp_path / "w.jenga"
+        jenga_file.write_text("# v1\n", encoding="utf-8")
+        exe = tmp_path / "app"
+        exe.write_text("", encoding="utf-8")
+        key = ArtifactManifest.Key("run", "Debug", None, None)
+        manifest = ArtifactManifest(tmp_path)
+        manifest.Record(key, "App", exe, [str(jenga_file)])
+        manifest.Save()
+
+        assert ArtifactManifest(tmp_path).Lookup(key)["project"] == "App"
+        assert ArtifactManifest(tmp_path).Lookup(ArtifactManifest.Key("run", "Release", None, None)) is None
+        jenga_file.write_text("# v2 (longer)\n", encoding="utf-8")
+        assert ArtifactManifest(tmp_path).Lookup(key) is None
+
+    def test_missing_artifact_is_not_returned(self, tmp_path):
+        from Jenga.Core.BuildSession import ArtifactManifest
+        key = ArtifactManifest.Key("run", "Debug", None, "App")
+        manifest = ArtifactManifest(tmp_path)
+        manifest.Record(key, "App", tmp_path / "gone", [])
+        assert manifest.Lookup(key) is None
+
+    def test_run_fast_path_skips_workspace_load(self, tmp_path, monkeypatch):
+        from Jenga.Commands.Run import RunCommand
+        from Jenga.Core.BuildSession import ArtifactManifest, BuildSession
+        from Jenga.Utils import Process
+        jenga_file = tmp_path / "w.jenga"
+        jenga_file.write_text("# workspace\n", encoding="utf-8")
+        exe = tmp_path / "app"
+        exe.write_text("", encoding="utf-8")
+        manifest = ArtifactManifest(tmp_path)
+        manifest.Record(ArtifactManifest.Key("run", "Debug", None, None), "App", exe, [str(jenga_file)])
+        manifest.Save()
+
+        def no_load(self):
+            raise AssertionError("workspace must not be loaded")
+        launched = []
+        monkeypatch.setattr(BuildSession, "LoadWorkspace", no_load)
+        monkeypatch.setattr(Process, "Run", lambda cmd: launched.append(cmd) or 0)
+        assert RunCommand.Execute(["--no-daemon", "--jenga-file", str(jenga_file), "--args", "-x"]) == 0
+        assert launched == [[str(exe), "-x"]]
+
+
+# ===========================================================================
+# 34. Persistance compacte de BuildState (StateStore SQLite)
+# ===========================================================================
+
+class TestBuildStateStore:
+    """Chemins internés, écritures incrémentales, lecture paresseuse par projet."""
+
+    def _State(self):
+        from Jenga.Core.State import BuildState
+        state = BuildState(workspace=None, platform="linux", targetArch="x86_64")
+        for i in range(4):
+            state.UpdateFileState(f"/ws/src/f{i}.cpp", "%064x" % i, 100.0 + i)
+        state.SetProjectDependencies("App", {"/ws/src/f0.cpp", "/ws/src/f1.cpp"})
+        state.SetProjectDependencies("Lib", {"/ws/src/f2.cpp"})
+        state.AddProjectOutput("App", "/ws/obj/f0.o")
+        state.AddProjectOutput("App", "/ws/obj/f1.o")
+        state.MarkProjectCompiled("App")
+        return state
+
+    def test_roundtrip_loads_projects_lazily(self, tmp_path):
+        from Jenga.Core.State import BuildState
+        db = tmp_path / "state.db"
+        state = self._State()
+        state.Save(db)
+        state.Close()
+
+        loaded = BuildState.Load(db, workspace=None)
+        assert loaded.IsProjectCompiled("App", "linux", "x86_64")
+        assert loaded.platform == "linux"
+        assert not loaded._fileStates and not loaded._projectDeps
+        assert loaded.GetProjectDependencies("App") == {"/ws/src/f0.cpp", "/ws/src/f1.cpp"}
+        assert loaded.GetProjectOutputs("App") == ["/ws/obj/f0.o", "/ws/obj/f1.o"]
+        assert set(loaded._fileStates) == {"/ws/src/f0.cpp", "/ws/src/f1.cpp"}
+        assert not loaded.HasFileChanged("/ws/src/f3.cpp", "%064x" % 3, 103.0)
+        assert loaded.HasFileChanged("/ws/src/missing.cpp", "00", 0.0)
+        assert loaded.ToDict() == BuildState.Load(db, workspace=None).ToDict()
+        loaded.Close()
+
+    def test_flush_writes_only_changes(self, tmp_path):
+        from Jenga.Core.State import BuildState
+        db = tmp_path / "state.db"
+        state = self._State()
+        state.Save(db)
+        state.UpdateFileState("/ws/src/f1.cpp", "beef", 5.0)
+        state.RemoveFileState("/ws/src/f2.cpp")
+        state.Reset()
+        state.AddProjectOutput("Lib", "/ws/obj/f2.o")
+        assert state._dirtyFiles == {"/ws/src/f1.cpp", "/ws/src/f2.cpp"}
+        assert state._dirtyDeps == set()
+        state.Close()
+
+        loaded = BuildState.Load(db, workspace=None)
+        assert loaded.GetFileHash("/ws/src/f1.cpp") == "beef"
+        assert loaded.GetFileState("/ws/src/f2.cpp") is None
+        assert loaded.GetProjectOutputs("App") == []
+        assert loaded.GetProjectOutputs("Lib") == ["/ws/obj/f2.o"]
+        assert not loaded.IsProjectCompiled("App")
+        assert loaded.GetProjectDependencies("Lib") == {"/ws/src/f2.cpp"}
+        loaded.Close()
+
+    def test_concurrent_updates_and_json_export(self, tmp_path):
+        import json
+        import threading
+        from Jenga.Core.State import BuildState
+        state = BuildState(workspace=None)
+        state.Attach(tmp_path / "state.db")
+
+        def build(project):
+            for i in range(200):
+                state.AddProjectDependency(project, f"/ws/{project}/h{i}.h")
+                state.UpdateFileState(f"/ws/{project}/h{i}.h", "%064x" % i, float(i))
+                if i % 50 == 0:
+                    state.Flush()
+            state.MarkProjectCompiled(project)
+        threads = [threading.Thread(target=build, args=(f"P{n}",)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        state.Close()
+
+        loaded = BuildState.Load(tmp_path / "state.db", workspace=None)
+        assert all(len(loaded.GetProjectDependencies(f"P{n}")) == 200 for n in range(4))
+        loaded.Save(tmp_path / "state.json")
+        data = json.loads((tmp_path / "state.json").read_text(encoding="utf-8"))
+        assert len(data["fileStates"]) == 800 and "checked" not in data["fileStates"]["/ws/P0/h0.h"]
+        assert BuildState.Load(tmp_path / "state.json", workspace=None).GetFileHash("/ws/P3/h7.h") == "%064x" % 7
+        loaded.Close()
+
+
+# ===========================================================================
+# 35. Empreinte de fichier en deux niveaux (stat puis hash parallèle)
+# ===========================================================================
+
+class TestLayeredFingerprint:
+    """Le hash n'est calculé que si (mtime_ns, taille, inode, ctime_ns) a changé."""
+
+    def _NoHash(self, monkeypatch):
+        from Jenga.Core.Incremental import Incremental
+
+        def fail(path, algorithm=None):
+            raise AssertionError(f"unexpected hash of {path}")
+        monkeypatch.setattr(Incremental, "ComputeFileHash", staticmethod(fail))
+
+    def test_unchanged_stat_skips_hashing(self, tmp_path, monkeypatch):
+        import os
+        from Jenga.Core.Incremental import Incremental
+        from Jenga.Core.State import BuildState
+        files = []
+        for i in range(3):
+            f = tmp_path / f"f{i}.cpp"
+            f.write_text(f"int f{i}();\n", encoding="utf-8")
+            files.append(str(f))
+        state = BuildState(workspace=None)
+        assert Incremental.ChangedFiles(state, files) == set(files)
+        Incremental.RecordFiles(state, files)
+
+        with monkeypatch.context() as m:
+            self._NoHash(m)
+            assert Incremental.ChangedFiles(state, files) == set()
+
+        st = os.stat(files[0])
+        os.utime(files[0], ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        assert Incremental.ChangedFiles(state, files) == set()
+        with monkeypatch.context() as m:
+            self._NoHash(m)   # signature rafraîchie : plus de hash
+            assert Incremental.ChangedFiles(state, files) == set()
+
+        (tmp_path / "f1.cpp").write_text("int changed();\n", encoding="utf-8")
+        os.remove(files[2])
+        assert Incremental.ChangedFiles(state, files) == {files[1], files[2]}
+        assert Incremental.ChangedFiles(state, files) == {files[1], files[2]}
+
+    def test_fingerprints_persist_in_state_store(self, tmp_path, monkeypatch):
+        from Jenga.Core.Incremental import Incremental
+        from Jenga.Core.State import BuildState
+        src = tmp_path / "a.cpp"
+        src.write_text("int a;\n", encoding="utf-8")
+        state = BuildState(workspace=None)
+        state.Attach(tmp_path / "state.db")
+        Incremental.RecordFiles(state, [str(src)])
+        state.Close()
+
+        loaded = BuildState.Load(tmp_path / "state.db", workspace=None)
+        self._NoHash(monkeypatch)
+        assert Incremental.ChangedFiles(loaded, [str(src)]) == set()
+        loaded.Close()
+
+    def test_parallel_hash_matches_sequential(self, tmp_path):
+        from Jenga.Core.Incremental import Incremental
+        paths = []
+        for i in range(8):
+            f = tmp_path / f"h{i}.h"
+            f.write_bytes(bytes([i]) * (300_000 + i))
+            paths.append(str(f))
+        hashes = Incremental.HashFiles(paths, jobs=4)
+        assert hashes == {p: Incremental.ComputeFileHash(p) for p in paths}
+        assert len(set(hashes.values())) == 8
+        assert Incremental.HashFiles([str(tmp_path / "missing.h")]) == {str(tmp_path / "missing.h"): None}
+
+
+# ===========================================================================
+# 36. Modèle Project compact (défauts partagés, conteneurs alloués à la demande)
+# ===========================================================================
+
+class TestCompactProjectModel:
+    """Un Project ne stocke que ce que le script a modifié."""
+
+    # Octets retenus par projet déclaré via le DSL (~12 Ko avant le modèle compact)
+    PROJECT_BYTES_BUDGET = 4000
+
+    def test_containers_allocated_on_first_access(self):
+        from Jenga.Core.Api import Project
+        a, b = Project(name="A"), Project(name="B")
+        assert set(vars(a)) == {"name"}
+        assert a.androidAbis == [] and a.installerOptions == {}
+        a.androidAbis.append("arm64-v8a")
+        assert "androidAbis" not in vars(b) and b.androidAbis == []
+        assert a.cppdialect == "C++17" and "cppdialect" not in vars(a)
+        assert Project(name="A") == Project(name="A")
+
+    def test_keyword_fields_and_unknown_field(self):
+        from Jenga.Core.Api import Project, ProjectKind
+        p = Project(name="Lib", kind=ProjectKind.STATIC_LIB, files=["a.cpp"])
+        assert p.kind == ProjectKind.STATIC_LIB and p.files == ["a.cpp"]
+        with pytest.raises(TypeError):
+            Project(name="Lib", notAField=1)
+
+    def test_selfbench_model_budget(self):
+        from Jenga.Commands.SelfBench import SelfBenchCommand
+        from Jenga.Core import Api
+        previous = Api.getcurrentworkspace()
+        model = SelfBenchCommand.MeasureProjectModel(500)
+        assert Api.getcurrentworkspace() is previous
+        assert model["projects"] == 500
+        assert model["bytes_per_project"] < self.PROJECT_BYTES_BUDGET
+
+
+# ===========================================================================
+# 37. Installateur self-extracting : payload en flux, deflate et doublons
+# ===========================================================================
+
+class TestInstallerStreamingPayload:
+    """Le payload est écrit bloc par bloc ; le stub le décompresse."""
+
+    def _Files(self, root):
+        (root / "sub").mkdir()
+        text = "".join(f"ligne {i}\n" for i in range(50000)).encode()
+        (root / "a.txt").write_bytes(text)
+        (root / "sub" / "b.txt").write_bytes(text)
+        (root / "noise.bin").write_bytes(os.urandom(300000))
+        (root / "empty").write_bytes(b"")
+        return [("a.txt", str(root / "a.txt"), 0o644),
+                ("sub/b.txt", str(root / "sub" / "b.txt"), 0o755),
+                ("noise.bin", str(root / "noise.bin"), 0o644),
+                ("empty", str(root / "empty"), 0o644)]
+
+    def test_duplicates_share_one_copy(self, tmp_path):
+        from Jenga.Tools.Installer import Builder
+        files = self._Files(tmp_path)
+        sizes = Builder._CheckFiles(files)
+        assert Builder._FindDuplicates(files, sizes) == {1: "a.txt"}
+
+    def test_archive_memory_is_flat(self, tmp_path):
+        import tracemalloc
+        from Jenga.Tools.Installer import Builder
+
+        class _Sink:
+            size = 0
+
+            def write(self, data):
+                self.size += len(data)
+
+        big = tmp_path / "big.bin"
+        with open(big, "wb") as f:
+            for _ in range(16):
+                f.write(b"\0" * Builder.BLOCK_SIZE)
+        files = [("big.bin", str(big), 0o644)]
+        for compression in Builder.COMPRESSION_METHODS:
+            sink = _Sink()
+            writer = Builder._PayloadWriter(sink)
+            tracemalloc.start()
+            try:
+                Builder._WriteArchive(writer, files, Builder._CheckFiles(files), {}, compression, 6)
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+            assert peak < 3 * Builder.BLOCK_SIZE
+        assert sink.size < Builder.BLOCK_SIZE        # deflate : 16 Mio de zéros
+
+    @pytest.mark.skipif(os.name == "nt", reason="stub lancé en mode console POSIX")
+    def test_installer_roundtrip(self, tmp_path):
+        import subprocess
+        from Jenga.Tools.Installer import BuildInstaller, BuilderError, DetectCCompiler
+        if DetectCCompiler() is None:
+            pytest.skip("aucun compilateur C")
+        src = tmp_path / "src"
+        src.mkdir()
+        files = self._Files(src)
+        with pytest.raises(BuilderError):
+            BuildInstaller(files, {"name": "T"}, tmp_path / "x.run", compression="zstd")
+        out = BuildInstaller(files, {"name": "T", "version": "1.0"}, tmp_path / "t.run",
+                             compression="deflate")
+        dest = tmp_path / "dest"
+        proc = subprocess.run([str(out), "--silent", "--dir", str(dest)],
+                              capture_output=True, text=True)
+        assert proc.returncode == 0, proc.stderr
+        for arc_name, abs_path, _mode in files:
+            assert (dest / arc_name).read_bytes() == Path(abs_path).read_bytes()
+        assert os.stat(dest / "sub" / "b.txt").st_mode & 0o777 == 0o755
+
+
+# ===========================================================================
+# 38. Éditeur de liens rapide (-fuse-ld=mold/lld) et temps de link par projet
+# ===========================================================================
+
+class TestFastLinkerSelection:
+    """linker() du projet/workspace, sonde -fuse-ld mise en cache."""
+
+    def _Builder(self, cls, accepted, project_linker="", workspace_linker="auto", ldflags=()):
+        from Jenga.Core.Api import Project, Toolchain, Workspace, CompilerFamily
+        from Jenga.Core.Toolchains import ToolchainManager
+        builder = cls.__new__(cls)
+        builder.workspace = Workspace(name="W", linker=workspace_linker)
+        builder.toolchain = Toolchain(name="host-gcc", compilerFamily=CompilerFamily.GCC,
+                                      cxxPath="/usr/bin/g++")
+        builder.toolchainManager = ToolchainManager()
+        builder.toolchainManager.linkers = {name: f"/usr/bin/ld.{name}" for name in ("mold", "lld", "bfd")}
+        builder._linkerChoices = {}
+        builder._ProbeCalls = []
+
+        def _Supports(driver, name):
+            builder._ProbeCalls.append(name)
+            return name in accepted
+        builder._supports = _Supports
+        return builder, Project(name="App", linker=project_linker, ldflags=list(ldflags))
+
+    def test_dsl_project_workspace_and_toolchain(self):
+        with workspace("LinkerWks") as wks:
+            linker("lld")
+            with toolchain("custom", "gcc"):
+                linker("/opt/bin/g++")
+            with project("App"):
+                linker("Mold")
+            with project("Lib"):
+                pass
+        assert wks.linker == "lld" and wks.toolchains["custom"].ldPath == "/opt/bin/g++"
+        assert wks.projects["App"].linker == "mold" and wks.projects["Lib"].linker == ""
+        with pytest.raises(ValueError):
+            with workspace("BadLinker"):
+                linker("ld64")
+
+    def test_auto_prefers_mold_then_lld(self, monkeypatch):
+        from Jenga.Core.Builders.Linux import LinuxBuilder
+        from Jenga.Core.Toolchains import ToolchainManager
+        builder, proj = self._Builder(LinuxBuilder, accepted={"lld"})
+        monkeypatch.setattr(ToolchainManager, "SupportsFuseLd", staticmethod(builder._supports))
+        assert builder.FuseLdFlags(proj) == ["-fuse-ld=lld"]
+        assert builder.FuseLdFlags(proj) == ["-fuse-ld=lld"]
+        assert builder._ProbeCalls == ["mold", "lld"]          # résultat mémorisé par projet
+
+        builder, proj = self._Builder(LinuxBuilder, accepted={"mold", "lld"})
+        monkeypatch.setattr(ToolchainManager, "SupportsFuseLd", staticmethod(builder._supports))
+        assert builder.ResolveLinker(proj) == "mold"
+
+    def test_explicit_choice_and_fallbacks(self, monkeypatch):
+        from Jenga.Core.Builders.Linux import LinuxBuilder
+        from Jenga.Core.Toolchains import ToolchainManager
+        builder, proj = self._Builder(LinuxBuilder, accepted={"mold", "bfd"}, project_linker="bfd",
+                                      workspace_linker="mold")
+        monkeypatch.setattr(ToolchainManager, "SupportsFuseLd", staticmethod(builder._supports))
+        assert builder.ResolveLinker(proj) == "bfd"
+
+        builder, proj = self._Builder(LinuxBuilder, accepted={"mold"}, project_linker="gold")
+        monkeypatch.setattr(ToolchainManager, "SupportsFuseLd", staticmethod(builder._supports))
+        monkeypatch.setattr(ToolchainManager, "LINKER_EXECUTABLES", {"gold": ("ld.gold.absent",)})
+        assert builder.ResolveLinker(proj) is None                # gold non installé
+
+        builder, proj = self._Builder(LinuxBuilder, accepted={"mold"}, ldflags=["-fuse-ld=gold"])
+        assert builder.FuseLdFlags(proj) == []                    # ldflags explicites prioritaires
+
+    def test_coordinator_reports_link_times(self, capsys):
+        from Jenga.Utils.Reporter import BuildCoordinator
+        coordinator = BuildCoordinator("W", "Debug", "Linux", "x86_64")
+        coordinator.RecordLinkTime("Core", 0.25, "ar")
+        coordinator.RecordLinkTime("App", 1.5, "mold")
+        coordinator.PrintFooter()
+        out = capsys.readouterr().out
+        assert "Link Time:" in out and "1.75s" in out
+        assert out.index("App") < out.index("Core") and "mold" in out
+
+
 # ===========================================================================
 # Main entry point (for running without pytest)
 # ===========================================================================